@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Benchmark range classification of numeric columns.
+
+For each enum, classifies a column of random values with:
+
+- classify():        the scalar path, one dict per value (run on a sample)
+- classify_array():  the vectorized path, first-match codes
+- classify_array(all_matches=True): the multi-hot matrix
+
+and, for a synthetic enum gated on two fields (age and weight), compares
+intersecting one classify() per field with classify_multi() and
+classify_multi_array().
+
+Usage:
+    uv run python scripts/benchmark_classify.py --rows 1000000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from valuesets.enums import BMIClassificationEnum, IPCCLikelihoodScale
+from valuesets.generators.rich_enum import RichEnum
+from valuesets.utils.classifier import classify, classify_array, classify_multi, classify_multi_array
+
+CASES = [
+    (IPCCLikelihoodScale, "probability", 0.0, 1.0),
+    (BMIClassificationEnum, "bmi", 10.0, 50.0),
+]
+
+
+def rate(rows: int, seconds: float) -> str:
+    return f"{rows / seconds:>14,.0f} rows/s"
+
+
+def staging_enum(stages: int = 40):
+    """An enum of overlapping age x weight boxes, like a pediatric staging table."""
+    Stage = RichEnum("Stage", {f"S{i}": f"S{i}" for i in range(stages)})
+    Stage._metadata = {
+        f"S{i}": {"annotations": {
+            "age_range": f"{i * 0.5}-{i * 0.5 + 2}",
+            "weight_range": f"{3 + i}-{3 + i * 2 + 10}",
+        }}
+        for i in range(stages)
+    }
+    return Stage
+
+
+def benchmark_multi(rows: int, sample: int, rng) -> None:
+    enum_class = staging_enum()
+    fields = ["age", "weight"]
+    columns = {"age": rng.uniform(0, 22, rows), "weight": rng.uniform(0, 100, rows)}
+    print(f"{enum_class.__name__} ({', '.join(fields)}, {len(enum_class)} members, {rows} rows)")
+
+    objs = [{"age": float(a), "weight": float(w)}
+            for a, w in zip(columns["age"][:sample], columns["weight"][:sample])]
+    classify_multi(objs[0], enum_class, fields)
+    start = time.perf_counter()
+    for obj in objs:
+        by_weight = set(classify(obj, enum_class, field="weight"))
+        [m for m in classify(obj, enum_class, field="age") if m in by_weight]
+    chained = time.perf_counter() - start
+    print(f"  classify() per field, intersected   {rate(sample, chained)}")
+
+    start = time.perf_counter()
+    for obj in objs:
+        classify_multi(obj, enum_class, fields)
+    elapsed = time.perf_counter() - start
+    print(f"  classify_multi()                    {rate(sample, elapsed)}  ({chained / elapsed:,.1f}x)")
+
+    start = time.perf_counter()
+    classify_multi_array(columns, enum_class, fields)
+    elapsed = time.perf_counter() - start
+    print(f"  classify_multi_array codes          {rate(rows, elapsed)}  "
+          f"({chained / sample * rows / elapsed:,.0f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows for the vectorized runs")
+    parser.add_argument("--sample", type=int, default=100_000, help="Rows for the scalar run")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    for enum_class, field, low, high in CASES:
+        values = rng.uniform(low, high, args.rows)
+        values[::100] = np.nan
+        print(f"{enum_class.__name__} ({field}, {args.rows} rows)")
+
+        rows = [{field: float(v)} for v in values[:args.sample]]
+        classify(rows[0], enum_class, field=field)
+        start = time.perf_counter()
+        for row in rows:
+            classify(row, enum_class, field=field)
+        scalar = time.perf_counter() - start
+        print(f"  classify() per dict        {rate(len(rows), scalar)}")
+
+        classify_array(values[:10], enum_class, field)
+        start = time.perf_counter()
+        classify_array(values, enum_class, field)
+        elapsed = time.perf_counter() - start
+        print(f"  classify_array codes       {rate(args.rows, elapsed)}  "
+              f"({scalar / len(rows) * args.rows / elapsed:,.0f}x)")
+
+        classify_array(values[:10], enum_class, field, all_matches=True)
+        start = time.perf_counter()
+        classify_array(values, enum_class, field, all_matches=True)
+        elapsed = time.perf_counter() - start
+        print(f"  classify_array multi-hot   {rate(args.rows, elapsed)}")
+
+    benchmark_multi(args.rows, args.sample, rng)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark `valuesets classify --workers` scaling on a large synthetic CSV.
+
+Generates a CSV of random probabilities, classifies it against
+IPCCLikelihoodScale end to end with each worker count, checks that every
+run writes exactly the serial output, and reports wall time and speedup.
+
+Usage:
+    uv run python scripts/benchmark_classify_workers.py --rows 2000000 --workers 1,2,4,8
+"""
+
+import argparse
+import filecmp
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000, help="Number of rows to generate")
+    parser.add_argument("--workers", default="1,2,4,8", help="Comma-separated worker counts")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Records per worker chunk")
+    parser.add_argument("--format", default="csv", choices=["csv", "json", "jsonl"], help="Output format")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    worker_counts = [int(n) for n in args.workers.split(",")]
+    print(f"CPUs available: {len(os.sched_getaffinity(0)) if hasattr(os, 'sched_getaffinity') else os.cpu_count()}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "input.csv"
+        rng = random.Random(args.seed)
+        with open(input_path, "w") as f:
+            f.write("id,probability,site\n")
+            for i in range(args.rows):
+                f.write(f"{i},{rng.random():.5f},site{i % 97}\n")
+        print(f"Input: {args.rows:,} rows ({input_path.stat().st_size / 2**20:.1f} MiB)")
+
+        baseline = None
+        serial_path = None
+        for workers in worker_counts:
+            output_path = Path(tmp) / f"output_{workers}.{args.format}"
+            command = [
+                sys.executable, "-m", "valuesets.cli", "classify", "IPCCLikelihoodScale",
+                "-i", str(input_path), "-o", str(output_path), "-f", "probability",
+                "--workers", str(workers), "--chunk-size", str(args.chunk_size),
+            ]
+            start = time.perf_counter()
+            subprocess.run(command, check=True, stderr=subprocess.DEVNULL)
+            elapsed = time.perf_counter() - start
+            if serial_path is None:
+                baseline, serial_path = elapsed, output_path
+                same = "reference"
+            else:
+                same = "identical" if filecmp.cmp(serial_path, output_path, shallow=False) else "DIFFERS"
+            print(f"  workers={workers:<3} {elapsed:>7.2f} s  {args.rows / elapsed:>12,.0f} rows/s  "
+                  f"speedup {baseline / elapsed:>5.2f}x  output {same}")
+
+
+if __name__ == "__main__":
+    main()
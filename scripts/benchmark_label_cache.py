@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark ontology label validation against a cold and a warm label cache.
+
+Validates every schema under src/valuesets/schema twice with one
+EnumEvaluator per run: first with an empty cache directory (cold, every
+configured term is resolved and written to the label store), then with the
+store the cold run filled (warm, every configured term is read from it).
+
+By default no ontology is downloaded: adapters are replaced by one that
+answers from the labels recorded in the repository's cache/ directory,
+optionally after --latency-ms, so the timings show the validator and cache
+cost. With --live the configured OAK adapters are used.
+
+Each run is made with meanings prefetched in bulk per prefix (the default)
+and looked up one term at a time; --legacy also runs the old CSV cache,
+which re-read a prefix's whole terms.csv before appending each new term.
+With --jobs N the prefetch run resolves up to N prefixes concurrently.
+
+Usage:
+    uv run python scripts/benchmark_label_cache.py --latency-ms 5 --legacy --jobs 4
+"""
+
+import argparse
+import csv
+import logging
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from valuesets.validators import enum_evaluator
+from valuesets.validators.enum_evaluator import EnumEvaluator, ValidationConfig
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class RecordedAdapter:
+    """An OAK-like adapter answering from recorded cache files."""
+
+    def __init__(self, cache_dir: Path, latency: float):
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+        self.recorded = {}
+        for path in cache_dir.glob("*/terms.csv"):
+            with open(path, newline="") as f:
+                for row in list(csv.reader(f))[1:]:
+                    if len(row) >= 2 and row[1]:
+                        self.recorded[row[0]] = row[1]
+
+    def _request(self):
+        with self._lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def label(self, curie):
+        self._request()
+        return self.recorded.get(curie)
+
+    def labels(self, curies):
+        # One round trip per bulk call, as for a SemSQL query
+        self._request()
+        return [(curie, self.recorded.get(curie)) for curie in curies]
+
+
+class LegacyEvaluator(EnumEvaluator):
+    """The previous file cache: re-read the prefix file for every new term, then append it."""
+
+    def _save_to_cache(self, prefix, curie, label):
+        if prefix.lower() not in self._oak_config:
+            return
+        self._stored_prefix_labels(prefix)[curie] = label
+        cache_file = self.config.cache_dir / prefix.lower() / "terms.csv"
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        existing = set()
+        if cache_file.exists():
+            with open(cache_file, newline="") as f:
+                existing = {row[0] for row in list(csv.reader(f))[1:] if row}
+        if curie in existing:
+            return
+        if not cache_file.exists():
+            with open(cache_file, "w", newline="") as f:
+                csv.writer(f).writerow(["curie", "label", "retrieved_at"])
+        with open(cache_file, "a", newline="") as f:
+            csv.writer(f).writerow([curie, label or "", datetime.now().isoformat()])
+
+
+def run(evaluator_class, schema_files, cache_dir, prefetch, jobs=1):
+    """Validate the schemas; return (total seconds, seconds in label lookups and cache writes, issues, terms)."""
+    evaluator = evaluator_class(
+        ValidationConfig(cache_dir=cache_dir, label_store_path=cache_dir / "labels.sqlite", jobs=jobs)
+    )
+    label_time = 0.0
+
+    def timed(method):
+        def wrapper(*args):
+            nonlocal label_time
+            start = time.perf_counter()
+            try:
+                return method(*args)
+            finally:
+                label_time += time.perf_counter() - start
+        return wrapper
+
+    # Schema loading dominates the total; time the cache's share separately
+    evaluator.get_ontology_label = timed(evaluator.get_ontology_label)
+    evaluator.prefetch_labels = timed(evaluator.prefetch_labels)
+    evaluator.flush_cache = timed(evaluator.flush_cache)
+    start = time.perf_counter()
+    issues = sum(len(r.issues) for r in evaluator.validate_schemas(schema_files, prefetch=prefetch))
+    terms = sum(len(labels) for labels in evaluator._stored_labels.values())
+    return time.perf_counter() - start, label_time, issues, terms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--schema-dir", type=Path, default=ROOT / "src" / "valuesets" / "schema")
+    parser.add_argument("--recorded-cache", type=Path, default=ROOT / "cache",
+                        help="Cache directory the offline adapter answers from")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Simulated latency per offline lookup")
+    parser.add_argument("--live", action="store_true", help="Use the configured OAK adapters")
+    parser.add_argument("--legacy", action="store_true", help="Also run the previous per-term cache")
+    parser.add_argument("--jobs", type=int, default=1, help="Prefixes prefetched concurrently")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    if not args.live:
+        recorded = RecordedAdapter(args.recorded_cache, args.latency_ms / 1000)
+        # Every prefix, configured or not, is answered from the recording
+        enum_evaluator.get_adapter = lambda adapter_string: recorded
+        enum_evaluator.get_rest_adapter = lambda adapter_string: recorded
+
+    schema_files = sorted(f for f in args.schema_dir.rglob("*.yaml") if "linkml_model" not in str(f))
+    print(f"Validating {len(schema_files)} schemas under {args.schema_dir}")
+
+    modes = [("prefetch", EnumEvaluator, True, 1), ("per-term", EnumEvaluator, False, 1)]
+    if args.jobs > 1:
+        modes.insert(1, (f"jobs={args.jobs}", EnumEvaluator, True, args.jobs))
+    if args.legacy:
+        modes.append(("legacy", LegacyEvaluator, False, 1))
+    for name, evaluator_class, prefetch, jobs in modes:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for state in ("cold", "warm"):
+                requests = recorded.requests if not args.live else 0
+                elapsed, label_time, issues, terms = run(evaluator_class, schema_files, Path(cache_dir), prefetch, jobs)
+                requests_made = f"  {recorded.requests - requests:5} requests" if not args.live else ""
+                print(f"  {name:<8} {state}: {elapsed:7.2f} s total  {label_time * 1000:8.1f} ms labels  "
+                      f"{issues:5} issues  {terms:5} cached terms{requests_made}")
+
+
+if __name__ == "__main__":
+    main()
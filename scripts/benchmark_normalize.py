@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark bulk normalization of raw strings to enum members.
+
+Generates a CSV with one column of raw values drawn from the names,
+aliases, meanings and labels of an enum (plus some junk), then measures:
+
+- normalize_many over the column with memoization (the default)
+- normalize_many with memoization disabled, on a sample
+- `valuesets normalize` end to end on the file
+
+Usage:
+    uv run python scripts/benchmark_normalize.py --rows 1000000
+"""
+
+import argparse
+import csv
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from valuesets.enums import UniProtSpeciesCode
+from valuesets.utils.normalize import Normalizer
+
+
+def raw_values(enum_class) -> list:
+    """Distinct raw spellings that should resolve (or not) to members of enum_class."""
+    values = ["unknown", "n/a", "", "???"]
+    for member in enum_class:
+        values.append(member.name)
+        values.append(member.name.lower())
+        if member.meaning:
+            values.append(member.meaning)
+        for alias in member.get_metadata().get("aliases", []):
+            values.append(alias)
+            values.append(alias.upper())
+    return values
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows to generate")
+    parser.add_argument("--sample", type=int, default=50_000, help="Rows used for the unmemoized run")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    distinct = raw_values(UniProtSpeciesCode)
+    column = [rng.choice(distinct) for _ in range(args.rows)]
+    print(f"{args.rows} rows, {len(set(column))} distinct values ({UniProtSpeciesCode.__name__})")
+
+    normalizer = Normalizer(UniProtSpeciesCode)
+    start = time.perf_counter()
+    for _ in normalizer.normalize_many(column):
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"normalize_many (memoized):   {elapsed:6.2f} s  {args.rows / elapsed:>12,.0f} rows/s  "
+          f"({normalizer.matched} matched)")
+
+    sample = column[:args.sample]
+    normalizer = Normalizer(UniProtSpeciesCode, max_cache_size=0)
+    start = time.perf_counter()
+    for _ in normalizer.normalize_many(sample):
+        pass
+    elapsed = time.perf_counter() - start
+    print(f"normalize_many (no memo):    {elapsed:6.2f} s  {len(sample) / elapsed:>12,.0f} rows/s  "
+          f"(on {len(sample)} rows)")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "input.csv"
+        output_path = Path(tmp) / "output.csv"
+        with open(input_path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["id", "species"])
+            writer.writerows(enumerate(column))
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "valuesets.cli", "normalize", "UniProtSpeciesCode",
+             "-f", "species", "-i", str(input_path), "-o", str(output_path)],
+            check=True,
+        )
+        elapsed = time.perf_counter() - start
+        print(f"valuesets normalize (CSV):   {elapsed:6.2f} s  {args.rows / elapsed:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Compare cold start time and peak RSS of metadata lookups.
+
+Each scenario runs in a fresh interpreter and looks up the meaning of one
+member:
+
+- eager:    import every enum exported by valuesets.enums (the old behaviour)
+- lazy:     import a single enum through the lazy valuesets.enums package
+- registry: answer the lookup from the precompiled registry file
+
+Usage:
+    uv run python scripts/benchmark_registry.py --runs 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+REPORT = """
+import json, resource
+print(json.dumps({"meaning": meaning, "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}))
+"""
+
+SCENARIOS = {
+    "python (baseline)": "meaning = None",
+    "eager": (
+        "import valuesets.enums as enums\n"
+        "classes = [getattr(enums, name) for name in enums.__all__]\n"
+        "meaning = enums.UniProtSpeciesCode.SP_HUMAN.get_meaning()"
+    ),
+    "lazy": (
+        "from valuesets.enums import UniProtSpeciesCode\n"
+        "meaning = UniProtSpeciesCode.SP_HUMAN.get_meaning()"
+    ),
+    "registry": (
+        "from valuesets.registry import get_registry\n"
+        "meaning = get_registry().get_member('UniProtSpeciesCode', 'SP_HUMAN').meaning"
+    ),
+}
+
+
+def run_scenario(code: str) -> tuple:
+    """Run one scenario in a fresh interpreter; return (seconds, maxrss_kb)."""
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", code + REPORT], check=True, capture_output=True, text=True
+    ).stdout
+    elapsed = time.perf_counter() - start
+    result = json.loads(output.strip().splitlines()[-1])
+    return elapsed, result["maxrss_kb"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Runs per scenario (median is reported)")
+    args = parser.parse_args()
+
+    print(f"{'scenario':<20} {'cold start (ms)':>16} {'peak RSS (MB)':>14}")
+    for name, code in SCENARIOS.items():
+        timings, rss = [], []
+        for _ in range(args.runs):
+            elapsed, maxrss_kb = run_scenario(code)
+            timings.append(elapsed)
+            rss.append(maxrss_kb)
+        print(f"{name:<20} {statistics.median(timings) * 1000:>16.1f} {statistics.median(rss) / 1024:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark `valuesets serve` latency and throughput on localhost.
+
+Starts a server (or uses a running one with --port), then for each batch
+size sends classify, normalize and lookup requests from several concurrent
+keep-alive connections and reports latency percentiles, requests/s and
+items/s. With --compare-cli, also times one `valuesets classify` run on a
+small file, the per-job cost the server avoids.
+
+Usage:
+    uv run python scripts/benchmark_server.py --batch-sizes 1,100,10000 --concurrency 8 --workers 2
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+def make_payload(endpoint, batch_size, rng):
+    if endpoint == "/classify":
+        return {"enum": "IPCCLikelihoodScale", "values": [round(rng.random(), 4) for _ in range(batch_size)]}
+    if endpoint == "/normalize":
+        choices = ["EUKARYOTA", "bacteria", "NCBITaxon:2759", "Archaea", "unknown"]
+        return {"enum": "BiologicalKingdom", "values": [rng.choice(choices) for _ in range(batch_size)]}
+    choices = ["BSPO:0000000", "NCBITaxon:2759", "PATO:0000384", "FAKE:0000001"]
+    return {"curies": [rng.choice(choices) for _ in range(batch_size)]}
+
+
+async def request(reader, writer, path, body):
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.decode("latin-1").split("\r\n"):
+        name, _, value = line.partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    status = int(head.split(b" ", 2)[1])
+    payload = await reader.readexactly(length)
+    if status != 200:
+        raise RuntimeError(f"{path} returned {status}: {payload[:200]!r}")
+
+
+async def run_client(host, port, path, bodies, latencies):
+    reader, writer = await asyncio.open_connection(host, port, limit=2**26)
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            await request(reader, writer, path, body)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run_case(host, port, path, batch_size, requests, concurrency, rng):
+    bodies = [json.dumps(make_payload(path, batch_size, rng)).encode() for _ in range(min(requests, 16))]
+    per_client = [[bodies[(i + c) % len(bodies)] for i in range(c, requests, concurrency)]
+                  for c in range(concurrency)]
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(host, port, path, b, latencies) for b in per_client if b))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+    print(f"  {path:<10} batch={batch_size:<7,} p50 {percentile(50):>8.2f} ms  p95 {percentile(95):>8.2f} ms  "
+          f"p99 {percentile(99):>8.2f} ms  {requests / elapsed:>9,.0f} req/s  "
+          f"{requests * batch_size / elapsed:>12,.0f} items/s")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def wait_for_server(host, port, process, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError("Server exited during start-up")
+        try:
+            with socket.create_connection((host, port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("Server did not start")
+
+
+def time_cli(rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "input.csv"
+        input_path.write_text("probability\n" + "".join(f"{i / rows:.4f}\n" for i in range(rows)))
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, "-m", "valuesets.cli", "classify", "IPCCLikelihoodScale",
+             "-i", str(input_path), "-o", str(Path(tmp) / "output.csv")],
+            check=True, stderr=subprocess.DEVNULL,
+        )
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, help="Benchmark a server already running on this port")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Worker processes for a started server")
+    parser.add_argument("--batch-sizes", default="1,100,10000", help="Comma-separated items per request")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per case")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent connections")
+    parser.add_argument("--endpoints", default="/classify,/normalize,/lookup")
+    parser.add_argument("--compare-cli", action="store_true", help="Also time one CLI classify run")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    process = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "valuesets.cli", "serve", "--host", args.host, "--port", str(port),
+             "--workers", str(args.workers), "--preload", "IPCCLikelihoodScale,BiologicalKingdom"],
+            stderr=subprocess.DEVNULL,
+        )
+    try:
+        start = time.perf_counter()
+        wait_for_server(args.host, port, process)
+        if process is not None:
+            print(f"Server started in {time.perf_counter() - start:.2f} s "
+                  f"(workers={args.workers}, CPUs={os.cpu_count()})")
+        rng = random.Random(args.seed)
+        for batch_size in (int(n) for n in args.batch_sizes.split(",")):
+            requests = max(args.concurrency, args.requests if batch_size <= 1000 else args.requests // 10)
+            for path in args.endpoints.split(","):
+                asyncio.run(run_case(args.host, port, path, batch_size, requests, args.concurrency, rng))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    if args.compare_cli:
+        print(f"One `valuesets classify` run on 100 rows: {time_cli(100):.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Check whether integer enum codes would shift against a previous release.
+
+Codes (see valuesets.utils.codes) follow the member order of the generated
+enums. This compares the code order of the enums currently in
+valuesets.enums with the order recorded in a registry file, by default the
+packaged one, which still describes the previous generation until the
+registry is rebuilt. Appending members is fine; reordering or removing
+members changes codes that may already be stored in data files.
+
+Usage:
+    uv run python scripts/check_code_shifts.py
+    git show v0.5.0:src/valuesets/enums/registry.sqlite > /tmp/old.sqlite
+    uv run python scripts/check_code_shifts.py --baseline /tmp/old.sqlite --strict
+"""
+
+import argparse
+import sys
+
+import valuesets.enums as enums
+from valuesets.registry import EnumRegistry
+from valuesets.utils.codes import code_shifts, code_snapshot, registry_code_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", help="Registry file of the previous release (default: packaged registry)")
+    parser.add_argument("--strict", action="store_true", help="Exit with status 1 if any code shifts")
+    args = parser.parse_args()
+
+    old = registry_code_snapshot(EnumRegistry(args.baseline))
+    new = code_snapshot({name: getattr(enums, name) for name in enums.__all__})
+    shifts = code_shifts(old, new)
+
+    if not shifts:
+        print(f"No code shifts in {len(new)} enums")
+        return
+    print(f"{len(shifts)} code shift(s):")
+    for line in shifts:
+        print(f"  {line}")
+    if args.strict:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ import yaml
 from pathlib import Path
 from urllib.parse import quote
 
+from valuesets.utils.label_store import LabelStore
 from valuesets.utils.query_describer import describe_enum_query, fetch_label_from_ols
 
 
@@ -140,7 +141,7 @@ def build_annotation_table(defn: dict, prefix_map: dict) -> str | None:
     return "\n".join([header_row, separator] + rows)
 
 
-def enrich_enum_doc(doc_path: Path, enum_name: str, enum_info: dict, label_cache: dict) -> bool:
+def enrich_enum_doc(doc_path: Path, enum_name: str, enum_info: dict, label_store: LabelStore) -> bool:
     """Enrich a single enum documentation file.
 
     Returns True if the file was modified.
@@ -162,13 +163,9 @@ def enrich_enum_doc(doc_path: Path, enum_name: str, enum_info: dict, label_cache
     if not already_has_query and "reachable_from" in defn:
         label_lookup = {}
         for node in defn.get("reachable_from", {}).get("source_nodes", []):
-            if node in label_cache:
-                label_lookup[node] = label_cache[node]
-            else:
-                label = fetch_label_from_ols(node)
-                if label:
-                    label_lookup[node] = label
-                    label_cache[node] = label
+            label = fetch_label_from_ols(node, label_store)
+            if label:
+                label_lookup[node] = label
 
         desc = describe_enum_query(defn, label_lookup, prefix_map)
         if desc:
@@ -232,6 +229,11 @@ def main():
         default=Path("docs/elements"),
         help="Generated docs directory",
     )
+    parser.add_argument(
+        "--label-store",
+        type=Path,
+        help="Shared label store file (default: $VALUESETS_LABEL_STORE or cache/labels.sqlite)",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -244,7 +246,7 @@ def main():
     all_enums = find_all_enums(args.schema_dir)
     print(f"Found {len(all_enums)} enums")
 
-    label_cache: dict[str, str] = {}
+    label_store = LabelStore(args.label_store)
     enriched = 0
 
     for enum_name, enum_info in all_enums.items():
@@ -254,7 +256,7 @@ def main():
             if doc_path.exists():
                 print(f"Would enrich: {doc_path}")
         else:
-            if enrich_enum_doc(doc_path, enum_name, enum_info, label_cache):
+            if enrich_enum_doc(doc_path, enum_name, enum_info, label_store):
                 print(f"Enriched: {doc_path}")
                 enriched += 1
 
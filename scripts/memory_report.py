@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Report memory held by the enums in valuesets.enums, measured with tracemalloc.
+
+Imports every exported enum in a fresh interpreter and reports the memory
+still allocated afterwards, in total and for the allocations made while
+executing the generated enum modules (which is where member metadata lives).
+
+Usage:
+    uv run python scripts/memory_report.py
+"""
+
+import argparse
+import gc
+import tracemalloc
+from pathlib import Path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--top", type=int, default=5, help="Number of largest enum modules to list")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    import valuesets.enums as enums
+    classes = [getattr(enums, name) for name in enums.__all__]
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    enums_dir = str(Path(enums.__file__).parent)
+    groups = {"enum modules": 0, "rich_enum.py": 0, "enum.py (stdlib)": 0, "other": 0}
+    module_sizes = {}
+    for stat in snapshot.statistics("filename"):
+        filename = stat.traceback[0].filename
+        if filename.startswith(enums_dir):
+            groups["enum modules"] += stat.size
+            module_sizes[str(Path(filename).relative_to(enums_dir))] = stat.size
+        elif filename.endswith("rich_enum.py"):
+            groups["rich_enum.py"] += stat.size
+        elif filename.endswith("/enum.py"):
+            groups["enum.py (stdlib)"] += stat.size
+        else:
+            groups["other"] += stat.size
+    members = sum(len(enum_class) for enum_class in classes)
+
+    print(f"Enums: {len(classes)}  members: {members}")
+    print(f"Allocated after import: {current / 2**20:.2f} MiB (peak {peak / 2**20:.2f} MiB)")
+    for group, size in groups.items():
+        print(f"  {group:<20} {size / 2**20:>6.2f} MiB")
+    print(f"Largest enum modules:")
+    for name, size in sorted(module_sizes.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {name:<50} {size / 1024:>8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,16 @@
-try:
-    from valuesets._version import __version__, __version_tuple__
-except ImportError:  # pragma: no cover
-    __version__ = "0.0.0"
-    __version_tuple__ = (0, 0, 0)
-
-from . import utils
+def __getattr__(name):
+    # The version is read from package metadata, and subpackages such as
+    # utils pull in heavy dependencies (e.g., oaklib); all are only loaded
+    # on first access so that importing valuesets (and the CLI) stays fast.
+    if name in ("__version__", "__version_tuple__"):
+        try:
+            from valuesets._version import __version__, __version_tuple__
+        except ImportError:  # pragma: no cover
+            __version__ = "0.0.0"
+            __version_tuple__ = (0, 0, 0)
+        globals().update(__version__=__version__, __version_tuple__=__version_tuple__)
+        return globals()[name]
+    if name == "utils":
+        import importlib
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
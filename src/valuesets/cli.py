@@ -2,15 +2,18 @@
 
 import csv
 import json
+import os
 import sys
+from collections import deque
 from contextlib import nullcontext
 from enum import Enum
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Type
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Type
 
 import typer
 
-from valuesets.utils.classifier import classify, detect_classifier_fields
 
 app = typer.Typer(
     name="valuesets",
@@ -18,13 +21,93 @@ app = typer.Typer(
     no_args_is_help=True,
 )
 
+# Heavy modules (numpy, oaklib, the enum modules, ...) are imported inside
+# the commands that use them, so that start-up and --help stay fast; see
+# --profile-startup and tests/test_cli_startup.py.
+
+
+def startup_profile(args: List[str], top: int = 25) -> str:
+    """
+    Run the CLI with args in a fresh interpreter under ``-X importtime`` and summarize it.
+
+    Args:
+        args: Command-line arguments after ``valuesets``
+        top: Number of modules to list, by cumulative import time
+
+    Returns:
+        A report with the wall time, the total import time and the slowest
+        imports (cumulative and self time, nested as in ``-X importtime``)
+    """
+    import subprocess
+    import time
+
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], check=True)
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "valuesets.cli", *args],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    wall = time.perf_counter() - start
+
+    imports = []  # (cumulative us, self us, name with nesting indent)
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        imports.append((int(cumulative_us), int(self_us), name[1:].rstrip()))
+    total = sum(cumulative for cumulative, _, name in imports if not name.startswith(" "))
+
+    lines = [
+        f"Start-up profile of: valuesets {' '.join(args)}",
+        f"  wall time      {wall:7.3f} s (exit status {result.returncode})",
+        f"  interpreter    {baseline:7.3f} s (python -c pass)",
+        f"  imports        {total / 1e6:7.3f} s ({len(imports)} modules)",
+        "",
+        "  cumulative       self  module",
+    ]
+    for cumulative, self_us, name in sorted(imports, reverse=True)[:top]:
+        lines.append(f"  {cumulative / 1000:7.1f} ms {self_us / 1000:7.1f} ms  {name}")
+    return "\n".join(lines)
+
+
+def _profile_startup(value: bool) -> None:
+    if value:
+        # Profile whatever follows the flag on the real command line
+        argv = sys.argv[sys.argv.index("--profile-startup") + 1:] if "--profile-startup" in sys.argv else []
+        typer.echo(startup_profile(argv or ["--help"]))
+        raise typer.Exit()
+
+
+@app.callback()
+def _main_options(
+    profile_startup: bool = typer.Option(
+        False,
+        "--profile-startup",
+        is_eager=True,
+        callback=_profile_startup,
+        help="Print an import-time breakdown of start-up for the rest of the command line "
+             "(or --help), then exit.",
+    ),
+) -> None:
+    pass
+
 
 def load_enum_class(enum_name: str, module: str = "valuesets.enums") -> Type[Enum]:
     """
-    Dynamically load an enum class by name.
+    Load an enum class by name, importing only the module that defines it.
+
+    For valuesets.enums, names are resolved with the packaged registry (see
+    valuesets.registry.load_enum), so enums shadowed by a same-named enum
+    can be selected with a module-qualified name such as
+    "bio.lipid_categories.PresenceEnum". For other modules the name may
+    also be qualified by a submodule.
 
     Args:
-        enum_name: Name of the enum class (e.g., "IPCCLikelihoodScale")
+        enum_name: Name of the enum class (e.g., "IPCCLikelihoodScale"),
+            optionally qualified by its module
         module: Module path to import from (default: "valuesets.enums")
 
     Returns:
@@ -35,21 +118,34 @@ def load_enum_class(enum_name: str, module: str = "valuesets.enums") -> Type[Enu
     """
     import importlib
 
-    try:
-        mod = importlib.import_module(module)
-        # Try direct attribute access
-        if hasattr(mod, enum_name):
-            return getattr(mod, enum_name)
+    if module == "valuesets.enums":
+        from valuesets.registry import load_enum
 
-        # Try searching submodules recursively
-        for attr_name in dir(mod):
-            attr = getattr(mod, attr_name)
-            if isinstance(attr, type) and issubclass(attr, Enum) and attr.__name__ == enum_name:
-                return attr
+        try:
+            return load_enum(enum_name)
+        except KeyError:
+            raise typer.BadParameter(f"Enum '{enum_name}' not found in module '{module}'")
+        except ValueError as e:
+            raise typer.BadParameter(str(e))
+        except FileNotFoundError:
+            pass  # No registry: fall back to the module itself
 
-        raise typer.BadParameter(f"Enum '{enum_name}' not found in module '{module}'")
+    qualifier, _, class_name = enum_name.rpartition(".")
+    try:
+        mod = importlib.import_module(f"{module}.{qualifier}" if qualifier else module)
     except ImportError as e:
         raise typer.BadParameter(f"Cannot import module '{module}': {e}")
+    enum_class = getattr(mod, class_name, None)
+    if isinstance(enum_class, type) and issubclass(enum_class, Enum):
+        return enum_class
+
+    # Enums imported into the module under another name
+    for attr_name in dir(mod):
+        attr = getattr(mod, attr_name)
+        if isinstance(attr, type) and issubclass(attr, Enum) and attr.__name__ == class_name:
+            return attr
+
+    raise typer.BadParameter(f"Enum '{enum_name}' not found in module '{module}'")
 
 
 def read_input(
@@ -66,56 +162,11 @@ def read_input(
     Yields:
         Dict objects from the input
     """
-    if input_path is None:
-        # Read from stdin
-        content = sys.stdin.read()
-        if not content.strip():
-            return
-
-        # Auto-detect format
-        if input_format is None:
-            if content.strip().startswith("[") or content.strip().startswith("{"):
-                input_format = "json"
-            else:
-                input_format = "csv"
-    else:
-        # Read from file
-        content = input_path.read_text()
-        if input_format is None:
-            suffix = input_path.suffix.lower()
-            if suffix == ".csv":
-                input_format = "csv"
-            elif suffix == ".jsonl":
-                input_format = "jsonl"
-            else:
-                input_format = "json"
-
-    if input_format == "csv":
-        reader = csv.DictReader(content.splitlines())
-        for row in reader:
-            # Convert numeric strings to floats where possible
-            converted = {}
-            for k, v in row.items():
-                try:
-                    converted[k] = float(v)
-                except (ValueError, TypeError):
-                    converted[k] = v
-            yield converted
-    elif input_format == "jsonl":
-        for line in content.splitlines():
-            line = line.strip()
-            if line:
-                yield json.loads(line)
-    else:  # json
-        data = json.loads(content)
-        if isinstance(data, list):
-            yield from data
-        else:
-            yield data
+    yield from iter_records(input_path, input_format)
 
 
 def write_output(
-    results: List[Dict[str, Any]],
+    results: Iterable[Dict[str, Any]],
     output_path: Optional[Path],
     output_format: Optional[str],
     input_format: str
@@ -124,43 +175,307 @@ def write_output(
     Write output data to file or stdout.
 
     Args:
-        results: List of result dicts
+        results: Result dicts (consumed lazily)
         output_path: Path to output file, or None for stdout
         output_format: Format ("csv", "json", "jsonl") or None to match input
         input_format: Original input format (used if output_format is None)
     """
-    if output_format is None:
-        if output_path:
-            suffix = output_path.suffix.lower()
-            if suffix == ".csv":
-                output_format = "csv"
-            elif suffix == ".jsonl":
-                output_format = "jsonl"
+    with RecordWriter(output_path, _output_format(output_path, output_format, input_format)) as writer:
+        writer.write_all(results)
+
+
+def _output_format(output_path: Optional[Path], output_format: Optional[str], input_format: str) -> str:
+    """Resolve the output format: explicit, else from the output suffix, else the input format."""
+    if output_format is not None:
+        return output_format
+    if output_path:
+        return _format_from_suffix(output_path)
+    return input_format
+
+
+# Formats read and written as Arrow record batches (requires pyarrow)
+COLUMNAR_FORMATS = ("arrow", "parquet")
+
+
+def _format_from_suffix(path: Path) -> str:
+    """Guess a record format (csv, jsonl, arrow, parquet or json) from a file suffix."""
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix == ".jsonl":
+        return "jsonl"
+    if suffix in (".arrow", ".feather", ".ipc"):
+        return "arrow"
+    if suffix in (".parquet", ".pq"):
+        return "parquet"
+    return "json"
+
+
+def _require_pyarrow():
+    """Import pyarrow, or fail with an install hint."""
+    try:
+        import pyarrow
+    except ImportError:
+        raise typer.BadParameter("pyarrow is required for arrow and parquet formats; install valuesets[arrow]")
+    return pyarrow
+
+
+def iter_batches(
+    input_path: Optional[Path],
+    input_format: str,
+    batch_size: int = 10_000,
+) -> Iterator["pyarrow.RecordBatch"]:
+    """
+    Stream Arrow record batches from an Arrow IPC or Parquet file.
+
+    Arrow input may also come from stdin, in the IPC stream format.
+    Parquet needs a seekable file.
+
+    Args:
+        input_path: Path to input file, or None for stdin
+        input_format: "arrow" or "parquet"
+        batch_size: Maximum rows per Parquet batch (Arrow batches are
+            yielded as stored)
+
+    Yields:
+        pyarrow.RecordBatch objects
+    """
+    pa = _require_pyarrow()
+    if input_format == "parquet":
+        if input_path is None:
+            raise typer.BadParameter("Parquet input must be a file (use --input)")
+        import pyarrow.parquet as pq
+
+        yield from pq.ParquetFile(input_path).iter_batches(batch_size=batch_size)
+    elif input_path is None:
+        yield from pa.ipc.open_stream(sys.stdin.buffer)
+    else:
+        with pa.memory_map(str(input_path)) as source:
+            try:
+                reader = pa.ipc.open_file(source)
+            except pa.ArrowInvalid:
+                # Not the file format; try the stream format
+                source.seek(0)
+                yield from pa.ipc.open_stream(source)
+                return
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i)
+
+
+def iter_records(
+    input_path: Optional[Path],
+    input_format: Optional[str],
+    convert_numbers: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream records from a file or stdin without reading it all into memory.
+
+    CSV and JSONL are read row by row, Arrow and Parquet batch by batch
+    (with their own column types); JSON is parsed as a whole.
+
+    Args:
+        input_path: Path to input file, or None for stdin
+        input_format: Format hint ("csv", "json", "jsonl", "arrow", "parquet")
+            or None for auto-detect
+        convert_numbers: Convert numeric CSV cells to floats
+
+    Yields:
+        Dict objects from the input
+    """
+    if input_format is None and input_path is not None:
+        input_format = _format_from_suffix(input_path)
+    if input_format in COLUMNAR_FORMATS:
+        for batch in iter_batches(input_path, input_format):
+            yield from batch.to_pylist()
+        return
+
+    cm = nullcontext(sys.stdin) if input_path is None else open(input_path, newline="")
+    with cm as stream:
+        if input_format is None:  # stdin: sniff the first line
+            first = stream.readline()
+            while first and not first.strip():
+                first = stream.readline()
+            if not first:
+                return
+            if first.lstrip().startswith("["):
+                input_format = "json"
+            elif first.lstrip().startswith("{"):
+                # One object per line, or a single pretty-printed object
+                try:
+                    json.loads(first)
+                    input_format = "jsonl"
+                except ValueError:
+                    input_format = "json"
             else:
-                output_format = "json"
+                input_format = "csv"
+            stream = _Prepended(first, stream)
+
+        if input_format == "csv":
+            for row in csv.DictReader(stream):
+                if convert_numbers:
+                    for k, v in row.items():
+                        try:
+                            row[k] = float(v)
+                        except (ValueError, TypeError):
+                            pass
+                yield row
+        elif input_format == "jsonl":
+            for line in stream:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:  # json
+            content = stream.read()
+            if not content.strip():
+                return
+            data = json.loads(content)
+            if isinstance(data, list):
+                yield from data
+            else:
+                yield data
+
+
+class _Prepended:
+    """A text stream with a line that was already read put back in front."""
+
+    def __init__(self, first: str, stream: TextIO):
+        self._first: Optional[str] = first
+        self._stream = stream
+
+    def __iter__(self) -> Iterator[str]:
+        if self._first is not None:
+            first, self._first = self._first, None
+            yield first
+        yield from self._stream
+
+    def read(self) -> str:
+        first, self._first = self._first or "", None
+        return first + self._stream.read()
+
+
+class RecordWriter:
+    """
+    Write records to a file or stdout one at a time.
+
+    CSV takes its header from the first record unless fieldnames are
+    given; with declared fieldnames, keys outside them are dropped. JSON
+    output is written as an array in batches of ``flush_every`` records and
+    matches json.dumps(records, indent=2). Arrow (IPC) and Parquet output
+    is written as record batches of ``flush_every`` records, with the schema
+    of the first batch. Output is flushed every ``flush_every`` records so
+    downstream consumers of a pipe see results as they are produced.
+    """
+
+    def __init__(self, output_path: Optional[Path], output_format: str,
+                 fieldnames: Optional[List[str]] = None, flush_every: int = 1000):
+        self.output_format = output_format
+        self.fieldnames = fieldnames
+        self.flush_every = flush_every
+        self.count = 0
+        self._columnar = output_format in COLUMNAR_FORMATS
+        if self._columnar:
+            _require_pyarrow()
+            self._stream = sys.stdout.buffer if output_path is None else open(output_path, "wb")
         else:
-            output_format = input_format
+            self._stream = sys.stdout if output_path is None else open(output_path, "w", newline="")
+        self._close_stream = output_path is not None
+        self._csv_writer: Optional[csv.DictWriter] = None
+        self._batch_writer = None
+        self._pending: List[Dict[str, Any]] = []
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """Write one record."""
+        if self.output_format == "csv":
+            if self._csv_writer is None:
+                self._csv_writer = csv.DictWriter(
+                    self._stream,
+                    fieldnames=self.fieldnames or list(record.keys()),
+                    extrasaction="ignore" if self.fieldnames else "raise",
+                )
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow(record)
+        elif self.output_format == "jsonl":
+            self._stream.write(json.dumps(record) + "\n")
+        else:  # json, arrow, parquet
+            self._pending.append(record)
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._write_pending()
+            self._stream.flush()
 
-    if output_format == "csv":
-        if not results:
+    def write_batch(self, batch: "pyarrow.RecordBatch") -> None:
+        """Write an Arrow record batch, keeping its column types for Arrow and Parquet output."""
+        if not self._columnar:
+            self.write_all(batch.to_pylist())
             return
-        fieldnames = list(results[0].keys())
-        cm = nullcontext(sys.stdout) if output_path is None else open(output_path, "w", newline="")
-        with cm as output:
-            writer = csv.DictWriter(output, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(results)
-    elif output_format == "jsonl":
-        cm = nullcontext(sys.stdout) if output_path is None else open(output_path, "w")
-        with cm as output:
-            for row in results:
-                output.write(json.dumps(row) + "\n")
-    else:  # json
-        content = json.dumps(results, indent=2)
-        if output_path:
-            output_path.write_text(content)
+        self._write_pending()
+        if self.fieldnames:
+            batch = batch.select(self.fieldnames)
+        self._batch_writer_for(batch.schema).write_batch(batch)
+        self.count += batch.num_rows
+        self._stream.flush()
+
+    def _batch_writer_for(self, schema: "pyarrow.Schema"):
+        if self._batch_writer is None:
+            pa = _require_pyarrow()
+            if self.output_format == "parquet":
+                import pyarrow.parquet as pq
+
+                self._batch_writer = pq.ParquetWriter(self._stream, schema)
+            elif self._close_stream:
+                self._batch_writer = pa.ipc.new_file(self._stream, schema)
+            else:
+                # stdout cannot seek back to write the file footer's offsets
+                self._batch_writer = pa.ipc.new_stream(self._stream, schema)
+        return self._batch_writer
+
+    def _write_pending(self) -> None:
+        """Write buffered JSON records as the next items of the array, or as one record batch."""
+        if not self._pending:
+            return
+        if self._columnar:
+            pa = _require_pyarrow()
+            schema = self._batch_writer.schema if self._batch_writer is not None else None
+            records = self._pending
+            if self.fieldnames:
+                records = [{name: record.get(name) for name in self.fieldnames} for record in records]
+            batch = pa.RecordBatch.from_pylist(records, schema=schema)
+            self._batch_writer_for(batch.schema).write_batch(batch)
+            self._pending = []
+            return
+        # Dumping a batch at once is about twice as fast as one record at a
+        # time; strip the batch's own brackets to splice it into the array
+        body = json.dumps(self._pending, indent=2)[2:-2]
+        written = self.count - len(self._pending)
+        self._stream.write(("[\n" if written == 0 else ",\n") + body)
+        self._pending = []
+
+    def write_all(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Write every record from an iterable."""
+        for record in records:
+            self.write(record)
+
+    def close(self) -> None:
+        """Finish the output (closing the JSON array or Arrow/Parquet footer) and close the file."""
+        if self.output_format == "json":
+            self._write_pending()
+            self._stream.write("\n]\n" if self.count else "[]\n")
+        elif self._columnar:
+            self._write_pending()
+            if self._batch_writer is not None:
+                self._batch_writer.close()
+        elif self.output_format == "csv" and self._csv_writer is None and self.fieldnames:
+            csv.DictWriter(self._stream, fieldnames=self.fieldnames).writeheader()
+        if self._close_stream:
+            self._stream.close()
         else:
-            print(content)
+            self._stream.flush()
+
+    def __enter__(self) -> "RecordWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 @app.command("classify")
@@ -197,12 +512,12 @@ def classify_cmd(
     input_format: Optional[str] = typer.Option(
         None,
         "--input-format",
-        help="Input format: csv, json, jsonl. Auto-detects if not provided."
+        help="Input format: csv, json, jsonl, arrow, parquet. Auto-detects if not provided."
     ),
     output_format: Optional[str] = typer.Option(
         None,
         "--output-format",
-        help="Output format: csv, json, jsonl. Matches input if not provided."
+        help="Output format: csv, json, jsonl, arrow, parquet. Matches input if not provided."
     ),
     all_matches: bool = typer.Option(
         True,
@@ -214,13 +529,38 @@ def classify_cmd(
         "--inclusive/--exclusive",
         help="Use inclusive (default) or exclusive range bounds."
     ),
+    unit_field: Optional[str] = typer.Option(
+        None,
+        "--unit-field", "-u",
+        help="Field holding the unit of each value (e.g. 'mL'); values are converted before comparing."
+    ),
+    columns: Optional[str] = typer.Option(
+        None,
+        "--columns",
+        help="Comma-separated CSV output columns. Defaults to the keys of the first record."
+    ),
+    workers: int = typer.Option(
+        1,
+        "--workers", "-w",
+        help="Number of worker processes. Output order always matches the input."
+    ),
+    chunk_size: int = typer.Option(
+        10_000,
+        "--chunk-size",
+        help="Records sent to a worker at a time (with --workers > 1), or rows per Parquet batch."
+    ),
 ) -> None:
     """
     Classify objects against an enum's range annotations.
 
     Reads objects from CSV, JSON, or JSONL input, classifies each object
     against the specified enum, and outputs the objects with an added
-    classification field.
+    classification field. Records are streamed: CSV and JSONL input is
+    read row by row and every output format is written as it goes, so
+    memory use does not grow with the input size. With --workers, chunks
+    of records are classified in a process pool and written in input order.
+    Arrow IPC and Parquet input keeps its column types and is classified a
+    record batch at a time with the vectorized classifier.
 
     Examples:
 
@@ -232,52 +572,410 @@ def classify_cmd(
 
         # Use custom enum from different module
         valuesets classify MyEnum -m mypackage.enums -i data.jsonl
+
+        # Parquet in, Parquet out (needs valuesets[arrow]); the result is a
+        # dictionary-encoded column
+        valuesets classify IPCCLikelihoodScale -i data.parquet -o results.parquet -f probability
+
+        # Large CSV on four cores
+        valuesets classify IPCCLikelihoodScale -i big.csv -o out.csv -f probability -w 4
+
+        # Mixed JSONL records to CSV with a fixed set of columns
+        valuesets classify BMICategory -i data.jsonl -o out.csv --columns id,bmi,enum_value
     """
+    from valuesets.utils.classifier import classifier_fields, get_classifier_config
+
     # Load the enum class
     enum_class = load_enum_class(enum_name, module)
 
     # Determine detected format for matching output
     detected_format = input_format or "json"
     if input_file and input_format is None:
-        suffix = input_file.suffix.lower()
-        if suffix == ".csv":
-            detected_format = "csv"
-        elif suffix == ".jsonl":
-            detected_format = "jsonl"
-        else:
-            detected_format = "json"
+        detected_format = _format_from_suffix(input_file)
 
     # If field not provided, try to detect from enum
     if field is None:
-        detected_fields = detect_classifier_fields(enum_class)
+        detected_fields = classifier_fields(enum_class)
         if detected_fields:
             typer.echo(
                 f"Auto-detected classifier field(s): {', '.join(sorted(detected_fields))}",
                 err=True
             )
+        # Resolve the field once when it does not depend on the record
+        field = get_classifier_config(enum_class).get("classifier_field")
+        if field is None and len(detected_fields) == 1:
+            field = next(iter(detected_fields))
 
-    # Process input
-    results = []
-    for obj in read_input(input_file, input_format):
-        matches = classify(obj, enum_class, field=field, inclusive=inclusive)
+    if workers < 1:
+        raise typer.BadParameter("--workers must be at least 1")
+    if chunk_size < 1:
+        raise typer.BadParameter("--chunk-size must be at least 1")
+
+    if columns:
+        fieldnames = [name.strip() for name in columns.split(",") if name.strip()]
+    else:
+        fieldnames = None
+    target_format = _output_format(output_file, output_format, detected_format)
 
+    # Typed columnar input: classify each record batch with the vectorized path
+    if detected_format in COLUMNAR_FORMATS:
+        with RecordWriter(output_file, target_format, fieldnames=fieldnames) as writer:
+            batch_field = field
+            for i, batch in enumerate(iter_batches(input_file, detected_format, chunk_size)):
+                # Every batch has the first one's schema, so resolve the field once
+                if i == 0:
+                    batch_field = _batch_field(enum_class, field, batch.schema.names)
+                writer.write_batch(_classify_batch(
+                    batch, enum_class, batch_field, output_field,
+                    all_matches=all_matches,
+                    inclusive=inclusive,
+                    list_matches=target_format != "csv",
+                    unit_field=unit_field,
+                ))
+        return
+
+    # Stream records through the classifier to the writer
+    records = iter_records(input_file, input_format)
+    classify_records = partial(
+        _classify_records,
+        enum_class=enum_class,
+        field=field,
+        output_field=output_field,
+        all_matches=all_matches,
+        inclusive=inclusive,
+        list_matches=detected_format != "csv",
+        unit_field=unit_field,
+    )
+    if workers == 1:
+        classified = classify_records(records)
+    else:
+        classified = _classify_parallel(records, classify_records, workers, chunk_size)
+    with RecordWriter(output_file, target_format, fieldnames=fieldnames) as writer:
+        writer.write_all(classified)
+
+
+def _classify_records(
+    records: Iterable[Dict[str, Any]],
+    enum_class: Type[Enum],
+    field: Optional[str],
+    output_field: str,
+    all_matches: bool = True,
+    inclusive: bool = True,
+    list_matches: bool = True,
+    unit_field: Optional[str] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Lazily add the classification of each record under ``output_field``.
+
+    Args:
+        records: Input records (consumed one at a time)
+        enum_class: The enum to classify against
+        field: Field to classify on, or None to auto-detect per record
+        output_field: Name of the field to store the result in
+        all_matches: Store every matching member name, not just the first
+        inclusive: Use inclusive range bounds
+        list_matches: Store all matches as a list (JSON) instead of a
+            comma-separated string, and no match as None instead of ""
+        unit_field: Field holding the unit of each value, if any
+
+    Yields:
+        The input records, updated in place
+    """
+    from valuesets.utils.classifier import classify
+
+    no_match = None if list_matches else ""
+    for obj in records:
+        matches = classify(obj, enum_class, field=field, inclusive=inclusive, unit_field=unit_field)
         if matches:
             if all_matches:
-                # Store all match names as comma-separated or list
                 match_names = [m.name for m in matches]
-                if detected_format == "json" or detected_format == "jsonl":
-                    obj[output_field] = match_names
-                else:
-                    obj[output_field] = ",".join(match_names)
+                obj[output_field] = match_names if list_matches else ",".join(match_names)
             else:
                 obj[output_field] = matches[0].name
         else:
-            obj[output_field] = None if detected_format != "csv" else ""
+            obj[output_field] = no_match
+        yield obj
+
+
+# Set in each classify worker process by _init_classify_worker
+_worker_classify_records: Optional[Callable[[Iterable[Dict[str, Any]]], Iterator[Dict[str, Any]]]] = None
+
+
+def _batch_field(enum_class: Type[Enum], field: Optional[str], column_names: List[str]) -> Optional[str]:
+    """Get the field to classify on: the given one, else the first detected field among the columns."""
+    from valuesets.utils.classifier import classifier_fields
+
+    if field is not None:
+        return field
+    detected_fields = classifier_fields(enum_class)
+    return next((f for f in detected_fields if f in column_names), next(iter(detected_fields), None))
+
+
+def _classify_batch(
+    batch: "pyarrow.RecordBatch",
+    enum_class: Type[Enum],
+    field: Optional[str],
+    output_field: str,
+    all_matches: bool = True,
+    inclusive: bool = True,
+    list_matches: bool = True,
+    unit_field: Optional[str] = None,
+) -> "pyarrow.RecordBatch":
+    """
+    Classify the rows of an Arrow record batch column-wise with classify_array.
+
+    The result is appended as a dictionary-encoded column of member names
+    (indices are the enum's stable codes); with ``all_matches`` and
+    ``list_matches`` it is a list of them. Rows without a numeric value or
+    a match get null. Matches are listed in definition order, as in
+    _classify_records.
+
+    Args:
+        batch: The input rows
+        enum_class: The enum to classify against
+        field: Field to classify on, or None to use the first detected
+            field present in the batch; an enum without classifier fields
+            gives an all-null column, as for records
+        output_field: Name of the column to append
+        all_matches: Store every matching member name, not just the first
+        inclusive: Use inclusive range bounds
+        list_matches: Store all matches as a list instead of a
+            comma-separated string
+        unit_field: Column holding the unit of each value, if any
+    """
+    pa = _require_pyarrow()
+    import numpy as np
+
+    from valuesets.utils.classifier import classify_array
+    from valuesets.utils.codes import code_table
+
+    table = code_table(enum_class)
+    names = pa.array(table.names, type=pa.string())
+    field = _batch_field(enum_class, field, batch.schema.names)
+    column = batch.column(field) if field is not None and field in batch.schema.names else None
+    if column is not None and (pa.types.is_integer(column.type) or pa.types.is_floating(column.type)
+                               or pa.types.is_decimal(column.type)):
+        values = column.cast(pa.float64()).to_numpy(zero_copy_only=False)
+    else:
+        values = np.full(batch.num_rows, np.nan)
+    units = None
+    if unit_field is not None and unit_field in batch.schema.names:
+        units = batch.column(unit_field).to_numpy(zero_copy_only=False)
+
+    if not all_matches:
+        if field is None:
+            codes = np.full(batch.num_rows, table.missing, dtype=table.dtype_name)
+        else:
+            codes = classify_array(values, enum_class, field, inclusive=inclusive, units=units)
+        result = pa.DictionaryArray.from_arrays(
+            pa.array(codes.astype(np.int32), mask=codes == table.missing), names
+        )
+    else:
+        if field is None:
+            multi_hot = np.zeros((batch.num_rows, len(table.members)), dtype=bool)
+        else:
+            multi_hot = classify_array(values, enum_class, field, inclusive=inclusive, all_matches=True,
+                                       units=units)
+        # Reorder the member axis from code order to definition order
+        definition_codes = np.array([table.code_of(member) for member in enum_class], dtype=np.int32)
+        rows, positions = np.nonzero(multi_hot[:, definition_codes])
+        counts = np.bincount(rows, minlength=batch.num_rows)
+        no_match = counts == 0
+        if list_matches:
+            offsets = np.zeros(batch.num_rows + 1, dtype=np.int32)
+            np.cumsum(counts, out=offsets[1:])
+            result = pa.ListArray.from_arrays(
+                pa.array(offsets),
+                pa.DictionaryArray.from_arrays(pa.array(definition_codes[positions]), names),
+                mask=pa.array(no_match),
+            )
+        else:
+            # Each distinct set of matches becomes one dictionary entry
+            match_sets, indices = np.unique(multi_hot, axis=0, return_inverse=True)
+            labels = [",".join(member.name for member in enum_class if row[table.code_of(member)])
+                      for row in match_sets]
+            result = pa.DictionaryArray.from_arrays(
+                pa.array(indices.reshape(-1).astype(np.int32), mask=no_match), pa.array(labels, type=pa.string())
+            )
+    if output_field in batch.schema.names:
+        return batch.set_column(batch.schema.get_field_index(output_field), output_field, result)
+    return batch.append_column(output_field, result)
+
 
-        results.append(obj)
+def _init_classify_worker(classify_records: Callable) -> None:
+    global _worker_classify_records
+    _worker_classify_records = classify_records
 
-    # Write output
-    write_output(results, output_file, output_format, detected_format)
+
+def _classify_chunk(chunk: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return list(_worker_classify_records(chunk))
+
+
+def _classify_parallel(
+    records: Iterable[Dict[str, Any]],
+    classify_records: Callable[[Iterable[Dict[str, Any]]], Iterator[Dict[str, Any]]],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Classify records in a process pool, yielding results in input order.
+
+    The resolved classify configuration is sent to each worker once, when
+    it starts; afterwards only chunks of records travel between processes.
+    At most two chunks per worker are in flight, so memory stays bounded
+    however long the input is.
+
+    Args:
+        records: Input records (consumed one chunk at a time)
+        classify_records: _classify_records with everything but the records bound
+        workers: Number of worker processes
+        chunk_size: Records per chunk
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    records = iter(records)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_classify_worker,
+        initargs=(classify_records,),
+    ) as pool:
+        in_flight = deque()
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+            in_flight.append(pool.submit(_classify_chunk, chunk))
+            if len(in_flight) >= 2 * workers:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
+
+
+def _normalize_csv(normalize, field: str, input_path: Optional[Path], output_path: Optional[Path],
+                   output_field: str, match_field: str) -> None:
+    """Normalize one column of a CSV stream, appending the member and match type columns."""
+    in_cm = nullcontext(sys.stdin) if input_path is None else open(input_path, newline="")
+    out_cm = nullcontext(sys.stdout) if output_path is None else open(output_path, "w", newline="")
+    with in_cm as source, out_cm as target:
+        reader = csv.reader(source)
+        writer = csv.writer(target)
+        header = next(reader, None)
+        if header is None:
+            return
+        if field not in header:
+            raise typer.BadParameter(f"Field '{field}' not found in CSV header")
+        column = header.index(field)
+        writer.writerow(header + [output_field, match_field])
+        for row in reader:
+            result = normalize(row[column] if column < len(row) else None)
+            row.append(result.member.name if result.member is not None else "")
+            row.append(result.match_type or "")
+            writer.writerow(row)
+
+
+@app.command("normalize")
+def normalize_cmd(
+    enum_name: str = typer.Argument(
+        ...,
+        help="Name of the enum to normalize to (e.g., 'BiologicalSexEnum')"
+    ),
+    field: str = typer.Option(
+        ...,
+        "--field", "-f",
+        help="Field (column) holding the raw values."
+    ),
+    input_file: Optional[Path] = typer.Option(
+        None,
+        "--input", "-i",
+        help="Input file path. Reads from stdin if not provided."
+    ),
+    output_file: Optional[Path] = typer.Option(
+        None,
+        "--output", "-o",
+        help="Output file path. Writes to stdout if not provided."
+    ),
+    output_field: str = typer.Option(
+        "enum_value",
+        "--output-field",
+        help="Name of the output field for the matched member name."
+    ),
+    match_field: str = typer.Option(
+        "match_type",
+        "--match-field",
+        help="Name of the output field for how the value matched "
+             "(name, value, meaning, label, ambiguous or empty)."
+    ),
+    unmatched_report: Optional[Path] = typer.Option(
+        None,
+        "--unmatched-report",
+        help="Write unmatched values and their counts to this CSV file."
+    ),
+    module: str = typer.Option(
+        "valuesets.enums",
+        "--module", "-m",
+        help="Python module containing the enum class."
+    ),
+    input_format: Optional[str] = typer.Option(
+        None,
+        "--input-format",
+        help="Input format: csv, json, jsonl, arrow, parquet. Auto-detects if not provided."
+    ),
+    output_format: Optional[str] = typer.Option(
+        None,
+        "--output-format",
+        help="Output format: csv, json, jsonl, arrow, parquet. Matches input if not provided."
+    ),
+) -> None:
+    """
+    Normalize a column of raw strings to enum members.
+
+    Each value is matched by member name, value, ontology meaning (CURIE or
+    IRI) or label (title or alias, ignoring case and punctuation). Input is
+    streamed and distinct values are only matched once. A summary is
+    printed to stderr.
+
+    Examples:
+
+        valuesets normalize BiologicalSexEnum -f sex -i samples.csv -o out.csv
+
+        valuesets normalize CountryCodeISO2Enum -f country -i rows.jsonl --unmatched-report unmatched.csv
+    """
+    from valuesets.utils.normalize import Normalizer
+
+    enum_class = load_enum_class(enum_name, module)
+    if not hasattr(enum_class, "match"):
+        raise typer.BadParameter(f"Enum '{enum_name}' is not a RichEnum")
+
+    if input_format is None and input_file is not None:
+        input_format = _format_from_suffix(input_file)
+    if output_format is None:
+        output_format = _format_from_suffix(output_file) if output_file else (input_format or "csv")
+    empty = "" if output_format == "csv" else None
+
+    normalizer = Normalizer(enum_class)
+    normalize = normalizer.normalize
+    if input_format == "csv" and output_format == "csv":
+        # Row lists instead of dicts: CSV to CSV is dominated by parsing
+        _normalize_csv(normalize, field, input_file, output_file, output_field, match_field)
+    else:
+        with RecordWriter(output_file, output_format) as writer:
+            for record in iter_records(input_file, input_format, convert_numbers=False):
+                result = normalize(record.get(field))
+                record[output_field] = result.member.name if result.member is not None else empty
+                record[match_field] = result.match_type or empty
+                writer.write(record)
+
+    typer.echo(
+        f"Normalized {normalizer.total} value(s): {normalizer.matched} matched, "
+        f"{normalizer.total - normalizer.matched} unmatched "
+        f"({len(normalizer.unmatched)} distinct)",
+        err=True,
+    )
+    if unmatched_report is not None:
+        with open(unmatched_report, "w", newline="") as f:
+            report = csv.writer(f)
+            report.writerow(["value", "count"])
+            report.writerows(normalizer.unmatched.most_common())
 
 
 @app.command()
@@ -297,10 +995,44 @@ def list_enums(
     List available enums in a module.
 
     Shows all enum classes available for classification, optionally
-    filtering to only those with range annotations.
+    filtering to only those with range annotations. For valuesets.enums
+    the classifier fields are read from the packaged registry, without
+    importing the enum modules.
     """
+    enums_found = _registry_enum_fields(module, classifiable_only)
+    if enums_found is None:
+        enums_found = _scan_enum_fields(module, classifiable_only)
+
+    if not enums_found:
+        typer.echo("No enums found.", err=True)
+        raise typer.Exit(1)
+
+    for name, fields in sorted(enums_found):
+        if fields:
+            typer.echo(f"{name} (fields: {', '.join(fields)})")
+        else:
+            typer.echo(name)
+
+
+def _registry_enum_fields(module: str, classifiable_only: bool) -> Optional[List[tuple]]:
+    """Get (enum name, sorted fields or None) pairs from the packaged registry, if it covers module."""
+    from valuesets.registry import packaged_registry
+
+    registry = packaged_registry() if module == "valuesets.enums" else None
+    if registry is None:
+        return None
+    classifiable = registry.classifiable_enums()
+    if classifiable_only:
+        return list(classifiable.items())
+    return [(name, classifiable.get(name)) for name in registry.enum_names()]
+
+
+def _scan_enum_fields(module: str, classifiable_only: bool) -> List[tuple]:
+    """Get (enum name, sorted fields or None) pairs by importing a module and scanning its enums."""
     import importlib
 
+    from valuesets.utils.classifier import detect_classifier_fields
+
     try:
         mod = importlib.import_module(module)
     except ImportError as e:
@@ -311,23 +1043,10 @@ def list_enums(
     for attr_name in dir(mod):
         attr = getattr(mod, attr_name)
         if isinstance(attr, type) and issubclass(attr, Enum) and attr is not Enum:
-            if classifiable_only:
-                fields = detect_classifier_fields(attr)
-                if fields:
-                    enums_found.append((attr_name, sorted(fields)))
-            else:
-                fields = detect_classifier_fields(attr)
+            fields = detect_classifier_fields(attr)
+            if fields or not classifiable_only:
                 enums_found.append((attr_name, sorted(fields) if fields else None))
-
-    if not enums_found:
-        typer.echo("No enums found.", err=True)
-        raise typer.Exit(1)
-
-    for name, fields in sorted(enums_found):
-        if fields:
-            typer.echo(f"{name} (fields: {', '.join(fields)})")
-        else:
-            typer.echo(name)
+    return enums_found
 
 
 @app.command()
@@ -345,36 +1064,246 @@ def inspect(
     """
     Inspect an enum's classifier configuration.
 
-    Shows the enum's permissible values and their range annotations.
+    Shows the enum's permissible values and their range annotations. For
+    valuesets.enums the parsed ranges are read from the packaged registry.
     """
-    from valuesets.utils.classifier import get_classifier_config, get_range_annotations
+    from valuesets.registry import packaged_registry
 
-    enum_class = load_enum_class(enum_name, module)
+    registry = packaged_registry() if module == "valuesets.enums" else None
+    if registry is not None and enum_name in registry:
+        config = registry.get_enum(enum_name).enum_metadata
+        fields = registry.classifier_fields(enum_name)
+        member_names = [member.name for member in registry.members(enum_name)]
+        ranges = {
+            (field, r.member_name): (r.min_value, r.max_value)
+            for field in fields for r in registry.classifier_ranges(enum_name, field)
+        }
+    else:
+        from valuesets.utils.classifier import detect_classifier_fields, get_classifier_config, get_range_annotations
+
+        enum_class = load_enum_class(enum_name, module)
+        config = get_classifier_config(enum_class)
+        fields = sorted(detect_classifier_fields(enum_class))
+        member_names = [member.name for member in enum_class]
+        mappings = config.get("annotation_mappings")
+        ranges = {
+            (field, member.name): get_range_annotations(member, field, mappings)
+            for field in fields for member in enum_class
+        }
 
     # Show enum-level config
-    config = get_classifier_config(enum_class)
     if config:
         typer.echo("Enum configuration:")
         typer.echo(f"  {json.dumps(config, indent=2)}")
         typer.echo()
 
-    # Detect fields
-    fields = detect_classifier_fields(enum_class)
     if fields:
-        typer.echo(f"Detected classifier fields: {', '.join(sorted(fields))}")
+        typer.echo(f"Detected classifier fields: {', '.join(fields)}")
         typer.echo()
 
     # Show each member's ranges
     typer.echo("Permissible values:")
-    for member in enum_class:
-        typer.echo(f"  {member.name}:")
-        if fields:
-            for field in sorted(fields):
-                min_val, max_val = get_range_annotations(member, field)
-                if min_val is not None or max_val is not None:
-                    min_str = str(min_val) if min_val is not None else "-inf"
-                    max_str = str(max_val) if max_val is not None else "+inf"
-                    typer.echo(f"    {field}: [{min_str}, {max_str}]")
+    for name in member_names:
+        typer.echo(f"  {name}:")
+        for field in fields:
+            min_val, max_val = ranges.get((field, name), (None, None))
+            if min_val is not None or max_val is not None:
+                min_str = str(min_val) if min_val is not None else "-inf"
+                max_str = str(max_val) if max_val is not None else "+inf"
+                typer.echo(f"    {field}: [{min_str}, {max_str}]")
+
+
+@app.command("which-enum")
+def which_enum_cmd(
+    curies: Optional[List[str]] = typer.Argument(
+        None,
+        help="CURIEs or IRIs to look up. Reads one per line from --input or stdin if not provided."
+    ),
+    input_file: Optional[Path] = typer.Option(
+        None,
+        "--input", "-i",
+        help="File with one CURIE or IRI per line."
+    ),
+    output_format: str = typer.Option(
+        "tsv",
+        "--output-format",
+        help="Output format: tsv, json, jsonl."
+    ),
+) -> None:
+    """
+    Find the enums and members mapped to ontology terms.
+
+    Matches member meanings and the schema mappings (exact, close, narrow,
+    broad, related) of every enum in valuesets.enums, using the index in
+    the packaged registry; no enum module is imported.
+
+    Examples:
+
+        valuesets which-enum NCIT:C20197 BSPO:0000000
+
+        cut -f1 terms.tsv | valuesets which-enum --output-format jsonl
+    """
+    from valuesets.curie_index import get_curie_index
+
+    if not curies:
+        lines = input_file.read_text().splitlines() if input_file else sys.stdin.read().splitlines()
+        curies = [line.strip() for line in lines if line.strip()]
+
+    index = get_curie_index()
+    results = []
+    unmatched = 0
+    for curie in curies:
+        hits = index.hits(curie)
+        if not hits:
+            unmatched += 1
+        results.append({
+            "curie": curie,
+            "matches": [
+                {
+                    "enum": hit.enum_name,
+                    "member": hit.member_name,
+                    "predicate": hit.predicate,
+                    "module": hit.module,
+                }
+                for hit in hits
+            ],
+        })
+
+    if output_format == "json":
+        typer.echo(json.dumps(results, indent=2))
+    elif output_format == "jsonl":
+        for result in results:
+            typer.echo(json.dumps(result))
+    else:
+        typer.echo("curie\tenum\tmember\tpredicate\tmodule")
+        for result in results:
+            if not result["matches"]:
+                typer.echo(f"{result['curie']}\t\t\t\t")
+            for match in result["matches"]:
+                typer.echo(
+                    f"{result['curie']}\t{match['enum']}\t{match['member']}\t"
+                    f"{match['predicate']}\t{match['module']}"
+                )
+
+    if unmatched:
+        typer.echo(f"{unmatched} of {len(curies)} term(s) not found", err=True)
+
+
+@app.command("labels")
+def labels_cmd(
+    store_path: Optional[Path] = typer.Option(
+        None,
+        "--store", "-s",
+        help="Label store file (default: $VALUESETS_LABEL_STORE or cache/labels.sqlite)."
+    ),
+    import_dir: Optional[Path] = typer.Option(
+        None,
+        "--import",
+        help="Import <prefix>/terms.csv cache files from this directory."
+    ),
+    export_dir: Optional[Path] = typer.Option(
+        None,
+        "--export",
+        help="Write the stored labels as <prefix>/terms.csv files under this directory."
+    ),
+) -> None:
+    """
+    Show, import or export the shared ontology label store.
+
+    The validator, the SSSOM generator and the documentation scripts look
+    labels up in this store before asking an ontology, and add what they
+    resolve.
+
+    Examples:
+
+        valuesets labels --import cache
+
+        valuesets labels --export cache
+    """
+    from valuesets.utils.label_store import LabelStore
+
+    store = LabelStore(store_path)
+    if import_dir:
+        typer.echo(f"Imported {store.import_csv_tree(import_dir)} labels from {import_dir}", err=True)
+    if export_dir:
+        typer.echo(f"Exported {store.export_csv_tree(export_dir)} labels to {export_dir}", err=True)
+
+    typer.echo("prefix\tterms\tnot_found")
+    for prefix in store.prefixes():
+        labels = store.labels(prefix)
+        typer.echo(f"{prefix}\t{len(labels)}\t{sum(label is None for label in labels.values())}")
+
+
+@app.command("serve")
+def serve_cmd(
+    host: str = typer.Option(
+        "127.0.0.1",
+        "--host",
+        help="Interface to listen on."
+    ),
+    port: int = typer.Option(
+        8765,
+        "--port", "-p",
+        help="TCP port to listen on."
+    ),
+    unix_socket: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help="Listen on this Unix socket instead of a TCP port."
+    ),
+    workers: int = typer.Option(
+        min(4, os.cpu_count() or 1),
+        "--workers", "-w",
+        help="Worker processes for large batches; 0 runs every batch in a thread pool."
+    ),
+    inline_limit: int = typer.Option(
+        2_000,
+        "--inline-limit",
+        help="Batches with at most this many items are answered without the worker pool."
+    ),
+    chunk_size: int = typer.Option(
+        20_000,
+        "--chunk-size",
+        help="Items per worker job when a large batch is split across workers."
+    ),
+    preload: Optional[str] = typer.Option(
+        None,
+        "--preload",
+        help="Comma-separated enums to load and compile at start-up."
+    ),
+) -> None:
+    """
+    Serve batch classify, normalize and lookup requests over HTTP.
+
+    Enums, compiled classifiers, normalizer caches and the CURIE index stay
+    in memory between requests. Endpoints take and return JSON: POST
+    /classify, /normalize and /lookup, and GET /health (see
+    valuesets.server for the request formats).
+
+    Examples:
+
+        valuesets serve --port 8765 --workers 4 --preload IPCCLikelihoodScale
+
+        curl -s localhost:8765/classify -d '{"enum": "ProcessScaleEnum", "values": [0.5], "units": "mL"}'
+
+        valuesets serve --socket /tmp/valuesets.sock
+    """
+    import asyncio
+
+    from valuesets.server import RequestError, serve
+
+    if workers < 0:
+        raise typer.BadParameter("--workers must be at least 0")
+    if chunk_size < 1:
+        raise typer.BadParameter("--chunk-size must be at least 1")
+    names = [name.strip() for name in preload.split(",") if name.strip()] if preload else []
+    try:
+        asyncio.run(serve(
+            host, port, unix_socket,
+            workers=workers, inline_limit=inline_limit, chunk_size=chunk_size, preload=names,
+        ))
+    except RequestError as e:
+        raise typer.BadParameter(e.message)
 
 
 def main():
@@ -0,0 +1,124 @@
+"""
+Package-wide index from ontology CURIEs to enum members.
+
+Answers "which value sets and members map to this term?" for every enum in
+valuesets.enums, by member meaning and by the exact, close, narrow, broad and
+related mappings declared in the source schemas. The index is persisted in
+the enum registry file (built once per release by
+valuesets.generators.registry_generator), loaded into a dict on first use,
+and only imports the enum modules of the members it returns.
+
+Examples:
+    >>> index = get_curie_index()
+    >>> hit = index.hits("BSPO:0000000")[0]
+    >>> (hit.enum_name, hit.member_name, hit.predicate)
+    ('AnatomicalSide', 'LEFT', 'meaning')
+    >>> enum_class, member = which_enum("http://purl.obolibrary.org/obo/BSPO_0000000")[0]
+    >>> member is enum_class.LEFT
+    True
+    >>> which_enum("FAKE:0000000")
+    []
+"""
+
+import importlib
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Type, Union
+
+from valuesets.generators.rich_enum import RichEnum, curie_key
+from valuesets.registry import EnumRegistry, get_registry
+
+
+class CurieHit(NamedTuple):
+    """An enum member indexed under a CURIE."""
+    module: str
+    enum_name: str
+    member_name: str
+    predicate: str
+
+    def resolve(self) -> Tuple[Type[RichEnum], RichEnum]:
+        """Import the enum class and return (enum class, member)."""
+        enum_class = getattr(importlib.import_module(self.module), self.enum_name)
+        return enum_class, enum_class[self.member_name]
+
+
+class CurieIndex:
+    """
+    In-memory index from normalized CURIE to the enum members mapped to it.
+
+    Hits are ordered by module, enum and member position, and include enums
+    shadowed by a same-named enum in another module.
+    """
+
+    def __init__(self, entries: Dict[str, Tuple[CurieHit, ...]]):
+        self._entries = entries
+
+    @classmethod
+    def from_registry(cls, registry: Optional[EnumRegistry] = None) -> 'CurieIndex':
+        """Load the index persisted in a registry file (the packaged one by default)."""
+        registry = registry or get_registry()
+        grouped: Dict[str, List[CurieHit]] = {}
+        for row in registry.curie_rows():
+            grouped.setdefault(row.curie, []).append(
+                CurieHit(row.module, row.enum_name, row.member_name, row.predicate)
+            )
+        return cls({curie: tuple(hits) for curie, hits in grouped.items()})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, curie: str) -> bool:
+        return bool(curie) and curie_key(curie) in self._entries
+
+    def hits(self, curie: Optional[str]) -> Tuple[CurieHit, ...]:
+        """
+        Find the members mapped to a CURIE without importing any enum module.
+
+        Args:
+            curie: The ontology term as a CURIE or expanded IRI
+
+        Returns:
+            Matching hits, or an empty tuple
+        """
+        if not curie:
+            return ()
+        return self._entries.get(curie_key(curie), ())
+
+    def lookup(self, curie: Optional[str]) -> List[Tuple[Type[RichEnum], RichEnum]]:
+        """
+        Find the (enum class, member) pairs mapped to a CURIE.
+
+        Args:
+            curie: The ontology term as a CURIE or expanded IRI
+
+        Returns:
+            Matching (enum class, member) pairs
+        """
+        return [hit.resolve() for hit in self.hits(curie)]
+
+    def lookup_many(self, curies: Iterable[str]) -> Dict[str, List[Tuple[Type[RichEnum], RichEnum]]]:
+        """Look up many CURIEs at once, keyed by the CURIEs as given."""
+        return {curie: self.lookup(curie) for curie in curies}
+
+
+@lru_cache(maxsize=None)
+def _index_for(path: Path) -> CurieIndex:
+    return CurieIndex.from_registry(get_registry(path))
+
+
+def get_curie_index(path: Optional[Union[str, Path]] = None) -> CurieIndex:
+    """Get the shared CURIE index for a registry file (the packaged one by default)."""
+    return _index_for(Path(path) if path else get_registry().path)
+
+
+def which_enum(curie: str) -> List[Tuple[Type[RichEnum], RichEnum]]:
+    """
+    Find every (enum class, member) in the package mapped to a CURIE.
+
+    Args:
+        curie: The ontology term as a CURIE or expanded IRI
+
+    Returns:
+        Matching (enum class, member) pairs
+    """
+    return get_curie_index().lookup(curie)
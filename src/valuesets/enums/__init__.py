@@ -5,6 +5,9 @@ This module provides convenient access to all enum definitions.
 Each enum includes rich metadata (descriptions, ontology mappings, annotations)
 while maintaining full Python enum compatibility.
 
+Enums are imported lazily: only the module defining a requested enum is
+loaded, so importing a single enum does not pay for the whole collection.
+
 Usage:
     from valuesets.enums import Presenceenum, AnatomicalSide
     
@@ -14,236 +17,924 @@ Usage:
 
 # flake8: noqa
 
-# Academic domain
-from .academic.organizations import USDOENationalLaboratoryEnum, USFederalFundingAgencyEnum, NIHInstituteCenterEnum, StandardsOrganizationEnum, UNSpecializedAgencyEnum
-from .academic.research import PublicationType, PeerReviewStatus, AcademicDegree, LicenseType, ResearchField, FundingType, ManuscriptSection, ResearchRole, OpenAccessType, CitationStyle
-
-# Analytical_Chemistry domain
-from .analytical_chemistry.mass_spectrometry import RelativeTimeEnum, PresenceEnum, MassSpectrometerFileFormat, MassSpectrometerVendor, ChromatographyType, DerivatizationMethod, MetabolomicsAssayType, AnalyticalControlType
-
-# Bio domain
-from .bio.assays.enzymology import EnzymologyAssayEnum
-from .bio.assays.immunology import ImmunologyAssayEnum
-from .bio.assays.nf_osi_assays import SequencingAssayEnum, ImagingAssayEnum, MassSpectrometryAssayEnum, CellBasedAssayEnum, ClinicalBehavioralAssayEnum
-from .bio.assays.protein_engineering import ProteinEngineeringAssayEnum
-from .bio.assays.toxicology import ToxicologyAssayEnum
-from .bio.bgc_categories import BgcCategoryEnum
-from .bio.biological_colors import EyeColorEnum, HairColorEnum, FlowerColorEnum, AnimalCoatColorEnum, SkinToneEnum, PlantLeafColorEnum
-from .bio.biosafety import BiosafetyLevelEnum
-from .bio.cell_cycle import CellCyclePhase, MitoticPhase, CellCycleCheckpoint, MeioticPhase, CellCycleRegulator, CellProliferationState, DNADamageResponse
-from .bio.cell_free_expression import CellFreeExpressionSystemEnum, CellFreeReactionFormatEnum, EnergyRegenerationSubstrateEnum, CellFreeApplicationEnum
-from .bio.currency_chemicals import CurrencyChemical
-from .bio.developmental_stages import HumanDevelopmentalStage, MouseDevelopmentalStage, HumanAgeGroupEnum, MousePostnatalAgeGroupEnum
-from .bio.expression_units import ExpressionUnitEnum, ConcentrationUnitEnum, TimeUnitEnum
-from .bio.gene_perturbation import GenePerturbationMethodEnum, GeneKnockoutMethodEnum, GenotypeEnum, VectorTypeEnum
-from .bio.genome_features import GenomeFeatureType
-from .bio.genomics import CdsPhaseType, ContigCollectionType, StrandType, SequenceType
-from .bio.go_aspect import GOAspect
-from .bio.go_causality import CausalPredicateEnum
-from .bio.go_evidence import GOEvidenceCode, GOElectronicMethods
-from .bio.insdc_geographic_locations import InsdcGeographicLocationEnum
-from .bio.insdc_missing_values import InsdcMissingValueEnum
-from .bio.lipid_categories import RelativeTimeEnum, PresenceEnum, LipidCategory
-from .bio.pato import ColorEnum, ShapeEnum, RelativeChangeEnum, IntensityEnum, TextureEnum, PATOBiologicalSexEnum, MaturityEnum, ViabilityEnum, CellularityEnum, SpatialPatternEnum
-from .bio.plant_biology import PlantSexualSystem
-from .bio.plant_developmental_stages import PlantDevelopmentalStage
-from .bio.plant_experimental_conditions import PlantStudyConditionEnum, SeasonalEnvironmentExposureEnum, EcologicalEnvironmentExposureEnum, PlantGrowthMediumExposureEnum
-from .bio.plant_sex import PlantSexEnum
-from .bio.protein_evidence import ProteinEvidenceForExistence, RefSeqStatusType
-from .bio.protein_structure_features import SecondaryStructureType, LocalStructuralFeature
-from .bio.proteomics_standards import RelativeTimeEnum, PresenceEnum, PeakAnnotationSeriesLabel, PeptideIonSeries, MassErrorUnit
-from .bio.psi_mi import InteractionDetectionMethod, InteractionType, ExperimentalRole, BiologicalRole, ParticipantIdentificationMethod, FeatureType, InteractorType, ConfidenceScore, ExperimentalPreparation
-from .bio.relationship_to_oxygen import RelToOxygenEnum
-from .bio.sequence_alphabets import DNABaseEnum, DNABaseExtendedEnum, RNABaseEnum, RNABaseExtendedEnum, AminoAcidEnum, AminoAcidExtendedEnum, CodonEnum, NucleotideModificationEnum, SequenceQualityEnum
-from .bio.sequence_chemistry import IUPACNucleotideCode, StandardAminoAcid, IUPACAminoAcidCode, SequenceAlphabet, SequenceQualityEncoding, GeneticCodeTable, SequenceStrand, SequenceTopology, SequenceModality
-from .bio.sequencing_platforms import SequencingPlatform, SequencingChemistry, LibraryPreparation, SequencingApplication, ReadType, SequenceFileFormat, DataProcessingLevel
-from .bio.specimen_processing import SpecimenPreparationMethodEnum, TissuePreservationEnum, SpecimenCollectionMethodEnum, SpecimenTypeEnum, AnalyteTypeEnum, SourceMaterialTypeEnum, SpecimenCreationActivityTypeEnum, SpecimenProcessingActivityTypeEnum, SpecimenQualityObservationTypeEnum, SpecimenQualityObservationMethodEnum, SpecimenQuantityObservationTypeEnum, SectionLocationEnum
-from .bio.structural_biology import SampleType, StructuralBiologyTechnique, CryoEMPreparationType, CryoEMGridType, VitrificationMethod, CrystallizationMethod, XRaySource, Detector, WorkflowType, FileFormat, DataType, ProcessingStatus, CoordinationGeometry, MetalLigandType, ProteinModificationType
-from .bio.taxonomy import CommonOrganismTaxaEnum, TaxonomicRank, BiologicalKingdom
-from .bio.transplantation import TransplantationTypeEnum, XenograftModelEnum, ModelSystemTypeEnum
-from .bio.trophic_levels import TrophicLevelEnum
-from .bio.uniprot_species import UniProtSpeciesCode
-from .bio.viral_genome_types import ViralGenomeTypeEnum
-
-# Bioprocessing domain
-from .bioprocessing.biomanufacturing import BiomanufacturingScaleType, BioproductCategoryType, BioprocessOptimizationType
-from .bioprocessing.scale_up import ProcessScaleEnum, BioreactorTypeEnum, FermentationModeEnum, OxygenationStrategyEnum, AgitationTypeEnum, DownstreamProcessEnum, FeedstockTypeEnum, ProductTypeEnum, SterilizationMethodEnum
-
-# Business domain
-from .business.human_resources import EmploymentTypeEnum, JobLevelEnum, HRFunctionEnum, CompensationTypeEnum, PerformanceRatingEnum, RecruitmentSourceEnum, TrainingTypeEnum, EmployeeStatusEnum, WorkArrangementEnum, BenefitsCategoryEnum
-from .business.industry_classifications import NAICSSectorEnum, EconomicSectorEnum, BusinessActivityTypeEnum, IndustryMaturityEnum, MarketStructureEnum, IndustryRegulationLevelEnum
-from .business.management_operations import ManagementMethodologyEnum, StrategicFrameworkEnum, OperationalModelEnum, PerformanceMeasurementEnum, DecisionMakingStyleEnum, LeadershipStyleEnum, BusinessProcessTypeEnum
-from .business.organizational_structures import LegalEntityTypeEnum, OrganizationalStructureEnum, ManagementLevelEnum, CorporateGovernanceRoleEnum, BusinessOwnershipTypeEnum, BusinessSizeClassificationEnum, BusinessLifecycleStageEnum
-from .business.quality_management import QualityStandardEnum, QualityMethodologyEnum, QualityControlTechniqueEnum, QualityAssuranceLevelEnum, ProcessImprovementApproachEnum, QualityMaturityLevelEnum
-from .business.supply_chain import ProcurementTypeEnum, VendorCategoryEnum, SupplyChainStrategyEnum, LogisticsOperationEnum, SourcingStrategyEnum, SupplierRelationshipTypeEnum, InventoryManagementApproachEnum
-
-# Chemistry domain
-from .chemistry.chemical_entities import SubatomicParticleEnum, BondTypeEnum, PeriodicTableBlockEnum, ElementFamilyEnum, ElementMetallicClassificationEnum, HardOrSoftEnum, BronstedAcidBaseRoleEnum, LewisAcidBaseRoleEnum, OxidationStateEnum, ChiralityEnum, NanostructureMorphologyEnum
-from .chemistry.reaction_directionality import RelativeTimeEnum, PresenceEnum, ReactionDirectionality
-from .chemistry.reactions import ReactionTypeEnum, ReactionMechanismEnum, CatalystTypeEnum, ReactionConditionEnum, ReactionRateOrderEnum, EnzymeClassEnum, SolventClassEnum, ThermodynamicParameterEnum
-
-# Clinical domain
-from .clinical.genetics import ModeOfInheritance
-from .clinical.nih_demographics import RaceOMB1997Enum, EthnicityOMB1997Enum, BiologicalSexEnum, AgeGroupEnum, ParticipantVitalStatusEnum, RecruitmentStatusEnum, StudyPhaseEnum
-from .clinical.phenopackets import KaryotypicSexEnum, PhenotypicSexEnum, AllelicStateEnum, LateralityEnum, OnsetTimingEnum, ACMGPathogenicityEnum, TherapeuticActionabilityEnum, InterpretationProgressEnum, RegimenStatusEnum, DrugResponseEnum
-from .clinical.provenance import ConditionProvenanceEnum, VisitProvenanceEnum, DrugExposureProvenanceEnum, StatusEnum, HistoricalStatusEnum, ResearchProjectTypeEnum
-
-# Computing domain
-from .computing.croissant_ml import MLDataType, DatasetEncodingFormat, DatasetSplitType, MLLicenseType, MLFieldRole, CompressionFormat, MLMediaType, MLModalityType
-from .computing.data_centers import DataCenterCoolingType, DataCenterTierLevel
-from .computing.file_formats import ImageFileFormatEnum, DocumentFormatEnum, DataFormatEnum, ArchiveFormatEnum, VideoFormatEnum, AudioFormatEnum, ProgrammingLanguageFileEnum, NetworkProtocolEnum
-from .computing.frontier_ai_models import FrontierModelEnum
-from .computing.geospatial_formats import GeospatialRasterFormat, GeospatialVectorFormat
-from .computing.maturity_levels import TechnologyReadinessLevel, SoftwareMaturityLevel, CapabilityMaturityLevel, StandardsMaturityLevel, ProjectMaturityLevel, DataMaturityLevel, OpenSourceMaturityLevel
-from .computing.microelectronics import SemiconductorMaterialType, ChipFabricationNodeType
-from .computing.mime_types import MimeType, MimeTypeCategory, TextCharset, CompressionType
-from .computing.ontologies import OWLProfileEnum
-from .computing.quantum import QubitType, QuantumAlgorithmCategoryType
-
-# Core domain
-from .confidence_levels import RelativeTimeEnum, PresenceEnum, ConfidenceLevel, CIOConfidenceLevel, OBCSCertaintyLevel, IPCCLikelihoodScale, IPCCConfidenceLevel, NCITFivePointConfidenceScale
-from .contributor import ContributorType
-from .core import RelativeTimeEnum, PresenceEnum
-from .demographics import EducationLevel, MaritalStatus, EmploymentStatus, HousingStatus, GenderIdentity, OmbRaceCategory, OmbEthnicityCategory
-from .ecological_interactions import RelativeTimeEnum, PresenceEnum, BioticInteractionType
-from .health import VitalStatusEnum
-from .healthcare import HealthcareEncounterClassification
-from .investigation import CaseOrControlEnum, PlannedProcessCompletionStatus
-from .mining_processing import RelativeTimeEnum, PresenceEnum, MineralogyFeedstockClass, BeneficiationPathway, InSituChemistryRegime, ExtractableTargetElement, SensorWhileDrillingFeature, ProcessPerformanceMetric, BioleachOrganism, BioleachMode, AutonomyLevel, RegulatoryConstraint
-from .statistics import PredictionOutcomeType
-from .stewardship import ValueSetStewardEnum
-
-# Data domain
-from .data.data_absent_reason import DataAbsentEnum
-from .data.data_use import DataUsePermissionEnum, DataUseModifierEnum
-
-# Data_Catalog domain
-from .data_catalog.access import AccessRights, DatasetStatus, UpdateFrequency, DataServiceType
-from .data_catalog.contributor_roles import DataCiteContributorType
-from .data_catalog.relations import DataCiteRelationType
-from .data_catalog.resource_types import DataCiteResourceType
-
-# Data_Science domain
-from .data_science.binary_classification import BinaryClassificationEnum, SpamClassificationEnum, AnomalyDetectionEnum, ChurnClassificationEnum, FraudDetectionEnum
-from .data_science.emotion_classification import BasicEmotionEnum, ExtendedEmotionEnum
-from .data_science.priority_severity import PriorityLevelEnum, SeverityLevelEnum, ConfidenceLevelEnum
-from .data_science.quality_control import QualityControlEnum, DefectClassificationEnum
-from .data_science.sentiment_analysis import SentimentClassificationEnum, FineSentimentClassificationEnum
-from .data_science.text_classification import NewsTopicCategoryEnum, ToxicityClassificationEnum, IntentClassificationEnum
-
-# Earth_Science domain
-from .earth_science.collection_methods import SESARCollectionMethod
-from .earth_science.fao_soil import FAOSoilType
-from .earth_science.hydrogeology import AquiferType, GroundwaterProcessType, HydrogeologyWellType
-from .earth_science.material_types import SESARMaterialType
-from .earth_science.physiographic_features import SESARPhysiographicFeature
-from .earth_science.remote_sensing import RemoteSensingPlatformType, RemoteSensingDataType
-from .earth_science.sample_types import SESARSampleType
-from .earth_science.subsurface import SubsurfaceFormationType, GeophysicalMethodType, SubsurfacePropertyType
-from .earth_science.water_resources import WaterResourceType, WaterUseCategoryType, WaterQualityParameterType
-
-# Energy domain
-from .energy.energy import EnergySource, EnergyUnit, PowerUnit, EnergyEfficiencyRating, BuildingEnergyStandard, GridType, BatteryType, PVCellType, PVSystemType, EnergyStorageType, EmissionScope, CarbonIntensity, ElectricityMarket, CapabilityStatus
-from .energy.fossil_fuels import FossilFuelTypeEnum
-from .energy.grid import GridComponentType, GridEnergyStorageType, GridManagementStrategyType
-from .energy.nuclear.fusion import FusionConfinementType, FusionFuelType, FusionPlasmaParameterType
-from .energy.nuclear.nuclear_cleanup import NuclearRemediationType, DecommissioningPhaseType, RadioactiveContaminantType
-from .energy.nuclear.nuclear_facilities import NuclearFacilityTypeEnum, PowerPlantStatusEnum, ResearchReactorTypeEnum, FuelCycleFacilityTypeEnum, WasteFacilityTypeEnum, NuclearShipTypeEnum
-from .energy.nuclear.nuclear_forensics import NuclearForensicsMethodType, NuclearThreatCategoryType
-from .energy.nuclear.nuclear_fuel_cycle import NuclearFuelCycleStageEnum, NuclearFuelFormEnum, EnrichmentProcessEnum
-from .energy.nuclear.nuclear_fuels import NuclearFuelTypeEnum, UraniumEnrichmentLevelEnum, FuelFormEnum, FuelAssemblyTypeEnum, FuelCycleStageEnum, FissileIsotopeEnum
-from .energy.nuclear.nuclear_operations import ReactorOperatingStateEnum, MaintenanceTypeEnum, LicensingStageEnum, FuelCycleOperationEnum, ReactorControlModeEnum, OperationalProcedureEnum
-from .energy.nuclear.nuclear_regulatory import NuclearRegulatoryBodyEnum, RegulatoryFrameworkEnum, LicensingStageEnum, ComplianceStandardEnum, InspectionTypeEnum
-from .energy.nuclear.nuclear_safety import INESLevelEnum, EmergencyClassificationEnum, NuclearSecurityCategoryEnum, SafetySystemClassEnum, ReactorSafetyFunctionEnum, DefenseInDepthLevelEnum, RadiationProtectionZoneEnum
-from .energy.nuclear.nuclear_waste import IAEAWasteClassificationEnum, NRCWasteClassEnum, WasteHeatGenerationEnum, WasteHalfLifeCategoryEnum, WasteDisposalMethodEnum, WasteSourceEnum, TransuranicWasteCategoryEnum
-from .energy.nuclear.reactor_types import ReactorTypeEnum, ReactorGenerationEnum, ReactorCoolantEnum, ReactorModeratorEnum, ReactorNeutronSpectrumEnum, ReactorSizeCategoryEnum
-from .energy.renewable.bioenergy import BiomassFeedstockType, BiofuelType, BiofuelGeneration, BioconversionProcess
-from .energy.renewable.geothermal import GeothermalSystemType, GeothermalReservoirType, GeothermalWellType, GeothermalApplication, GeothermalResourceTemperature
-from .energy.renewable.hydrogen import HydrogenType, HydrogenProductionMethod, HydrogenStorageMethod, HydrogenApplication
-from .energy.subsurface_energy import SubsurfaceEnergyResourceType, SubsurfaceStorageType, ReservoirCharacterizationMethodType
-
-# Environmental_Health domain
-from .environmental_health.carcinogenicity import IARCCarcinogenicityGroup, EPAIRISCarcinogenicityGroup, NTPCarcinogenicityGroup
-from .environmental_health.exposures import AirPollutantEnum, PesticideTypeEnum, HeavyMetalEnum, ExposureRouteEnum, ExposureSourceEnum, WaterContaminantEnum, EndocrineDisruptorEnum, ExposureDurationEnum, SmokingStatusEnum, ExposureStressorTypeEnum, ExposureTransportPathEnum, ExposureFrequencyEnum, StudyPopulationEnum, HHEARExposureAssessedEnum
-from .environmental_health.gb_edoh import ExtremeWeatherEventEnum, ExposureAgentCategoryEnum, TemporalAggregationEnum, SpatialResolutionEnum
-from .environmental_health.radionuclides import RadionuclideEnum, NORMEnum
-
-# Geography domain
-from .geography.geographic_codes import CountryCodeISO2Enum, CountryCodeISO3Enum, USStateCodeEnum, CanadianProvinceCodeEnum, CompassDirection, RelativeDirection, WindDirection, ContinentEnum, UNRegionEnum, LanguageCodeISO6391enum, TimeZoneEnum, CurrencyCodeISO4217Enum
+import importlib
+from typing import TYPE_CHECKING
 
-# Health domain
-from .health.vaccination import VaccinationStatusEnum, VaccinationPeriodicityEnum, VaccineCategoryEnum
+if TYPE_CHECKING:
+    # Academic domain
+    from .academic.organizations import USDOENationalLaboratoryEnum, USFederalFundingAgencyEnum, NIHInstituteCenterEnum, StandardsOrganizationEnum, UNSpecializedAgencyEnum
+    from .academic.research import PublicationType, PeerReviewStatus, AcademicDegree, LicenseType, ResearchField, FundingType, ManuscriptSection, ResearchRole, OpenAccessType, CitationStyle
+    # Analytical_Chemistry domain
+    from .analytical_chemistry.mass_spectrometry import RelativeTimeEnum, PresenceEnum, MassSpectrometerFileFormat, MassSpectrometerVendor, ChromatographyType, DerivatizationMethod, MetabolomicsAssayType, AnalyticalControlType
+    # Bio domain
+    from .bio.assays.enzymology import EnzymologyAssayEnum
+    from .bio.assays.immunology import ImmunologyAssayEnum
+    from .bio.assays.nf_osi_assays import SequencingAssayEnum, ImagingAssayEnum, MassSpectrometryAssayEnum, CellBasedAssayEnum, ClinicalBehavioralAssayEnum
+    from .bio.assays.protein_engineering import ProteinEngineeringAssayEnum
+    from .bio.assays.toxicology import ToxicologyAssayEnum
+    from .bio.bgc_categories import BgcCategoryEnum
+    from .bio.biological_colors import EyeColorEnum, HairColorEnum, FlowerColorEnum, AnimalCoatColorEnum, SkinToneEnum, PlantLeafColorEnum
+    from .bio.biosafety import BiosafetyLevelEnum
+    from .bio.cell_cycle import CellCyclePhase, MitoticPhase, CellCycleCheckpoint, MeioticPhase, CellCycleRegulator, CellProliferationState, DNADamageResponse
+    from .bio.cell_free_expression import CellFreeExpressionSystemEnum, CellFreeReactionFormatEnum, EnergyRegenerationSubstrateEnum, CellFreeApplicationEnum
+    from .bio.currency_chemicals import CurrencyChemical
+    from .bio.developmental_stages import HumanDevelopmentalStage, MouseDevelopmentalStage, HumanAgeGroupEnum, MousePostnatalAgeGroupEnum
+    from .bio.expression_units import ExpressionUnitEnum, ConcentrationUnitEnum, TimeUnitEnum
+    from .bio.gene_perturbation import GenePerturbationMethodEnum, GeneKnockoutMethodEnum, GenotypeEnum, VectorTypeEnum
+    from .bio.genome_features import GenomeFeatureType
+    from .bio.genomics import CdsPhaseType, ContigCollectionType, StrandType, SequenceType
+    from .bio.go_aspect import GOAspect
+    from .bio.go_causality import CausalPredicateEnum
+    from .bio.go_evidence import GOEvidenceCode, GOElectronicMethods
+    from .bio.insdc_geographic_locations import InsdcGeographicLocationEnum
+    from .bio.insdc_missing_values import InsdcMissingValueEnum
+    from .bio.lipid_categories import RelativeTimeEnum, PresenceEnum, LipidCategory
+    from .bio.pato import ColorEnum, ShapeEnum, RelativeChangeEnum, IntensityEnum, TextureEnum, PATOBiologicalSexEnum, MaturityEnum, ViabilityEnum, CellularityEnum, SpatialPatternEnum
+    from .bio.plant_biology import PlantSexualSystem
+    from .bio.plant_developmental_stages import PlantDevelopmentalStage
+    from .bio.plant_experimental_conditions import PlantStudyConditionEnum, SeasonalEnvironmentExposureEnum, EcologicalEnvironmentExposureEnum, PlantGrowthMediumExposureEnum
+    from .bio.plant_sex import PlantSexEnum
+    from .bio.protein_evidence import ProteinEvidenceForExistence, RefSeqStatusType
+    from .bio.protein_structure_features import SecondaryStructureType, LocalStructuralFeature
+    from .bio.proteomics_standards import RelativeTimeEnum, PresenceEnum, PeakAnnotationSeriesLabel, PeptideIonSeries, MassErrorUnit
+    from .bio.psi_mi import InteractionDetectionMethod, InteractionType, ExperimentalRole, BiologicalRole, ParticipantIdentificationMethod, FeatureType, InteractorType, ConfidenceScore, ExperimentalPreparation
+    from .bio.relationship_to_oxygen import RelToOxygenEnum
+    from .bio.sequence_alphabets import DNABaseEnum, DNABaseExtendedEnum, RNABaseEnum, RNABaseExtendedEnum, AminoAcidEnum, AminoAcidExtendedEnum, CodonEnum, NucleotideModificationEnum, SequenceQualityEnum
+    from .bio.sequence_chemistry import IUPACNucleotideCode, StandardAminoAcid, IUPACAminoAcidCode, SequenceAlphabet, SequenceQualityEncoding, GeneticCodeTable, SequenceStrand, SequenceTopology, SequenceModality
+    from .bio.sequencing_platforms import SequencingPlatform, SequencingChemistry, LibraryPreparation, SequencingApplication, ReadType, SequenceFileFormat, DataProcessingLevel
+    from .bio.specimen_processing import SpecimenPreparationMethodEnum, TissuePreservationEnum, SpecimenCollectionMethodEnum, SpecimenTypeEnum, AnalyteTypeEnum, SourceMaterialTypeEnum, SpecimenCreationActivityTypeEnum, SpecimenProcessingActivityTypeEnum, SpecimenQualityObservationTypeEnum, SpecimenQualityObservationMethodEnum, SpecimenQuantityObservationTypeEnum, SectionLocationEnum
+    from .bio.structural_biology import SampleType, StructuralBiologyTechnique, CryoEMPreparationType, CryoEMGridType, VitrificationMethod, CrystallizationMethod, XRaySource, Detector, WorkflowType, FileFormat, DataType, ProcessingStatus, CoordinationGeometry, MetalLigandType, ProteinModificationType
+    from .bio.taxonomy import CommonOrganismTaxaEnum, TaxonomicRank, BiologicalKingdom
+    from .bio.transplantation import TransplantationTypeEnum, XenograftModelEnum, ModelSystemTypeEnum
+    from .bio.trophic_levels import TrophicLevelEnum
+    from .bio.uniprot_species import UniProtSpeciesCode
+    from .bio.viral_genome_types import ViralGenomeTypeEnum
+    # Bioprocessing domain
+    from .bioprocessing.biomanufacturing import BiomanufacturingScaleType, BioproductCategoryType, BioprocessOptimizationType
+    from .bioprocessing.scale_up import ProcessScaleEnum, BioreactorTypeEnum, FermentationModeEnum, OxygenationStrategyEnum, AgitationTypeEnum, DownstreamProcessEnum, FeedstockTypeEnum, ProductTypeEnum, SterilizationMethodEnum
+    # Business domain
+    from .business.human_resources import EmploymentTypeEnum, JobLevelEnum, HRFunctionEnum, CompensationTypeEnum, PerformanceRatingEnum, RecruitmentSourceEnum, TrainingTypeEnum, EmployeeStatusEnum, WorkArrangementEnum, BenefitsCategoryEnum
+    from .business.industry_classifications import NAICSSectorEnum, EconomicSectorEnum, BusinessActivityTypeEnum, IndustryMaturityEnum, MarketStructureEnum, IndustryRegulationLevelEnum
+    from .business.management_operations import ManagementMethodologyEnum, StrategicFrameworkEnum, OperationalModelEnum, PerformanceMeasurementEnum, DecisionMakingStyleEnum, LeadershipStyleEnum, BusinessProcessTypeEnum
+    from .business.organizational_structures import LegalEntityTypeEnum, OrganizationalStructureEnum, ManagementLevelEnum, CorporateGovernanceRoleEnum, BusinessOwnershipTypeEnum, BusinessSizeClassificationEnum, BusinessLifecycleStageEnum
+    from .business.quality_management import QualityStandardEnum, QualityMethodologyEnum, QualityControlTechniqueEnum, QualityAssuranceLevelEnum, ProcessImprovementApproachEnum, QualityMaturityLevelEnum
+    from .business.supply_chain import ProcurementTypeEnum, VendorCategoryEnum, SupplyChainStrategyEnum, LogisticsOperationEnum, SourcingStrategyEnum, SupplierRelationshipTypeEnum, InventoryManagementApproachEnum
+    # Chemistry domain
+    from .chemistry.chemical_entities import SubatomicParticleEnum, BondTypeEnum, PeriodicTableBlockEnum, ElementFamilyEnum, ElementMetallicClassificationEnum, HardOrSoftEnum, BronstedAcidBaseRoleEnum, LewisAcidBaseRoleEnum, OxidationStateEnum, ChiralityEnum, NanostructureMorphologyEnum
+    from .chemistry.reaction_directionality import RelativeTimeEnum, PresenceEnum, ReactionDirectionality
+    from .chemistry.reactions import ReactionTypeEnum, ReactionMechanismEnum, CatalystTypeEnum, ReactionConditionEnum, ReactionRateOrderEnum, EnzymeClassEnum, SolventClassEnum, ThermodynamicParameterEnum
+    # Clinical domain
+    from .clinical.genetics import ModeOfInheritance
+    from .clinical.nih_demographics import RaceOMB1997Enum, EthnicityOMB1997Enum, BiologicalSexEnum, AgeGroupEnum, ParticipantVitalStatusEnum, RecruitmentStatusEnum, StudyPhaseEnum
+    from .clinical.phenopackets import KaryotypicSexEnum, PhenotypicSexEnum, AllelicStateEnum, LateralityEnum, OnsetTimingEnum, ACMGPathogenicityEnum, TherapeuticActionabilityEnum, InterpretationProgressEnum, RegimenStatusEnum, DrugResponseEnum
+    from .clinical.provenance import ConditionProvenanceEnum, VisitProvenanceEnum, DrugExposureProvenanceEnum, StatusEnum, HistoricalStatusEnum, ResearchProjectTypeEnum
+    # Computing domain
+    from .computing.croissant_ml import MLDataType, DatasetEncodingFormat, DatasetSplitType, MLLicenseType, MLFieldRole, CompressionFormat, MLMediaType, MLModalityType
+    from .computing.data_centers import DataCenterCoolingType, DataCenterTierLevel
+    from .computing.file_formats import ImageFileFormatEnum, DocumentFormatEnum, DataFormatEnum, ArchiveFormatEnum, VideoFormatEnum, AudioFormatEnum, ProgrammingLanguageFileEnum, NetworkProtocolEnum
+    from .computing.frontier_ai_models import FrontierModelEnum
+    from .computing.geospatial_formats import GeospatialRasterFormat, GeospatialVectorFormat
+    from .computing.maturity_levels import TechnologyReadinessLevel, SoftwareMaturityLevel, CapabilityMaturityLevel, StandardsMaturityLevel, ProjectMaturityLevel, DataMaturityLevel, OpenSourceMaturityLevel
+    from .computing.microelectronics import SemiconductorMaterialType, ChipFabricationNodeType
+    from .computing.mime_types import MimeType, MimeTypeCategory, TextCharset, CompressionType
+    from .computing.ontologies import OWLProfileEnum
+    from .computing.quantum import QubitType, QuantumAlgorithmCategoryType
+    # Core domain
+    from .confidence_levels import RelativeTimeEnum, PresenceEnum, ConfidenceLevel, CIOConfidenceLevel, OBCSCertaintyLevel, IPCCLikelihoodScale, IPCCConfidenceLevel, NCITFivePointConfidenceScale
+    from .contributor import ContributorType
+    from .core import RelativeTimeEnum, PresenceEnum
+    from .demographics import EducationLevel, MaritalStatus, EmploymentStatus, HousingStatus, GenderIdentity, OmbRaceCategory, OmbEthnicityCategory
+    from .ecological_interactions import RelativeTimeEnum, PresenceEnum, BioticInteractionType
+    from .health import VitalStatusEnum
+    from .healthcare import HealthcareEncounterClassification
+    from .investigation import CaseOrControlEnum, PlannedProcessCompletionStatus
+    from .mining_processing import RelativeTimeEnum, PresenceEnum, MineralogyFeedstockClass, BeneficiationPathway, InSituChemistryRegime, ExtractableTargetElement, SensorWhileDrillingFeature, ProcessPerformanceMetric, BioleachOrganism, BioleachMode, AutonomyLevel, RegulatoryConstraint
+    from .statistics import PredictionOutcomeType
+    from .stewardship import ValueSetStewardEnum
+    # Data domain
+    from .data.data_absent_reason import DataAbsentEnum
+    from .data.data_use import DataUsePermissionEnum, DataUseModifierEnum
+    # Data_Catalog domain
+    from .data_catalog.access import AccessRights, DatasetStatus, UpdateFrequency, DataServiceType
+    from .data_catalog.contributor_roles import DataCiteContributorType
+    from .data_catalog.relations import DataCiteRelationType
+    from .data_catalog.resource_types import DataCiteResourceType
+    # Data_Science domain
+    from .data_science.binary_classification import BinaryClassificationEnum, SpamClassificationEnum, AnomalyDetectionEnum, ChurnClassificationEnum, FraudDetectionEnum
+    from .data_science.emotion_classification import BasicEmotionEnum, ExtendedEmotionEnum
+    from .data_science.priority_severity import PriorityLevelEnum, SeverityLevelEnum, ConfidenceLevelEnum
+    from .data_science.quality_control import QualityControlEnum, DefectClassificationEnum
+    from .data_science.sentiment_analysis import SentimentClassificationEnum, FineSentimentClassificationEnum
+    from .data_science.text_classification import NewsTopicCategoryEnum, ToxicityClassificationEnum, IntentClassificationEnum
+    # Earth_Science domain
+    from .earth_science.collection_methods import SESARCollectionMethod
+    from .earth_science.fao_soil import FAOSoilType
+    from .earth_science.hydrogeology import AquiferType, GroundwaterProcessType, HydrogeologyWellType
+    from .earth_science.material_types import SESARMaterialType
+    from .earth_science.physiographic_features import SESARPhysiographicFeature
+    from .earth_science.remote_sensing import RemoteSensingPlatformType, RemoteSensingDataType
+    from .earth_science.sample_types import SESARSampleType
+    from .earth_science.subsurface import SubsurfaceFormationType, GeophysicalMethodType, SubsurfacePropertyType
+    from .earth_science.water_resources import WaterResourceType, WaterUseCategoryType, WaterQualityParameterType
+    # Energy domain
+    from .energy.energy import EnergySource, EnergyUnit, PowerUnit, EnergyEfficiencyRating, BuildingEnergyStandard, GridType, BatteryType, PVCellType, PVSystemType, EnergyStorageType, EmissionScope, CarbonIntensity, ElectricityMarket, CapabilityStatus
+    from .energy.fossil_fuels import FossilFuelTypeEnum
+    from .energy.grid import GridComponentType, GridEnergyStorageType, GridManagementStrategyType
+    from .energy.nuclear.fusion import FusionConfinementType, FusionFuelType, FusionPlasmaParameterType
+    from .energy.nuclear.nuclear_cleanup import NuclearRemediationType, DecommissioningPhaseType, RadioactiveContaminantType
+    from .energy.nuclear.nuclear_facilities import NuclearFacilityTypeEnum, PowerPlantStatusEnum, ResearchReactorTypeEnum, FuelCycleFacilityTypeEnum, WasteFacilityTypeEnum, NuclearShipTypeEnum
+    from .energy.nuclear.nuclear_forensics import NuclearForensicsMethodType, NuclearThreatCategoryType
+    from .energy.nuclear.nuclear_fuel_cycle import NuclearFuelCycleStageEnum, NuclearFuelFormEnum, EnrichmentProcessEnum
+    from .energy.nuclear.nuclear_fuels import NuclearFuelTypeEnum, UraniumEnrichmentLevelEnum, FuelFormEnum, FuelAssemblyTypeEnum, FuelCycleStageEnum, FissileIsotopeEnum
+    from .energy.nuclear.nuclear_operations import ReactorOperatingStateEnum, MaintenanceTypeEnum, LicensingStageEnum, FuelCycleOperationEnum, ReactorControlModeEnum, OperationalProcedureEnum
+    from .energy.nuclear.nuclear_regulatory import NuclearRegulatoryBodyEnum, RegulatoryFrameworkEnum, LicensingStageEnum, ComplianceStandardEnum, InspectionTypeEnum
+    from .energy.nuclear.nuclear_safety import INESLevelEnum, EmergencyClassificationEnum, NuclearSecurityCategoryEnum, SafetySystemClassEnum, ReactorSafetyFunctionEnum, DefenseInDepthLevelEnum, RadiationProtectionZoneEnum
+    from .energy.nuclear.nuclear_waste import IAEAWasteClassificationEnum, NRCWasteClassEnum, WasteHeatGenerationEnum, WasteHalfLifeCategoryEnum, WasteDisposalMethodEnum, WasteSourceEnum, TransuranicWasteCategoryEnum
+    from .energy.nuclear.reactor_types import ReactorTypeEnum, ReactorGenerationEnum, ReactorCoolantEnum, ReactorModeratorEnum, ReactorNeutronSpectrumEnum, ReactorSizeCategoryEnum
+    from .energy.renewable.bioenergy import BiomassFeedstockType, BiofuelType, BiofuelGeneration, BioconversionProcess
+    from .energy.renewable.geothermal import GeothermalSystemType, GeothermalReservoirType, GeothermalWellType, GeothermalApplication, GeothermalResourceTemperature
+    from .energy.renewable.hydrogen import HydrogenType, HydrogenProductionMethod, HydrogenStorageMethod, HydrogenApplication
+    from .energy.subsurface_energy import SubsurfaceEnergyResourceType, SubsurfaceStorageType, ReservoirCharacterizationMethodType
+    # Environmental_Health domain
+    from .environmental_health.carcinogenicity import IARCCarcinogenicityGroup, EPAIRISCarcinogenicityGroup, NTPCarcinogenicityGroup
+    from .environmental_health.exposures import AirPollutantEnum, PesticideTypeEnum, HeavyMetalEnum, ExposureRouteEnum, ExposureSourceEnum, WaterContaminantEnum, EndocrineDisruptorEnum, ExposureDurationEnum, SmokingStatusEnum, ExposureStressorTypeEnum, ExposureTransportPathEnum, ExposureFrequencyEnum, StudyPopulationEnum, HHEARExposureAssessedEnum
+    from .environmental_health.gb_edoh import ExtremeWeatherEventEnum, ExposureAgentCategoryEnum, TemporalAggregationEnum, SpatialResolutionEnum
+    from .environmental_health.radionuclides import RadionuclideEnum, NORMEnum
+    # Geography domain
+    from .geography.geographic_codes import CountryCodeISO2Enum, CountryCodeISO3Enum, USStateCodeEnum, CanadianProvinceCodeEnum, CompassDirection, RelativeDirection, WindDirection, ContinentEnum, UNRegionEnum, LanguageCodeISO6391enum, TimeZoneEnum, CurrencyCodeISO4217Enum
+    # Health domain
+    from .health.vaccination import VaccinationStatusEnum, VaccinationPeriodicityEnum, VaccineCategoryEnum
+    # Industry domain
+    from .industry.construction import BuildingSystemType, BuildingEnergyPerformanceLevel
+    from .industry.extractive_industry import ExtractiveIndustryFacilityTypeEnum, ExtractiveIndustryProductTypeEnum, MiningMethodEnum, WellTypeEnum
+    from .industry.manufacturing import ManufacturingProcessType, SmartManufacturingTechnologyType
+    from .industry.mining import MiningType, MineralCategory, CriticalMineral, CommonMineral, MiningEquipment, OreGrade, MiningPhase, MiningHazard, EnvironmentalImpact
+    from .industry.safety_colors import SafetyColorEnum, TrafficLightColorEnum, HazmatColorEnum, FireSafetyColorEnum, MaritimeSignalColorEnum, AviationLightColorEnum, ElectricalWireColorEnum
+    from .industry.unconventional_resources import UnconventionalMineralResourceType, BioextractionMethodType, TailingCharacterizationType
+    # Lab_Automation domain
+    from .lab_automation.autonomous_labs import AutonomousLabComponentType, ExperimentalDesignMethodType, LabAutomationWorkflowType
+    from .lab_automation.cloud_lab import RelativeTimeEnum, PresenceEnum, LabUnitOperationEnum, CloudLabExperimentEnum
+    from .lab_automation.devices import LaboratoryDeviceTypeEnum, RoboticArmTypeEnum
+    from .lab_automation.labware import MicroplateFormatEnum, ContainerTypeEnum, PlateMaterialEnum, PlateCoatingEnum
+    from .lab_automation.operations import LiquidHandlingOperationEnum, SampleProcessingOperationEnum
+    from .lab_automation.protocols import WorkflowOrchestrationTypeEnum, SchedulerTypeEnum, ProtocolStateEnum, ExecutionModeEnum, WorkflowErrorHandlingEnum, IntegrationSystemEnum
+    from .lab_automation.standards import AutomationStandardEnum, CommunicationProtocolEnum, LabwareStandardEnum, IntegrationFeatureEnum
+    from .lab_automation.thermal_cycling import ThermalCyclerTypeEnum, PCROperationTypeEnum, DetectionModeEnum, PCRPlateTypeEnum, ThermalCyclingStepEnum
+    # Materials_Science domain
+    from .materials_science.characterization_methods import MicroscopyMethodEnum, SpectroscopyMethodEnum, ThermalAnalysisMethodEnum, MechanicalTestingMethodEnum
+    from .materials_science.computational_materials import MaterialsSimulationType, MaterialPropertyPredictionType
+    from .materials_science.crystal_structures import CrystalSystemEnum, BravaisLatticeEnum
+    from .materials_science.material_properties import ElectricalConductivityEnum, MagneticPropertyEnum, OpticalPropertyEnum, ThermalConductivityEnum, MechanicalBehaviorEnum
+    from .materials_science.material_types import MaterialClassEnum, PolymerTypeEnum, MetalTypeEnum, CompositeTypeEnum
+    from .materials_science.pigments_dyes import TraditionalPigmentEnum, IndustrialDyeEnum, FoodColoringEnum, AutomobilePaintColorEnum
+    from .materials_science.synthesis_methods import SynthesisMethodEnum, CrystalGrowthMethodEnum, AdditiveManufacturingEnum
+    # Medical domain
+    from .medical.clinical import BloodTypeEnum, AnatomicalSystemEnum, MedicalSpecialtyEnum, DrugRouteEnum, VitalSignEnum, DiagnosticTestTypeEnum, SymptomSeverityEnum, AllergyTypeEnum, VaccineTypeEnum, BMIClassificationEnum
+    from .medical.family_history import FamilyRelationship, FamilyHistoryStatus, GeneticRelationship
+    from .medical.imaging_platforms import MRIPlatformEnum, MicroscopyPlatformEnum, ImagingSystemPlatformEnum
+    from .medical.neuroimaging import MRIModalityEnum, MRISequenceTypeEnum, MRIContrastTypeEnum, FMRIParadigmTypeEnum
+    from .medical.oncology.icdo import TumorTopography, TumorMorphology, TumorBehavior, TumorGrade
+    from .medical.pediatric_oncology.diagnosis_categories import PediatricOncologyDiagnosisCategory
+    from .medical.pediatric_oncology.iccc3 import ICCC3MainGroup, ICCC3Subgroup
+    from .medical.pediatric_oncology.staging.neuroblastoma import INRGSSStage, INSSStage, NeuroblastomaRiskGroup, ImageDefinedRiskFactor
+    # Physics domain
+    from .physics.particle_physics import ParticleAcceleratorType, FundamentalParticleType, DetectorType
+    from .physics.radiation import ElectromagneticRadiationTypeEnum, InfraredRadiationTypeEnum, AcousticRadiationTypeEnum
+    from .physics.states_of_matter import StateOfMatterEnum
+    # Preservation domain
+    from .preservation.digital_objects import DigitalObjectCategory, CopyrightStatus, RightsBasis, PreservationLevelRole, PreservationLevelValue
+    from .preservation.events import PreservationEventType, PreservationEventOutcome
+    from .preservation.fixity import CryptographicHashFunction
+    # Publishing domain
+    from .publishing.arxiv_categories import ArxivCategory
+    from .publishing.osti_record import OstiWorkflowStatus, OstiAccessLimitation, OstiCollectionType, OstiSensitivityFlag, OstiOrganizationIdentifierType, OstiProductType, OstiOrganizationType, OstiPersonType, OstiContributorType, OstiRelatedIdentifierType, OstiRelationType, OstiIdentifierType, OstiGeolocationType, OstiMediaLocationType
+    # Social domain
+    from .social.person_status import PersonStatusEnum
+    from .social.sdoh import GravitySdohDomainEnum, EducationalAttainmentEnum
+    # Spatial domain
+    from .spatial.spatial_qualifiers import SimpleSpatialDirection, AnatomicalSide, AnatomicalRegion, AnatomicalAxis, AnatomicalPlane, SpatialRelationship, CellPolarity, AnatomicalOrientation
+    # Statistics domain
+    from .statistics.prediction_outcomes import OutcomeTypeEnum
+    # Time domain
+    from .time.temporal import DayOfWeek, Month, Quarter, Season, TimePeriod, TimeOfDay, BusinessTimeFrame, GeologicalEra, HistoricalPeriod
+    # Units domain
+    from .units.measurements import LengthUnitEnum, MassUnitEnum, VolumeUnitEnum, TemperatureUnitEnum, TimeUnitEnum, PressureUnitEnum, ConcentrationUnitEnum, FrequencyUnitEnum, AngleUnitEnum, DataSizeUnitEnum
+    from .units.quantity_kinds import QuantityKindEnum
+    # Visual domain
+    from .visual.colors import BasicColorEnum, WebColorEnum, X11ColorEnum, ColorSpaceEnum
 
-# Industry domain
-from .industry.construction import BuildingSystemType, BuildingEnergyPerformanceLevel
-from .industry.extractive_industry import ExtractiveIndustryFacilityTypeEnum, ExtractiveIndustryProductTypeEnum, MiningMethodEnum, WellTypeEnum
-from .industry.manufacturing import ManufacturingProcessType, SmartManufacturingTechnologyType
-from .industry.mining import MiningType, MineralCategory, CriticalMineral, CommonMineral, MiningEquipment, OreGrade, MiningPhase, MiningHazard, EnvironmentalImpact
-from .industry.safety_colors import SafetyColorEnum, TrafficLightColorEnum, HazmatColorEnum, FireSafetyColorEnum, MaritimeSignalColorEnum, AviationLightColorEnum, ElectricalWireColorEnum
-from .industry.unconventional_resources import UnconventionalMineralResourceType, BioextractionMethodType, TailingCharacterizationType
-
-# Lab_Automation domain
-from .lab_automation.autonomous_labs import AutonomousLabComponentType, ExperimentalDesignMethodType, LabAutomationWorkflowType
-from .lab_automation.cloud_lab import RelativeTimeEnum, PresenceEnum, LabUnitOperationEnum, CloudLabExperimentEnum
-from .lab_automation.devices import LaboratoryDeviceTypeEnum, RoboticArmTypeEnum
-from .lab_automation.labware import MicroplateFormatEnum, ContainerTypeEnum, PlateMaterialEnum, PlateCoatingEnum
-from .lab_automation.operations import LiquidHandlingOperationEnum, SampleProcessingOperationEnum
-from .lab_automation.protocols import WorkflowOrchestrationTypeEnum, SchedulerTypeEnum, ProtocolStateEnum, ExecutionModeEnum, WorkflowErrorHandlingEnum, IntegrationSystemEnum
-from .lab_automation.standards import AutomationStandardEnum, CommunicationProtocolEnum, LabwareStandardEnum, IntegrationFeatureEnum
-from .lab_automation.thermal_cycling import ThermalCyclerTypeEnum, PCROperationTypeEnum, DetectionModeEnum, PCRPlateTypeEnum, ThermalCyclingStepEnum
-
-# Materials_Science domain
-from .materials_science.characterization_methods import MicroscopyMethodEnum, SpectroscopyMethodEnum, ThermalAnalysisMethodEnum, MechanicalTestingMethodEnum
-from .materials_science.computational_materials import MaterialsSimulationType, MaterialPropertyPredictionType
-from .materials_science.crystal_structures import CrystalSystemEnum, BravaisLatticeEnum
-from .materials_science.material_properties import ElectricalConductivityEnum, MagneticPropertyEnum, OpticalPropertyEnum, ThermalConductivityEnum, MechanicalBehaviorEnum
-from .materials_science.material_types import MaterialClassEnum, PolymerTypeEnum, MetalTypeEnum, CompositeTypeEnum
-from .materials_science.pigments_dyes import TraditionalPigmentEnum, IndustrialDyeEnum, FoodColoringEnum, AutomobilePaintColorEnum
-from .materials_science.synthesis_methods import SynthesisMethodEnum, CrystalGrowthMethodEnum, AdditiveManufacturingEnum
-
-# Medical domain
-from .medical.clinical import BloodTypeEnum, AnatomicalSystemEnum, MedicalSpecialtyEnum, DrugRouteEnum, VitalSignEnum, DiagnosticTestTypeEnum, SymptomSeverityEnum, AllergyTypeEnum, VaccineTypeEnum, BMIClassificationEnum
-from .medical.family_history import FamilyRelationship, FamilyHistoryStatus, GeneticRelationship
-from .medical.imaging_platforms import MRIPlatformEnum, MicroscopyPlatformEnum, ImagingSystemPlatformEnum
-from .medical.neuroimaging import MRIModalityEnum, MRISequenceTypeEnum, MRIContrastTypeEnum, FMRIParadigmTypeEnum
-from .medical.oncology.icdo import TumorTopography, TumorMorphology, TumorBehavior, TumorGrade
-from .medical.pediatric_oncology.diagnosis_categories import PediatricOncologyDiagnosisCategory
-from .medical.pediatric_oncology.iccc3 import ICCC3MainGroup, ICCC3Subgroup
-from .medical.pediatric_oncology.staging.neuroblastoma import INRGSSStage, INSSStage, NeuroblastomaRiskGroup, ImageDefinedRiskFactor
-
-# Physics domain
-from .physics.particle_physics import ParticleAcceleratorType, FundamentalParticleType, DetectorType
-from .physics.radiation import ElectromagneticRadiationTypeEnum, InfraredRadiationTypeEnum, AcousticRadiationTypeEnum
-from .physics.states_of_matter import StateOfMatterEnum
-
-# Preservation domain
-from .preservation.digital_objects import DigitalObjectCategory, CopyrightStatus, RightsBasis, PreservationLevelRole, PreservationLevelValue
-from .preservation.events import PreservationEventType, PreservationEventOutcome
-from .preservation.fixity import CryptographicHashFunction
-
-# Publishing domain
-from .publishing.arxiv_categories import ArxivCategory
-from .publishing.osti_record import OstiWorkflowStatus, OstiAccessLimitation, OstiCollectionType, OstiSensitivityFlag, OstiOrganizationIdentifierType, OstiProductType, OstiOrganizationType, OstiPersonType, OstiContributorType, OstiRelatedIdentifierType, OstiRelationType, OstiIdentifierType, OstiGeolocationType, OstiMediaLocationType
-
-# Social domain
-from .social.person_status import PersonStatusEnum
-from .social.sdoh import GravitySdohDomainEnum, EducationalAttainmentEnum
-
-# Spatial domain
-from .spatial.spatial_qualifiers import SimpleSpatialDirection, AnatomicalSide, AnatomicalRegion, AnatomicalAxis, AnatomicalPlane, SpatialRelationship, CellPolarity, AnatomicalOrientation
-
-# Statistics domain
-from .statistics.prediction_outcomes import OutcomeTypeEnum
-
-# Time domain
-from .time.temporal import DayOfWeek, Month, Quarter, Season, TimePeriod, TimeOfDay, BusinessTimeFrame, GeologicalEra, HistoricalPeriod
-
-# Units domain
-from .units.measurements import LengthUnitEnum, MassUnitEnum, VolumeUnitEnum, TemperatureUnitEnum, TimeUnitEnum, PressureUnitEnum, ConcentrationUnitEnum, FrequencyUnitEnum, AngleUnitEnum, DataSizeUnitEnum
-from .units.quantity_kinds import QuantityKindEnum
-
-# Visual domain
-from .visual.colors import BasicColorEnum, WebColorEnum, X11ColorEnum, ColorSpaceEnum
+# Module defining each exported enum, relative to this package
+_ENUM_MODULES = {
+    # Academic domain
+    "USDOENationalLaboratoryEnum": ".academic.organizations",
+    "USFederalFundingAgencyEnum": ".academic.organizations",
+    "NIHInstituteCenterEnum": ".academic.organizations",
+    "StandardsOrganizationEnum": ".academic.organizations",
+    "UNSpecializedAgencyEnum": ".academic.organizations",
+    "PublicationType": ".academic.research",
+    "PeerReviewStatus": ".academic.research",
+    "AcademicDegree": ".academic.research",
+    "LicenseType": ".academic.research",
+    "ResearchField": ".academic.research",
+    "FundingType": ".academic.research",
+    "ManuscriptSection": ".academic.research",
+    "ResearchRole": ".academic.research",
+    "OpenAccessType": ".academic.research",
+    "CitationStyle": ".academic.research",
+    # Analytical_Chemistry domain
+    "MassSpectrometerFileFormat": ".analytical_chemistry.mass_spectrometry",
+    "MassSpectrometerVendor": ".analytical_chemistry.mass_spectrometry",
+    "ChromatographyType": ".analytical_chemistry.mass_spectrometry",
+    "DerivatizationMethod": ".analytical_chemistry.mass_spectrometry",
+    "MetabolomicsAssayType": ".analytical_chemistry.mass_spectrometry",
+    "AnalyticalControlType": ".analytical_chemistry.mass_spectrometry",
+    # Bio domain
+    "EnzymologyAssayEnum": ".bio.assays.enzymology",
+    "ImmunologyAssayEnum": ".bio.assays.immunology",
+    "SequencingAssayEnum": ".bio.assays.nf_osi_assays",
+    "ImagingAssayEnum": ".bio.assays.nf_osi_assays",
+    "MassSpectrometryAssayEnum": ".bio.assays.nf_osi_assays",
+    "CellBasedAssayEnum": ".bio.assays.nf_osi_assays",
+    "ClinicalBehavioralAssayEnum": ".bio.assays.nf_osi_assays",
+    "ProteinEngineeringAssayEnum": ".bio.assays.protein_engineering",
+    "ToxicologyAssayEnum": ".bio.assays.toxicology",
+    "BgcCategoryEnum": ".bio.bgc_categories",
+    "EyeColorEnum": ".bio.biological_colors",
+    "HairColorEnum": ".bio.biological_colors",
+    "FlowerColorEnum": ".bio.biological_colors",
+    "AnimalCoatColorEnum": ".bio.biological_colors",
+    "SkinToneEnum": ".bio.biological_colors",
+    "PlantLeafColorEnum": ".bio.biological_colors",
+    "BiosafetyLevelEnum": ".bio.biosafety",
+    "CellCyclePhase": ".bio.cell_cycle",
+    "MitoticPhase": ".bio.cell_cycle",
+    "CellCycleCheckpoint": ".bio.cell_cycle",
+    "MeioticPhase": ".bio.cell_cycle",
+    "CellCycleRegulator": ".bio.cell_cycle",
+    "CellProliferationState": ".bio.cell_cycle",
+    "DNADamageResponse": ".bio.cell_cycle",
+    "CellFreeExpressionSystemEnum": ".bio.cell_free_expression",
+    "CellFreeReactionFormatEnum": ".bio.cell_free_expression",
+    "EnergyRegenerationSubstrateEnum": ".bio.cell_free_expression",
+    "CellFreeApplicationEnum": ".bio.cell_free_expression",
+    "CurrencyChemical": ".bio.currency_chemicals",
+    "HumanDevelopmentalStage": ".bio.developmental_stages",
+    "MouseDevelopmentalStage": ".bio.developmental_stages",
+    "HumanAgeGroupEnum": ".bio.developmental_stages",
+    "MousePostnatalAgeGroupEnum": ".bio.developmental_stages",
+    "ExpressionUnitEnum": ".bio.expression_units",
+    "GenePerturbationMethodEnum": ".bio.gene_perturbation",
+    "GeneKnockoutMethodEnum": ".bio.gene_perturbation",
+    "GenotypeEnum": ".bio.gene_perturbation",
+    "VectorTypeEnum": ".bio.gene_perturbation",
+    "GenomeFeatureType": ".bio.genome_features",
+    "CdsPhaseType": ".bio.genomics",
+    "ContigCollectionType": ".bio.genomics",
+    "StrandType": ".bio.genomics",
+    "SequenceType": ".bio.genomics",
+    "GOAspect": ".bio.go_aspect",
+    "CausalPredicateEnum": ".bio.go_causality",
+    "GOEvidenceCode": ".bio.go_evidence",
+    "GOElectronicMethods": ".bio.go_evidence",
+    "InsdcGeographicLocationEnum": ".bio.insdc_geographic_locations",
+    "InsdcMissingValueEnum": ".bio.insdc_missing_values",
+    "LipidCategory": ".bio.lipid_categories",
+    "ColorEnum": ".bio.pato",
+    "ShapeEnum": ".bio.pato",
+    "RelativeChangeEnum": ".bio.pato",
+    "IntensityEnum": ".bio.pato",
+    "TextureEnum": ".bio.pato",
+    "PATOBiologicalSexEnum": ".bio.pato",
+    "MaturityEnum": ".bio.pato",
+    "ViabilityEnum": ".bio.pato",
+    "CellularityEnum": ".bio.pato",
+    "SpatialPatternEnum": ".bio.pato",
+    "PlantSexualSystem": ".bio.plant_biology",
+    "PlantDevelopmentalStage": ".bio.plant_developmental_stages",
+    "PlantStudyConditionEnum": ".bio.plant_experimental_conditions",
+    "SeasonalEnvironmentExposureEnum": ".bio.plant_experimental_conditions",
+    "EcologicalEnvironmentExposureEnum": ".bio.plant_experimental_conditions",
+    "PlantGrowthMediumExposureEnum": ".bio.plant_experimental_conditions",
+    "PlantSexEnum": ".bio.plant_sex",
+    "ProteinEvidenceForExistence": ".bio.protein_evidence",
+    "RefSeqStatusType": ".bio.protein_evidence",
+    "SecondaryStructureType": ".bio.protein_structure_features",
+    "LocalStructuralFeature": ".bio.protein_structure_features",
+    "PeakAnnotationSeriesLabel": ".bio.proteomics_standards",
+    "PeptideIonSeries": ".bio.proteomics_standards",
+    "MassErrorUnit": ".bio.proteomics_standards",
+    "InteractionDetectionMethod": ".bio.psi_mi",
+    "InteractionType": ".bio.psi_mi",
+    "ExperimentalRole": ".bio.psi_mi",
+    "BiologicalRole": ".bio.psi_mi",
+    "ParticipantIdentificationMethod": ".bio.psi_mi",
+    "FeatureType": ".bio.psi_mi",
+    "InteractorType": ".bio.psi_mi",
+    "ConfidenceScore": ".bio.psi_mi",
+    "ExperimentalPreparation": ".bio.psi_mi",
+    "RelToOxygenEnum": ".bio.relationship_to_oxygen",
+    "DNABaseEnum": ".bio.sequence_alphabets",
+    "DNABaseExtendedEnum": ".bio.sequence_alphabets",
+    "RNABaseEnum": ".bio.sequence_alphabets",
+    "RNABaseExtendedEnum": ".bio.sequence_alphabets",
+    "AminoAcidEnum": ".bio.sequence_alphabets",
+    "AminoAcidExtendedEnum": ".bio.sequence_alphabets",
+    "CodonEnum": ".bio.sequence_alphabets",
+    "NucleotideModificationEnum": ".bio.sequence_alphabets",
+    "SequenceQualityEnum": ".bio.sequence_alphabets",
+    "IUPACNucleotideCode": ".bio.sequence_chemistry",
+    "StandardAminoAcid": ".bio.sequence_chemistry",
+    "IUPACAminoAcidCode": ".bio.sequence_chemistry",
+    "SequenceAlphabet": ".bio.sequence_chemistry",
+    "SequenceQualityEncoding": ".bio.sequence_chemistry",
+    "GeneticCodeTable": ".bio.sequence_chemistry",
+    "SequenceStrand": ".bio.sequence_chemistry",
+    "SequenceTopology": ".bio.sequence_chemistry",
+    "SequenceModality": ".bio.sequence_chemistry",
+    "SequencingPlatform": ".bio.sequencing_platforms",
+    "SequencingChemistry": ".bio.sequencing_platforms",
+    "LibraryPreparation": ".bio.sequencing_platforms",
+    "SequencingApplication": ".bio.sequencing_platforms",
+    "ReadType": ".bio.sequencing_platforms",
+    "SequenceFileFormat": ".bio.sequencing_platforms",
+    "DataProcessingLevel": ".bio.sequencing_platforms",
+    "SpecimenPreparationMethodEnum": ".bio.specimen_processing",
+    "TissuePreservationEnum": ".bio.specimen_processing",
+    "SpecimenCollectionMethodEnum": ".bio.specimen_processing",
+    "SpecimenTypeEnum": ".bio.specimen_processing",
+    "AnalyteTypeEnum": ".bio.specimen_processing",
+    "SourceMaterialTypeEnum": ".bio.specimen_processing",
+    "SpecimenCreationActivityTypeEnum": ".bio.specimen_processing",
+    "SpecimenProcessingActivityTypeEnum": ".bio.specimen_processing",
+    "SpecimenQualityObservationTypeEnum": ".bio.specimen_processing",
+    "SpecimenQualityObservationMethodEnum": ".bio.specimen_processing",
+    "SpecimenQuantityObservationTypeEnum": ".bio.specimen_processing",
+    "SectionLocationEnum": ".bio.specimen_processing",
+    "SampleType": ".bio.structural_biology",
+    "StructuralBiologyTechnique": ".bio.structural_biology",
+    "CryoEMPreparationType": ".bio.structural_biology",
+    "CryoEMGridType": ".bio.structural_biology",
+    "VitrificationMethod": ".bio.structural_biology",
+    "CrystallizationMethod": ".bio.structural_biology",
+    "XRaySource": ".bio.structural_biology",
+    "Detector": ".bio.structural_biology",
+    "WorkflowType": ".bio.structural_biology",
+    "FileFormat": ".bio.structural_biology",
+    "DataType": ".bio.structural_biology",
+    "ProcessingStatus": ".bio.structural_biology",
+    "CoordinationGeometry": ".bio.structural_biology",
+    "MetalLigandType": ".bio.structural_biology",
+    "ProteinModificationType": ".bio.structural_biology",
+    "CommonOrganismTaxaEnum": ".bio.taxonomy",
+    "TaxonomicRank": ".bio.taxonomy",
+    "BiologicalKingdom": ".bio.taxonomy",
+    "TransplantationTypeEnum": ".bio.transplantation",
+    "XenograftModelEnum": ".bio.transplantation",
+    "ModelSystemTypeEnum": ".bio.transplantation",
+    "TrophicLevelEnum": ".bio.trophic_levels",
+    "UniProtSpeciesCode": ".bio.uniprot_species",
+    "ViralGenomeTypeEnum": ".bio.viral_genome_types",
+    # Bioprocessing domain
+    "BiomanufacturingScaleType": ".bioprocessing.biomanufacturing",
+    "BioproductCategoryType": ".bioprocessing.biomanufacturing",
+    "BioprocessOptimizationType": ".bioprocessing.biomanufacturing",
+    "ProcessScaleEnum": ".bioprocessing.scale_up",
+    "BioreactorTypeEnum": ".bioprocessing.scale_up",
+    "FermentationModeEnum": ".bioprocessing.scale_up",
+    "OxygenationStrategyEnum": ".bioprocessing.scale_up",
+    "AgitationTypeEnum": ".bioprocessing.scale_up",
+    "DownstreamProcessEnum": ".bioprocessing.scale_up",
+    "FeedstockTypeEnum": ".bioprocessing.scale_up",
+    "ProductTypeEnum": ".bioprocessing.scale_up",
+    "SterilizationMethodEnum": ".bioprocessing.scale_up",
+    # Business domain
+    "EmploymentTypeEnum": ".business.human_resources",
+    "JobLevelEnum": ".business.human_resources",
+    "HRFunctionEnum": ".business.human_resources",
+    "CompensationTypeEnum": ".business.human_resources",
+    "PerformanceRatingEnum": ".business.human_resources",
+    "RecruitmentSourceEnum": ".business.human_resources",
+    "TrainingTypeEnum": ".business.human_resources",
+    "EmployeeStatusEnum": ".business.human_resources",
+    "WorkArrangementEnum": ".business.human_resources",
+    "BenefitsCategoryEnum": ".business.human_resources",
+    "NAICSSectorEnum": ".business.industry_classifications",
+    "EconomicSectorEnum": ".business.industry_classifications",
+    "BusinessActivityTypeEnum": ".business.industry_classifications",
+    "IndustryMaturityEnum": ".business.industry_classifications",
+    "MarketStructureEnum": ".business.industry_classifications",
+    "IndustryRegulationLevelEnum": ".business.industry_classifications",
+    "ManagementMethodologyEnum": ".business.management_operations",
+    "StrategicFrameworkEnum": ".business.management_operations",
+    "OperationalModelEnum": ".business.management_operations",
+    "PerformanceMeasurementEnum": ".business.management_operations",
+    "DecisionMakingStyleEnum": ".business.management_operations",
+    "LeadershipStyleEnum": ".business.management_operations",
+    "BusinessProcessTypeEnum": ".business.management_operations",
+    "LegalEntityTypeEnum": ".business.organizational_structures",
+    "OrganizationalStructureEnum": ".business.organizational_structures",
+    "ManagementLevelEnum": ".business.organizational_structures",
+    "CorporateGovernanceRoleEnum": ".business.organizational_structures",
+    "BusinessOwnershipTypeEnum": ".business.organizational_structures",
+    "BusinessSizeClassificationEnum": ".business.organizational_structures",
+    "BusinessLifecycleStageEnum": ".business.organizational_structures",
+    "QualityStandardEnum": ".business.quality_management",
+    "QualityMethodologyEnum": ".business.quality_management",
+    "QualityControlTechniqueEnum": ".business.quality_management",
+    "QualityAssuranceLevelEnum": ".business.quality_management",
+    "ProcessImprovementApproachEnum": ".business.quality_management",
+    "QualityMaturityLevelEnum": ".business.quality_management",
+    "ProcurementTypeEnum": ".business.supply_chain",
+    "VendorCategoryEnum": ".business.supply_chain",
+    "SupplyChainStrategyEnum": ".business.supply_chain",
+    "LogisticsOperationEnum": ".business.supply_chain",
+    "SourcingStrategyEnum": ".business.supply_chain",
+    "SupplierRelationshipTypeEnum": ".business.supply_chain",
+    "InventoryManagementApproachEnum": ".business.supply_chain",
+    # Chemistry domain
+    "SubatomicParticleEnum": ".chemistry.chemical_entities",
+    "BondTypeEnum": ".chemistry.chemical_entities",
+    "PeriodicTableBlockEnum": ".chemistry.chemical_entities",
+    "ElementFamilyEnum": ".chemistry.chemical_entities",
+    "ElementMetallicClassificationEnum": ".chemistry.chemical_entities",
+    "HardOrSoftEnum": ".chemistry.chemical_entities",
+    "BronstedAcidBaseRoleEnum": ".chemistry.chemical_entities",
+    "LewisAcidBaseRoleEnum": ".chemistry.chemical_entities",
+    "OxidationStateEnum": ".chemistry.chemical_entities",
+    "ChiralityEnum": ".chemistry.chemical_entities",
+    "NanostructureMorphologyEnum": ".chemistry.chemical_entities",
+    "ReactionDirectionality": ".chemistry.reaction_directionality",
+    "ReactionTypeEnum": ".chemistry.reactions",
+    "ReactionMechanismEnum": ".chemistry.reactions",
+    "CatalystTypeEnum": ".chemistry.reactions",
+    "ReactionConditionEnum": ".chemistry.reactions",
+    "ReactionRateOrderEnum": ".chemistry.reactions",
+    "EnzymeClassEnum": ".chemistry.reactions",
+    "SolventClassEnum": ".chemistry.reactions",
+    "ThermodynamicParameterEnum": ".chemistry.reactions",
+    # Clinical domain
+    "ModeOfInheritance": ".clinical.genetics",
+    "RaceOMB1997Enum": ".clinical.nih_demographics",
+    "EthnicityOMB1997Enum": ".clinical.nih_demographics",
+    "BiologicalSexEnum": ".clinical.nih_demographics",
+    "AgeGroupEnum": ".clinical.nih_demographics",
+    "ParticipantVitalStatusEnum": ".clinical.nih_demographics",
+    "RecruitmentStatusEnum": ".clinical.nih_demographics",
+    "StudyPhaseEnum": ".clinical.nih_demographics",
+    "KaryotypicSexEnum": ".clinical.phenopackets",
+    "PhenotypicSexEnum": ".clinical.phenopackets",
+    "AllelicStateEnum": ".clinical.phenopackets",
+    "LateralityEnum": ".clinical.phenopackets",
+    "OnsetTimingEnum": ".clinical.phenopackets",
+    "ACMGPathogenicityEnum": ".clinical.phenopackets",
+    "TherapeuticActionabilityEnum": ".clinical.phenopackets",
+    "InterpretationProgressEnum": ".clinical.phenopackets",
+    "RegimenStatusEnum": ".clinical.phenopackets",
+    "DrugResponseEnum": ".clinical.phenopackets",
+    "ConditionProvenanceEnum": ".clinical.provenance",
+    "VisitProvenanceEnum": ".clinical.provenance",
+    "DrugExposureProvenanceEnum": ".clinical.provenance",
+    "StatusEnum": ".clinical.provenance",
+    "HistoricalStatusEnum": ".clinical.provenance",
+    "ResearchProjectTypeEnum": ".clinical.provenance",
+    # Computing domain
+    "MLDataType": ".computing.croissant_ml",
+    "DatasetEncodingFormat": ".computing.croissant_ml",
+    "DatasetSplitType": ".computing.croissant_ml",
+    "MLLicenseType": ".computing.croissant_ml",
+    "MLFieldRole": ".computing.croissant_ml",
+    "CompressionFormat": ".computing.croissant_ml",
+    "MLMediaType": ".computing.croissant_ml",
+    "MLModalityType": ".computing.croissant_ml",
+    "DataCenterCoolingType": ".computing.data_centers",
+    "DataCenterTierLevel": ".computing.data_centers",
+    "ImageFileFormatEnum": ".computing.file_formats",
+    "DocumentFormatEnum": ".computing.file_formats",
+    "DataFormatEnum": ".computing.file_formats",
+    "ArchiveFormatEnum": ".computing.file_formats",
+    "VideoFormatEnum": ".computing.file_formats",
+    "AudioFormatEnum": ".computing.file_formats",
+    "ProgrammingLanguageFileEnum": ".computing.file_formats",
+    "NetworkProtocolEnum": ".computing.file_formats",
+    "FrontierModelEnum": ".computing.frontier_ai_models",
+    "GeospatialRasterFormat": ".computing.geospatial_formats",
+    "GeospatialVectorFormat": ".computing.geospatial_formats",
+    "TechnologyReadinessLevel": ".computing.maturity_levels",
+    "SoftwareMaturityLevel": ".computing.maturity_levels",
+    "CapabilityMaturityLevel": ".computing.maturity_levels",
+    "StandardsMaturityLevel": ".computing.maturity_levels",
+    "ProjectMaturityLevel": ".computing.maturity_levels",
+    "DataMaturityLevel": ".computing.maturity_levels",
+    "OpenSourceMaturityLevel": ".computing.maturity_levels",
+    "SemiconductorMaterialType": ".computing.microelectronics",
+    "ChipFabricationNodeType": ".computing.microelectronics",
+    "MimeType": ".computing.mime_types",
+    "MimeTypeCategory": ".computing.mime_types",
+    "TextCharset": ".computing.mime_types",
+    "CompressionType": ".computing.mime_types",
+    "OWLProfileEnum": ".computing.ontologies",
+    "QubitType": ".computing.quantum",
+    "QuantumAlgorithmCategoryType": ".computing.quantum",
+    # Core domain
+    "ConfidenceLevel": ".confidence_levels",
+    "CIOConfidenceLevel": ".confidence_levels",
+    "OBCSCertaintyLevel": ".confidence_levels",
+    "IPCCLikelihoodScale": ".confidence_levels",
+    "IPCCConfidenceLevel": ".confidence_levels",
+    "NCITFivePointConfidenceScale": ".confidence_levels",
+    "ContributorType": ".contributor",
+    "EducationLevel": ".demographics",
+    "MaritalStatus": ".demographics",
+    "EmploymentStatus": ".demographics",
+    "HousingStatus": ".demographics",
+    "GenderIdentity": ".demographics",
+    "OmbRaceCategory": ".demographics",
+    "OmbEthnicityCategory": ".demographics",
+    "BioticInteractionType": ".ecological_interactions",
+    "VitalStatusEnum": ".health",
+    "HealthcareEncounterClassification": ".healthcare",
+    "CaseOrControlEnum": ".investigation",
+    "PlannedProcessCompletionStatus": ".investigation",
+    "MineralogyFeedstockClass": ".mining_processing",
+    "BeneficiationPathway": ".mining_processing",
+    "InSituChemistryRegime": ".mining_processing",
+    "ExtractableTargetElement": ".mining_processing",
+    "SensorWhileDrillingFeature": ".mining_processing",
+    "ProcessPerformanceMetric": ".mining_processing",
+    "BioleachOrganism": ".mining_processing",
+    "BioleachMode": ".mining_processing",
+    "AutonomyLevel": ".mining_processing",
+    "RegulatoryConstraint": ".mining_processing",
+    "PredictionOutcomeType": ".statistics",
+    "ValueSetStewardEnum": ".stewardship",
+    # Data domain
+    "DataAbsentEnum": ".data.data_absent_reason",
+    "DataUsePermissionEnum": ".data.data_use",
+    "DataUseModifierEnum": ".data.data_use",
+    # Data_Catalog domain
+    "AccessRights": ".data_catalog.access",
+    "DatasetStatus": ".data_catalog.access",
+    "UpdateFrequency": ".data_catalog.access",
+    "DataServiceType": ".data_catalog.access",
+    "DataCiteContributorType": ".data_catalog.contributor_roles",
+    "DataCiteRelationType": ".data_catalog.relations",
+    "DataCiteResourceType": ".data_catalog.resource_types",
+    # Data_Science domain
+    "BinaryClassificationEnum": ".data_science.binary_classification",
+    "SpamClassificationEnum": ".data_science.binary_classification",
+    "AnomalyDetectionEnum": ".data_science.binary_classification",
+    "ChurnClassificationEnum": ".data_science.binary_classification",
+    "FraudDetectionEnum": ".data_science.binary_classification",
+    "BasicEmotionEnum": ".data_science.emotion_classification",
+    "ExtendedEmotionEnum": ".data_science.emotion_classification",
+    "PriorityLevelEnum": ".data_science.priority_severity",
+    "SeverityLevelEnum": ".data_science.priority_severity",
+    "ConfidenceLevelEnum": ".data_science.priority_severity",
+    "QualityControlEnum": ".data_science.quality_control",
+    "DefectClassificationEnum": ".data_science.quality_control",
+    "SentimentClassificationEnum": ".data_science.sentiment_analysis",
+    "FineSentimentClassificationEnum": ".data_science.sentiment_analysis",
+    "NewsTopicCategoryEnum": ".data_science.text_classification",
+    "ToxicityClassificationEnum": ".data_science.text_classification",
+    "IntentClassificationEnum": ".data_science.text_classification",
+    # Earth_Science domain
+    "SESARCollectionMethod": ".earth_science.collection_methods",
+    "FAOSoilType": ".earth_science.fao_soil",
+    "AquiferType": ".earth_science.hydrogeology",
+    "GroundwaterProcessType": ".earth_science.hydrogeology",
+    "HydrogeologyWellType": ".earth_science.hydrogeology",
+    "SESARMaterialType": ".earth_science.material_types",
+    "SESARPhysiographicFeature": ".earth_science.physiographic_features",
+    "RemoteSensingPlatformType": ".earth_science.remote_sensing",
+    "RemoteSensingDataType": ".earth_science.remote_sensing",
+    "SESARSampleType": ".earth_science.sample_types",
+    "SubsurfaceFormationType": ".earth_science.subsurface",
+    "GeophysicalMethodType": ".earth_science.subsurface",
+    "SubsurfacePropertyType": ".earth_science.subsurface",
+    "WaterResourceType": ".earth_science.water_resources",
+    "WaterUseCategoryType": ".earth_science.water_resources",
+    "WaterQualityParameterType": ".earth_science.water_resources",
+    # Energy domain
+    "EnergySource": ".energy.energy",
+    "EnergyUnit": ".energy.energy",
+    "PowerUnit": ".energy.energy",
+    "EnergyEfficiencyRating": ".energy.energy",
+    "BuildingEnergyStandard": ".energy.energy",
+    "GridType": ".energy.energy",
+    "BatteryType": ".energy.energy",
+    "PVCellType": ".energy.energy",
+    "PVSystemType": ".energy.energy",
+    "EnergyStorageType": ".energy.energy",
+    "EmissionScope": ".energy.energy",
+    "CarbonIntensity": ".energy.energy",
+    "ElectricityMarket": ".energy.energy",
+    "CapabilityStatus": ".energy.energy",
+    "FossilFuelTypeEnum": ".energy.fossil_fuels",
+    "GridComponentType": ".energy.grid",
+    "GridEnergyStorageType": ".energy.grid",
+    "GridManagementStrategyType": ".energy.grid",
+    "FusionConfinementType": ".energy.nuclear.fusion",
+    "FusionFuelType": ".energy.nuclear.fusion",
+    "FusionPlasmaParameterType": ".energy.nuclear.fusion",
+    "NuclearRemediationType": ".energy.nuclear.nuclear_cleanup",
+    "DecommissioningPhaseType": ".energy.nuclear.nuclear_cleanup",
+    "RadioactiveContaminantType": ".energy.nuclear.nuclear_cleanup",
+    "NuclearFacilityTypeEnum": ".energy.nuclear.nuclear_facilities",
+    "PowerPlantStatusEnum": ".energy.nuclear.nuclear_facilities",
+    "ResearchReactorTypeEnum": ".energy.nuclear.nuclear_facilities",
+    "FuelCycleFacilityTypeEnum": ".energy.nuclear.nuclear_facilities",
+    "WasteFacilityTypeEnum": ".energy.nuclear.nuclear_facilities",
+    "NuclearShipTypeEnum": ".energy.nuclear.nuclear_facilities",
+    "NuclearForensicsMethodType": ".energy.nuclear.nuclear_forensics",
+    "NuclearThreatCategoryType": ".energy.nuclear.nuclear_forensics",
+    "NuclearFuelCycleStageEnum": ".energy.nuclear.nuclear_fuel_cycle",
+    "NuclearFuelFormEnum": ".energy.nuclear.nuclear_fuel_cycle",
+    "EnrichmentProcessEnum": ".energy.nuclear.nuclear_fuel_cycle",
+    "NuclearFuelTypeEnum": ".energy.nuclear.nuclear_fuels",
+    "UraniumEnrichmentLevelEnum": ".energy.nuclear.nuclear_fuels",
+    "FuelFormEnum": ".energy.nuclear.nuclear_fuels",
+    "FuelAssemblyTypeEnum": ".energy.nuclear.nuclear_fuels",
+    "FuelCycleStageEnum": ".energy.nuclear.nuclear_fuels",
+    "FissileIsotopeEnum": ".energy.nuclear.nuclear_fuels",
+    "ReactorOperatingStateEnum": ".energy.nuclear.nuclear_operations",
+    "MaintenanceTypeEnum": ".energy.nuclear.nuclear_operations",
+    "FuelCycleOperationEnum": ".energy.nuclear.nuclear_operations",
+    "ReactorControlModeEnum": ".energy.nuclear.nuclear_operations",
+    "OperationalProcedureEnum": ".energy.nuclear.nuclear_operations",
+    "NuclearRegulatoryBodyEnum": ".energy.nuclear.nuclear_regulatory",
+    "RegulatoryFrameworkEnum": ".energy.nuclear.nuclear_regulatory",
+    "LicensingStageEnum": ".energy.nuclear.nuclear_regulatory",
+    "ComplianceStandardEnum": ".energy.nuclear.nuclear_regulatory",
+    "InspectionTypeEnum": ".energy.nuclear.nuclear_regulatory",
+    "INESLevelEnum": ".energy.nuclear.nuclear_safety",
+    "EmergencyClassificationEnum": ".energy.nuclear.nuclear_safety",
+    "NuclearSecurityCategoryEnum": ".energy.nuclear.nuclear_safety",
+    "SafetySystemClassEnum": ".energy.nuclear.nuclear_safety",
+    "ReactorSafetyFunctionEnum": ".energy.nuclear.nuclear_safety",
+    "DefenseInDepthLevelEnum": ".energy.nuclear.nuclear_safety",
+    "RadiationProtectionZoneEnum": ".energy.nuclear.nuclear_safety",
+    "IAEAWasteClassificationEnum": ".energy.nuclear.nuclear_waste",
+    "NRCWasteClassEnum": ".energy.nuclear.nuclear_waste",
+    "WasteHeatGenerationEnum": ".energy.nuclear.nuclear_waste",
+    "WasteHalfLifeCategoryEnum": ".energy.nuclear.nuclear_waste",
+    "WasteDisposalMethodEnum": ".energy.nuclear.nuclear_waste",
+    "WasteSourceEnum": ".energy.nuclear.nuclear_waste",
+    "TransuranicWasteCategoryEnum": ".energy.nuclear.nuclear_waste",
+    "ReactorTypeEnum": ".energy.nuclear.reactor_types",
+    "ReactorGenerationEnum": ".energy.nuclear.reactor_types",
+    "ReactorCoolantEnum": ".energy.nuclear.reactor_types",
+    "ReactorModeratorEnum": ".energy.nuclear.reactor_types",
+    "ReactorNeutronSpectrumEnum": ".energy.nuclear.reactor_types",
+    "ReactorSizeCategoryEnum": ".energy.nuclear.reactor_types",
+    "BiomassFeedstockType": ".energy.renewable.bioenergy",
+    "BiofuelType": ".energy.renewable.bioenergy",
+    "BiofuelGeneration": ".energy.renewable.bioenergy",
+    "BioconversionProcess": ".energy.renewable.bioenergy",
+    "GeothermalSystemType": ".energy.renewable.geothermal",
+    "GeothermalReservoirType": ".energy.renewable.geothermal",
+    "GeothermalWellType": ".energy.renewable.geothermal",
+    "GeothermalApplication": ".energy.renewable.geothermal",
+    "GeothermalResourceTemperature": ".energy.renewable.geothermal",
+    "HydrogenType": ".energy.renewable.hydrogen",
+    "HydrogenProductionMethod": ".energy.renewable.hydrogen",
+    "HydrogenStorageMethod": ".energy.renewable.hydrogen",
+    "HydrogenApplication": ".energy.renewable.hydrogen",
+    "SubsurfaceEnergyResourceType": ".energy.subsurface_energy",
+    "SubsurfaceStorageType": ".energy.subsurface_energy",
+    "ReservoirCharacterizationMethodType": ".energy.subsurface_energy",
+    # Environmental_Health domain
+    "IARCCarcinogenicityGroup": ".environmental_health.carcinogenicity",
+    "EPAIRISCarcinogenicityGroup": ".environmental_health.carcinogenicity",
+    "NTPCarcinogenicityGroup": ".environmental_health.carcinogenicity",
+    "AirPollutantEnum": ".environmental_health.exposures",
+    "PesticideTypeEnum": ".environmental_health.exposures",
+    "HeavyMetalEnum": ".environmental_health.exposures",
+    "ExposureRouteEnum": ".environmental_health.exposures",
+    "ExposureSourceEnum": ".environmental_health.exposures",
+    "WaterContaminantEnum": ".environmental_health.exposures",
+    "EndocrineDisruptorEnum": ".environmental_health.exposures",
+    "ExposureDurationEnum": ".environmental_health.exposures",
+    "SmokingStatusEnum": ".environmental_health.exposures",
+    "ExposureStressorTypeEnum": ".environmental_health.exposures",
+    "ExposureTransportPathEnum": ".environmental_health.exposures",
+    "ExposureFrequencyEnum": ".environmental_health.exposures",
+    "StudyPopulationEnum": ".environmental_health.exposures",
+    "HHEARExposureAssessedEnum": ".environmental_health.exposures",
+    "ExtremeWeatherEventEnum": ".environmental_health.gb_edoh",
+    "ExposureAgentCategoryEnum": ".environmental_health.gb_edoh",
+    "TemporalAggregationEnum": ".environmental_health.gb_edoh",
+    "SpatialResolutionEnum": ".environmental_health.gb_edoh",
+    "RadionuclideEnum": ".environmental_health.radionuclides",
+    "NORMEnum": ".environmental_health.radionuclides",
+    # Geography domain
+    "CountryCodeISO2Enum": ".geography.geographic_codes",
+    "CountryCodeISO3Enum": ".geography.geographic_codes",
+    "USStateCodeEnum": ".geography.geographic_codes",
+    "CanadianProvinceCodeEnum": ".geography.geographic_codes",
+    "CompassDirection": ".geography.geographic_codes",
+    "RelativeDirection": ".geography.geographic_codes",
+    "WindDirection": ".geography.geographic_codes",
+    "ContinentEnum": ".geography.geographic_codes",
+    "UNRegionEnum": ".geography.geographic_codes",
+    "LanguageCodeISO6391enum": ".geography.geographic_codes",
+    "TimeZoneEnum": ".geography.geographic_codes",
+    "CurrencyCodeISO4217Enum": ".geography.geographic_codes",
+    # Health domain
+    "VaccinationStatusEnum": ".health.vaccination",
+    "VaccinationPeriodicityEnum": ".health.vaccination",
+    "VaccineCategoryEnum": ".health.vaccination",
+    # Industry domain
+    "BuildingSystemType": ".industry.construction",
+    "BuildingEnergyPerformanceLevel": ".industry.construction",
+    "ExtractiveIndustryFacilityTypeEnum": ".industry.extractive_industry",
+    "ExtractiveIndustryProductTypeEnum": ".industry.extractive_industry",
+    "MiningMethodEnum": ".industry.extractive_industry",
+    "WellTypeEnum": ".industry.extractive_industry",
+    "ManufacturingProcessType": ".industry.manufacturing",
+    "SmartManufacturingTechnologyType": ".industry.manufacturing",
+    "MiningType": ".industry.mining",
+    "MineralCategory": ".industry.mining",
+    "CriticalMineral": ".industry.mining",
+    "CommonMineral": ".industry.mining",
+    "MiningEquipment": ".industry.mining",
+    "OreGrade": ".industry.mining",
+    "MiningPhase": ".industry.mining",
+    "MiningHazard": ".industry.mining",
+    "EnvironmentalImpact": ".industry.mining",
+    "SafetyColorEnum": ".industry.safety_colors",
+    "TrafficLightColorEnum": ".industry.safety_colors",
+    "HazmatColorEnum": ".industry.safety_colors",
+    "FireSafetyColorEnum": ".industry.safety_colors",
+    "MaritimeSignalColorEnum": ".industry.safety_colors",
+    "AviationLightColorEnum": ".industry.safety_colors",
+    "ElectricalWireColorEnum": ".industry.safety_colors",
+    "UnconventionalMineralResourceType": ".industry.unconventional_resources",
+    "BioextractionMethodType": ".industry.unconventional_resources",
+    "TailingCharacterizationType": ".industry.unconventional_resources",
+    # Lab_Automation domain
+    "AutonomousLabComponentType": ".lab_automation.autonomous_labs",
+    "ExperimentalDesignMethodType": ".lab_automation.autonomous_labs",
+    "LabAutomationWorkflowType": ".lab_automation.autonomous_labs",
+    "RelativeTimeEnum": ".lab_automation.cloud_lab",
+    "PresenceEnum": ".lab_automation.cloud_lab",
+    "LabUnitOperationEnum": ".lab_automation.cloud_lab",
+    "CloudLabExperimentEnum": ".lab_automation.cloud_lab",
+    "LaboratoryDeviceTypeEnum": ".lab_automation.devices",
+    "RoboticArmTypeEnum": ".lab_automation.devices",
+    "MicroplateFormatEnum": ".lab_automation.labware",
+    "ContainerTypeEnum": ".lab_automation.labware",
+    "PlateMaterialEnum": ".lab_automation.labware",
+    "PlateCoatingEnum": ".lab_automation.labware",
+    "LiquidHandlingOperationEnum": ".lab_automation.operations",
+    "SampleProcessingOperationEnum": ".lab_automation.operations",
+    "WorkflowOrchestrationTypeEnum": ".lab_automation.protocols",
+    "SchedulerTypeEnum": ".lab_automation.protocols",
+    "ProtocolStateEnum": ".lab_automation.protocols",
+    "ExecutionModeEnum": ".lab_automation.protocols",
+    "WorkflowErrorHandlingEnum": ".lab_automation.protocols",
+    "IntegrationSystemEnum": ".lab_automation.protocols",
+    "AutomationStandardEnum": ".lab_automation.standards",
+    "CommunicationProtocolEnum": ".lab_automation.standards",
+    "LabwareStandardEnum": ".lab_automation.standards",
+    "IntegrationFeatureEnum": ".lab_automation.standards",
+    "ThermalCyclerTypeEnum": ".lab_automation.thermal_cycling",
+    "PCROperationTypeEnum": ".lab_automation.thermal_cycling",
+    "DetectionModeEnum": ".lab_automation.thermal_cycling",
+    "PCRPlateTypeEnum": ".lab_automation.thermal_cycling",
+    "ThermalCyclingStepEnum": ".lab_automation.thermal_cycling",
+    # Materials_Science domain
+    "MicroscopyMethodEnum": ".materials_science.characterization_methods",
+    "SpectroscopyMethodEnum": ".materials_science.characterization_methods",
+    "ThermalAnalysisMethodEnum": ".materials_science.characterization_methods",
+    "MechanicalTestingMethodEnum": ".materials_science.characterization_methods",
+    "MaterialsSimulationType": ".materials_science.computational_materials",
+    "MaterialPropertyPredictionType": ".materials_science.computational_materials",
+    "CrystalSystemEnum": ".materials_science.crystal_structures",
+    "BravaisLatticeEnum": ".materials_science.crystal_structures",
+    "ElectricalConductivityEnum": ".materials_science.material_properties",
+    "MagneticPropertyEnum": ".materials_science.material_properties",
+    "OpticalPropertyEnum": ".materials_science.material_properties",
+    "ThermalConductivityEnum": ".materials_science.material_properties",
+    "MechanicalBehaviorEnum": ".materials_science.material_properties",
+    "MaterialClassEnum": ".materials_science.material_types",
+    "PolymerTypeEnum": ".materials_science.material_types",
+    "MetalTypeEnum": ".materials_science.material_types",
+    "CompositeTypeEnum": ".materials_science.material_types",
+    "TraditionalPigmentEnum": ".materials_science.pigments_dyes",
+    "IndustrialDyeEnum": ".materials_science.pigments_dyes",
+    "FoodColoringEnum": ".materials_science.pigments_dyes",
+    "AutomobilePaintColorEnum": ".materials_science.pigments_dyes",
+    "SynthesisMethodEnum": ".materials_science.synthesis_methods",
+    "CrystalGrowthMethodEnum": ".materials_science.synthesis_methods",
+    "AdditiveManufacturingEnum": ".materials_science.synthesis_methods",
+    # Medical domain
+    "BloodTypeEnum": ".medical.clinical",
+    "AnatomicalSystemEnum": ".medical.clinical",
+    "MedicalSpecialtyEnum": ".medical.clinical",
+    "DrugRouteEnum": ".medical.clinical",
+    "VitalSignEnum": ".medical.clinical",
+    "DiagnosticTestTypeEnum": ".medical.clinical",
+    "SymptomSeverityEnum": ".medical.clinical",
+    "AllergyTypeEnum": ".medical.clinical",
+    "VaccineTypeEnum": ".medical.clinical",
+    "BMIClassificationEnum": ".medical.clinical",
+    "FamilyRelationship": ".medical.family_history",
+    "FamilyHistoryStatus": ".medical.family_history",
+    "GeneticRelationship": ".medical.family_history",
+    "MRIPlatformEnum": ".medical.imaging_platforms",
+    "MicroscopyPlatformEnum": ".medical.imaging_platforms",
+    "ImagingSystemPlatformEnum": ".medical.imaging_platforms",
+    "MRIModalityEnum": ".medical.neuroimaging",
+    "MRISequenceTypeEnum": ".medical.neuroimaging",
+    "MRIContrastTypeEnum": ".medical.neuroimaging",
+    "FMRIParadigmTypeEnum": ".medical.neuroimaging",
+    "TumorTopography": ".medical.oncology.icdo",
+    "TumorMorphology": ".medical.oncology.icdo",
+    "TumorBehavior": ".medical.oncology.icdo",
+    "TumorGrade": ".medical.oncology.icdo",
+    "PediatricOncologyDiagnosisCategory": ".medical.pediatric_oncology.diagnosis_categories",
+    "ICCC3MainGroup": ".medical.pediatric_oncology.iccc3",
+    "ICCC3Subgroup": ".medical.pediatric_oncology.iccc3",
+    "INRGSSStage": ".medical.pediatric_oncology.staging.neuroblastoma",
+    "INSSStage": ".medical.pediatric_oncology.staging.neuroblastoma",
+    "NeuroblastomaRiskGroup": ".medical.pediatric_oncology.staging.neuroblastoma",
+    "ImageDefinedRiskFactor": ".medical.pediatric_oncology.staging.neuroblastoma",
+    # Physics domain
+    "ParticleAcceleratorType": ".physics.particle_physics",
+    "FundamentalParticleType": ".physics.particle_physics",
+    "DetectorType": ".physics.particle_physics",
+    "ElectromagneticRadiationTypeEnum": ".physics.radiation",
+    "InfraredRadiationTypeEnum": ".physics.radiation",
+    "AcousticRadiationTypeEnum": ".physics.radiation",
+    "StateOfMatterEnum": ".physics.states_of_matter",
+    # Preservation domain
+    "DigitalObjectCategory": ".preservation.digital_objects",
+    "CopyrightStatus": ".preservation.digital_objects",
+    "RightsBasis": ".preservation.digital_objects",
+    "PreservationLevelRole": ".preservation.digital_objects",
+    "PreservationLevelValue": ".preservation.digital_objects",
+    "PreservationEventType": ".preservation.events",
+    "PreservationEventOutcome": ".preservation.events",
+    "CryptographicHashFunction": ".preservation.fixity",
+    # Publishing domain
+    "ArxivCategory": ".publishing.arxiv_categories",
+    "OstiWorkflowStatus": ".publishing.osti_record",
+    "OstiAccessLimitation": ".publishing.osti_record",
+    "OstiCollectionType": ".publishing.osti_record",
+    "OstiSensitivityFlag": ".publishing.osti_record",
+    "OstiOrganizationIdentifierType": ".publishing.osti_record",
+    "OstiProductType": ".publishing.osti_record",
+    "OstiOrganizationType": ".publishing.osti_record",
+    "OstiPersonType": ".publishing.osti_record",
+    "OstiContributorType": ".publishing.osti_record",
+    "OstiRelatedIdentifierType": ".publishing.osti_record",
+    "OstiRelationType": ".publishing.osti_record",
+    "OstiIdentifierType": ".publishing.osti_record",
+    "OstiGeolocationType": ".publishing.osti_record",
+    "OstiMediaLocationType": ".publishing.osti_record",
+    # Social domain
+    "PersonStatusEnum": ".social.person_status",
+    "GravitySdohDomainEnum": ".social.sdoh",
+    "EducationalAttainmentEnum": ".social.sdoh",
+    # Spatial domain
+    "SimpleSpatialDirection": ".spatial.spatial_qualifiers",
+    "AnatomicalSide": ".spatial.spatial_qualifiers",
+    "AnatomicalRegion": ".spatial.spatial_qualifiers",
+    "AnatomicalAxis": ".spatial.spatial_qualifiers",
+    "AnatomicalPlane": ".spatial.spatial_qualifiers",
+    "SpatialRelationship": ".spatial.spatial_qualifiers",
+    "CellPolarity": ".spatial.spatial_qualifiers",
+    "AnatomicalOrientation": ".spatial.spatial_qualifiers",
+    # Statistics domain
+    "OutcomeTypeEnum": ".statistics.prediction_outcomes",
+    # Time domain
+    "DayOfWeek": ".time.temporal",
+    "Month": ".time.temporal",
+    "Quarter": ".time.temporal",
+    "Season": ".time.temporal",
+    "TimePeriod": ".time.temporal",
+    "TimeOfDay": ".time.temporal",
+    "BusinessTimeFrame": ".time.temporal",
+    "GeologicalEra": ".time.temporal",
+    "HistoricalPeriod": ".time.temporal",
+    # Units domain
+    "LengthUnitEnum": ".units.measurements",
+    "MassUnitEnum": ".units.measurements",
+    "VolumeUnitEnum": ".units.measurements",
+    "TemperatureUnitEnum": ".units.measurements",
+    "TimeUnitEnum": ".units.measurements",
+    "PressureUnitEnum": ".units.measurements",
+    "ConcentrationUnitEnum": ".units.measurements",
+    "FrequencyUnitEnum": ".units.measurements",
+    "AngleUnitEnum": ".units.measurements",
+    "DataSizeUnitEnum": ".units.measurements",
+    "QuantityKindEnum": ".units.quantity_kinds",
+    # Visual domain
+    "BasicColorEnum": ".visual.colors",
+    "WebColorEnum": ".visual.colors",
+    "X11ColorEnum": ".visual.colors",
+    "ColorSpaceEnum": ".visual.colors",
+}
 
 __all__ = [
     "ACMGPathogenicityEnum",
@@ -925,4 +1616,17 @@ __all__ = [
     "X11ColorEnum",
     "XRaySource",
     "XenograftModelEnum",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _ENUM_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
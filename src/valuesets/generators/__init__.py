@@ -1,12 +1,17 @@
 """Custom generators for the valuesets project."""
 
-from .enhanced_pydantic_generator import (
-    EnhancedPydanticGenerator,
-    EnhancedEnumValue,
-    generate_enhanced_pydantic
-)
+import importlib
+
 from .rich_enum import RichEnum, RichEnumMeta, RichEnumType
-from .rich_pydantic_generator import RichPydanticGenerator
+
+# The pydantic generators depend on linkml; import them only when used so
+# that importing generated enums (which need RichEnum) stays lightweight.
+_LAZY_IMPORTS = {
+    'EnhancedPydanticGenerator': '.enhanced_pydantic_generator',
+    'EnhancedEnumValue': '.enhanced_pydantic_generator',
+    'generate_enhanced_pydantic': '.enhanced_pydantic_generator',
+    'RichPydanticGenerator': '.rich_pydantic_generator',
+}
 
 __all__ = [
     'EnhancedPydanticGenerator',
@@ -16,4 +21,13 @@ __all__ = [
     'RichEnumMeta',
     'RichEnumType',
     'RichPydanticGenerator'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -197,6 +197,9 @@ class ModularRichEnumGenerator:
         if pv.description:
             metadata['description'] = pv.description
 
+        if pv.title:
+            metadata['title'] = pv.title
+
         if pv.meaning:
             metadata['meaning'] = pv.meaning
 
@@ -241,6 +244,31 @@ class ModularRichEnumGenerator:
 
     def generate_init_file(self):
         """Generate top-level __init__.py for convenient imports."""
+        # Collect all enums from all modules
+        imports_by_module = {}
+        for module_key, info in sorted(self.generated_modules.items()):
+            if info['enums']:
+                module_path = module_key.replace('/', '.')
+                imports_by_module[module_path] = info['enums']
+
+        # Write the init file
+        init_path = self.output_dir / '__init__.py'
+        init_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(init_path, 'w') as f:
+            f.write(self.render_init_file(imports_by_module))
+
+        all_enums = [enum for enums in imports_by_module.values() for enum in enums]
+        logger.info(f"Generated {init_path} with {len(all_enums)} enum exports")
+
+    def render_init_file(self, imports_by_module: Dict[str, List[str]]) -> str:
+        """
+        Render the package __init__.py for the given module -> enum names table.
+
+        The package resolves enums lazily (PEP 562): importing one enum only
+        imports the module that defines it. Where several modules define the
+        same enum name, the module that sorts last wins, matching the
+        behaviour of the former eager imports.
+        """
         output = []
 
         output.append('"""')
@@ -250,6 +278,9 @@ class ModularRichEnumGenerator:
         output.append('Each enum includes rich metadata (descriptions, ontology mappings, annotations)')
         output.append('while maintaining full Python enum compatibility.')
         output.append('')
+        output.append('Enums are imported lazily: only the module defining a requested enum is')
+        output.append('loaded, so importing a single enum does not pay for the whole collection.')
+        output.append('')
         output.append('Usage:')
         output.append('    from valuesets.enums import Presenceenum, AnatomicalSide')
         output.append('    ')
@@ -259,18 +290,11 @@ class ModularRichEnumGenerator:
         output.append('')
         output.append('# flake8: noqa')
         output.append('')
+        output.append('import importlib')
+        output.append('from typing import TYPE_CHECKING')
+        output.append('')
 
-        # Collect all enums from all modules
-        all_enums = []
-        imports_by_module = {}
-
-        for module_key, info in sorted(self.generated_modules.items()):
-            if info['enums']:
-                module_path = module_key.replace('/', '.')
-                imports_by_module[module_path] = info['enums']
-                all_enums.extend(info['enums'])
-
-        # Generate imports grouped by domain
+        # Group modules by domain
         domains = {}
         for module_path, enums in imports_by_module.items():
             parts = module_path.split('.')
@@ -279,30 +303,60 @@ class ModularRichEnumGenerator:
                 domains[domain] = {}
             domains[domain][module_path] = enums
 
-        # Write imports organized by domain
+        # Resolve each enum name to its defining module (last one wins)
+        enum_modules = {}
+        for domain in sorted(domains.keys()):
+            for module_path, enums in sorted(domains[domain].items()):
+                for enum in enums:
+                    enum_modules[enum] = module_path
+
+        # Static imports for type checkers and IDEs only
+        output.append('if TYPE_CHECKING:')
         for domain in sorted(domains.keys()):
-            output.append(f'# {domain.title()} domain')
+            output.append(f'    # {domain.title()} domain')
             for module_path, enums in sorted(domains[domain].items()):
                 if enums:
                     enum_list = ', '.join(enums)
-                    output.append(f'from .{module_path} import {enum_list}')
-            output.append('')
+                    output.append(f'    from .{module_path} import {enum_list}')
+        output.append('')
+
+        # Name -> module table used by __getattr__, grouped by domain
+        output.append('# Module defining each exported enum, relative to this package')
+        output.append('_ENUM_MODULES = {')
+        for domain in sorted(domains.keys()):
+            output.append(f'    # {domain.title()} domain')
+            for module_path, enums in sorted(domains[domain].items()):
+                for enum in enums:
+                    if enum_modules[enum] == module_path:
+                        output.append(f'    "{enum}": ".{module_path}",')
+                        enum_modules[enum] = None  # Emit each name once
+        output.append('}')
+        output.append('')
 
         # Generate __all__
         output.append('__all__ = [')
-        for enum in sorted(set(all_enums)):
+        for enum in sorted(enum_modules):
             output.append(f'    "{enum}",')
         output.append(']')
+        output.append('')
+        output.append('')
+        output.append('def __getattr__(name):')
+        output.append('    module = _ENUM_MODULES.get(name)')
+        output.append('    if module is None:')
+        output.append('        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")')
+        output.append('    value = getattr(importlib.import_module(module, __name__), name)')
+        output.append('    globals()[name] = value')
+        output.append('    return value')
+        output.append('')
+        output.append('')
+        output.append('def __dir__():')
+        output.append('    return sorted(set(globals()) | set(__all__))')
+        output.append('')
 
-        # Write the init file
-        init_path = self.output_dir / '__init__.py'
-        init_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(init_path, 'w') as f:
-            f.write('\n'.join(output))
-
-        logger.info(f"Generated {init_path} with {len(all_enums)} enum exports")
+        return '\n'.join(output)
 
-    def _get_class_name(self, name: str) -> str:
+    @staticmethod
+    def _get_class_name(name: str) -> str:
         """Convert LinkML name to Python class name with proper CamelCase."""
         # Handle already CamelCase names
         if not any(c in name for c in ['_', '-', ' ']):
@@ -0,0 +1,305 @@
+"""
+Enum Registry Generator
+
+Serializes every RichEnum in a generated enums package (names, values,
+meanings, descriptions, aliases and annotations) into a single SQLite file.
+The registry is read by valuesets.registry, which answers metadata lookups
+without importing the enum modules.
+
+The registry also holds a CURIE index: every member's meaning plus the
+exact/close/narrow/broad/related mappings declared in the source schemas,
+keyed by normalized CURIE (see valuesets.curie_index).
+
+Classifier capabilities are precomputed too: the classifier fields of every
+enum (see valuesets.utils.classifier.detect_classifier_fields) and each
+member's parsed range bounds and unit for those fields.
+
+Run this after ModularRichEnumGenerator so the registry matches the
+generated modules.
+"""
+
+import importlib
+import json
+import logging
+import pkgutil
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from valuesets.generators.rich_enum import RichEnum, curie_key
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Bump when the table layout changes; readers refuse other versions
+REGISTRY_FORMAT_VERSION = 3
+
+# Schema directory of the valuesets package, the default source of mappings
+DEFAULT_SCHEMA_DIR = Path(__file__).parent.parent / "schema"
+
+# Permissible value slots indexed as mapping CURIEs, besides meaning
+MAPPING_SLOTS = ("exact_mappings", "close_mappings", "narrow_mappings",
+                 "broad_mappings", "related_mappings")
+
+REGISTRY_SCHEMA = """
+CREATE TABLE info (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE enums (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    module TEXT NOT NULL,
+    description TEXT,
+    enum_metadata TEXT
+);
+CREATE TABLE exports (
+    name TEXT PRIMARY KEY,
+    enum_id INTEGER NOT NULL REFERENCES enums(id)
+);
+CREATE TABLE members (
+    enum_id INTEGER NOT NULL REFERENCES enums(id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL,
+    meaning TEXT,
+    description TEXT,
+    metadata TEXT,
+    PRIMARY KEY (enum_id, position)
+);
+CREATE TABLE curies (
+    curie TEXT NOT NULL,
+    enum_id INTEGER NOT NULL REFERENCES enums(id),
+    position INTEGER NOT NULL,
+    predicate TEXT NOT NULL
+);
+CREATE TABLE classifier_fields (
+    enum_id INTEGER NOT NULL REFERENCES enums(id),
+    field TEXT NOT NULL,
+    PRIMARY KEY (enum_id, field)
+);
+CREATE TABLE classifier_ranges (
+    enum_id INTEGER NOT NULL REFERENCES enums(id),
+    field TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    min_value REAL,
+    max_value REAL,
+    unit TEXT,
+    PRIMARY KEY (enum_id, field, position)
+);
+CREATE INDEX enums_by_name ON enums(name);
+CREATE INDEX enums_by_module ON enums(module, name);
+CREATE INDEX members_by_name ON members(enum_id, name);
+CREATE INDEX members_by_meaning ON members(meaning);
+CREATE INDEX curies_by_curie ON curies(curie);
+"""
+
+
+class EnumRegistryGenerator:
+    """
+    Build a SQLite registry of all RichEnum classes in a package.
+    """
+
+    def __init__(self, package: str = "valuesets.enums", schema_dir: Optional[Path] = None):
+        self.package = package
+        if schema_dir is None and package == "valuesets.enums" and DEFAULT_SCHEMA_DIR.is_dir():
+            schema_dir = DEFAULT_SCHEMA_DIR
+        self.schema_dir = Path(schema_dir) if schema_dir else None
+        self._schema_cache: Dict[str, Dict[str, Any]] = {}
+
+    def iter_enum_classes(self) -> Iterator[Tuple[str, Type[RichEnum]]]:
+        """Yield (module name, enum class) for every enum defined in the package."""
+        pkg = importlib.import_module(self.package)
+        for module_info in sorted(pkgutil.walk_packages(pkg.__path__, f"{self.package}."),
+                                  key=lambda m: m.name):
+            try:
+                module = importlib.import_module(module_info.name)
+            except Exception as e:
+                logger.error(f"Could not import {module_info.name}: {e}")
+                continue
+            for attr in vars(module).values():
+                if (isinstance(attr, type) and issubclass(attr, RichEnum)
+                        and attr is not RichEnum and attr.__module__ == module.__name__):
+                    yield module.__name__, attr
+
+    def _exported_classes(self) -> Dict[str, Type[RichEnum]]:
+        """Map each name exported by the package to the enum class it resolves to."""
+        pkg = importlib.import_module(self.package)
+        exported = {}
+        for name in getattr(pkg, "__all__", []):
+            attr = getattr(pkg, name, None)
+            if isinstance(attr, type) and issubclass(attr, RichEnum):
+                exported[name] = attr
+        return exported
+
+    def generate(self, output_path: Path) -> int:
+        """
+        Write the registry to output_path, replacing any existing file.
+
+        Returns:
+            Number of enum classes written
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+        enum_ids: Dict[Type[RichEnum], int] = {}
+        count = 0
+        conn = sqlite3.connect(tmp_path)
+        try:
+            conn.executescript(REGISTRY_SCHEMA)
+            conn.executemany("INSERT INTO info VALUES (?, ?)", [
+                ("format_version", str(REGISTRY_FORMAT_VERSION)),
+                ("package", self.package),
+            ])
+            for module_name, enum_class in self.iter_enum_classes():
+                enum_id = count + 1
+                enum_metadata = getattr(enum_class, "_enum_metadata", None)
+                conn.execute(
+                    "INSERT INTO enums VALUES (?, ?, ?, ?, ?)",
+                    (
+                        enum_id,
+                        enum_class.__name__,
+                        module_name,
+                        enum_class.__doc__.strip() if enum_class.__doc__ else None,
+                        json.dumps(enum_metadata) if enum_metadata else None,
+                    ),
+                )
+                conn.executemany(
+                    "INSERT INTO members VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    self._member_rows(enum_id, enum_class),
+                )
+                conn.executemany(
+                    "INSERT INTO curies VALUES (?, ?, ?, ?)",
+                    self._curie_rows(enum_id, module_name, enum_class),
+                )
+                fields, ranges = self._classifier_rows(enum_id, enum_class)
+                conn.executemany("INSERT INTO classifier_fields VALUES (?, ?)", fields)
+                conn.executemany("INSERT INTO classifier_ranges VALUES (?, ?, ?, ?, ?, ?)", ranges)
+                enum_ids[enum_class] = enum_id
+                count += 1
+            # Names exported by the package; these may be aliases, and decide
+            # which definition wins when several modules share a class name
+            conn.executemany(
+                "INSERT INTO exports VALUES (?, ?)",
+                [(name, enum_ids[enum_class]) for name, enum_class in self._exported_classes().items()
+                 if enum_class in enum_ids],
+            )
+            conn.commit()
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+
+        tmp_path.replace(output_path)
+        logger.info(f"Generated {output_path} with {count} enums")
+        return count
+
+    def _member_rows(self, enum_id: int, enum_class: Type[RichEnum]) -> List[Tuple[Any, ...]]:
+        """Build member rows; metadata beyond meaning/description is stored as JSON."""
+        metadata = enum_class.__dict__.get("_metadata", {})
+        rows = []
+        for position, member in enumerate(enum_class):
+            record = metadata.get(member.name)
+            member_metadata = record.to_dict() if record is not None else {}
+            meaning = member_metadata.pop("meaning", None)
+            description = member_metadata.pop("description", None)
+            rows.append((
+                enum_id,
+                position,
+                member.name,
+                member.value,
+                meaning,
+                description,
+                json.dumps(member_metadata, sort_keys=True) if member_metadata else None,
+            ))
+        return rows
+
+    def _classifier_rows(self, enum_id: int, enum_class: Type[RichEnum]) -> Tuple[List[Tuple[Any, ...]], List[Tuple[Any, ...]]]:
+        """Build classifier field rows and the range rows of members with bounds for them."""
+        # Imported lazily: valuesets.utils pulls in the ontology tooling
+        from valuesets.utils.classifier import detect_classifier_fields, get_classifier_config, get_range_with_unit
+
+        fields = sorted(detect_classifier_fields(enum_class))
+        mappings = get_classifier_config(enum_class).get("annotation_mappings")
+        ranges = []
+        for field in fields:
+            for position, member in enumerate(enum_class):
+                min_val, max_val, unit = get_range_with_unit(member, field, mappings)
+                if min_val is not None or max_val is not None:
+                    ranges.append((enum_id, field, position, min_val, max_val, unit))
+        return [(enum_id, field) for field in fields], ranges
+
+    def _schema_enums(self, module_name: str) -> Dict[str, Any]:
+        """Load the enum definitions of the schema file a module was generated from."""
+        if self.schema_dir is None:
+            return {}
+        relative = module_name[len(self.package) + 1:].replace(".", "/")
+        if relative not in self._schema_cache:
+            schema_path = self.schema_dir / f"{relative}.yaml"
+            enums = {}
+            if schema_path.exists():
+                with open(schema_path) as f:
+                    enums = (yaml.load(f, Loader=SafeLoader) or {}).get("enums") or {}
+            self._schema_cache[relative] = enums
+        return self._schema_cache[relative]
+
+    def _schema_mappings(self, module_name: str, enum_class: Type[RichEnum]) -> Dict[str, List[Tuple[str, str]]]:
+        """Map member values to (predicate, CURIE) pairs declared in the source schema."""
+        # Imported lazily: the modular generator pulls in linkml_runtime
+        from valuesets.generators.modular_rich_generator import ModularRichEnumGenerator
+
+        mappings: Dict[str, List[Tuple[str, str]]] = {}
+        for enum_name, enum_def in self._schema_enums(module_name).items():
+            if ModularRichEnumGenerator._get_class_name(enum_name) != enum_class.__name__:
+                continue
+            for pv_name, pv in ((enum_def or {}).get("permissible_values") or {}).items():
+                pv = pv or {}
+                value = pv.get("text") or pv_name
+                for slot in MAPPING_SLOTS:
+                    for curie in pv.get(slot) or ():
+                        mappings.setdefault(str(value), []).append((slot, str(curie)))
+        return mappings
+
+    def _curie_rows(self, enum_id: int, module_name: str, enum_class: Type[RichEnum]) -> List[Tuple[Any, ...]]:
+        """Build CURIE index rows from member meanings and schema mappings."""
+        mappings = self._schema_mappings(module_name, enum_class)
+        rows = []
+        for position, member in enumerate(enum_class):
+            seen = set()
+            pairs = [("meaning", member.meaning)] if member.meaning else []
+            pairs.extend(mappings.get(member.value, ()))
+            for predicate, curie in pairs:
+                key = curie_key(curie)
+                if key not in seen:
+                    seen.add(key)
+                    rows.append((key, enum_id, position, predicate))
+        return rows
+
+
+def main():
+    """CLI entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Build the binary enum registry from generated enum modules')
+    parser.add_argument('-o', '--output', required=True, help='Output path for the registry file')
+    parser.add_argument('-p', '--package', default='valuesets.enums', help='Package containing the generated enums')
+    parser.add_argument('-s', '--schema-dir', help='Schema directory to read mappings from '
+                        '(defaults to the packaged schemas for valuesets.enums)')
+
+    args = parser.parse_args()
+
+    generator = EnumRegistryGenerator(args.package, args.schema_dir)
+    generator.generate(Path(args.output))
+
+
+if __name__ == '__main__':
+    main()
@@ -2,25 +2,327 @@
 Rich Enum Implementation with Metadata Support
 
 This module provides enums that maintain full compatibility with standard Python 
-enums while adding metadata support using __init_subclass__.
+enums while adding metadata support. Metadata assigned to an enum class is
+exposed as plain member attributes (member.meaning, member.description,
+member.annotations).
 """
 
-from enum import Enum
-from typing import Dict, Any, Optional, Type
+import re
+from collections.abc import Mapping
+from enum import Enum, EnumMeta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Type
 
 
-class RichEnum(str, Enum):
+# IRI namespaces that can be contracted to CURIEs when comparing meanings.
+# OBO PURLs (http://purl.obolibrary.org/obo/PREFIX_LOCAL) are handled
+# generically; other namespaces can be added with register_curie_prefix().
+OBO_PURL_NAMESPACE = "http://purl.obolibrary.org/obo/"
+
+CURIE_NAMESPACES: Dict[str, str] = {
+    "dcterms": "http://purl.org/dc/terms/",
+    "EDAM": "http://edamontology.org/",
+    "MESH": "http://id.nlm.nih.gov/mesh/",
+    "quantitykind": "http://qudt.org/vocab/quantitykind/",
+    "QUDT": "http://qudt.org/schema/qudt/",
+    "ROR": "https://ror.org/",
+    "SIO": "http://semanticscience.org/resource/SIO_",
+    "SNOMED": "http://snomed.info/id/",
+    "xsd": "http://www.w3.org/2001/XMLSchema#",
+}
+
+
+def register_curie_prefix(prefix: str, namespace: str) -> None:
+    """
+    Register an IRI namespace so that expanded IRIs match their CURIE form.
+
+    Args:
+        prefix: The CURIE prefix (e.g., "ROR")
+        namespace: The IRI namespace the prefix expands to
+    """
+    CURIE_NAMESPACES[prefix] = namespace
+    curie_key.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def curie_key(meaning: str) -> str:
+    """
+    Normalize a CURIE or IRI to the CURIE form used as a lookup key.
+
+    CURIEs are returned unchanged; IRIs in the OBO PURL namespace or in
+    a registered namespace are contracted. Unknown IRIs are returned as-is.
+
+    Examples:
+        >>> curie_key("NCBITaxon:9606")
+        'NCBITaxon:9606'
+        >>> curie_key("http://purl.obolibrary.org/obo/NCBITaxon_9606")
+        'NCBITaxon:9606'
+        >>> curie_key("https://ror.org/02jbv0t02")
+        'ROR:02jbv0t02'
+        >>> curie_key("https://example.org/thing/1")
+        'https://example.org/thing/1'
+    """
+    if "://" not in meaning:
+        return meaning
+    iri = meaning
+    if iri.startswith("https://purl.obolibrary.org/obo/"):
+        iri = "http://" + iri[len("https://"):]
+    if iri.startswith(OBO_PURL_NAMESPACE):
+        local = iri[len(OBO_PURL_NAMESPACE):]
+        prefix, sep, rest = local.partition("_")
+        if sep and prefix and rest:
+            return f"{prefix}:{rest}"
+    best = None
+    for prefix, namespace in CURIE_NAMESPACES.items():
+        if iri.startswith(namespace) and (best is None or len(namespace) > len(best[1])):
+            best = (prefix, namespace)
+    if best is not None:
+        return f"{best[0]}:{iri[len(best[1]):]}"
+    return meaning
+
+
+_NON_ALPHANUMERIC = re.compile(r'[^a-zA-Z0-9\s]')
+_WHITESPACE = re.compile(r'\s+')
+
+# Annotation keys whose values are treated as additional labels
+LABEL_ANNOTATION_KEYS = ('label', 'display_name', 'preferred_name', 'synonym')
+
+# Label sources in order of precedence; when a normalized label matches
+# members through different sources, only the highest-precedence ones count
+_LABEL_RANK_NAME = 0
+_LABEL_RANK_TITLE = 1
+_LABEL_RANK_ALIAS = 2
+
+
+def normalize_label(s: Optional[str]) -> str:
+    """
+    Normalize a string for comparison by replacing non-alphanumeric chars
+    with spaces, collapsing whitespace and converting to lowercase.
+
+    Examples:
+        >>> normalize_label("Baker's yeast")
+        'baker s yeast'
+        >>> normalize_label("  Fission   YEAST ")
+        'fission yeast'
+        >>> normalize_label(None)
+        ''
+    """
+    if not s:
+        return ""
+    s = _NON_ALPHANUMERIC.sub(' ', s)
+    s = _WHITESPACE.sub(' ', s)
+    return s.strip().lower()
+
+
+class AmbiguousLabelError(ValueError):
+    """Raised when a label matches more than one member of an enum."""
+
+    def __init__(self, enum_class: type, label: str, candidates: Tuple['RichEnum', ...]):
+        self.enum_class = enum_class
+        self.label = label
+        self.candidates = candidates
+        names = ", ".join(member.name for member in candidates)
+        super().__init__(f"Label {label!r} is ambiguous in {enum_class.__name__}: matches {names}")
+
+
+_EMPTY_ANNOTATIONS: Mapping = MappingProxyType({})
+
+
+class MemberMetadata(Mapping):
+    """
+    Read-only, slotted metadata record for one enum member.
+
+    Behaves like the metadata dict it was built from, except that aliases
+    are a tuple and annotations a read-only mapping; use to_dict() for a
+    plain, JSON-serializable copy.
+
+    Examples:
+        >>> record = MemberMetadata.from_dict({
+        ...     "description": "Homo sapiens",
+        ...     "meaning": "NCBITaxon:9606",
+        ...     "aliases": ["Human"],
+        ...     "annotations": {"sources": "GO"},
+        ... })
+        >>> record["meaning"]
+        'NCBITaxon:9606'
+        >>> record["aliases"]
+        ('Human',)
+        >>> record.to_dict() == {"description": "Homo sapiens", "meaning": "NCBITaxon:9606",
+        ...                      "aliases": ["Human"], "annotations": {"sources": "GO"}}
+        True
+        >>> "title" in record
+        False
+    """
+
+    __slots__ = ("description", "meaning", "title", "rank", "annotations", "aliases", "extra")
+
+    # Keys stored in dedicated slots, in iteration order
+    FIELDS = ("description", "meaning", "title", "rank", "annotations", "aliases")
+
+    def __init__(self, description=None, meaning=None, title=None, rank=None,
+                 annotations=None, aliases=None, extra=None):
+        self.description = description
+        self.meaning = meaning
+        self.title = title
+        self.rank = rank
+        self.annotations = annotations
+        self.aliases = aliases
+        self.extra = extra
+
+    @classmethod
+    def from_dict(cls, metadata: Mapping) -> 'MemberMetadata':
+        """Build a compact record from a metadata dict."""
+        if isinstance(metadata, MemberMetadata):
+            return metadata
+        extra = {key: value for key, value in metadata.items() if key not in cls.FIELDS}
+        annotations = metadata.get("annotations")
+        aliases = metadata.get("aliases")
+        return cls(
+            description=metadata.get("description"),
+            meaning=metadata.get("meaning"),
+            title=metadata.get("title"),
+            rank=metadata.get("rank"),
+            annotations=MappingProxyType(annotations) if annotations else None,
+            aliases=tuple(aliases) if aliases else None,
+            extra=MappingProxyType(extra) if extra else None,
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if getattr(self, key) is not None:
+                yield key
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"MemberMetadata({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get a plain, mutable copy with aliases as a list and annotations as a dict."""
+        result: Dict[str, Any] = {}
+        for key in self:
+            value = self[key]
+            if key == "aliases":
+                value = list(value)
+            elif key == "annotations":
+                value = dict(value)
+            result[key] = value
+        return result
+
+
+def compact_metadata(metadata: Optional[Mapping]) -> Mapping:
+    """
+    Convert a {member name: metadata dict} table to read-only MemberMetadata records.
+
+    This is applied automatically when _metadata is assigned on a RichEnum.
+    """
+    if not metadata:
+        return MappingProxyType({})
+    return MappingProxyType({
+        name: MemberMetadata.from_dict(member_metadata)
+        for name, member_metadata in metadata.items()
+    })
+
+
+class _MemberField:
+    """
+    Shared descriptor supplying the default for a per-member metadata attribute.
+
+    The metaclass stores each member's value in the member's instance
+    dict when _metadata is assigned, so normal attribute lookup finds it
+    there without calling this descriptor; __get__ only runs for members
+    that have no value for the field.
+    """
+
+    def __init__(self, default: Any = None, doc: Optional[str] = None):
+        self.default = default
+        self.__doc__ = doc
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return self.default
+
+
+# Member attributes populated from MemberMetadata records
+_MEMBER_FIELDS = ("description", "meaning", "annotations")
+
+
+def _bind_member_fields(enum_class, metadata: Mapping) -> None:
+    """Store each member's metadata fields as attributes of the member."""
+    for member in enum_class.__members__.values():
+        record = metadata.get(member._name_)
+        member_dict = member.__dict__
+        for field in _MEMBER_FIELDS:
+            value = getattr(record, field) if record is not None else None
+            if value is None:
+                member_dict.pop(field, None)
+            else:
+                member_dict[field] = value
+
+
+# Class attributes holding lazily built lookup indexes; they are
+# discarded whenever _metadata is reassigned.
+_INDEX_ATTRS = (
+    "_meaning_index_cache",
+    "_label_index_cache",
+    "_code_table_cache",
+    "_classifier_cache",
+)
+
+
+class _RichEnumType(EnumMeta):
+    """
+    Enum metaclass that compacts ``_metadata`` into MemberMetadata records
+    on assignment, copies their fields onto the members and invalidates
+    cached lookup indexes.
+    """
+
+    def __setattr__(cls, name, value):
+        if name == "_metadata":
+            value = compact_metadata(value)
+        super().__setattr__(name, value)
+        if name == "_metadata":
+            _bind_member_fields(cls, value)
+            for attr in _INDEX_ATTRS:
+                if attr in cls.__dict__:
+                    type.__delattr__(cls, attr)
+
+
+class RichEnum(str, Enum, metaclass=_RichEnumType):
     """
     Base class for enums with metadata support.
     
     This class creates enums that:
     1. Are fully compatible with standard Python enums
     2. Support string values (inherit from str)
-    3. Have metadata access methods
-    4. Can be looked up by ontology meaning
+    3. Expose metadata as member attributes (meaning, description,
+       annotations), with get_* methods as aliases
+    4. Can be looked up by ontology meaning (CURIE or IRI) via a cached
+       reverse index that is rebuilt when _metadata is reassigned
+    5. Can be looked up by free-text label (name, value, title or alias)
     
     The metadata should be set AFTER class creation to avoid it becoming
-    an enum member.
+    an enum member. On assignment it is converted to a read-only mapping of
+    compact MemberMetadata records (see compact_metadata), and each
+    member's description, meaning and annotations are stored on the member
+    itself, so reading them is a plain attribute lookup.
     
     Usage:
         class MyEnum(RichEnum):
@@ -39,87 +341,243 @@ class RichEnum(str, Enum):
                 "meaning": "ONTO:0000002"
             }
         }
+
+        MyEnum.VALUE1.meaning  # "ONTO:0000001"
     """
-    
-    def __init_subclass__(cls, **kwargs):
-        super().__init_subclass__(**kwargs)
-        
-        # Add metadata access methods to the class
-        def get_description(self) -> Optional[str]:
-            """Get the description for this enum member."""
-            metadata = self.__class__.__dict__.get('_metadata', {})
-            member_metadata = metadata.get(self.name, {})
-            return member_metadata.get("description")
-        
-        def get_meaning(self) -> Optional[str]:
-            """Get the ontology meaning/mapping for this enum member."""
-            metadata = self.__class__.__dict__.get('_metadata', {})
-            member_metadata = metadata.get(self.name, {})
-            return member_metadata.get("meaning")
-        
-        def get_annotations(self) -> Dict[str, Any]:
-            """Get the annotations dictionary for this enum member."""
-            metadata = self.__class__.__dict__.get('_metadata', {})
-            member_metadata = metadata.get(self.name, {})
-            return member_metadata.get("annotations", {})
-        
-        def get_metadata(self) -> Dict[str, Any]:
-            """Get all metadata for this enum member."""
-            base = {"name": self.name, "value": self.value}
-            metadata = self.__class__.__dict__.get('_metadata', {})
-            base.update(metadata.get(self.name, {}))
-            return base
-        
-        @classmethod
-        def from_meaning(cls_inner, meaning: str) -> Optional['RichEnum']:
-            """
-            Find an enum member by its ontology meaning.
-            
-            Args:
-                meaning: The ontology term (e.g., "BSPO:0000000")
-                
-            Returns:
-                The enum member with the given meaning, or None if not found
-            """
-            for member in cls_inner:
-                if member.get_meaning() == meaning:
-                    return member
-            return None
-        
-        @classmethod
-        def get_all_meanings(cls_inner) -> Dict[str, str]:
-            """Get a mapping of all member names to their meanings."""
-            meanings = {}
-            for member in cls_inner:
-                meaning = member.get_meaning()
+
+    description = _MemberField(doc="Description of this member, or None.")
+    meaning = _MemberField(doc="Ontology meaning (CURIE) of this member, or None.")
+    annotations = _MemberField(
+        _EMPTY_ANNOTATIONS, doc="Read-only mapping of this member's annotations."
+    )
+
+    def get_description(self) -> Optional[str]:
+        """Get the description for this enum member."""
+        return self.description
+
+    def get_meaning(self) -> Optional[str]:
+        """Get the ontology meaning/mapping for this enum member."""
+        return self.meaning
+
+    def get_annotations(self) -> Mapping:
+        """Get a read-only view of the annotations for this enum member."""
+        return self.annotations
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get a copy of all metadata for this enum member."""
+        base = {"name": self.name, "value": self.value}
+        metadata = self.__class__.__dict__.get('_metadata', {})
+        member_metadata = metadata.get(self.name)
+        if member_metadata is not None:
+            base.update(member_metadata.to_dict())
+        return base
+
+    @classmethod
+    def get_all_meanings(cls) -> Dict[str, str]:
+        """Get a mapping of all member names to their meanings."""
+        return {member.name: member.meaning for member in cls if member.meaning}
+
+    @classmethod
+    def get_all_descriptions(cls) -> Dict[str, str]:
+        """Get a mapping of all member names to their descriptions."""
+        return {member.name: member.description for member in cls if member.description}
+
+    @classmethod
+    def list_metadata(cls) -> Dict[str, Dict[str, Any]]:
+        """Get all metadata for all members."""
+        return {member.name: member.get_metadata() for member in cls}
+
+    @classmethod
+    def _meaning_index(cls) -> Dict[str, Tuple['RichEnum', ...]]:
+        """Get the reverse index from normalized meaning to members, building it on first use."""
+        index = cls.__dict__.get("_meaning_index_cache")
+        if index is None:
+            grouped: Dict[str, List['RichEnum']] = {}
+            for member in cls:
+                meaning = member.meaning
                 if meaning:
-                    meanings[member.name] = meaning
-            return meanings
-        
-        @classmethod
-        def get_all_descriptions(cls_inner) -> Dict[str, str]:
-            """Get a mapping of all member names to their descriptions."""
-            descriptions = {}
-            for member in cls_inner:
-                description = member.get_description()
-                if description:
-                    descriptions[member.name] = description
-            return descriptions
-        
-        @classmethod
-        def list_metadata(cls_inner) -> Dict[str, Dict[str, Any]]:
-            """Get all metadata for all members."""
-            return {member.name: member.get_metadata() for member in cls_inner}
-        
-        # Set methods on the class
-        setattr(cls, 'get_description', get_description)
-        setattr(cls, 'get_meaning', get_meaning) 
-        setattr(cls, 'get_annotations', get_annotations)
-        setattr(cls, 'get_metadata', get_metadata)
-        setattr(cls, 'from_meaning', from_meaning)
-        setattr(cls, 'get_all_meanings', get_all_meanings)
-        setattr(cls, 'get_all_descriptions', get_all_descriptions)
-        setattr(cls, 'list_metadata', list_metadata)
+                    grouped.setdefault(curie_key(meaning), []).append(member)
+            index = {key: tuple(members) for key, members in grouped.items()}
+            type.__setattr__(cls, "_meaning_index_cache", index)
+        return index
+
+    @classmethod
+    def members_with_meaning(cls, meaning: Optional[str]) -> Tuple['RichEnum', ...]:
+        """
+        Find all enum members mapped to an ontology meaning.
+
+        Args:
+            meaning: The ontology term as a CURIE or expanded IRI
+
+        Returns:
+            Members with the given meaning, in definition order
+        """
+        if not meaning:
+            return ()
+        return cls._meaning_index().get(curie_key(meaning), ())
+
+    @classmethod
+    def from_meaning(cls, meaning: Optional[str]) -> Optional['RichEnum']:
+        """
+        Find an enum member by its ontology meaning.
+
+        Args:
+            meaning: The ontology term (e.g., "BSPO:0000000") or its expanded IRI
+
+        Returns:
+            The first enum member with the given meaning, or None if not found
+        """
+        if not meaning:
+            return None
+        members = cls._meaning_index().get(curie_key(meaning))
+        return members[0] if members else None
+
+    @classmethod
+    def from_meanings(cls, meanings: Iterable[Optional[str]]) -> List[Optional['RichEnum']]:
+        """
+        Look up many ontology meanings at once.
+
+        Args:
+            meanings: Ontology terms as CURIEs or expanded IRIs
+
+        Returns:
+            The first matching member (or None) for each meaning, in input order
+        """
+        index = cls._meaning_index()
+        results = []
+        for meaning in meanings:
+            members = index.get(curie_key(meaning)) if meaning else None
+            results.append(members[0] if members else None)
+        return results
+
+    @classmethod
+    def _label_index(cls) -> Dict[str, Tuple['RichEnum', ...]]:
+        """
+        Get the index from normalized label to members, building it on first use.
+
+        Names and values take precedence over titles, which take precedence
+        over aliases; each key keeps only the members from its best source.
+        """
+        index = cls.__dict__.get("_label_index_cache")
+        if index is None:
+            metadata = cls.__dict__.get('_metadata', {})
+            ranked: Dict[str, Tuple[int, List['RichEnum']]] = {}
+
+            def add(label: Any, rank: int, member: 'RichEnum') -> None:
+                key = normalize_label(str(label)) if label is not None else ""
+                if not key:
+                    return
+                best = ranked.get(key)
+                if best is None or rank < best[0]:
+                    ranked[key] = (rank, [member])
+                elif rank == best[0] and member not in best[1]:
+                    best[1].append(member)
+
+            for member in cls:
+                member_metadata = metadata.get(member.name, {})
+                add(member.name, _LABEL_RANK_NAME, member)
+                add(member.value, _LABEL_RANK_NAME, member)
+                add(member_metadata.get("title"), _LABEL_RANK_TITLE, member)
+                for alias in member_metadata.get("aliases") or ():
+                    add(alias, _LABEL_RANK_ALIAS, member)
+                annotations = member_metadata.get("annotations") or {}
+                for key in LABEL_ANNOTATION_KEYS:
+                    add(annotations.get(key), _LABEL_RANK_ALIAS, member)
+            index = {key: tuple(members) for key, (_, members) in ranked.items()}
+            type.__setattr__(cls, "_label_index_cache", index)
+        return index
+
+    @classmethod
+    def members_with_label(cls, label: Optional[str]) -> Tuple['RichEnum', ...]:
+        """
+        Find all enum members matching a free-text label.
+
+        Matching ignores case, punctuation and repeated whitespace (see
+        normalize_label) and covers names, values, titles and aliases.
+
+        Args:
+            label: The text to look up (e.g., "Baker's yeast")
+
+        Returns:
+            All members matching the label through its best-ranked source
+        """
+        if not label:
+            return ()
+        return cls._label_index().get(normalize_label(label), ())
+
+    @classmethod
+    def from_label(cls, label: Optional[str]) -> Optional['RichEnum']:
+        """
+        Find an enum member by name, value, title or alias.
+
+        Args:
+            label: The text to look up (e.g., "human", "Rabbit")
+
+        Returns:
+            The matching member, or None if nothing matches
+
+        Raises:
+            AmbiguousLabelError: If the label matches more than one member
+        """
+        members = cls.members_with_label(label)
+        if len(members) > 1:
+            raise AmbiguousLabelError(cls, label, members)
+        return members[0] if members else None
+
+    @classmethod
+    def match(cls, text: Optional[str]) -> Tuple[Tuple['RichEnum', ...], Optional[str]]:
+        """
+        Find the members matching a name, value, meaning or label, and how they matched.
+
+        Sources are tried in the order used by from_any. A meaning match
+        yields only the first member with that meaning; a label match may
+        yield several members, in which case the label is ambiguous.
+
+        Args:
+            text: A member name, value, ontology term or free-text label
+
+        Returns:
+            The matching members and the match type ("name", "value",
+            "meaning" or "label"), or ((), None) if nothing matches
+        """
+        if not text:
+            return (), None
+        member = cls._member_map_.get(text)
+        if member is not None:
+            return (member,), "name"
+        member = cls._value2member_map_.get(text)
+        if member is not None:
+            return (member,), "value"
+        member = cls.from_meaning(text)
+        if member is not None:
+            return (member,), "meaning"
+        members = cls.members_with_label(text)
+        if members:
+            return members, "label"
+        return (), None
+
+    @classmethod
+    def from_any(cls, text: Optional[str]) -> Optional['RichEnum']:
+        """
+        Find an enum member by exact name, exact value, meaning or label.
+
+        Exact identifiers are tried first, then the ontology meaning
+        (CURIE or IRI), then the normalized label index.
+
+        Args:
+            text: A member name, value, ontology term or free-text label
+
+        Returns:
+            The matching member, or None if nothing matches
+
+        Raises:
+            AmbiguousLabelError: If only the label index matches and it
+                matches more than one member
+        """
+        members, _ = cls.match(text)
+        if len(members) > 1:
+            raise AmbiguousLabelError(cls, text, members)
+        return members[0] if members else None
 
 
 # Type alias for clarity  
@@ -18,12 +18,14 @@ from linkml_runtime.linkml_model import EnumDefinition, PermissibleValue
 # Import shared mapping utilities
 try:
     from ..utils.mapping_utils import extract_all_mappings, deduplicate_mappings
+    from ..utils.label_store import LabelStore
 except ImportError:
     # Fallback for running as script
     import sys
     from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from valuesets.utils.mapping_utils import extract_all_mappings, deduplicate_mappings
+    from valuesets.utils.label_store import LabelStore
 
 try:
     from oaklib import get_adapter
@@ -49,17 +51,21 @@ SSSOM_PREFIXES = {
 class SSSOMGenerator:
     """Generator for SSSOM TSV files from LinkML schemas."""
 
-    def __init__(self, oak_adapter_string: str = "sqlite:obo:", cache_labels: bool = True):
+    def __init__(self, oak_adapter_string: str = "sqlite:obo:", cache_labels: bool = True,
+                 label_store: Optional[LabelStore] = None):
         """
         Initialize the SSSOM generator.
 
         Args:
             oak_adapter_string: OAK adapter configuration
-            cache_labels: Whether to cache ontology labels
+            cache_labels: Whether to cache ontology labels, in memory and in the label store
+            label_store: Shared label store (default: LabelStore() when caching)
         """
         self.oak_adapter_string = oak_adapter_string
         self._label_cache = {} if cache_labels else None
+        self.label_store = (label_store or LabelStore()) if cache_labels else None
         self._per_prefix_adapters = {}
+        self._adapter_strings = {}  # Adapter string of each per-prefix adapter
         self._initialize_oak()
 
     def _initialize_oak(self):
@@ -80,13 +86,21 @@ class SSSOMGenerator:
 
     def get_ontology_label(self, curie: str) -> Optional[str]:
         """Get label for an ontology term."""
-        if not HAS_OAK:
-            return None
-
         # Check cache
         if self._label_cache is not None and curie in self._label_cache:
             return self._label_cache[curie]
 
+        # Check the label store, which other tools fill too
+        if self.label_store is not None:
+            stored = self.label_store.get(curie)
+            if stored is not None:
+                if self._label_cache is not None:
+                    self._label_cache[curie] = stored.label
+                return stored.label
+
+        if not HAS_OAK:
+            return None
+
         label = None
         prefix = curie.split(":")[0].lower() if ":" in curie else None
 
@@ -96,17 +110,21 @@ class SSSOMGenerator:
                 try:
                     adapter_string = f"sqlite:obo:{prefix}"
                     self._per_prefix_adapters[prefix] = get_adapter(adapter_string)
+                    self._adapter_strings[prefix] = adapter_string
                     logger.debug(f"Created adapter for {prefix}")
                 except:
                     # Try merged as fallback
                     try:
                         self._per_prefix_adapters[prefix] = get_adapter("sqlite:obo:merged")
+                        self._adapter_strings[prefix] = "sqlite:obo:merged"
                     except:
                         self._per_prefix_adapters[prefix] = None
 
             adapter = self._per_prefix_adapters.get(prefix)
+            source = self._adapter_strings.get(prefix)
         else:
             adapter = self._per_prefix_adapters.get('_default')
+            source = self.oak_adapter_string
 
         # Get label
         if adapter:
@@ -114,10 +132,14 @@ class SSSOMGenerator:
                 label = adapter.label(curie)
             except Exception as e:
                 logger.debug(f"Could not get label for {curie}: {e}")
+                adapter = None
 
         # Cache result
         if self._label_cache is not None:
             self._label_cache[curie] = label
+        # Only answers from an adapter are stored; failed lookups are retried next run
+        if self.label_store is not None and adapter:
+            self.label_store.put(curie, label, source=source)
 
         return label
 
@@ -351,6 +373,11 @@ def main():
         action="store_true",
         help="Skip ontology label lookups"
     )
+    parser.add_argument(
+        "--label-store",
+        type=Path,
+        help="Shared label store file (default: $VALUESETS_LABEL_STORE or cache/labels.sqlite)"
+    )
     parser.add_argument(
         "--mapping-set-id",
         help="Mapping set ID for SSSOM metadata"
@@ -364,9 +391,9 @@ def main():
 
     # Create generator
     if args.no_labels:
-        generator = SSSOMGenerator(oak_adapter_string=None)
+        generator = SSSOMGenerator(oak_adapter_string=None, cache_labels=False)
     else:
-        generator = SSSOMGenerator(oak_adapter_string=args.adapter)
+        generator = SSSOMGenerator(oak_adapter_string=args.adapter, label_store=LabelStore(args.label_store))
 
     # Prepare metadata
     metadata = {}
@@ -0,0 +1,433 @@
+"""
+Read-only access to the precompiled enum registry.
+
+The registry file (built by valuesets.generators.registry_generator) holds the
+names, values and metadata of every enum in valuesets.enums in one SQLite
+database. Lookups are answered from that file, which is opened read-only and
+memory-mapped, without importing any enum module. Enum classes can be
+materialized from the registry on demand.
+
+Examples:
+    >>> registry = get_registry()
+    >>> member = registry.get_member("BiologicalKingdom", "EUKARYOTA")
+    >>> member.meaning
+    'NCBITaxon:2759'
+    >>> registry.from_meaning("BiologicalKingdom", "NCBITaxon:2759").name
+    'EUKARYOTA'
+    >>> Kingdom = registry.materialize("BiologicalKingdom")
+    >>> Kingdom.EUKARYOTA.get_meaning()
+    'NCBITaxon:2759'
+"""
+
+import importlib
+import json
+import sqlite3
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Type, Union
+
+from valuesets.generators.rich_enum import RichEnum, curie_key
+
+DEFAULT_REGISTRY_PATH = Path(__file__).parent / "enums" / "registry.sqlite"
+
+# Must match valuesets.generators.registry_generator.REGISTRY_FORMAT_VERSION
+REGISTRY_FORMAT_VERSION = 3
+
+# Upper bound for the memory-mapped region of the registry file
+MMAP_SIZE = 256 * 1024 * 1024
+
+
+class EnumRecord(NamedTuple):
+    """An enum class as stored in the registry."""
+    name: str
+    module: str
+    description: Optional[str]
+    enum_metadata: Dict[str, Any]
+
+
+class MemberRecord(NamedTuple):
+    """An enum member as stored in the registry."""
+    enum_name: str
+    name: str
+    value: str
+    metadata: Dict[str, Any]
+
+    @property
+    def meaning(self) -> Optional[str]:
+        return self.metadata.get("meaning")
+
+    @property
+    def description(self) -> Optional[str]:
+        return self.metadata.get("description")
+
+    @property
+    def aliases(self) -> List[str]:
+        return self.metadata.get("aliases", [])
+
+    @property
+    def annotations(self) -> Dict[str, Any]:
+        return self.metadata.get("annotations", {})
+
+
+class CurieRow(NamedTuple):
+    """A member indexed under a CURIE, by meaning or by a schema mapping."""
+    curie: str
+    module: str
+    enum_name: str
+    member_name: str
+    predicate: str
+
+
+class ClassifierRange(NamedTuple):
+    """A member's parsed range bounds for a classifier field (None is unbounded)."""
+    member_name: str
+    min_value: Optional[float]
+    max_value: Optional[float]
+    unit: Optional[str]
+
+
+class EnumRegistry:
+    """
+    Metadata lookups backed by a registry file.
+
+    Enum names refer to the enums exported by valuesets.enums; where a name
+    is defined in several modules, the exported one is used. Names may be
+    qualified by their module to select another definition (see
+    resolve_name).
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        self.path = Path(path) if path else DEFAULT_REGISTRY_PATH
+        if not self.path.exists():
+            raise FileNotFoundError(f"Enum registry not found: {self.path}")
+        self._conn = sqlite3.connect(
+            f"{self.path.resolve().as_uri()}?mode=ro&immutable=1",
+            uri=True,
+            check_same_thread=False,
+        )
+        self._conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        self._lock = threading.Lock()
+        self._materialized: Dict[str, Type[RichEnum]] = {}
+        self._definitions: Optional[Dict[str, Tuple[str, ...]]] = None
+
+        version = self._query_one("SELECT value FROM info WHERE key = 'format_version'")
+        if version is None or int(version[0]) != REGISTRY_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported enum registry format in {self.path}: "
+                f"expected {REGISTRY_FORMAT_VERSION}, found {version[0] if version else None}"
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _query_one(self, sql: str, params: tuple = ()) -> Optional[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()
+
+    def _enum_row(self, enum_name: str) -> Optional[tuple]:
+        """Find the registry row for an enum name, preferring the exported definition."""
+        if "." in enum_name:
+            try:
+                module, class_name = self.resolve_name(enum_name)
+            except (KeyError, ValueError):
+                return None
+            return self._query_one(
+                "SELECT id, name, module, description, enum_metadata FROM enums WHERE module = ? AND name = ?",
+                (module, class_name),
+            )
+        row = self._query_one(
+            "SELECT e.id, e.name, e.module, e.description, e.enum_metadata "
+            "FROM exports x JOIN enums e ON e.id = x.enum_id WHERE x.name = ?",
+            (enum_name,),
+        )
+        if row is None:
+            row = self._query_one(
+                "SELECT id, name, module, description, enum_metadata FROM enums "
+                "WHERE name = ? ORDER BY module LIMIT 1",
+                (enum_name,),
+            )
+        return row
+
+    @staticmethod
+    def _member_record(enum_name: str, row: tuple) -> MemberRecord:
+        name, value, meaning, description, extra = row
+        metadata: Dict[str, Any] = {}
+        if description is not None:
+            metadata["description"] = description
+        if meaning is not None:
+            metadata["meaning"] = meaning
+        if extra:
+            metadata.update(json.loads(extra))
+        return MemberRecord(enum_name, name, value, metadata)
+
+    def definitions(self, enum_name: str) -> List[str]:
+        """
+        Get the modules defining an enum name, the exported definition first.
+
+        Covers every definition, including those shadowed by a same-named
+        enum exported from another module. The name index is loaded into a
+        dict on first use.
+
+        Examples:
+            >>> modules = get_registry().definitions("PresenceEnum")
+            >>> modules[0] == get_registry().get_enum("PresenceEnum").module, len(modules) > 1
+            (True, True)
+        """
+        if self._definitions is None:
+            rows = self._query(
+                "SELECT e.name, e.module FROM enums e LEFT JOIN exports x ON x.enum_id = e.id AND x.name = e.name "
+                "ORDER BY e.name, x.name IS NULL, e.module"
+            )
+            index: Dict[str, List[str]] = {}
+            for name, module in rows:
+                index.setdefault(name, []).append(module)
+            self._definitions = {name: tuple(modules) for name, modules in index.items()}
+        return list(self._definitions.get(enum_name, ()))
+
+    def resolve_name(self, name: str, package: str = "valuesets.enums") -> Tuple[str, str]:
+        """
+        Resolve an enum name, optionally qualified by its module, to (module, class name).
+
+        Unqualified names resolve to the exported enum, or to the only
+        definition of a name that is not exported. Qualified names pick one
+        of several same-named enums: the qualifier is the module path,
+        relative to package or absolute, or any unambiguous trailing part of it.
+
+        Raises:
+            KeyError: If no enum matches
+            ValueError: If the name matches enums in several modules
+
+        Examples:
+            >>> get_registry().resolve_name("bio.lipid_categories.PresenceEnum")
+            ('valuesets.enums.bio.lipid_categories', 'PresenceEnum')
+            >>> get_registry().resolve_name("lipid_categories.PresenceEnum")
+            ('valuesets.enums.bio.lipid_categories', 'PresenceEnum')
+        """
+        qualifier, _, class_name = name.rpartition(".")
+        if not qualifier:
+            exported = self._query_one(
+                "SELECT e.module, e.name FROM exports x JOIN enums e ON e.id = x.enum_id WHERE x.name = ?",
+                (name,),
+            )
+            if exported is not None:
+                return exported
+            modules = self.definitions(name)
+        else:
+            modules = [
+                module for module in self.definitions(class_name)
+                if module == qualifier or module == f"{package}.{qualifier}" or module.endswith(f".{qualifier}")
+            ]
+        if not modules:
+            raise KeyError(name)
+        if len(modules) > 1:
+            candidates = ", ".join(f"{module[len(package) + 1:]}.{class_name}" for module in modules)
+            raise ValueError(f"Enum name {name!r} is ambiguous; qualify it with its module: {candidates}")
+        return modules[0], class_name
+
+    def enum_names(self) -> List[str]:
+        """Get the names of all enums exported by the package."""
+        return [row[0] for row in self._query("SELECT name FROM exports ORDER BY name")]
+
+    def __contains__(self, enum_name: str) -> bool:
+        return self._enum_row(enum_name) is not None
+
+    def get_enum(self, enum_name: str) -> Optional[EnumRecord]:
+        """Get the record for an enum, or None if it is not in the registry."""
+        row = self._enum_row(enum_name)
+        if row is None:
+            return None
+        _, name, module, description, enum_metadata = row
+        return EnumRecord(name, module, description, json.loads(enum_metadata) if enum_metadata else {})
+
+    def members(self, enum_name: str) -> List[MemberRecord]:
+        """Get all members of an enum in definition order."""
+        row = self._enum_row(enum_name)
+        if row is None:
+            raise KeyError(enum_name)
+        rows = self._query(
+            "SELECT name, value, meaning, description, metadata FROM members "
+            "WHERE enum_id = ? ORDER BY position",
+            (row[0],),
+        )
+        return [self._member_record(row[1], r) for r in rows]
+
+    def get_member(self, enum_name: str, member_name: str) -> Optional[MemberRecord]:
+        """Get a member of an enum by its name."""
+        row = self._enum_row(enum_name)
+        if row is None:
+            raise KeyError(enum_name)
+        member = self._query_one(
+            "SELECT name, value, meaning, description, metadata FROM members "
+            "WHERE enum_id = ? AND name = ?",
+            (row[0], member_name),
+        )
+        return self._member_record(row[1], member) if member else None
+
+    def from_meaning(self, enum_name: str, meaning: str) -> Optional[MemberRecord]:
+        """Find the first member of an enum with the given meaning (CURIE or IRI)."""
+        row = self._enum_row(enum_name)
+        if row is None:
+            raise KeyError(enum_name)
+        if not meaning:
+            return None
+        # The CURIE index holds normalized keys, whatever form the meaning was written in
+        member = self._query_one(
+            "SELECT m.name, m.value, m.meaning, m.description, m.metadata FROM curies c "
+            "JOIN members m ON m.enum_id = c.enum_id AND m.position = c.position "
+            "WHERE c.curie = ? AND c.enum_id = ? AND c.predicate = 'meaning' ORDER BY c.position LIMIT 1",
+            (curie_key(meaning), row[0]),
+        )
+        return self._member_record(row[1], member) if member else None
+
+    def curie_rows(self, curie: Optional[str] = None) -> List[CurieRow]:
+        """
+        Get CURIE index rows, for one CURIE (or IRI) or for all CURIEs.
+
+        Rows cover every enum definition, including ones shadowed by a
+        same-named enum in another module, ordered by module, enum and position.
+        """
+        sql = (
+            "SELECT c.curie, e.module, e.name, m.name, c.predicate FROM curies c "
+            "JOIN enums e ON e.id = c.enum_id "
+            "JOIN members m ON m.enum_id = c.enum_id AND m.position = c.position"
+        )
+        params: tuple = ()
+        if curie is not None:
+            sql += " WHERE c.curie = ?"
+            params = (curie_key(curie),)
+        sql += " ORDER BY e.module, e.name, c.position"
+        return [CurieRow(*row) for row in self._query(sql, params)]
+
+    def classifier_fields(self, enum_name: str) -> List[str]:
+        """
+        Get an enum's classifier fields, sorted.
+
+        Precomputed with detect_classifier_fields from the generated enums.
+
+        Examples:
+            >>> get_registry().classifier_fields("ProcessScaleEnum")
+            ['volume']
+        """
+        row = self._enum_row(enum_name)
+        if row is None:
+            raise KeyError(enum_name)
+        return [r[0] for r in self._query(
+            "SELECT field FROM classifier_fields WHERE enum_id = ? ORDER BY field", (row[0],)
+        )]
+
+    def classifiable_enums(self) -> Dict[str, List[str]]:
+        """Map the name of every exported enum with classifier fields to its sorted fields."""
+        result: Dict[str, List[str]] = {}
+        for name, field in self._query(
+            "SELECT x.name, f.field FROM exports x JOIN classifier_fields f ON f.enum_id = x.enum_id "
+            "ORDER BY x.name, f.field"
+        ):
+            result.setdefault(name, []).append(field)
+        return result
+
+    def classifier_ranges(self, enum_name: str, field: str) -> List[ClassifierRange]:
+        """
+        Get the parsed range bounds of an enum's members for a field.
+
+        Only members with a bound for the field are included, in definition
+        order. Bounds are parsed with the enum's annotation_mappings, as
+        classify() does.
+
+        Examples:
+            >>> get_registry().classifier_ranges("ProcessScaleEnum", "volume")[0]
+            ClassifierRange(member_name='BENCH_SCALE', min_value=0.1, max_value=10.0, unit='L')
+        """
+        row = self._enum_row(enum_name)
+        if row is None:
+            raise KeyError(enum_name)
+        rows = self._query(
+            "SELECT m.name, r.min_value, r.max_value, r.unit FROM classifier_ranges r "
+            "JOIN members m ON m.enum_id = r.enum_id AND m.position = r.position "
+            "WHERE r.enum_id = ? AND r.field = ? ORDER BY r.position",
+            (row[0], field),
+        )
+        return [ClassifierRange(*r) for r in rows]
+
+    def materialize(self, enum_name: str) -> Type[RichEnum]:
+        """
+        Build a RichEnum class from the registry.
+
+        The class has the same members and metadata as the generated one but
+        is a distinct class object; it is cached per registry.
+        """
+        enum_class = self._materialized.get(enum_name)
+        if enum_class is not None:
+            return enum_class
+        record = self.get_enum(enum_name)
+        if record is None:
+            raise KeyError(enum_name)
+        members = self.members(enum_name)
+        enum_class = RichEnum(
+            record.name,
+            [(member.name, member.value) for member in members],
+            module=record.module,
+            qualname=record.name,
+        )
+        enum_class.__doc__ = record.description
+        enum_class._metadata = {member.name: member.metadata for member in members if member.metadata}
+        if record.enum_metadata:
+            enum_class._enum_metadata = record.enum_metadata
+        self._materialized[enum_name] = enum_class
+        return enum_class
+
+
+@lru_cache(maxsize=None)
+def _registry_for(path: Path) -> EnumRegistry:
+    return EnumRegistry(path)
+
+
+def get_registry(path: Optional[Union[str, Path]] = None) -> EnumRegistry:
+    """Get a shared registry instance for a registry file (the packaged one by default)."""
+    return _registry_for(Path(path) if path else DEFAULT_REGISTRY_PATH)
+
+
+def packaged_registry() -> Optional[EnumRegistry]:
+    """Get the shared packaged registry, or None if it is missing or in an older format."""
+    try:
+        return get_registry()
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def load_enum(name: str, registry: Optional[EnumRegistry] = None) -> Type[RichEnum]:
+    """
+    Import an enum class of valuesets.enums by name, importing only its module.
+
+    Accepts the names exported by valuesets.enums, names of enums that are
+    only defined in a submodule, and module-qualified names for enums
+    shadowed by a same-named enum elsewhere (see EnumRegistry.resolve_name).
+
+    Raises:
+        KeyError: If no enum matches
+        ValueError: If an unqualified name is defined in several modules
+            and none of them is exported
+
+    Examples:
+        >>> load_enum("bio.lipid_categories.PresenceEnum").__module__
+        'valuesets.enums.bio.lipid_categories'
+        >>> load_enum("BiologicalKingdom").__name__
+        'BiologicalKingdom'
+    """
+    if "." not in name:
+        import valuesets.enums
+
+        # Exported names resolve through the package's lazy attribute lookup
+        enum_class = getattr(valuesets.enums, name, None)
+        if isinstance(enum_class, type) and issubclass(enum_class, RichEnum):
+            return enum_class
+    module, class_name = (registry or get_registry()).resolve_name(name)
+    enum_class = getattr(importlib.import_module(module), class_name, None)
+    if not (isinstance(enum_class, type) and issubclass(enum_class, RichEnum)):
+        raise KeyError(name)
+    return enum_class
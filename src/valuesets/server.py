@@ -0,0 +1,536 @@
+"""
+Long-running server for batch classification, normalization and CURIE lookups.
+
+``valuesets serve`` keeps enum classes, compiled classifiers, normalizer
+caches and the CURIE index in memory between requests, so many small jobs
+pay the start-up cost once. Requests are JSON batches over HTTP/1.1 (with
+keep-alive), on a TCP port or a Unix socket:
+
+``POST /classify``
+    ``{"enum": "ProcessScaleEnum", "values": [0.5, 500], "units": "mL"}``
+    gives ``{"results": ["MICROFLUIDIC_SCALE", "BENCH_SCALE"]}``. Send
+    ``"records"`` (objects, with an optional ``"unit_field"``) instead of
+    ``"values"`` to classify whole records. Optional keys: ``"field"``,
+    ``"inclusive"`` (default true) and ``"all_matches"`` (default false;
+    results are then lists of member names).
+
+``POST /normalize``
+    ``{"enum": "BiologicalSexEnum", "values": ["M", "female", "?"]}`` gives
+    one ``{"member": ..., "match_type": ...}`` per value, plus ``"matched"``
+    and ``"total"`` counts.
+
+``POST /lookup``
+    ``{"curies": ["BSPO:0000000"]}`` gives the members mapped to each term,
+    in the shape of ``valuesets which-enum --output-format json``.
+
+``GET /health``
+    Request and item counts.
+
+Batches of up to ``inline_limit`` items run in a bounded thread pool, so
+the event loop keeps serving other connections (including ``/health``)
+while they are classified. Larger batches go to a bounded process pool,
+split into chunks of ``chunk_size`` items that run in parallel; results
+keep the input order. Without worker processes every batch runs in the
+thread pool.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import stat
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Type
+
+from valuesets.generators.rich_enum import RichEnum
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Worker processes for large batches, and threads for the others
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Requests with more items than this are sent to the worker pool
+DEFAULT_INLINE_LIMIT = 2_000
+
+# Items per worker job when a batch is split across the pool
+DEFAULT_CHUNK_SIZE = 20_000
+
+# Largest accepted request body
+DEFAULT_MAX_BODY_SIZE = 64 * 1024 * 1024
+
+# Longest accepted request line plus headers
+MAX_HEADER_SIZE = 64 * 1024
+
+_REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    411: "Length Required", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 501: "Not Implemented",
+}
+
+
+class RequestError(Exception):
+    """A request the server cannot answer, reported with an HTTP status."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(status, message)
+        self.status = status
+        self.message = message
+
+
+# --- Batch handlers ----------------------------------------------------------
+#
+# Handlers take the decoded request body and return the response body. They
+# run in the server's thread pool or in a worker process, so they only use
+# module-level state (the caches below are per process) and keep per-request
+# state local.
+
+# Memoized normalize results per enum, shared by the requests' normalizers
+_normalize_caches: Dict[Type[RichEnum], Dict[Any, Any]] = {}
+
+
+def _enum_class(payload: Dict[str, Any]) -> Type[RichEnum]:
+    """Get the enum named (optionally module-qualified) by a request."""
+    name = payload.get("enum")
+    if not isinstance(name, str) or not name:
+        raise RequestError(400, "Missing 'enum'")
+    from valuesets.registry import load_enum
+
+    try:
+        return load_enum(name)
+    except KeyError:
+        raise RequestError(404, f"Unknown enum: {name!r}")
+    except ValueError as e:
+        raise RequestError(400, str(e))
+
+
+def _items(payload: Dict[str, Any], key: str) -> List[Any]:
+    items = payload.get(key)
+    if not isinstance(items, list):
+        raise RequestError(400, f"'{key}' must be a list")
+    return items
+
+
+def _batch_key(path: str, payload: Dict[str, Any]) -> str:
+    """Get the key of the list a request's batch is made of."""
+    if path == "/lookup":
+        return "curies"
+    if path == "/classify" and "records" in payload:
+        return "records"
+    return "values"
+
+
+def _value_field(enum_class: Type[RichEnum], field: Optional[str]) -> str:
+    """Resolve the field to classify bare values on."""
+    from valuesets.utils.classifier import classifier_fields, get_classifier_config
+
+    if field:
+        return field
+    field = get_classifier_config(enum_class).get("classifier_field")
+    if field:
+        return field
+    fields = classifier_fields(enum_class)
+    if len(fields) != 1:
+        detected = ", ".join(sorted(fields)) or "none"
+        raise RequestError(400, f"'field' is required for {enum_class.__name__} (detected: {detected})")
+    return next(iter(fields))
+
+
+def _classify_values(values: List[Any], units: Any, enum_class: Type[RichEnum], field: str,
+                     inclusive: bool, all_matches: bool) -> List[Any]:
+    """Classify bare values to member names, all at once with classify_array when numpy is installed."""
+    from valuesets.utils.classifier import classify, classify_array
+    from valuesets.utils.codes import code_table
+
+    if isinstance(units, list) and len(units) != len(values):
+        raise RequestError(400, "'units' must be a single unit or a list as long as 'values'")
+    if not HAS_NUMPY:
+        unit_of = (lambda i: units[i]) if isinstance(units, list) else (lambda i: units)
+        return _match_names([
+            [] if isinstance(value, bool) else classify({field: (value, unit_of(i))}, enum_class, field, inclusive)
+            for i, value in enumerate(values)
+        ], all_matches)
+
+    # Non-numeric values match nothing, as in classify(); JSON true/false are not numbers
+    numeric = np.array([
+        value if isinstance(value, (int, float)) and not isinstance(value, bool) else np.nan
+        for value in values
+    ], dtype=np.float64)
+    unit_array = np.array(units, dtype=object) if isinstance(units, list) else units
+    result = classify_array(numeric, enum_class, field, inclusive, all_matches=all_matches, units=unit_array)
+    table = code_table(enum_class)
+    if not all_matches:
+        names = np.array(table.names + [None], dtype=object)
+        return names[np.where(result == table.missing, len(table), result)].tolist()
+    # Reorder the code-ordered columns to definition order
+    members = list(enum_class)
+    result = result[:, [table.code_of(member) for member in members]]
+    return [[members[i].name for i in np.flatnonzero(row)] for row in result]
+
+
+def _match_names(matches: List[List[RichEnum]], all_matches: bool) -> List[Any]:
+    """Turn classify() results into member names (lists of names with all_matches)."""
+    if all_matches:
+        return [[member.name for member in members] for members in matches]
+    return [members[0].name if members else None for members in matches]
+
+
+def classify_batch(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Answer a /classify request."""
+    from valuesets.utils.classifier import classify
+
+    enum_class = _enum_class(payload)
+    inclusive = bool(payload.get("inclusive", True))
+    all_matches = bool(payload.get("all_matches", False))
+    if "records" in payload:
+        unit_field = payload.get("unit_field")
+        matches = [
+            classify(record, enum_class, payload.get("field"), inclusive, unit_field)
+            if isinstance(record, dict) else []
+            for record in _items(payload, "records")
+        ]
+        return {"results": _match_names(matches, all_matches)}
+    field = _value_field(enum_class, payload.get("field"))
+    values = _items(payload, "values")
+    return {"results": _classify_values(values, payload.get("units"), enum_class, field, inclusive, all_matches)}
+
+
+def normalize_batch(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Answer a /normalize request."""
+    from valuesets.utils.normalize import Normalizer
+
+    enum_class = _enum_class(payload)
+    values = _items(payload, "values")
+    # Counts are this request's; only the memoized results are shared
+    normalizer = Normalizer(enum_class, cache=_normalize_caches.setdefault(enum_class, {}))
+    results = [
+        {"member": result.member.name if result.member else None, "match_type": result.match_type}
+        for result in normalizer.normalize_many(values)
+    ]
+    return {"results": results, "matched": normalizer.matched, "total": normalizer.total}
+
+
+def lookup_batch(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Answer a /lookup request."""
+    from valuesets.curie_index import get_curie_index
+
+    index = get_curie_index()
+    results = []
+    for curie in _items(payload, "curies"):
+        hits = index.hits(curie) if isinstance(curie, str) else ()
+        results.append({
+            "curie": curie,
+            "matches": [
+                {"enum": hit.enum_name, "member": hit.member_name, "predicate": hit.predicate, "module": hit.module}
+                for hit in hits
+            ],
+        })
+    return {"results": results}
+
+
+HANDLERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "/classify": classify_batch,
+    "/normalize": normalize_batch,
+    "/lookup": lookup_batch,
+}
+
+
+def run_handler(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the handler for an endpoint (also the worker pool entry point)."""
+    return HANDLERS[path](payload)
+
+
+def _split(payload: Dict[str, Any], key: str, chunk_size: int) -> List[Dict[str, Any]]:
+    """Split a batch request into requests of at most chunk_size items."""
+    items = payload[key]
+    units = payload.get("units")
+    chunks = []
+    for start in range(0, len(items), chunk_size):
+        chunk = dict(payload)
+        chunk[key] = items[start:start + chunk_size]
+        if isinstance(units, list):
+            chunk["units"] = units[start:start + chunk_size]
+        chunks.append(chunk)
+    return chunks
+
+
+def _merge(responses: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+    """Concatenate the results of chunk responses and add up their counts."""
+    merged: Dict[str, Any] = {"results": []}
+    for response in responses:
+        merged["results"].extend(response["results"])
+        for key, value in response.items():
+            if key != "results":
+                merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def _init_worker(preload: Sequence[str]) -> None:
+    """Load enums and build their state once per worker process."""
+    warm_up(preload)
+
+
+def warm_up(enum_names: Sequence[str]) -> None:
+    """
+    Load enums, compile their classifiers and build the CURIE index ahead of requests.
+
+    Raises:
+        RequestError: If an enum is unknown
+    """
+    from valuesets.curie_index import get_curie_index
+    from valuesets.utils.classifier import classifier_fields, compiled_classifier, get_classifier_config
+
+    get_curie_index()
+    for name in enum_names:
+        enum_class = _enum_class({"enum": name})
+        mappings = get_classifier_config(enum_class).get("annotation_mappings")
+        for field in classifier_fields(enum_class):
+            compiled_classifier(enum_class, field, mappings)
+        # Build the meaning and label indexes used by /normalize
+        enum_class._meaning_index()
+        enum_class._label_index()
+
+
+# --- HTTP server -------------------------------------------------------------
+
+class ValuesetsServer:
+    """
+    Asyncio HTTP server for the batch endpoints.
+
+    Args:
+        workers: Worker processes for large batches, and threads for the
+            others; 0 runs every batch in a thread pool of DEFAULT_WORKERS
+        inline_limit: Batches with at most this many items are answered in
+            the thread pool
+        chunk_size: Items per worker job
+        preload: Enum names to load and compile at start-up (in every worker)
+        max_body_size: Largest accepted request body, in bytes
+    """
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        inline_limit: int = DEFAULT_INLINE_LIMIT,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        preload: Sequence[str] = (),
+        max_body_size: int = DEFAULT_MAX_BODY_SIZE,
+    ):
+        if workers < 0:
+            raise ValueError("workers must be at least 0")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.workers = workers
+        self.inline_limit = inline_limit
+        self.chunk_size = chunk_size
+        self.preload = list(preload)
+        self.max_body_size = max_body_size
+        self.stats: Dict[str, int] = {"requests": 0, "items": 0, "pooled_requests": 0, "errors": 0}
+        self._started = time.monotonic()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        # Keeps batch CPU work off the event loop
+        self._threads = ThreadPoolExecutor(max_workers=workers or DEFAULT_WORKERS, thread_name_prefix="valuesets")
+        self._pool_slots: Optional[asyncio.Semaphore] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.Task] = set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765,
+                    unix_socket: Optional[Path] = None) -> asyncio.AbstractServer:
+        """Load the preloaded enums, start the worker pool and start listening."""
+        warm_up(self.preload)
+        if self.workers:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker, initargs=(self.preload,)
+            )
+            # At most two jobs queued per worker; later chunks wait here
+            self._pool_slots = asyncio.Semaphore(2 * self.workers)
+        if unix_socket is not None:
+            unix_socket = Path(unix_socket)
+            if unix_socket.exists() and stat.S_ISSOCK(unix_socket.stat().st_mode):
+                unix_socket.unlink()
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=str(unix_socket), limit=MAX_HEADER_SIZE
+            )
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_HEADER_SIZE)
+        return self._server
+
+    @property
+    def address(self) -> str:
+        """The listening address, as host:port or a socket path."""
+        name = self._server.sockets[0].getsockname()
+        return name if isinstance(name, str) else f"{name[0]}:{name[1]}"
+
+    async def close(self) -> None:
+        """Stop listening and shut the worker pool down."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        # Idle keep-alive connections wait for a next request; drop them
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+        self._threads.shutdown(cancel_futures=True)
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """Answer one request with (status, response body)."""
+        path = path.split("?", 1)[0]
+        if path == "/health":
+            if method != "GET":
+                raise RequestError(405, "Use GET for /health")
+            return 200, self.health()
+        if path not in HANDLERS:
+            raise RequestError(404, f"Unknown endpoint: {path}")
+        if method != "POST":
+            raise RequestError(405, f"Use POST for {path}")
+        try:
+            payload = json.loads(body)
+        except ValueError as e:
+            raise RequestError(400, f"Invalid JSON: {e}")
+        if not isinstance(payload, dict):
+            raise RequestError(400, "The request body must be a JSON object")
+
+        key = _batch_key(path, payload)
+        items = payload.get(key)
+        size = len(items) if isinstance(items, list) else 0
+        self.stats["requests"] += 1
+        self.stats["items"] += size
+        if self._pool is None or size <= self.inline_limit:
+            loop = asyncio.get_running_loop()
+            return 200, await loop.run_in_executor(self._threads, run_handler, path, payload)
+        self.stats["pooled_requests"] += 1
+        responses = await asyncio.gather(*(
+            self._run_pooled(path, chunk) for chunk in _split(payload, key, self.chunk_size)
+        ))
+        return 200, _merge(responses)
+
+    async def _run_pooled(self, path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._pool_slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, run_handler, path, payload)
+
+    def health(self) -> Dict[str, Any]:
+        """Get server status and request counts."""
+        return {
+            "status": "ok",
+            "workers": self.workers,
+            "uptime_seconds": round(time.monotonic() - self._started, 3),
+            **self.stats,
+        }
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while await self._handle_request(reader, writer):
+                pass
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _handle_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """Read and answer one request; return whether to keep the connection open."""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.IncompleteReadError:
+            return False
+        except asyncio.LimitOverrunError:
+            await self._respond(writer, 431, {"error": "Request headers too large"}, keep_alive=False)
+            return False
+        request_line, *header_lines = head.decode("latin-1").rstrip("\r\n").split("\r\n")
+        try:
+            method, target, version = request_line.split(" ", 2)
+        except ValueError:
+            await self._respond(writer, 400, {"error": "Malformed request line"}, keep_alive=False)
+            return False
+        headers = {}
+        for line in header_lines:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            await self._respond(writer, 501, {"error": "Chunked request bodies are not supported"}, keep_alive=False)
+            return False
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            length = -1
+        if length < 0:
+            await self._respond(writer, 411, {"error": "Invalid Content-Length"}, keep_alive=False)
+            return False
+        if length > self.max_body_size:
+            await self._respond(writer, 413, {"error": f"Request body over {self.max_body_size} bytes"},
+                                keep_alive=False)
+            return False
+        body = await reader.readexactly(length) if length else b""
+
+        try:
+            status, response = await self.dispatch(method, target, body)
+        except RequestError as e:
+            self.stats["errors"] += 1
+            status, response = e.status, {"error": e.message}
+        except Exception as e:
+            self.stats["errors"] += 1
+            status, response = 500, {"error": f"{type(e).__name__}: {e}"}
+        await self._respond(writer, status, response, keep_alive)
+        return keep_alive
+
+    @staticmethod
+    async def _respond(writer: asyncio.StreamWriter, status: int, response: Dict[str, Any],
+                       keep_alive: bool) -> None:
+        body = json.dumps(response, separators=(",", ":")).encode()
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+async def serve(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: Optional[Path] = None,
+    **options: Any,
+) -> None:
+    """
+    Run a ValuesetsServer until interrupted.
+
+    Args:
+        host: Interface to listen on
+        port: TCP port to listen on
+        unix_socket: Listen on this Unix socket instead of TCP
+        options: ValuesetsServer arguments
+    """
+    server = ValuesetsServer(**options)
+    listener = await server.start(host, port, unix_socket)
+    print(f"Serving on {'unix:' if unix_socket else 'http://'}{server.address} "
+          f"(pid {os.getpid()}, {server.workers} worker(s))", file=sys.stderr, flush=True)
+    loop = asyncio.get_running_loop()
+    stop = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+    try:
+        async with listener:
+            await stop.wait()
+    finally:
+        await server.close()
+        if unix_socket is not None:
+            Path(unix_socket).unlink(missing_ok=True)
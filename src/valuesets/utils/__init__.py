@@ -1,21 +1,110 @@
-"""Utilities for working with common value sets."""
-
-from .classifier import (
-    classify,
-    detect_classifier_fields,
-    get_classifier_config,
-    get_range_annotations,
-    parse_range,
-)
-from .comparison import same_meaning_as
-from .expand_dynamic_enums import DynamicEnumExpander
+"""
+Utilities for working with common value sets.
+
+Names are imported lazily from their submodules on first access:
+expand_dynamic_enums pulls in oaklib, which takes seconds to import, and
+most callers only need the classifier or normalizer.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .classifier import (
+        BoxIndex,
+        CompiledClassifier,
+        box_index,
+        classify,
+        classify_array,
+        classify_multi,
+        classify_multi_array,
+        classifier_fields,
+        compiled_classifier,
+        detect_classifier_fields,
+        get_classifier_config,
+        get_range_annotations,
+        get_range_with_unit,
+        parse_range,
+        parse_range_with_unit,
+    )
+    from .codes import CodeTable, code_shifts, code_table
+    from .comparison import same_meaning_as
+    from .expand_dynamic_enums import DynamicEnumExpander
+    from .label_store import LabelStore, StoredLabel
+    from .normalize import Normalizer, NormalizeResult, normalize_many
+    from .units import UnitConversion, UnitTable, unit_table
+
+_ATTRIBUTE_MODULES = {
+    "same_meaning_as": ".comparison",
+    "DynamicEnumExpander": ".expand_dynamic_enums",
+    "classify": ".classifier",
+    "classify_array": ".classifier",
+    "classify_multi": ".classifier",
+    "classify_multi_array": ".classifier",
+    "BoxIndex": ".classifier",
+    "box_index": ".classifier",
+    "CompiledClassifier": ".classifier",
+    "compiled_classifier": ".classifier",
+    "classifier_fields": ".classifier",
+    "detect_classifier_fields": ".classifier",
+    "get_classifier_config": ".classifier",
+    "get_range_annotations": ".classifier",
+    "parse_range": ".classifier",
+    "get_range_with_unit": ".classifier",
+    "parse_range_with_unit": ".classifier",
+    "UnitConversion": ".units",
+    "UnitTable": ".units",
+    "unit_table": ".units",
+    "Normalizer": ".normalize",
+    "NormalizeResult": ".normalize",
+    "normalize_many": ".normalize",
+    "CodeTable": ".codes",
+    "code_table": ".codes",
+    "code_shifts": ".codes",
+    "LabelStore": ".label_store",
+    "StoredLabel": ".label_store",
+}
 
 __all__ = [
     "same_meaning_as",
     "DynamicEnumExpander",
     "classify",
+    "classify_array",
+    "classify_multi",
+    "classify_multi_array",
+    "BoxIndex",
+    "box_index",
+    "CompiledClassifier",
+    "compiled_classifier",
+    "classifier_fields",
     "detect_classifier_fields",
     "get_classifier_config",
     "get_range_annotations",
     "parse_range",
-]
\ No newline at end of file
+    "get_range_with_unit",
+    "parse_range_with_unit",
+    "UnitConversion",
+    "UnitTable",
+    "unit_table",
+    "Normalizer",
+    "NormalizeResult",
+    "normalize_many",
+    "CodeTable",
+    "code_table",
+    "code_shifts",
+    "LabelStore",
+    "StoredLabel",
+]
+
+
+def __getattr__(name):
+    module = _ATTRIBUTE_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,295 @@
+"""Stable integer codes for enum members, with NumPy and pandas conversions."""
+
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Type
+
+from valuesets.generators.rich_enum import RichEnum
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+def code_order(entries: Iterable[Tuple[str, Optional[Any]]]) -> List[str]:
+    """
+    Order member names for code assignment.
+
+    Members are coded in definition order unless some carry a ``rank``;
+    then ranked members come first by rank (ties in definition order),
+    followed by unranked members in definition order.
+
+    Args:
+        entries: (member name, rank or None) pairs in definition order
+
+    Returns:
+        Member names in code order
+
+    Examples:
+        >>> code_order([("A", None), ("B", None)])
+        ['A', 'B']
+        >>> code_order([("A", None), ("B", 2), ("C", 1)])
+        ['C', 'B', 'A']
+    """
+    entries = list(entries)
+    if all(rank is None for _, rank in entries):
+        return [name for name, _ in entries]
+    ranked = sorted(
+        (position for position, (_, rank) in enumerate(entries) if rank is not None),
+        key=lambda position: (entries[position][1], position),
+    )
+    unranked = [position for position, (_, rank) in enumerate(entries) if rank is None]
+    return [entries[position][0] for position in ranked + unranked]
+
+
+class CodeTable:
+    """
+    Mapping between the members of an enum and small unsigned integer codes.
+
+    Codes are assigned by code_order from the generated enum definition, so
+    they are reproducible across releases as long as members are only ever
+    appended (see code_shifts). The largest value of the dtype is reserved
+    for missing values.
+
+    Examples:
+        >>> from valuesets.enums.bio.taxonomy import BiologicalKingdom
+        >>> table = code_table(BiologicalKingdom)
+        >>> table.dtype_name
+        'uint8'
+        >>> table.code_of(BiologicalKingdom.BACTERIA)
+        0
+        >>> codes = table.encode(["EUKARYOTA", BiologicalKingdom.BACTERIA, None])
+        >>> codes.tolist()
+        [2, 0, 255]
+        >>> [m.name if m else None for m in table.decode(codes)]
+        ['EUKARYOTA', 'BACTERIA', None]
+    """
+
+    def __init__(self, enum_class: Type[RichEnum]):
+        metadata = enum_class.__dict__.get("_metadata", {})
+        order = code_order(
+            (member.name, metadata[member.name].rank if member.name in metadata else None)
+            for member in enum_class
+        )
+        self.enum_class = enum_class
+        self.members: Tuple[RichEnum, ...] = tuple(enum_class[name] for name in order)
+        self.dtype_name = "uint8" if len(self.members) < 0xFF else "uint16"
+        self.missing = 0xFF if self.dtype_name == "uint8" else 0xFFFF
+        self._codes: Dict[Any, int] = {}
+        for code, member in enumerate(self.members):
+            self._codes[member] = code
+            self._codes.setdefault(member.name, code)
+            self._codes.setdefault(member.value, code)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    @property
+    def names(self) -> List[str]:
+        """Member names in code order (the categories of a Categorical)."""
+        return [member.name for member in self.members]
+
+    def code_of(self, value: Any) -> int:
+        """
+        Get the code of a member, member name or member value.
+
+        Raises:
+            KeyError: If the value is not a member of the enum
+        """
+        return self._codes[value]
+
+    def member_of(self, code: int) -> Optional[RichEnum]:
+        """
+        Get the member for a code, or None for the missing code.
+
+        Raises:
+            ValueError: If the code is neither a member's code nor the missing code
+        """
+        if code == self.missing:
+            return None
+        if not 0 <= code < len(self.members):
+            raise ValueError(f"Invalid code {code} for {self.enum_class.__name__}")
+        return self.members[code]
+
+    def encode(self, values: Iterable[Any]) -> "np.ndarray":
+        """
+        Encode members, names or values as a uint8/uint16 array.
+
+        Each distinct value is looked up once. None and NaN become the
+        missing code.
+
+        Raises:
+            ValueError: If a value is not a member of the enum
+        """
+        _require_numpy()
+        values = values if isinstance(values, np.ndarray) else np.asarray(list(values), dtype=object)
+        if values.size == 0:
+            return np.empty(values.shape, dtype=self.dtype_name)
+        uniques, inverse = _factorize(values.ravel())
+        # The extra last entry is the target of the -1 (missing) index
+        lookup = np.empty(len(uniques) + 1, dtype=self.dtype_name)
+        lookup[-1] = self.missing
+        for i, value in enumerate(uniques):
+            code = self._codes.get(value)
+            if code is None:
+                raise ValueError(f"{value!r} is not a member of {self.enum_class.__name__}")
+            lookup[i] = code
+        return lookup[inverse].reshape(values.shape)
+
+    def decode(self, codes: "np.ndarray") -> "np.ndarray":
+        """
+        Decode codes to an object array of members (None for missing).
+
+        Raises:
+            ValueError: If a code is neither a member's code nor the missing code
+        """
+        _require_numpy()
+        codes = np.asarray(codes)
+        table = np.empty(len(self.members) + 1, dtype=object)
+        table[:-1] = self.members
+        table[-1] = None
+        missing = codes == self.missing
+        invalid = ~missing & ((codes < 0) | (codes >= len(self.members)))
+        if invalid.any():
+            bad = sorted(set(codes[invalid].tolist()))
+            raise ValueError(f"Invalid codes for {self.enum_class.__name__}: {bad[:10]}")
+        positions = np.where(missing, len(self.members), codes)
+        return table[positions]
+
+    def to_categorical(self, codes: "np.ndarray"):
+        """
+        Build a pandas Categorical of member names from codes, without hashing strings.
+
+        All members are categories, in code order; missing codes become NaN.
+        """
+        _require_numpy()
+        import pandas as pd
+
+        codes = np.asarray(codes)
+        signed = codes.astype(np.int32)
+        signed[codes == self.missing] = -1
+        return pd.Categorical.from_codes(signed, categories=self.names)
+
+    def from_categorical(self, categorical) -> "np.ndarray":
+        """
+        Encode a pandas Categorical whose categories are member names or values.
+
+        Only the categories are looked up; the per-row category codes are
+        remapped with one array index.
+        """
+        _require_numpy()
+        category_codes = self.encode(list(categorical.categories))
+        lookup = np.append(category_codes, np.array([self.missing], dtype=self.dtype_name))
+        return lookup[np.asarray(categorical.codes)]
+
+
+def code_table(enum_class: Type[RichEnum]) -> CodeTable:
+    """Get the cached CodeTable of an enum (rebuilt when _metadata is reassigned)."""
+    table = enum_class.__dict__.get("_code_table_cache")
+    if table is None:
+        table = CodeTable(enum_class)
+        type.__setattr__(enum_class, "_code_table_cache", table)
+    return table
+
+
+def encode(enum_class: Type[RichEnum], values: Iterable[Any]) -> "np.ndarray":
+    """Encode members, names or values of an enum as an integer code array."""
+    return code_table(enum_class).encode(values)
+
+
+def decode(enum_class: Type[RichEnum], codes: "np.ndarray") -> "np.ndarray":
+    """Decode an integer code array to an object array of members."""
+    return code_table(enum_class).decode(codes)
+
+
+def code_shifts(old: Mapping[str, Sequence[str]], new: Mapping[str, Sequence[str]]) -> List[str]:
+    """
+    Report code changes between two code snapshots.
+
+    A snapshot maps enum names to member names in code order. Appending
+    members does not change existing codes and is not reported; moved,
+    removed or replaced members are.
+
+    Args:
+        old: Snapshot of the previous release
+        new: Snapshot of the current definitions
+
+    Returns:
+        One line per shifted code, e.g. "Color: GREEN 1 -> 2"
+
+    Examples:
+        >>> code_shifts({"Color": ["RED", "GREEN"]}, {"Color": ["RED", "BLUE", "GREEN"]})
+        ['Color: GREEN 1 -> 2']
+        >>> code_shifts({"Color": ["RED"]}, {"Color": ["RED", "BLUE"]})
+        []
+        >>> code_shifts({"Color": ["RED", "GREEN"], "Size": ["S"]}, {"Color": ["RED"]})
+        ['Color: GREEN 1 removed', 'Size: enum removed']
+    """
+    shifts = []
+    for enum_name in sorted(old):
+        if enum_name not in new:
+            shifts.append(f"{enum_name}: enum removed")
+            continue
+        new_codes = {name: code for code, name in enumerate(new[enum_name])}
+        for code, name in enumerate(old[enum_name]):
+            new_code = new_codes.get(name)
+            if new_code is None:
+                shifts.append(f"{enum_name}: {name} {code} removed")
+            elif new_code != code:
+                shifts.append(f"{enum_name}: {name} {code} -> {new_code}")
+    return shifts
+
+
+def code_snapshot(enum_classes: Mapping[str, Type[RichEnum]]) -> Dict[str, List[str]]:
+    """Snapshot the code order (member names) of named enum classes."""
+    return {name: code_table(enum_class).names for name, enum_class in enum_classes.items()}
+
+
+def registry_code_snapshot(registry) -> Dict[str, List[str]]:
+    """
+    Snapshot the code order of every exported enum from a registry file.
+
+    Use a registry from a previous release as the baseline for code_shifts.
+
+    Args:
+        registry: A valuesets.registry.EnumRegistry
+    """
+    return {
+        name: code_order((member.name, member.metadata.get("rank")) for member in registry.members(name))
+        for name in registry.enum_names()
+    }
+
+
+def _factorize(values: "np.ndarray") -> Tuple[List[Any], "np.ndarray"]:
+    """
+    Split values into distinct values and an inverse index (-1 for None/NaN).
+
+    Uses pandas.factorize (hash based) when pandas is installed, and a
+    dict-based loop otherwise.
+    """
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+    if pd is not None:
+        inverse, uniques = pd.factorize(values)
+        return list(uniques), inverse
+    index: Dict[Any, int] = {}
+    uniques: List[Any] = []
+    inverse = np.empty(len(values), dtype=np.intp)
+    for i, value in enumerate(values):
+        if value is None or value != value:  # None or NaN
+            inverse[i] = -1
+            continue
+        position = index.get(value)
+        if position is None:
+            position = index[value] = len(uniques)
+            uniques.append(value)
+        inverse[i] = position
+    return uniques, inverse
+
+
+def _require_numpy() -> None:
+    if not HAS_NUMPY:
+        raise ImportError("numpy is required for array encoding; install valuesets[numpy]")
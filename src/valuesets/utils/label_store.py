@@ -0,0 +1,281 @@
+"""
+Shared store of ontology term labels.
+
+One SQLite database, in WAL mode, holds the labels that the validators,
+generators and documentation scripts resolve, so a CURIE looked up by one
+tool is not resolved again by the next. Each row records the label (None for
+a term that was looked up and not found), synonyms, when it was retrieved
+and the adapter it came from. WAL lets any number of processes read while
+one writes.
+
+The per-prefix ``cache/<prefix>/terms.csv`` files used before the store can
+be imported with import_csv_tree and regenerated with export_csv_tree.
+
+Examples:
+    >>> import tempfile
+    >>> store = LabelStore(Path(tempfile.mkdtemp()) / "labels.sqlite")
+    >>> store.put("GO:0008150", "biological_process", synonyms=["biological process"], source="sqlite:obo:go")
+    >>> store.get("GO:0008150").label
+    'biological_process'
+    >>> store.put_many([StoredLabel("GO:0005575", "cellular_component"), StoredLabel("GO:9999999", None)])
+    2
+    >>> sorted(store.get_many(["GO:0005575", "GO:9999999", "GO:0000000"]))
+    ['GO:0005575', 'GO:9999999']
+    >>> store.labels("go")["GO:9999999"] is None
+    True
+"""
+
+import csv
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Store used when none is given; VALUESETS_LABEL_STORE overrides it
+DEFAULT_LABEL_STORE_PATH = Path("cache") / "labels.sqlite"
+
+# File name of each prefix's labels in the CSV cache trees
+CSV_CACHE_FILE = "terms.csv"
+CSV_CACHE_HEADER = ["curie", "label", "retrieved_at"]
+
+# A timestamp directly followed by the next row's CURIE
+_GLUED_ROW = re.compile(r"^(\d{4}-\d\d-\d\dT[\d:.]+)(\S+:\S+)$")
+
+# Keeps the number of bound parameters per statement under SQLite's limit
+_BATCH_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS labels (
+    curie TEXT PRIMARY KEY,
+    prefix TEXT NOT NULL,
+    label TEXT,
+    synonyms TEXT,
+    retrieved_at TEXT NOT NULL,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS labels_prefix ON labels (prefix);
+"""
+
+# A row replaces a stored one unless it was retrieved earlier
+_UPSERT = """
+INSERT INTO labels (curie, prefix, label, synonyms, retrieved_at, source) VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (curie) DO UPDATE SET
+    label = excluded.label, synonyms = excluded.synonyms,
+    retrieved_at = excluded.retrieved_at, source = excluded.source
+WHERE excluded.retrieved_at >= labels.retrieved_at
+"""
+
+
+class StoredLabel(NamedTuple):
+    """A term's label as stored; label is None for terms that were not found."""
+    curie: str
+    label: Optional[str]
+    synonyms: Sequence[str] = ()
+    retrieved_at: str = ""
+    source: Optional[str] = None
+
+
+def curie_prefix(curie: str) -> str:
+    """
+    Get the lower-cased prefix the store indexes a CURIE under.
+
+    Examples:
+        >>> curie_prefix("NCBITaxon:9606")
+        'ncbitaxon'
+    """
+    return curie.split(":", 1)[0].lower()
+
+
+def default_label_store_path(cache_dir: Optional[Union[str, Path]] = None) -> Path:
+    """Get the store path from VALUESETS_LABEL_STORE, or labels.sqlite in cache_dir (default: cache)."""
+    if os.environ.get("VALUESETS_LABEL_STORE"):
+        return Path(os.environ["VALUESETS_LABEL_STORE"])
+    return Path(cache_dir) / DEFAULT_LABEL_STORE_PATH.name if cache_dir else DEFAULT_LABEL_STORE_PATH
+
+
+def _csv_terms(row: List[str]) -> Iterator[Tuple[str, str, str]]:
+    """
+    Get the (curie, label, retrieved_at) terms in a terms.csv row.
+
+    Concurrent appends to the old CSV cache could leave two rows on one line,
+    the second CURIE straight after the first timestamp; both are recovered.
+
+    Examples:
+        >>> list(_csv_terms(["ENVO:1", "volcano", "2025-11-03T17:34:10.52ENVO:2", "biome", "2025-11-25T07:59:01"]))
+        [('ENVO:1', 'volcano', '2025-11-03T17:34:10.52'), ('ENVO:2', 'biome', '2025-11-25T07:59:01')]
+    """
+    while len(row) >= 2 and row[0]:
+        retrieved_at = row[2] if len(row) > 2 else ""
+        glued = _GLUED_ROW.match(retrieved_at) if len(row) > 3 else None
+        if glued is None:
+            yield row[0], row[1], retrieved_at
+            return
+        yield row[0], row[1], glued.group(1)
+        row = [glued.group(2)] + row[3:]
+
+
+class LabelStore:
+    """
+    Ontology term labels in a SQLite file shared between tools and processes.
+
+    The connection is opened lazily and reopened after a fork, so a store
+    can be handed to worker processes. Writes from several threads are
+    serialized; concurrent writers in other processes wait for each other
+    (up to timeout seconds).
+
+    Args:
+        path: Database file, created if missing (default: default_label_store_path())
+        timeout: Seconds to wait for another process's write lock
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, timeout: float = 30.0):
+        self.path = Path(path) if path else default_label_store_path()
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=self.timeout, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection; the store reopens it on next use."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def _query(self, sql: str, params: Sequence = ()) -> List[tuple]:
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    @staticmethod
+    def _record(row: tuple) -> StoredLabel:
+        curie, label, synonyms, retrieved_at, source = row
+        return StoredLabel(curie, label, tuple(json.loads(synonyms)) if synonyms else (), retrieved_at, source)
+
+    def __len__(self) -> int:
+        return self._query("SELECT COUNT(*) FROM labels")[0][0]
+
+    def __contains__(self, curie: str) -> bool:
+        return bool(self._query("SELECT 1 FROM labels WHERE curie = ?", (curie,)))
+
+    def get(self, curie: str) -> Optional[StoredLabel]:
+        """Get a stored term, or None if it was never stored."""
+        rows = self._query(
+            "SELECT curie, label, synonyms, retrieved_at, source FROM labels WHERE curie = ?", (curie,)
+        )
+        return self._record(rows[0]) if rows else None
+
+    def get_many(self, curies: Iterable[str]) -> Dict[str, StoredLabel]:
+        """Get the stored terms among many CURIEs, by CURIE; unknown CURIEs are left out."""
+        curies = list(dict.fromkeys(curies))
+        found: Dict[str, StoredLabel] = {}
+        for start in range(0, len(curies), _BATCH_SIZE):
+            batch = curies[start:start + _BATCH_SIZE]
+            rows = self._query(
+                "SELECT curie, label, synonyms, retrieved_at, source FROM labels "
+                f"WHERE curie IN ({', '.join('?' * len(batch))})",
+                batch,
+            )
+            for row in rows:
+                found[row[0]] = self._record(row)
+        return found
+
+    def labels(self, prefix: str) -> Dict[str, Optional[str]]:
+        """Get every stored CURIE -> label for a prefix (any case)."""
+        return dict(self._query("SELECT curie, label FROM labels WHERE prefix = ?", (prefix.lower(),)))
+
+    def prefixes(self) -> List[str]:
+        """Get the lower-cased prefixes with stored terms."""
+        return [row[0] for row in self._query("SELECT DISTINCT prefix FROM labels ORDER BY prefix")]
+
+    def put(self, curie: str, label: Optional[str], synonyms: Sequence[str] = (),
+            source: Optional[str] = None) -> None:
+        """Store a term's label, retrieved now."""
+        self.put_many([StoredLabel(curie, label, synonyms, "", source)])
+
+    def put_many(self, entries: Iterable[StoredLabel]) -> int:
+        """
+        Store many terms in one transaction.
+
+        Entries without retrieved_at are stamped with the current time. An
+        entry does not replace a stored term retrieved later.
+
+        Returns:
+            Number of entries given
+        """
+        now = datetime.now().isoformat()
+        rows = [
+            (e.curie, curie_prefix(e.curie), e.label or None,
+             json.dumps(list(e.synonyms)) if e.synonyms else None, e.retrieved_at or now, e.source)
+            for e in entries
+        ]
+        if rows:
+            with self._lock:
+                conn = self._connection()
+                with conn:
+                    conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def import_csv_tree(self, cache_dir: Union[str, Path], source: Optional[str] = None) -> int:
+        """
+        Import labels from a tree of <prefix>/terms.csv cache files.
+
+        Empty labels are imported as not found; retrieval times are kept.
+
+        Returns:
+            Number of rows imported
+        """
+        entries = []
+        for path in sorted(Path(cache_dir).glob(f"*/{CSV_CACHE_FILE}")):
+            with open(path, "r", newline="") as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Skip header
+                for row in reader:
+                    for curie, label, retrieved_at in _csv_terms(row):
+                        entries.append(StoredLabel(curie, label or None, (), retrieved_at, source))
+        return self.put_many(entries)
+
+    def export_csv_tree(self, cache_dir: Union[str, Path], prefixes: Optional[Iterable[str]] = None) -> int:
+        """
+        Write stored labels as <prefix>/terms.csv cache files, in retrieval order.
+
+        Each file is written to a temporary file and renamed into place.
+
+        Returns:
+            Number of rows written
+        """
+        written = 0
+        for prefix in prefixes or self.prefixes():
+            rows = self._query(
+                "SELECT curie, label, retrieved_at FROM labels WHERE prefix = ? ORDER BY retrieved_at, curie",
+                (prefix.lower(),),
+            )
+            if not rows:
+                continue
+            path = Path(cache_dir) / prefix.lower() / CSV_CACHE_FILE
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+            try:
+                with open(tmp_path, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(CSV_CACHE_HEADER)
+                    writer.writerows((curie, label or "", retrieved_at) for curie, label, retrieved_at in rows)
+                os.replace(tmp_path, path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+            written += len(rows)
+        return written
@@ -0,0 +1,133 @@
+"""Bulk normalization of raw strings to enum members."""
+
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional, Type
+
+from valuesets.generators.rich_enum import RichEnum
+
+# Match type reported when a label matches more than one member
+AMBIGUOUS = "ambiguous"
+
+# Default upper bound on the number of distinct raw values remembered
+DEFAULT_MAX_CACHE_SIZE = 1_000_000
+
+
+class NormalizeResult(NamedTuple):
+    """The outcome of normalizing one raw value."""
+    raw: Any
+    member: Optional[RichEnum]
+    match_type: Optional[str]
+
+
+class Normalizer:
+    """
+    Map raw strings to members of one enum, memoizing distinct values.
+
+    Each value is matched by name, value, meaning or label (see
+    RichEnum.match). Results are cached per distinct raw value, so a column
+    with few distinct values costs one dict lookup per cell. Values that do
+    not resolve to a single member are counted in ``unmatched``.
+
+    Args:
+        enum_class: The RichEnum to normalize to
+        max_cache_size: Stop memoizing new values once this many are cached
+        cache: Memoized results to share with other normalizers of the same
+            enum (each keeps its own counts); a new cache by default
+
+    Examples:
+        >>> from valuesets.generators.rich_enum import RichEnum
+
+        >>> class Sex(RichEnum):
+        ...     MALE = "MALE"
+        ...     FEMALE = "FEMALE"
+        >>> Sex._metadata = {
+        ...     "MALE": {"meaning": "PATO:0000384", "aliases": ["M", "man"]},
+        ...     "FEMALE": {"meaning": "PATO:0000383", "aliases": ["F", "woman"]},
+        ... }
+
+        >>> normalizer = Normalizer(Sex)
+        >>> [(r.member.name if r.member else None, r.match_type)
+        ...  for r in normalizer.normalize_many(["MALE", "f", "PATO:0000384", "?", "f"])]
+        [('MALE', 'name'), ('FEMALE', 'label'), ('MALE', 'meaning'), (None, None), ('FEMALE', 'label')]
+        >>> normalizer.unmatched
+        Counter({'?': 1})
+        >>> normalizer.matched, normalizer.total
+        (4, 5)
+    """
+
+    def __init__(self, enum_class: Type[RichEnum], max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+                 cache: Optional[Dict[Any, NormalizeResult]] = None):
+        self.enum_class = enum_class
+        self.max_cache_size = max_cache_size
+        self.unmatched: Counter = Counter()
+        self.matched = 0
+        self.total = 0
+        self._cache: Dict[Any, NormalizeResult] = {} if cache is None else cache
+
+    def _resolve(self, raw: Any) -> NormalizeResult:
+        if raw is None:
+            return NormalizeResult(raw, None, None)
+        text = raw if isinstance(raw, str) else str(raw)
+        members, match_type = self.enum_class.match(text.strip())
+        if len(members) > 1:
+            return NormalizeResult(raw, None, AMBIGUOUS)
+        return NormalizeResult(raw, members[0] if members else None, match_type)
+
+    def reset_counts(self) -> None:
+        """Reset the match counts and unmatched report, keeping memoized results."""
+        self.unmatched.clear()
+        self.matched = 0
+        self.total = 0
+
+    def normalize(self, raw: Any) -> NormalizeResult:
+        """Normalize one raw value and update the match counts."""
+        # Only strings are memoized: equal keys such as 1, 1.0 and True
+        # would otherwise share a result carrying the first raw value
+        if type(raw) is str:
+            result = self._cache.get(raw)
+            if result is None:
+                result = self._resolve(raw)
+                if len(self._cache) < self.max_cache_size:
+                    self._cache[raw] = result
+        else:
+            result = self._resolve(raw)
+        self.total += 1
+        if result.member is None:
+            self.unmatched["" if raw is None else raw if isinstance(raw, str) else str(raw)] += 1
+        else:
+            self.matched += 1
+        return result
+
+    def normalize_many(self, values: Iterable[Any]) -> Iterator[NormalizeResult]:
+        """Normalize values lazily, in input order."""
+        normalize = self.normalize
+        for raw in values:
+            yield normalize(raw)
+
+
+def normalize_many(
+    enum_class: Type[RichEnum],
+    values: Iterable[Any],
+    max_cache_size: int = DEFAULT_MAX_CACHE_SIZE,
+) -> Iterator[NormalizeResult]:
+    """
+    Map raw strings to enum members by name, value, alias or meaning.
+
+    Values are consumed lazily, so arbitrarily long streams can be
+    normalized. Use a Normalizer directly to also get the unmatched report.
+
+    Args:
+        enum_class: The RichEnum to normalize to
+        values: Raw values (typically strings from a CSV column)
+        max_cache_size: Maximum number of distinct values to memoize
+
+    Returns:
+        An iterator of NormalizeResult(raw, member, match_type), where
+        match_type is "name", "value", "meaning", "label", "ambiguous" or None
+
+    Examples:
+        >>> from valuesets.enums.bio.taxonomy import BiologicalKingdom
+        >>> [r.member for r in normalize_many(BiologicalKingdom, ["EUKARYOTA", "NCBITaxon:2759", "nope"])]
+        [<BiologicalKingdom.EUKARYOTA: 'EUKARYOTA'>, <BiologicalKingdom.EUKARYOTA: 'EUKARYOTA'>, None]
+    """
+    return Normalizer(enum_class, max_cache_size).normalize_many(values)
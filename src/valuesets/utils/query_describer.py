@@ -6,7 +6,10 @@ like "subclasses of 'cell' (CL:0000000)".
 """
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from valuesets.utils.label_store import LabelStore
 
 
 # Standard OBO prefix expansions
@@ -320,7 +323,10 @@ def list_dynamic_enums(schema_dir: str, markdown: bool = False, fetch_labels: bo
     import yaml
     from pathlib import Path
 
+    from valuesets.utils.label_store import LabelStore
+
     label_cache: dict[str, str] = {}
+    store = LabelStore() if fetch_labels else None
 
     def get_label(curie: str) -> str | None:
         """Get label for a CURIE, with caching."""
@@ -331,7 +337,7 @@ def list_dynamic_enums(schema_dir: str, markdown: bool = False, fetch_labels: bo
             return None
 
         # Try OLS lookup
-        label = fetch_label_from_ols(curie)
+        label = fetch_label_from_ols(curie, store)
         label_cache[curie] = label
         return label
 
@@ -368,10 +374,11 @@ def list_dynamic_enums(schema_dir: str, markdown: bool = False, fetch_labels: bo
                         print(f"  query: {query}")
 
 
-def fetch_label_from_ols(curie: str) -> str | None:
+def fetch_label_from_ols(curie: str, store: "LabelStore | None" = None) -> str | None:
     """Fetch a label from OLS for a CURIE.
 
-    Returns None if lookup fails.
+    With a label store, a stored label is returned without a request and
+    labels fetched from OLS are stored. Returns None if lookup fails.
 
     >>> fetch_label_from_ols("CL:0000000")  # doctest: +SKIP
     'cell'
@@ -380,6 +387,11 @@ def fetch_label_from_ols(curie: str) -> str | None:
     import urllib.parse
     import json
 
+    if store is not None:
+        stored = store.get(curie)
+        if stored is not None and stored.label:
+            return stored.label
+
     uri = curie_to_uri(curie)
     if not uri:
         return None
@@ -396,11 +408,13 @@ def fetch_label_from_ols(curie: str) -> str | None:
     try:
         with urllib.request.urlopen(url, timeout=5) as response:
             data = json.loads(response.read().decode())
-            return data.get("label")
     except Exception:
-        pass
+        return None
 
-    return None
+    label = data.get("label")
+    if label and store is not None:
+        store.put(curie, label, synonyms=data.get("synonyms") or (), source="ols")
+    return label
 
 
 if __name__ == "__main__":
@@ -0,0 +1,305 @@
+"""Unit conversion factors derived from the unit value sets."""
+
+import ast
+import operator
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple, Type
+
+from valuesets.generators.rich_enum import RichEnum
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+# Annotation prefix giving a unit's size in another unit, e.g. conversion_to_meter: "0.01"
+_CONVERSION_PREFIX = "conversion_to_"
+
+# Dimension codes of to_base_array for unknown and missing units
+UNKNOWN_UNIT = -1
+NO_UNIT = -2
+
+# Spellings folded together when looking units up ("μL", "µL" and "uL")
+_FOLD = str.maketrans({"³": "3", "²": "2", "µ": "u", "μ": "u"})
+
+
+class UnitConversion(NamedTuple):
+    """
+    How to express a value in a unit in its dimension's base unit.
+
+    ``base = value * scale + offset``; the offset is only non-zero for
+    temperature scales.
+    """
+    unit: RichEnum
+    dimension: str
+    scale: float
+    offset: float
+
+    def to_base(self, value: float) -> float:
+        """Convert a value in this unit to the dimension's base unit."""
+        return value * self.scale + self.offset
+
+
+class UnitTable:
+    """
+    Conversion factors for every member of a set of unit enums.
+
+    Members are grouped into dimensions by following their
+    ``conversion_to_<unit>`` annotations (or, for temperatures, the
+    ``conversion`` formula in kelvin) to a unit without one, the dimension's
+    base. Units whose conversions end at different bases (molar and percent
+    concentrations, say) are in different dimensions and never compared.
+
+    Units are looked up by member, member name (singular or plural, any
+    case) or symbol. Symbols are matched exactly first, then ignoring case
+    when that is unambiguous; the first of two members sharing a symbol
+    wins (e.g. "gal" is the US gallon).
+
+    Args:
+        enum_classes: Unit enums, in lookup priority order
+
+    Examples:
+        >>> table = unit_table()
+        >>> table.lookup("mL").unit.name, table.lookup("mL").dimension
+        ('MILLILITER', 'VolumeUnitEnum.CUBIC_METER')
+        >>> table.convert(250, "mL", "L")
+        0.25
+        >>> table.convert(37, "°C", "FAHRENHEIT")
+        98.6
+        >>> table.lookup("years").unit.name
+        'YEAR'
+        >>> table.lookup("furlong") is None
+        True
+    """
+
+    def __init__(self, enum_classes: Iterable[Type[RichEnum]]):
+        self.conversions: List[UnitConversion] = []
+        self._exact: Dict[str, UnitConversion] = {}
+        self._folded: Dict[str, Optional[UnitConversion]] = {}
+        for enum_class in enum_classes:
+            members = list(enum_class)
+            resolved: Dict[str, Tuple[str, float, float]] = {}
+            for member in members:
+                base, scale, offset = self._resolve(member, members, resolved, ())
+                conversion = UnitConversion(member, f"{enum_class.__name__}.{base}", scale, offset)
+                self.conversions.append(conversion)
+                self._add_keys(conversion)
+        self._lookup_cache: Dict[Any, Optional[UnitConversion]] = {}
+
+    @staticmethod
+    def _find(text: str, members: List[RichEnum]) -> Optional[RichEnum]:
+        """Find the member a conversion_to_<text> annotation refers to."""
+        key = text.translate(_FOLD).lower()
+        for member in members:
+            symbol = str((member.get_annotations() or {}).get("symbol", ""))
+            if key in (member.name.lower(), symbol.translate(_FOLD).lower()):
+                return member
+        return None
+
+    def _resolve(self, member: RichEnum, members: List[RichEnum],
+                 resolved: Dict[str, Tuple[str, float, float]], seen: Tuple[str, ...]) -> Tuple[str, float, float]:
+        """Get (base unit name, scale, offset) for a member, following conversions."""
+        if member.name in resolved:
+            return resolved[member.name]
+        annotations = member.get_annotations() or {}
+        result = (member.name, 1.0, 0.0)
+        for key, value in annotations.items():
+            if key.startswith(_CONVERSION_PREFIX):
+                target_name = key[len(_CONVERSION_PREFIX):]
+                factor = float(value)
+                target = self._find(target_name, members)
+                if target is None or target.name in seen + (member.name,):
+                    # A base that is not itself a member, e.g. "fraction"
+                    result = (target_name, factor, 0.0)
+                else:
+                    base, scale, offset = self._resolve(target, members, resolved, seen + (member.name,))
+                    result = (base, factor * scale, offset)
+                break
+        else:
+            formula = annotations.get("conversion")
+            kelvin = self._find("K", members)
+            if formula and kelvin is not None:
+                # The formula gives this unit's value from kelvin: u = a * K + b
+                a, b = _linear_formula(str(formula), "K")
+                result = (kelvin.name, 1 / a, -b / a)
+        resolved[member.name] = result
+        return result
+
+    def _add_keys(self, conversion: UnitConversion) -> None:
+        member = conversion.unit
+        symbol = str((member.get_annotations() or {}).get("symbol", ""))
+        name = member.name.lower()
+        for key in (symbol, member.name):
+            if key:
+                self._exact.setdefault(key, conversion)
+        folded = {symbol.translate(_FOLD).lower(), name, name.replace("_", " "), name + "s"}
+        if symbol.startswith("°") and len(symbol) > 1:
+            folded.add(symbol[1:].lower())
+        for key in folded:
+            if not key:
+                continue
+            if key in self._folded and self._folded[key] is not None and self._folded[key].unit is not member:
+                # Ambiguous ignoring case: only exact spellings resolve
+                self._folded[key] = None
+            else:
+                self._folded.setdefault(key, conversion)
+
+    def lookup(self, unit: Any) -> Optional[UnitConversion]:
+        """
+        Find the conversion for a unit member, name or symbol.
+
+        Text with trailing words (e.g. "Å typical") falls back to its first
+        word. Returns None for unknown units.
+        """
+        if unit is None:
+            return None
+        try:
+            return self._lookup_cache[unit]
+        except KeyError:
+            pass
+        except TypeError:  # unhashable
+            return None
+        conversion = self._lookup(unit)
+        self._lookup_cache[unit] = conversion
+        return conversion
+
+    def _lookup(self, unit: Any) -> Optional[UnitConversion]:
+        if isinstance(unit, RichEnum):
+            for conversion in self.conversions:
+                if conversion.unit is unit:
+                    return conversion
+            return None
+        text = str(unit).strip()
+        if not text:
+            return None
+        for candidate in (text, text.split()[0]):
+            conversion = self._exact.get(candidate)
+            if conversion is None:
+                conversion = self._folded.get(candidate.translate(_FOLD).lower())
+            if conversion is not None:
+                return conversion
+        return None
+
+    def convert(self, value: float, from_unit: Any, to_unit: Any) -> float:
+        """
+        Convert a value between two units of the same dimension.
+
+        Raises:
+            ValueError: If a unit is unknown or the dimensions differ
+        """
+        source, target = self.lookup(from_unit), self.lookup(to_unit)
+        if source is None or target is None:
+            raise ValueError(f"Unknown unit: {from_unit if source is None else to_unit!r}")
+        if source.dimension != target.dimension:
+            raise ValueError(f"Cannot convert {source.unit.name} to {target.unit.name}")
+        return round((source.to_base(value) - target.offset) / target.scale, 12)
+
+    def to_base_array(self, values: "np.ndarray", units: Any) -> Tuple["np.ndarray", "np.ndarray", List[str]]:
+        """
+        Convert values to their dimensions' base units, vectorized.
+
+        Each distinct unit is looked up once; the conversion itself is one
+        multiply-add over the array.
+
+        Args:
+            values: Numeric values, any shape
+            units: One unit for all values, or units shaped like values
+
+        Returns:
+            (base values, dimension codes, dimensions): dimension codes index
+            into dimensions. They are UNKNOWN_UNIT (with a NaN base value)
+            for unknown units, and NO_UNIT (with the value unchanged) where
+            the unit is missing (None, NaN or empty).
+
+        Examples:
+            >>> base, codes, dimensions = unit_table().to_base_array([1.0, 2.0, 3.0, 4.0], ["L", "mL", None, "?"])
+            >>> base.tolist()[:3], codes.tolist(), dimensions
+            ([0.001, 2e-06, 3.0], [0, 0, -2, -1], ['VolumeUnitEnum.CUBIC_METER'])
+        """
+        if not HAS_NUMPY:
+            raise ImportError("numpy is required for array conversion; install valuesets[numpy]")
+        from valuesets.utils.codes import _factorize
+
+        values = np.asarray(values, dtype=np.float64)
+        if isinstance(units, (str, RichEnum)) or units is None:
+            units = np.full(values.shape, units, dtype=object)
+        units = np.asarray(units, dtype=object)
+        if units.shape != values.shape:
+            raise ValueError(f"units shape {units.shape} does not match values shape {values.shape}")
+        uniques, inverse = _factorize(units.ravel())
+        dimensions: List[str] = []
+        # The extra last entry is the target of the -1 (missing) index
+        scale = np.ones(len(uniques) + 1)
+        offset = np.zeros(len(uniques) + 1)
+        codes = np.full(len(uniques) + 1, NO_UNIT, dtype=np.intp)
+        for i, unit in enumerate(uniques):
+            if isinstance(unit, str) and not unit.strip():
+                continue
+            conversion = self.lookup(unit)
+            if conversion is None:
+                scale[i], codes[i] = np.nan, UNKNOWN_UNIT
+                continue
+            if conversion.dimension not in dimensions:
+                dimensions.append(conversion.dimension)
+            scale[i], offset[i] = conversion.scale, conversion.offset
+            codes[i] = dimensions.index(conversion.dimension)
+        base = values.ravel() * scale[inverse] + offset[inverse]
+        return base.reshape(values.shape), codes[inverse].reshape(values.shape), dimensions
+
+
+@lru_cache(maxsize=None)
+def unit_table() -> UnitTable:
+    """Get the shared UnitTable for the measurement unit enums in valuesets.enums.units."""
+    from valuesets.enums.units import measurements
+
+    return UnitTable([
+        measurements.LengthUnitEnum,
+        measurements.MassUnitEnum,
+        measurements.VolumeUnitEnum,
+        measurements.TemperatureUnitEnum,
+        measurements.TimeUnitEnum,
+        measurements.PressureUnitEnum,
+        measurements.ConcentrationUnitEnum,
+        measurements.FrequencyUnitEnum,
+        measurements.AngleUnitEnum,
+        measurements.DataSizeUnitEnum,
+    ])
+
+
+_OPERATORS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+
+
+def _linear_formula(formula: str, variable: str) -> Tuple[float, float]:
+    """
+    Get (a, b) for a formula linear in one variable, a * variable + b.
+
+    Only numbers, the variable, + - * / and parentheses are accepted.
+
+    Examples:
+        >>> _linear_formula("(K - 273.15) * 9/5 + 32", "K")
+        (1.8, -459.67)
+    """
+    tree = ast.parse(formula, mode="eval")
+
+    def evaluate(node, x: float) -> float:
+        if isinstance(node, ast.Expression):
+            return evaluate(node.body, x)
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+            return float(node.value)
+        if isinstance(node, ast.Name) and node.id == variable:
+            return x
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+            return -evaluate(node.operand, x)
+        if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+            return _OPERATORS[type(node.op)](evaluate(node.left, x), evaluate(node.right, x))
+        raise ValueError(f"Unsupported conversion formula: {formula!r}")
+
+    b = evaluate(tree, 0.0)
+    return round(evaluate(tree, 1.0) - b, 12), round(b, 12)
@@ -7,22 +7,33 @@ match the expected labels from the ontology.
 Uses OAK (Ontology Access Kit) as the abstraction layer for all ontology access.
 """
 
-import re
+import hashlib
+import json
 import logging
 import sys
 import os
+import sqlite3
+import threading
 import warnings
-import csv
 import yaml
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Set
+from typing import Dict, Iterable, List, Optional, Set
 from pydantic import BaseModel, Field, ConfigDict
 from linkml_runtime.utils.schemaview import SchemaView
 from linkml_runtime.linkml_model import EnumDefinition, PermissibleValue
 
+from valuesets.generators.rich_enum import LABEL_ANNOTATION_KEYS, normalize_label
+from valuesets.utils.label_store import LabelStore, StoredLabel, curie_prefix, default_label_store_path
+
 LIMIT = 300
 
+# Bump when validation logic changes, so issues recorded by older code are not replayed
+MANIFEST_VERSION = 2
+
+# Manifest file in cache_dir used when none is given
+MANIFEST_FILE = "validation_manifest.json"
+
 try:
     from oaklib import get_adapter
     HAS_OAK = True
@@ -63,6 +74,23 @@ class ValidationConfig(BaseModel):
         default=Path("cache"),
         description="Directory for storing cached terms"
     )
+    label_store_path: Optional[Path] = Field(
+        default=None,
+        description="Shared label store file (default: labels.sqlite in cache_dir)"
+    )
+    jobs: int = Field(
+        default=1,
+        ge=1,
+        description="Number of prefixes whose labels are prefetched concurrently"
+    )
+    incremental: bool = Field(
+        default=False,
+        description="Re-validate only enums changed since the run recorded in the manifest"
+    )
+    manifest_path: Optional[Path] = Field(
+        default=None,
+        description="Manifest of enum hashes and issues for incremental runs (default: validation_manifest.json in cache_dir)"
+    )
 
 
 class ValidationIssue(BaseModel):
@@ -85,6 +113,7 @@ class ValidationResult(BaseModel):
     schema_path: Optional[Path] = None
     issues: List[ValidationIssue] = Field(default_factory=list)
     total_enums_checked: int = 0
+    total_enums_replayed: int = 0
     total_values_checked: int = 0
     total_mappings_checked: int = 0
 
@@ -100,6 +129,8 @@ class ValidationResult(BaseModel):
         """Print a summary of validation results."""
         print(f"\nValidation Summary:")
         print(f"  Enums checked: {self.total_enums_checked}")
+        if self.total_enums_replayed:
+            print(f"  Enums unchanged (issues replayed): {self.total_enums_replayed}")
         print(f"  Values checked: {self.total_values_checked}")
         print(f"  Mappings checked: {self.total_mappings_checked}")
 
@@ -126,8 +157,14 @@ class EnumEvaluator:
         self._label_cache = {} if self.config.cache_labels else None
         self._per_prefix_adapters = {}  # Cache of per-ontology adapters
         self._oak_config = self._load_oak_config()
-        self._prefix_caches = {}  # Initialize here to avoid AttributeError
+        self._label_store = None  # Shared label store, opened on first use
+        self._stored_labels = {}  # Stored labels of configured prefixes, loaded once per prefix
+        self._pending_labels = []  # Resolved labels not yet written to the store
         self._warned_prefixes = set()  # Track prefixes we've already warned about
+        self._adapter_threads = {}  # Thread that created each adapter in _per_prefix_adapters
+        self._thread_adapters = threading.local()  # Adapters created by other threads, per thread
+        self._lock = threading.Lock()  # Guards the shared state below and the creation of prefix locks
+        self._prefix_locks = {}  # One lock per prefix for its adapter and stored labels
         self._initialize_oak()
 
     def _load_oak_config(self) -> Dict[str, str]:
@@ -172,69 +209,67 @@ class EnumEvaluator:
                         f"Install required dependencies or update oak_config.yaml."
                     )
 
-    def _get_cache_file(self, prefix: str) -> Path:
-        """Get the cache file path for a given prefix."""
-        cache_dir = self.config.cache_dir / prefix.lower()
-        cache_dir.mkdir(parents=True, exist_ok=True)
-        return cache_dir / "terms.csv"
-
-    def _load_cache(self, prefix: str) -> Dict[str, str]:
-        """Load cached terms for a prefix."""
-        cache_file = self._get_cache_file(prefix)
-        cache = {}
-
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', newline='') as f:
-                    reader = csv.reader(f)
-                    next(reader)  # Skip header
-                    for row in reader:
-                        if len(row) >= 2:
-                            cache[row[0]] = row[1]  # curie -> label
-            except Exception as e:
-                logger.warning(f"Could not load cache for {prefix}: {e}")
-
-        return cache
+    @property
+    def label_store(self) -> LabelStore:
+        """The shared label store; a new store imports the CSV cache files under cache_dir."""
+        with self._lock:
+            if self._label_store is None:
+                path = self.config.label_store_path or default_label_store_path(self.config.cache_dir)
+                store = LabelStore(path)
+                if len(store) == 0:
+                    imported = store.import_csv_tree(self.config.cache_dir)
+                    if imported:
+                        logger.info(f"Imported {imported} cached labels into {path}")
+                self._label_store = store
+        return self._label_store
+
+    def _prefix_lock(self, prefix: str) -> threading.RLock:
+        """Get the lock serializing adapter creation and stored label updates for a prefix."""
+        with self._lock:
+            return self._prefix_locks.setdefault(prefix.lower(), threading.RLock())
+
+    def _stored_prefix_labels(self, prefix: str) -> Dict[str, Optional[str]]:
+        """Get the stored labels for a configured prefix, reading them from the store once."""
+        prefix_lower = prefix.lower()
+        with self._prefix_lock(prefix_lower):
+            if prefix_lower not in self._stored_labels:
+                self._stored_labels[prefix_lower] = self.label_store.labels(prefix_lower)
+            return self._stored_labels[prefix_lower]
 
     def _save_to_cache(self, prefix: str, curie: str, label: Optional[str]):
-        """Save a term to cache."""
-        if prefix.lower() not in self._oak_config:
+        """Buffer a term for the label store; flush_cache() writes it."""
+        prefix_lower = prefix.lower()
+        if prefix_lower not in self._oak_config:
             return  # Only cache for configured prefixes
+        with self._prefix_lock(prefix_lower):
+            stored = self._stored_prefix_labels(prefix)
+            if curie in stored:
+                return
+            stored[curie] = label
+            with self._lock:
+                self._pending_labels.append(StoredLabel(curie, label, source=self._oak_config[prefix_lower]))
+
+    def flush_cache(self) -> int:
+        """
+        Write terms resolved since the last flush to the label store, in one transaction.
 
-        cache_file = self._get_cache_file(prefix)
-
-        # Read existing cache
-        existing_cache = set()
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r', newline='') as f:
-                    reader = csv.reader(f)
-                    next(reader)  # Skip header
-                    for row in reader:
-                        if len(row) >= 1:
-                            existing_cache.add(row[0])
-            except Exception:
-                pass
-
-        # Don't add if already exists
-        if curie in existing_cache:
-            return
-
-        # Append new entry
+        The cache/<prefix>/terms.csv files of the affected prefixes are then
+        rewritten from the store, so they can be committed with the schemas.
+        """
+        with self._lock:
+            pending, self._pending_labels = self._pending_labels, []
+        if not pending:
+            return 0
+        prefixes = sorted({curie_prefix(entry.curie) for entry in pending})
         try:
-            # Create file with header if it doesn't exist
-            if not cache_file.exists():
-                with open(cache_file, 'w', newline='') as f:
-                    writer = csv.writer(f)
-                    writer.writerow(['curie', 'label', 'retrieved_at'])
-
-            # Append new row
-            with open(cache_file, 'a', newline='') as f:
-                writer = csv.writer(f)
-                timestamp = datetime.now().isoformat()
-                writer.writerow([curie, label or '', timestamp])
-        except Exception as e:
-            logger.warning(f"Could not save to cache for {prefix}: {e}")
+            written = self.label_store.put_many(pending)
+            self.label_store.export_csv_tree(self.config.cache_dir, prefixes)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not save labels to {self.label_store.path}: {e}")
+            with self._lock:
+                self._pending_labels[:0] = pending  # Retry on the next flush
+            return 0
+        return written
 
     def _initialize_oak(self):
         """Initialize OAK adapters dynamically based on usage."""
@@ -251,6 +286,7 @@ class EnumEvaluator:
         # For other adapter types (ols:, bioportal:, etc), create a single adapter
         try:
             self._per_prefix_adapters['_default'] = get_adapter(self.config.oak_adapter_string)
+            self._adapter_threads['_default'] = threading.get_ident()
             logger.info(f"Initialized OAK adapter: {self.config.oak_adapter_string}")
         except Exception as e:
             logger.warning(f"Could not initialize OAK adapter: {e}")
@@ -273,73 +309,23 @@ class EnumEvaluator:
         prefix_lower = prefix.lower()
 
         # Check file cache for configured prefixes
-        if prefix_lower in self._prefix_caches:
-            if curie in self._prefix_caches[prefix_lower]:
-                label = self._prefix_caches[prefix_lower][curie]
+        if prefix_lower in self._oak_config:
+            stored = self._stored_prefix_labels(prefix)
+            if curie in stored:
+                label = stored[curie]
                 # Also cache in memory
                 if self._label_cache is not None:
                     self._label_cache[curie] = label
-                return label if label else None
-
-        label = None
-        adapter = None
-
-        # Load cache for this prefix if not already loaded
-        if prefix_lower in self._oak_config and prefix_lower not in self._prefix_caches:
-            self._prefix_caches[prefix_lower] = self._load_cache(prefix)
+                return label
 
-        # Try configured adapter first for this prefix
-        if prefix_lower in self._oak_config:
-            adapter_string = self._oak_config[prefix_lower]
-
-            # If adapter string is empty or None, skip validation entirely
-            if not adapter_string:
-                logger.debug(f"Skipping validation for {prefix} (empty adapter string in config)")
-                self._per_prefix_adapters[prefix_lower] = None
-                return None
+        # If adapter string is empty or None, skip validation entirely
+        if prefix_lower in self._oak_config and not self._oak_config[prefix_lower]:
+            logger.debug(f"Skipping validation for {prefix} (empty adapter string in config)")
+            self._per_prefix_adapters[prefix_lower] = None
+            return None
 
-            if prefix_lower not in self._per_prefix_adapters:
-                try:
-                    # Check if this is a REST adapter (e.g., "rest:ror:")
-                    if adapter_string.startswith("rest:"):
-                        if not HAS_REST_ADAPTERS:
-                            logger.warning(f"REST adapters module not available for {prefix}")
-                            self._per_prefix_adapters[prefix_lower] = None
-                        else:
-                            adapter = get_rest_adapter(adapter_string)
-                            if adapter:
-                                self._per_prefix_adapters[prefix_lower] = adapter
-                                logger.info(f"Created REST adapter for {prefix}: {adapter_string}")
-                            else:
-                                logger.warning(f"Could not create REST adapter for {prefix}: {adapter_string}")
-                                self._per_prefix_adapters[prefix_lower] = None
-                    else:
-                        # Standard OAK adapter
-                        self._per_prefix_adapters[prefix_lower] = get_adapter(adapter_string)
-                        logger.info(f"Created configured adapter for {prefix} ontology")
-                except Exception as e:
-                    logger.warning(f"Could not create configured adapter for {prefix}: {e}")
-                    self._per_prefix_adapters[prefix_lower] = None
-
-            adapter = self._per_prefix_adapters.get(prefix_lower)
-        elif self.config.oak_adapter_string == "sqlite:obo:" and prefix:
-            # Dynamic mode: create per-ontology adapter on demand
-            if prefix_lower not in self._per_prefix_adapters:
-                try:
-                    adapter_string = f"sqlite:obo:{prefix_lower}"
-                    self._per_prefix_adapters[prefix_lower] = get_adapter(adapter_string)
-                    logger.info(f"Created adapter for {prefix} ontology")
-                except Exception as e:
-                    logger.debug(f"Could not create adapter for {prefix}: {e}")
-                    # Track unknown prefix for end-of-run reporting
-                    if prefix_lower not in self._warned_prefixes:
-                        self._warned_prefixes.add(prefix_lower)
-                    self._per_prefix_adapters[prefix_lower] = None
-
-            adapter = self._per_prefix_adapters.get(prefix_lower)
-        else:
-            # Use default adapter for other configurations
-            adapter = self._per_prefix_adapters.get('_default')
+        label = None
+        adapter = self._get_adapter(prefix)
 
         # Get the label
         if adapter:
@@ -348,18 +334,177 @@ class EnumEvaluator:
             except Exception as e:
                 logger.debug(f"Could not get label for {curie}: {e}")
 
-        # Cache the result in memory
+        self._remember_label(prefix, curie, label)
+        return label
+
+    def _remember_label(self, prefix: str, curie: str, label: Optional[str]):
+        """Cache a looked-up label in memory and, for configured prefixes, in the label store."""
         if self._label_cache is not None:
             self._label_cache[curie] = label
+        self._save_to_cache(prefix, curie, label)
+
+    def _get_adapter(self, prefix: str):
+        """
+        Get the adapter for a prefix, creating it on first use; None if there is none.
 
-        # Save to file cache for configured prefixes
+        SemSQL adapters hold a sqlite connection, so an adapter the evaluator
+        created is only used by the thread that created it: other threads
+        (see prefetch_labels) create their own, one per prefix per thread.
+        Adapters placed in _per_prefix_adapters by the caller are shared.
+        A prefix whose adapter could not be created is not retried.
+        """
+        prefix_lower = prefix.lower()
         if prefix_lower in self._oak_config:
-            self._save_to_cache(prefix, curie, label)
-            # Also update in-memory cache
-            if prefix_lower in self._prefix_caches:
-                self._prefix_caches[prefix_lower][curie] = label or ''
+            if not self._oak_config[prefix_lower]:
+                return None
+            key = prefix_lower
+        elif self.config.oak_adapter_string == "sqlite:obo:":
+            key = prefix_lower
+        else:
+            key = '_default'
+
+        thread = threading.get_ident()
+        with self._prefix_lock(key):
+            if key in self._per_prefix_adapters:
+                adapter = self._per_prefix_adapters[key]
+                if adapter is None or self._adapter_threads.get(key, thread) == thread:
+                    return adapter
+                if not hasattr(self._thread_adapters, "adapters"):
+                    self._thread_adapters.adapters = {}
+                thread_adapters = self._thread_adapters.adapters
+                if key not in thread_adapters:
+                    thread_adapters[key] = self._create_adapter(prefix, key)
+                return thread_adapters[key]
+            if key == '_default':
+                return None  # The default adapter could not be initialized
+            adapter = self._per_prefix_adapters[key] = self._create_adapter(prefix, key)
+            if adapter is not None:
+                self._adapter_threads[key] = thread
+            return adapter
+
+    def _create_adapter(self, prefix: str, key: str):
+        """Create the adapter for a prefix (key is its lower-cased prefix or '_default'); None on failure."""
+        if key == '_default':
+            try:
+                return get_adapter(self.config.oak_adapter_string)
+            except Exception as e:
+                logger.warning(f"Could not initialize OAK adapter: {e}")
+                return None
 
-        return label
+        # Try configured adapter first for this prefix
+        if key in self._oak_config:
+            adapter_string = self._oak_config[key]
+            try:
+                # Check if this is a REST adapter (e.g., "rest:ror:")
+                if adapter_string.startswith("rest:"):
+                    if not HAS_REST_ADAPTERS:
+                        logger.warning(f"REST adapters module not available for {prefix}")
+                        return None
+                    adapter = get_rest_adapter(adapter_string)
+                    if adapter:
+                        logger.info(f"Created REST adapter for {prefix}: {adapter_string}")
+                    else:
+                        logger.warning(f"Could not create REST adapter for {prefix}: {adapter_string}")
+                    return adapter
+                # Standard OAK adapter
+                adapter = get_adapter(adapter_string)
+                logger.info(f"Created configured adapter for {prefix} ontology")
+                return adapter
+            except Exception as e:
+                logger.warning(f"Could not create configured adapter for {prefix}: {e}")
+                return None
+
+        # Dynamic mode: create per-ontology adapter on demand
+        try:
+            adapter = get_adapter(f"sqlite:obo:{key}")
+            logger.info(f"Created adapter for {prefix} ontology")
+            return adapter
+        except Exception as e:
+            logger.debug(f"Could not create adapter for {prefix}: {e}")
+            # Track unknown prefix for end-of-run reporting
+            with self._lock:
+                self._warned_prefixes.add(key)
+            return None
+
+    def prefetch_labels(self, curies: Iterable[str]) -> int:
+        """
+        Resolve many terms up front, with one bulk lookup per prefix.
+
+        CURIEs are deduplicated and grouped by prefix. Each group is answered
+        from the label store where possible, and the rest with one call to
+        the prefix adapter's labels() (OAK adapters query their database in
+        chunks; REST adapters send concurrent requests). Later
+        get_ontology_label calls for these terms are answered from memory.
+        Does nothing when in-memory label caching is disabled.
+
+        With config.jobs above 1, up to that many prefixes are looked up at
+        once in a thread pool, each thread with its own adapters. The results
+        are merged in input order once all lookups finish, so the caches and
+        the label store end up the same whatever the scheduling.
+
+        Returns:
+            Number of terms looked up with an adapter
+        """
+        if self._label_cache is None:
+            return 0
+        by_prefix: Dict[str, List[str]] = {}
+        for curie in dict.fromkeys(curies):
+            if not curie or ":" not in curie or curie in self._label_cache:
+                continue
+            by_prefix.setdefault(curie.split(":")[0], []).append(curie)
+
+        groups = []
+        for prefix, group in by_prefix.items():
+            prefix_lower = prefix.lower()
+            if prefix_lower in self._oak_config:
+                if not self._oak_config[prefix_lower]:
+                    continue  # Not validated
+                stored = self._stored_prefix_labels(prefix)
+                for curie in group:
+                    if curie in stored:
+                        self._label_cache[curie] = stored[curie]
+                group = [curie for curie in group if curie not in stored]
+            if group:
+                groups.append((prefix, group))
+
+        jobs = min(self.config.jobs, len(groups))
+        if jobs > 1:
+            with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="labels") as pool:
+                results = list(pool.map(lambda prefix_group: self._lookup_labels(*prefix_group), groups))
+        else:
+            results = [self._lookup_labels(prefix, group) for prefix, group in groups]
+
+        looked_up = 0
+        for (prefix, group), labels in zip(groups, results):
+            looked_up += len(group) if labels is not None else 0
+            for curie in group:
+                self._remember_label(prefix, curie, (labels or {}).get(curie))
+        self.flush_cache()
+        return looked_up
+
+    def _lookup_labels(self, prefix: str, curies: List[str]) -> Optional[Dict[str, Optional[str]]]:
+        """Look up one prefix's terms with this thread's adapter; None if the prefix has no adapter."""
+        adapter = self._get_adapter(prefix)
+        return self._bulk_labels(adapter, curies) if adapter else None
+
+    @staticmethod
+    def _bulk_labels(adapter, curies: List[str]) -> Dict[str, Optional[str]]:
+        """Look up labels with one labels() call, falling back to label() per term."""
+        labels: Dict[str, Optional[str]] = {}
+        try:
+            for curie, label in adapter.labels(curies):
+                # Keep the first label of terms with several, as label() does
+                if labels.get(curie) is None:
+                    labels[curie] = label
+            return labels
+        except Exception as e:
+            logger.debug(f"Bulk label lookup failed, looking up terms one by one: {e}")
+        for curie in curies:
+            try:
+                labels[curie] = adapter.label(curie)
+            except Exception as e:
+                logger.debug(f"Could not get label for {curie}: {e}")
+        return labels
 
     def is_prefix_configured(self, prefix: str) -> bool:
         """Check if a prefix is configured for strict validation."""
@@ -372,13 +517,7 @@ class EnumEvaluator:
         Normalize a string for comparison by removing non-alphanumeric chars
         and converting to lowercase.
         """
-        if not s:
-            return ""
-        # Remove non-alphanumeric characters
-        s = re.sub(r'[^a-zA-Z0-9\s]', ' ', s)
-        # Collapse multiple spaces
-        s = re.sub(r'\s+', ' ', s)
-        return s.strip().lower()
+        return normalize_label(s)
 
     def extract_aliases(self, pv: PermissibleValue, value_name: str) -> Set[str]:
         """
@@ -406,7 +545,7 @@ class EnumEvaluator:
 
         # Check annotations for common alias fields
         if pv.annotations:
-            for key in ['label', 'display_name', 'preferred_name', 'synonym']:
+            for key in LABEL_ANNOTATION_KEYS:
                 if key in pv.annotations:
                     val = pv.annotations[key]
                     if val and hasattr(val, 'value'):
@@ -486,18 +625,199 @@ class EnumEvaluator:
 
         return issues
 
-    def validate_schema(self, schema_path: Path) -> ValidationResult:
+    def enum_hash(self, enum_name: str, enum_def: EnumDefinition,
+                  labels: Optional[Dict[str, Optional[str]]] = None) -> str:
+        """
+        Hash what validate_enum compares: each value's name, meaning, aliases
+        and the meaning's stored label, in order.
+
+        Args:
+            enum_name: Name of the enum
+            enum_def: The enum definition
+            labels: Stored labels of the meanings (CURIE -> label, None for
+                terms stored as not found); meanings left out are hashed as
+                not stored
+
+        Examples:
+            >>> evaluator = EnumEvaluator(ValidationConfig(oak_adapter_string="sqlite:obo:"))
+            >>> enum_def = EnumDefinition(name="E", permissible_values={"GROWTH": {"meaning": "GO:0040007"}})
+            >>> h = evaluator.enum_hash("E", enum_def)
+            >>> evaluator.enum_hash("E", enum_def, {"GO:0040007": "growth"}) == h
+            False
+            >>> enum_def.permissible_values["GROWTH"].aliases = ["growth"]
+            >>> evaluator.enum_hash("E", enum_def) == h
+            False
+        """
+        labels = labels or {}
+        values = [
+            [value_name, pv.meaning, sorted(self.extract_aliases(pv, value_name)),
+             pv.meaning in labels, labels.get(pv.meaning)]
+            for value_name, pv in (enum_def.permissible_values or {}).items()
+        ]
+        return hashlib.sha256(json.dumps([enum_name, values]).encode()).hexdigest()
+
+    def _enum_hashes(self, loaded: List[tuple]) -> List[Dict[str, str]]:
+        """Hash every enum of the loaded schemas, with their meanings' labels read from the store at once."""
+        meanings = {
+            pv.meaning
+            for _, enums, _ in loaded if enums
+            for enum_def in enums.values()
+            for pv in (enum_def.permissible_values or {}).values() if pv.meaning
+        }
+        labels = {curie: stored.label for curie, stored in self.label_store.get_many(meanings).items()}
+        return [
+            {enum_name: self.enum_hash(enum_name, enum_def, labels) for enum_name, enum_def in (enums or {}).items()}
+            for _, enums, _ in loaded
+        ]
+
+    def _manifest_fingerprint(self) -> str:
+        """Hash the settings that change the issues of an unchanged enum."""
+        settings = [
+            MANIFEST_VERSION, self.config.oak_adapter_string, self.config.strict_mode,
+            sorted(self._oak_config.items()), LABEL_ANNOTATION_KEYS,
+        ]
+        return hashlib.sha256(json.dumps(settings).encode()).hexdigest()
+
+    @property
+    def manifest_path(self) -> Path:
+        """The incremental validation manifest file."""
+        return self.config.manifest_path or self.config.cache_dir / MANIFEST_FILE
+
+    def _load_manifest(self) -> Dict[str, Dict[str, dict]]:
+        """
+        Get the recorded enums, as schema path -> enum name -> {"hash", "issues"}.
+
+        A manifest written with other adapter settings or manifest version is ignored.
+        """
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable validation manifest {self.manifest_path}: {e}")
+            return {}
+        if manifest.get("fingerprint") != self._manifest_fingerprint():
+            logger.info("Adapter configuration changed since the last run; validating every enum")
+            return {}
+        return manifest.get("schemas", {})
+
+    def _save_manifest(self, schemas: Dict[str, Dict[str, dict]]) -> None:
+        """Write the manifest to a temporary file and rename it into place."""
+        path = self.manifest_path
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"fingerprint": self._manifest_fingerprint(), "schemas": schemas}, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not save validation manifest {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def validate_schema(self, schema_path: Path, prefetch: bool = True, full: bool = False) -> ValidationResult:
         """
         Validate all enums in a schema.
+
+        With prefetch, the schema's meanings are resolved in bulk first; with
+        incremental validation, unchanged enums are replayed unless full
+        (see validate_schemas).
+        """
+        return self.validate_schemas([schema_path], prefetch=prefetch, full=full)[0]
+
+    def validate_schemas(self, schema_paths: Iterable[Path], prefetch: bool = True,
+                         full: bool = False) -> List[ValidationResult]:
+        """
+        Validate all enums in several schemas, one result per schema in order.
+
+        With prefetch, validation runs in two phases: every schema is loaded
+        and the meanings of all its enums are collected, then they are
+        deduplicated and resolved together by prefetch_labels, with one bulk
+        lookup per prefix across all schemas. The enums are then compared
+        against labels already in memory. Without prefetch, terms are looked
+        up one at a time as each enum is compared.
+
+        With config.incremental, each enum's hash (see enum_hash) and issues
+        are recorded per schema in the manifest. The hash covers the labels
+        in the label store, so a refreshed label or another store makes the
+        enum's next run validate it again. An enum whose hash matches the
+        manifest is not validated again: its recorded issues are replayed,
+        and its meanings are not looked up. A full run validates every enum
+        and rewrites the manifest entries of the given schemas.
+        """
+        loaded = []
+        for schema_path in schema_paths:
+            try:
+                loaded.append((schema_path, SchemaView(str(schema_path)).all_enums(), None))
+            except Exception as e:
+                loaded.append((schema_path, None, e))
+
+        manifest = self._load_manifest() if self.config.incremental else {}
+        hashes = self._enum_hashes(loaded) if self.config.incremental and not full else [{} for _ in loaded]
+        replays = []
+        for (schema_path, _, _), enum_hashes in zip(loaded, hashes):
+            recorded = {} if full else manifest.get(str(schema_path), {})
+            replay = {
+                enum_name: [ValidationIssue(**issue) for issue in recorded[enum_name]["issues"]]
+                for enum_name, enum_hash in enum_hashes.items()
+                if enum_name in recorded and recorded[enum_name]["hash"] == enum_hash
+            }
+            for enum_name in replay:
+                self._warned_prefixes.update(recorded[enum_name].get("unknown_prefixes", []))
+            replays.append(replay)
+
+        if prefetch:
+            self.prefetch_labels(
+                pv.meaning
+                for (_, enums, _), replay in zip(loaded, replays) if enums
+                for enum_name, enum_def in enums.items() if enum_name not in replay
+                for pv in (enum_def.permissible_values or {}).values() if pv.meaning
+            )
+
+        results = [
+            self._validate_enums(schema_path, enums, error, replay)
+            for (schema_path, enums, error), replay in zip(loaded, replays)
+        ]
+
+        if self.config.incremental:
+            # Record the hashes with the labels this run resolved and stored
+            hashes = self._enum_hashes(loaded)
+            for (schema_path, enums, error), enum_hashes, result in zip(loaded, hashes, results):
+                if error is not None or any(i.enum_name == "<schema>" for i in result.issues):
+                    manifest.pop(str(schema_path), None)
+                    continue
+                manifest[str(schema_path)] = {
+                    enum_name: {
+                        "hash": enum_hash,
+                        "issues": [i.model_dump(exclude_none=True) for i in result.issues if i.enum_name == enum_name],
+                        # Replayed enums are not looked up, so keep what report_unknown_prefixes needs
+                        "unknown_prefixes": sorted(self._warned_prefixes & {
+                            curie_prefix(pv.meaning)
+                            for pv in (enums[enum_name].permissible_values or {}).values() if pv.meaning
+                        }),
+                    }
+                    for enum_name, enum_hash in enum_hashes.items()
+                }
+            self._save_manifest(manifest)
+        return results
+
+    def _validate_enums(self, schema_path: Path, enums: Optional[Dict[str, EnumDefinition]],
+                        error: Optional[Exception],
+                        replay: Optional[Dict[str, List[ValidationIssue]]] = None) -> ValidationResult:
         """
+        Validate the enums of a loaded schema, or report why it could not be loaded.
+
+        Enums in replay are not validated; their recorded issues are reported instead.
+        """
+        replay = replay or {}
         result = ValidationResult(schema_path=schema_path)
 
         try:
-            # Load schema
-            sv = SchemaView(str(schema_path))
+            if error is not None:
+                raise error
 
             # Validate each enum
-            for enum_name, enum_def in sv.all_enums().items():
+            for enum_name, enum_def in enums.items():
                 result.total_enums_checked += 1
 
                 if enum_def.permissible_values:
@@ -508,6 +828,11 @@ class EnumEvaluator:
                         if pv.meaning:
                             result.total_mappings_checked += 1
 
+                    if enum_name in replay:
+                        result.total_enums_replayed += 1
+                        result.issues.extend(replay[enum_name])
+                        continue
+
                     # Validate the enum
                     issues = self.validate_enum(enum_def, enum_name)
                     result.issues.extend(issues)
@@ -523,6 +848,8 @@ class EnumEvaluator:
             )
             result.issues.append(issue)
 
+        # Write the schema's newly resolved terms in one batch
+        self.flush_cache()
         return result
 
     def report_unknown_prefixes(self) -> None:
@@ -544,16 +871,29 @@ def main():
     parser.add_argument("--adapter", default="sqlite:obo:",
                        help="OAK adapter string (e.g., sqlite:obo:, sqlite:obo:merged, ols:, bioportal:)")
     parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
-    parser.add_argument("--no-cache", action="store_true", help="Disable label caching")
+    parser.add_argument("--no-cache", action="store_true", help="Disable label caching and incremental validation")
+    parser.add_argument("--label-store", type=Path,
+                       help="Shared label store file (default: $VALUESETS_LABEL_STORE or cache/labels.sqlite)")
+    parser.add_argument("--no-prefetch", action="store_true",
+                       help="Look terms up one at a time instead of in bulk per prefix before comparing")
+    parser.add_argument("--full", action="store_true",
+                       help="Re-validate every enum instead of only those changed since the last run")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                       help="Number of prefixes whose labels are resolved concurrently (default: 1)")
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output with detailed information")
 
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Build configuration
     config = ValidationConfig(
         oak_adapter_string=args.adapter,
         strict_mode=args.strict,
-        cache_labels=not args.no_cache
+        cache_labels=not args.no_cache,
+        label_store_path=args.label_store,
+        jobs=args.jobs,
+        incremental=not args.no_cache
     )
 
     # Configure logging based on verbose flag
@@ -579,7 +919,7 @@ def main():
 
     # Process path
     if args.path.is_file():
-        result = evaluator.validate_schema(args.path)
+        result = evaluator.validate_schema(args.path, prefetch=not args.no_prefetch, full=args.full)
 
         # Handle output based on results and verbosity
         if not result.has_errors() and not result.has_warnings():
@@ -635,13 +975,11 @@ def main():
         if args.verbose:
             print(f"🔍 Validating {len(schema_files)} schema files...\n")
 
-        # Collect results
-        for schema_file in schema_files:
+        # Collect results; all schemas' meanings are resolved together before comparing
+        for result in evaluator.validate_schemas(schema_files, prefetch=not args.no_prefetch, full=args.full):
             if args.verbose:
-                print(f"Validating {schema_file.name}...")
+                print(f"Validating {result.schema_path.name}...")
 
-            result = evaluator.validate_schema(schema_file)
-            result.schema_path = schema_file  # Store path for error reporting
             all_results.append(result)
 
             if args.verbose:
@@ -9,7 +9,8 @@ seamless integration into the existing validation framework.
 import logging
 import re
 import requests
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
 from functools import lru_cache
 
 logger = logging.getLogger(__name__)
@@ -21,8 +22,12 @@ class BaseRestAdapter:
 
     Implements the minimal OAK interface needed for validation:
     - label(curie) -> Optional[str]
+    - labels(curies) -> Iterator[Tuple[str, Optional[str]]]
     """
 
+    # Concurrent requests made by labels()
+    max_concurrent_requests = 8
+
     def label(self, curie: str) -> Optional[str]:
         """
         Get the label for a term.
@@ -35,6 +40,24 @@ class BaseRestAdapter:
         """
         raise NotImplementedError("Subclasses must implement label()")
 
+    def labels(self, curies: Iterable[str], allow_none: bool = True) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Get the labels of many terms, as OAK's labels() does.
+
+        APIs without a bulk endpoint are queried with up to
+        max_concurrent_requests requests in flight over the adapter's
+        session. Pairs are yielded in the order of curies.
+
+        Args:
+            curies: CURIE identifiers
+            allow_none: Yield (curie, None) for terms without a label
+        """
+        curies = list(curies)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_concurrent_requests, len(curies)))) as pool:
+            for curie, label in zip(curies, pool.map(self.label, curies)):
+                if label is not None or allow_none:
+                    yield curie, label
+
 
 class RORAdapter(BaseRestAdapter):
     """
@@ -0,0 +1,361 @@
+"""
+Tests for compiled range classification
+"""
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+import valuesets.enums
+from valuesets.generators.rich_enum import RichEnum
+from valuesets.utils.classifier import (
+    BoxIndex,
+    CompiledClassifier,
+    box_index,
+    classify,
+    classify_array,
+    classify_multi,
+    classify_multi_array,
+    compiled_classifier,
+    detect_classifier_fields,
+    get_classifier_config,
+    get_range_annotations,
+    get_range_with_unit,
+    parse_range_with_unit,
+)
+from valuesets.utils.codes import code_table
+from valuesets.utils.units import unit_table
+
+
+def reference_classify(value, enum_class, field, annotation_mappings=None, inclusive=True):
+    """The per-member scan classify() used before ranges were compiled."""
+    results = []
+    for member in enum_class:
+        min_val, max_val = get_range_annotations(member, field, annotation_mappings)
+        if min_val is None and max_val is None:
+            continue
+        if inclusive:
+            in_range = (min_val is None or value >= min_val) and (max_val is None or value <= max_val)
+        else:
+            in_range = (min_val is None or value > min_val) and (max_val is None or value < max_val)
+        if in_range:
+            results.append(member)
+    return results
+
+
+def classifiable_enums():
+    for name in valuesets.enums.__all__:
+        enum_class = getattr(valuesets.enums, name)
+        for field in sorted(detect_classifier_fields(enum_class)):
+            yield enum_class, field
+
+
+class TestCompiledClassifier:
+    """Test that compiled classification matches the per-member scan"""
+
+    @pytest.mark.parametrize("inclusive", [True, False])
+    def test_matches_reference_on_packaged_enums(self, inclusive):
+        rng = random.Random(0)
+        checked = 0
+        for enum_class, field in classifiable_enums():
+            mappings = get_classifier_config(enum_class).get("annotation_mappings")
+            compiled = CompiledClassifier(enum_class, field, mappings)
+            points = compiled.boundaries
+            values = list(points)
+            values += [(a + b) / 2 for a, b in zip(points, points[1:])]
+            if points:
+                values += [points[0] - 1, points[-1] + 1]
+            values += [rng.uniform(-100, 1000) for _ in range(20)]
+            for value in values:
+                expected = reference_classify(value, enum_class, field, mappings, inclusive)
+                assert compiled.classify(value, inclusive) == expected, (enum_class.__name__, field, value)
+                checked += 1
+        assert checked > 100
+
+    def test_overlapping_and_unbounded_ranges(self):
+        class Band(RichEnum):
+            ANY_LOW = "ANY_LOW"
+            MIDDLE = "MIDDLE"
+            WIDE = "WIDE"
+            POINT = "POINT"
+
+        Band._metadata = {
+            "ANY_LOW": {"annotations": {"x_range": "<10"}},
+            "MIDDLE": {"annotations": {"x_range": "5-15"}},
+            "WIDE": {"annotations": {"minimum_x": "0"}},
+            "POINT": {"annotations": {"x_range": "7-7"}},
+        }
+        compiled = CompiledClassifier(Band, "x")
+        assert compiled.classify(-5) == [Band.ANY_LOW]
+        assert compiled.classify(7) == [Band.ANY_LOW, Band.MIDDLE, Band.WIDE, Band.POINT]
+        assert compiled.classify(7, inclusive=False) == [Band.ANY_LOW, Band.MIDDLE, Band.WIDE]
+        assert compiled.classify(10) == [Band.ANY_LOW, Band.MIDDLE, Band.WIDE]
+        assert compiled.classify(10, inclusive=False) == [Band.MIDDLE, Band.WIDE]
+        assert compiled.classify(math.inf) == [Band.WIDE]
+        assert compiled.classify(math.nan) == []
+
+    def test_no_ranges(self):
+        class Plain(RichEnum):
+            A = "A"
+
+        compiled = CompiledClassifier(Plain, "x")
+        assert compiled.boundaries == []
+        assert compiled.classify(1.0) == []
+
+
+class TestClassifierCache:
+    """Test that classify() reuses compiled classifiers"""
+
+    def test_cached_per_field_and_mappings(self):
+        class Score(RichEnum):
+            LOW = "LOW"
+            HIGH = "HIGH"
+
+        Score._metadata = {
+            "LOW": {"annotations": {"score_range": "0-0.5", "lo": "0", "hi": "0.2"}},
+            "HIGH": {"annotations": {"score_range": "0.5-1"}},
+        }
+        mappings = {"lo": {"field": "score", "bound": "minimum"}, "hi": {"field": "score", "bound": "maximum"}}
+        plain = compiled_classifier(Score, "score")
+        assert compiled_classifier(Score, "score") is plain
+        mapped = compiled_classifier(Score, "score", mappings)
+        assert mapped is not plain
+        assert compiled_classifier(Score, "score", dict(mappings)) is mapped
+        assert mapped.classify(0.3) == []
+        assert plain.classify(0.3) == [Score.LOW]
+
+    def test_cache_invalidated_on_metadata_reassignment(self):
+        class Level(RichEnum):
+            LOW = "LOW"
+            HIGH = "HIGH"
+
+        Level._metadata = {
+            "LOW": {"annotations": {"x_range": "0-5"}},
+            "HIGH": {"annotations": {"x_range": "5-10"}},
+        }
+        assert classify({"x": 7}, Level) == [Level.HIGH]
+        Level._metadata = {
+            "LOW": {"annotations": {"x_range": "0-8"}},
+            "HIGH": {"annotations": {"x_range": "8-10"}},
+        }
+        assert classify({"x": 7}, Level) == [Level.LOW]
+
+
+class TestClassifyArray:
+    """Test vectorized classification against the scalar path"""
+
+    @pytest.mark.parametrize("inclusive", [True, False])
+    def test_matches_scalar_on_packaged_enums(self, inclusive):
+        rng = np.random.default_rng(0)
+        for enum_class, field in classifiable_enums():
+            compiled = compiled_classifier(
+                enum_class, field, get_classifier_config(enum_class).get("annotation_mappings")
+            )
+            points = np.array(compiled.boundaries)
+            values = np.concatenate([points, rng.uniform(-100, 1000, 50), [np.nan, -np.inf, np.inf]])
+            table = code_table(enum_class)
+            codes = classify_array(values, enum_class, field, inclusive=inclusive)
+            multi_hot = classify_array(values, enum_class, field, inclusive=inclusive, all_matches=True)
+            assert multi_hot.shape == (len(values), len(table))
+            for value, code, row in zip(values, codes, multi_hot):
+                expected = classify({field: float(value)}, enum_class, field=field, inclusive=inclusive)
+                assert table.member_of(int(code)) == (expected[0] if expected else None), (enum_class, value)
+                assert [table.members[i] for i in np.flatnonzero(row)] == sorted(
+                    expected, key=table.code_of
+                ), (enum_class, value)
+
+    def test_shape_and_field_detection(self):
+        from valuesets.enums import BMIClassificationEnum
+
+        values = np.array([[17.0, 22.0], [np.nan, 45.0]])
+        codes = classify_array(values, BMIClassificationEnum)
+        assert codes.shape == (2, 2)
+        assert codes.tolist() == classify_array(values.ravel(), BMIClassificationEnum, "bmi").reshape(2, 2).tolist()
+        assert classify_array([], BMIClassificationEnum).shape == (0,)
+
+    def test_no_classifier_field(self):
+        class Plain(RichEnum):
+            A = "A"
+
+        with pytest.raises(ValueError):
+            classify_array(np.array([1.0]), Plain)
+
+
+def random_box_enum(rng, fields, size=12):
+    """A RichEnum whose members carry random (sometimes open or missing) ranges per field."""
+    names = [f"M{i}" for i in range(size)]
+    Boxes = RichEnum("Boxes", {name: name for name in names})
+    metadata = {}
+    for name in names:
+        annotations = {}
+        for field in fields:
+            kind = rng.random()
+            lo, hi = sorted(rng.choice(range(0, 10)) for _ in range(2))
+            if kind < 0.1:
+                continue
+            elif kind < 0.2:
+                annotations[f"minimum_{field}"] = str(lo)
+            elif kind < 0.3:
+                annotations[f"maximum_{field}"] = str(hi)
+            else:
+                annotations[f"{field}_range"] = f"{lo}-{hi}"
+        metadata[name] = {"annotations": annotations}
+        if rng.random() < 0.5:
+            # Ranked members make code order differ from definition order
+            metadata[name]["rank"] = size - len(metadata)
+    Boxes._metadata = metadata
+    return Boxes
+
+
+class TestClassifyMulti:
+    """Test multi-field classification against intersecting single-field results"""
+
+    FIELDS = ["age", "weight", "height"]
+
+    @pytest.mark.parametrize("inclusive", [True, False])
+    def test_matches_intersection(self, inclusive):
+        rng = random.Random(1)
+        for _ in range(10):
+            enum_class = random_box_enum(rng, self.FIELDS)
+            for _ in range(200):
+                obj = {field: rng.choice([rng.randint(-1, 11), rng.uniform(-1, 11)]) for field in self.FIELDS}
+                expected = [
+                    member for member in enum_class
+                    if all(member in reference_classify(obj[f], enum_class, f, inclusive=inclusive)
+                           for f in self.FIELDS)
+                ]
+                assert classify_multi(obj, enum_class, self.FIELDS, inclusive) == expected, obj
+
+    @pytest.mark.parametrize("inclusive", [True, False])
+    def test_array_matches_scalar(self, inclusive):
+        rng = random.Random(2)
+        nprng = np.random.default_rng(2)
+        for _ in range(5):
+            enum_class = random_box_enum(rng, self.FIELDS)
+            table = code_table(enum_class)
+            columns = {field: nprng.integers(-1, 12, 500).astype(float) for field in self.FIELDS}
+            columns["weight"][::7] = np.nan
+            codes = classify_multi_array(columns, enum_class, self.FIELDS, inclusive)
+            multi_hot = classify_multi_array(columns, enum_class, self.FIELDS, inclusive, all_matches=True)
+            for row in range(500):
+                obj = {field: float(columns[field][row]) for field in self.FIELDS}
+                expected = classify_multi(obj, enum_class, self.FIELDS, inclusive)
+                assert table.member_of(int(codes[row])) == (expected[0] if expected else None)
+                assert [table.members[i] for i in np.flatnonzero(multi_hot[row])] == sorted(
+                    expected, key=table.code_of
+                )
+
+    def test_single_field_matches_classify(self):
+        for enum_class, field in classifiable_enums():
+            compiled = compiled_classifier(
+                enum_class, field, get_classifier_config(enum_class).get("annotation_mappings")
+            )
+            for value in compiled.boundaries + [-1e9, 1e9]:
+                assert classify_multi({field: value}, enum_class, [field]) == classify(
+                    {field: value}, enum_class, field=field
+                )
+
+    def test_missing_and_non_numeric_values(self):
+        enum_class = random_box_enum(random.Random(3), ["a", "b"])
+        assert classify_multi({"a": 1}, enum_class, ["a", "b"]) == []
+        assert classify_multi({"a": 1, "b": None}, enum_class, ["a", "b"]) == []
+        assert classify_multi({"a": 1, "b": "x"}, enum_class, ["a", "b"]) == []
+
+    def test_pandas_columns_and_shapes(self):
+        import pandas as pd
+
+        enum_class = random_box_enum(random.Random(4), ["a", "b"])
+        frame = pd.DataFrame({"a": [1.0, 5.0, 9.0], "b": [2.0, 2.0, np.nan]})
+        codes = classify_multi_array(frame, enum_class, ["a", "b"])
+        assert codes.shape == (3,)
+        assert codes.tolist() == classify_multi_array(
+            {"a": frame["a"].to_numpy(), "b": frame["b"].to_numpy()}, enum_class, ["a", "b"]
+        ).tolist()
+        empty = classify_multi_array({"a": np.array([]), "b": np.array([])}, enum_class, ["a", "b"])
+        assert empty.shape == (0,)
+
+    def test_box_index_cached(self):
+        enum_class = random_box_enum(random.Random(5), ["a", "b"])
+        assert box_index(enum_class, ["a", "b"]) is box_index(enum_class, ("a", "b"))
+        assert box_index(enum_class, ["b", "a"]) is not box_index(enum_class, ["a", "b"])
+
+    def test_no_fields(self):
+        class Plain(RichEnum):
+            A = "A"
+
+        with pytest.raises(ValueError):
+            classify_multi({"x": 1}, Plain)
+        with pytest.raises(ValueError):
+            BoxIndex(Plain, [])
+
+
+class TestUnitAwareClassification:
+    """Test classification of values with units against ranges with units"""
+
+    def test_units_convert_before_comparing(self):
+        from valuesets.enums import ProcessScaleEnum
+
+        assert classify({"volume": (0.5, "mL")}, ProcessScaleEnum) == [ProcessScaleEnum.MICROFLUIDIC_SCALE]
+        assert classify({"volume": (500, "mL")}, ProcessScaleEnum) == [ProcessScaleEnum.BENCH_SCALE]
+        assert classify({"volume": (0.2, "m³")}, ProcessScaleEnum) == [ProcessScaleEnum.PILOT_SCALE]
+        # Without a unit the value is compared with the ranges as written
+        assert classify({"volume": 0.5}, ProcessScaleEnum) == [
+            ProcessScaleEnum.BENCH_SCALE, ProcessScaleEnum.MICROFLUIDIC_SCALE,
+        ]
+        assert classify({"volume": (0.5, "")}, ProcessScaleEnum) == classify({"volume": 0.5}, ProcessScaleEnum)
+
+    def test_unit_field_matches_tuple(self):
+        from valuesets.enums import ProcessScaleEnum
+
+        assert classify({"volume": 0.5, "unit": "mL"}, ProcessScaleEnum, unit_field="unit") == classify(
+            {"volume": (0.5, "mL")}, ProcessScaleEnum
+        )
+        assert classify({"volume": 0.5}, ProcessScaleEnum, unit_field="unit") == classify(
+            {"volume": 0.5}, ProcessScaleEnum
+        )
+
+    def test_unknown_unit_or_dimension_matches_nothing(self):
+        from valuesets.enums import ProcessScaleEnum
+
+        assert classify({"volume": (0.5, "furlong")}, ProcessScaleEnum) == []
+        assert classify({"volume": (0.5, "kg")}, ProcessScaleEnum) == []
+
+    @pytest.mark.parametrize("all_matches", [False, True])
+    def test_array_matches_scalar(self, all_matches):
+        from valuesets.enums import ProcessScaleEnum
+
+        rng = np.random.default_rng(6)
+        values = 10.0 ** rng.uniform(-5, 6, 400)
+        units = rng.choice(np.array(["L", "mL", "uL", "m³", "kg", "furlong", "", None], dtype=object), 400)
+        table = code_table(ProcessScaleEnum)
+        result = classify_array(values, ProcessScaleEnum, "volume", all_matches=all_matches, units=units)
+        for value, unit, row in zip(values, units, result):
+            expected = classify({"volume": (float(value), unit)}, ProcessScaleEnum)
+            if all_matches:
+                assert [table.members[i] for i in np.flatnonzero(row)] == sorted(expected, key=table.code_of)
+            else:
+                assert table.member_of(int(row)) == (expected[0] if expected else None)
+
+    def test_array_single_unit(self):
+        from valuesets.enums import ProcessScaleEnum
+
+        codes = classify_array(np.array([0.5, 500.0]), ProcessScaleEnum, "volume", units="mL")
+        table = code_table(ProcessScaleEnum)
+        assert [table.member_of(int(c)) for c in codes] == [
+            ProcessScaleEnum.MICROFLUIDIC_SCALE, ProcessScaleEnum.BENCH_SCALE,
+        ]
+
+    def test_range_units_parsed(self):
+        assert parse_range_with_unit("0.1-10 L") == (0.1, 10.0, "L")
+        assert parse_range_with_unit("<1 mL") == (None, 1.0, "mL")
+        assert parse_range_with_unit("0.5-0.7") == (0.5, 0.7, None)
+        for enum_class, field in classifiable_enums():
+            mappings = get_classifier_config(enum_class).get("annotation_mappings")
+            for member in enum_class:
+                min_val, max_val, unit = get_range_with_unit(member, field, mappings)
+                assert (min_val, max_val) == get_range_annotations(member, field, mappings)
+                if unit is not None and unit_table().lookup(unit) is None:
+                    # Units outside the unit value sets keep the raw comparison
+                    assert classify({field: (min_val or max_val or 0, unit)}, enum_class, field) == []
@@ -0,0 +1,335 @@
+"""
+Tests for the streaming classify CLI command
+"""
+
+import csv
+import json
+import random
+
+import pytest
+from typer.testing import CliRunner
+
+from valuesets.cli import RecordWriter, _classify_records, app, iter_records
+from valuesets.enums import IPCCLikelihoodScale
+
+PROBABILITIES = [0.995, 0.95, 0.5, 0.2, 0.005]
+
+
+def classify_output(args, input_text=None):
+    result = CliRunner().invoke(app, ["classify", "IPCCLikelihoodScale", *args], input=input_text)
+    assert result.exit_code == 0, result.output
+    return result
+
+
+class TestClassifyCommand:
+    """Test classify output for each input and output format"""
+
+    def test_json_stdin(self):
+        records = [{"id": i, "probability": p} for i, p in enumerate(PROBABILITIES)]
+        result = classify_output(["-f", "probability", "--first-match"], json.dumps(records))
+        output = json.loads(result.stdout)
+        assert [r["enum_value"] for r in output] == [
+            "VIRTUALLY_CERTAIN", "EXTREMELY_LIKELY", "MORE_LIKELY_THAN_NOT", "UNLIKELY", "UNLIKELY",
+        ]
+        assert [r["id"] for r in output] == list(range(len(PROBABILITIES)))
+
+    def test_csv_file(self, tmp_path):
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        input_path.write_text("id,probability\n" + "".join(f"{i},{p}\n" for i, p in enumerate(PROBABILITIES)))
+        classify_output(["-i", str(input_path), "-o", str(output_path), "-f", "probability"])
+        with open(output_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert list(rows[0]) == ["id", "probability", "enum_value"]
+        assert rows[1]["enum_value"] == "EXTREMELY_LIKELY,VERY_LIKELY,LIKELY,MORE_LIKELY_THAN_NOT"
+
+    def test_jsonl_to_csv_with_declared_columns(self, tmp_path):
+        input_path = tmp_path / "input.jsonl"
+        output_path = tmp_path / "output.csv"
+        input_path.write_text(
+            '{"id": 1, "probability": 0.5}\n'
+            '{"id": 2, "probability": 0.995, "note": "late key"}\n'
+        )
+        classify_output([
+            "-i", str(input_path), "-o", str(output_path), "-f", "probability",
+            "--first-match", "--columns", "id,enum_value",
+        ])
+        assert output_path.read_text().splitlines() == [
+            "id,enum_value", "1,MORE_LIKELY_THAN_NOT", "2,VIRTUALLY_CERTAIN",
+        ]
+
+    def test_empty_json_input(self):
+        result = classify_output(["-f", "probability", "--input-format", "json"], "[]")
+        assert json.loads(result.stdout) == []
+
+
+class TestStreaming:
+    """Test that the classify pipeline is lazy from reader to writer"""
+
+    def test_records_are_classified_lazily(self):
+        consumed = []
+
+        def source():
+            for p in PROBABILITIES:
+                consumed.append(p)
+                yield {"probability": p}
+
+        classified = _classify_records(source(), IPCCLikelihoodScale, "probability", "enum_value",
+                                       all_matches=False)
+        assert consumed == []
+        assert next(classified)["enum_value"] == "VIRTUALLY_CERTAIN"
+        assert consumed == [0.995]
+
+    def test_writer_streams_json_array(self, tmp_path):
+        records = [{"a": 1, "b": [1, 2]}, {"a": None, "b": {"c": "d"}}]
+        output_path = tmp_path / "output.json"
+        writer = RecordWriter(output_path, "json", flush_every=1)
+        writer.write(records[0])
+        # The first record is already on disk before the array is closed
+        assert output_path.read_text().startswith('[\n  {\n    "a": 1')
+        writer.write(records[1])
+        writer.close()
+        assert output_path.read_text() == json.dumps(records, indent=2) + "\n"
+
+    def test_csv_header_with_no_records(self, tmp_path):
+        output_path = tmp_path / "output.csv"
+        with RecordWriter(output_path, "csv", fieldnames=["id", "enum_value"]):
+            pass
+        assert output_path.read_text().splitlines() == ["id,enum_value"]
+
+    def test_csv_rows_read_incrementally(self, tmp_path):
+        input_path = tmp_path / "input.csv"
+        input_path.write_text("probability\n0.5\n0.2\n")
+        records = iter_records(input_path, None)
+        assert next(records) == {"probability": 0.5}
+        assert next(records) == {"probability": 0.2}
+
+
+class TestParallelClassify:
+    """Test that --workers produces exactly the serial output"""
+
+    @pytest.fixture
+    def input_csv(self, tmp_path):
+        rng = random.Random(0)
+        path = tmp_path / "input.csv"
+        lines = ["id,probability,note"]
+        lines += [f"{i},{rng.random():.4f},row {i}" for i in range(2_503)]
+        lines += ["2503,,missing", "2504,high,text"]
+        path.write_text("\n".join(lines) + "\n")
+        return path
+
+    @pytest.mark.parametrize("output_format", ["csv", "json", "jsonl"])
+    @pytest.mark.parametrize("match_flag", ["--all-matches", "--first-match"])
+    def test_matches_serial(self, tmp_path, input_csv, output_format, match_flag):
+        outputs = []
+        for workers, chunk_size in [(1, 10_000), (2, 100), (3, 7)]:
+            output_path = tmp_path / f"output_{workers}.{output_format}"
+            classify_output([
+                "-i", str(input_csv), "-o", str(output_path), match_flag,
+                "--workers", str(workers), "--chunk-size", str(chunk_size),
+            ])
+            outputs.append(output_path.read_bytes())
+        assert outputs[0] == outputs[1] == outputs[2]
+
+    def test_jsonl_stdin(self):
+        records = "".join(json.dumps({"id": i, "probability": i / 100}) + "\n" for i in range(101))
+        serial = classify_output(["-f", "probability"], records).stdout
+        parallel = classify_output(["-f", "probability", "-w", "2", "--chunk-size", "10"], records).stdout
+        assert parallel == serial
+        assert len(json.loads(parallel)) == 101
+
+    def test_empty_input(self):
+        result = classify_output(["-f", "probability", "--input-format", "jsonl", "-w", "2"], "")
+        assert result.stdout == ""
+
+    def test_invalid_workers(self):
+        result = CliRunner().invoke(app, ["classify", "IPCCLikelihoodScale", "-w", "0"], input="[]")
+        assert result.exit_code != 0
+
+
+class TestArrowFormats:
+    """Test Arrow IPC and Parquet input and output"""
+
+    @pytest.fixture
+    def records(self):
+        rng = random.Random(3)
+        rows = [{"id": i, "probability": round(rng.random(), 4)} for i in range(300)]
+        rows[5]["probability"] = None
+        return rows
+
+    def write_jsonl(self, path, records):
+        path.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+    @pytest.mark.parametrize("match_flag", ["--all-matches", "--first-match"])
+    @pytest.mark.parametrize("suffix", ["parquet", "arrow"])
+    def test_matches_record_path(self, tmp_path, records, match_flag, suffix):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pylist(records)
+        input_path = tmp_path / f"input.{suffix}"
+        if suffix == "parquet":
+            pq.write_table(table, input_path, row_group_size=64)
+        else:
+            with pa.ipc.new_file(input_path, table.schema) as writer:
+                writer.write_table(table, max_chunksize=64)
+        jsonl_path = tmp_path / "input.jsonl"
+        self.write_jsonl(jsonl_path, records)
+        csv_path = tmp_path / "input.csv"
+        csv_path.write_text("id,probability\n" + "".join(
+            f"{r['id']},{'' if r['probability'] is None else r['probability']}\n" for r in records
+        ))
+
+        # JSONL output matches classifying the same typed records
+        columnar_out, record_out = tmp_path / "columnar.jsonl", tmp_path / "record.jsonl"
+        classify_output(["-i", str(input_path), "-o", str(columnar_out), "-f", "probability",
+                         match_flag, "--chunk-size", "50"])
+        classify_output(["-i", str(jsonl_path), "-o", str(record_out), "-f", "probability", match_flag])
+        assert columnar_out.read_text() == record_out.read_text()
+
+        # CSV output matches classifying the CSV, with all matches comma-separated
+        columnar_out, record_out = tmp_path / "columnar.csv", tmp_path / "record.csv"
+        classify_output(["-i", str(input_path), "-o", str(columnar_out), "-f", "probability",
+                         match_flag, "--chunk-size", "50"])
+        classify_output(["-i", str(csv_path), "-o", str(record_out), "-f", "probability", match_flag])
+        with open(columnar_out, newline="") as f, open(record_out, newline="") as g:
+            assert [r["enum_value"] for r in csv.DictReader(f)] == [r["enum_value"] for r in csv.DictReader(g)]
+
+    def test_dictionary_encoded_result(self, tmp_path, records):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        input_path = tmp_path / "input.parquet"
+        output_path = tmp_path / "output.parquet"
+        pq.write_table(pa.Table.from_pylist(records), input_path)
+        classify_output(["-i", str(input_path), "-o", str(output_path), "-f", "probability", "--first-match"])
+        result = pq.read_table(output_path)
+        assert pa.types.is_dictionary(result.schema.field("enum_value").type)
+        assert result.column("id").type == pa.int64()
+        assert result.column("enum_value")[5].as_py() is None
+
+        classify_output(["-i", str(input_path), "-o", str(output_path), "-f", "probability"])
+        value_type = pq.read_table(output_path).schema.field("enum_value").type.value_type
+        assert pa.types.is_dictionary(value_type)
+
+    def test_records_to_parquet(self, tmp_path, records):
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        input_path = tmp_path / "input.jsonl"
+        output_path = tmp_path / "output.parquet"
+        self.write_jsonl(input_path, records)
+        classify_output(["-i", str(input_path), "-o", str(output_path), "-f", "probability", "--first-match"])
+        result = pq.read_table(output_path).to_pylist()
+        assert len(result) == len(records)
+        assert result[0]["enum_value"] is not None
+        assert result[5]["enum_value"] is None
+
+    @pytest.mark.parametrize("match_flag", ["--all-matches", "--first-match"])
+    def test_enum_without_classifier_fields(self, tmp_path, match_flag):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        input_path = tmp_path / "input.parquet"
+        pq.write_table(pa.table({"id": [1, 2], "value": [0.5, 3.0]}), input_path)
+        outputs = {}
+        for output_format in ["csv", "parquet"]:
+            output_path = tmp_path / f"output.{output_format}"
+            result = CliRunner().invoke(app, [
+                "classify", "BiologicalKingdom", "-i", str(input_path), "-o", str(output_path), match_flag,
+            ])
+            assert result.exit_code == 0, result.output
+            outputs[output_format] = output_path
+        with open(outputs["csv"], newline="") as f:
+            assert [r["enum_value"] for r in csv.DictReader(f)] == ["", ""]
+        result = pq.read_table(outputs["parquet"])
+        assert result.column("enum_value").to_pylist() == [None, None]
+        assert result.column("enum_value").null_count == 2
+
+    def test_typed_input_is_not_sniffed(self, tmp_path):
+        pa = pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        input_path = tmp_path / "input.parquet"
+        pq.write_table(pa.table({"code": ["007"], "n": [3]}), input_path)
+        assert list(iter_records(input_path, None)) == [{"code": "007", "n": 3}]
+
+    def test_unit_field(self, tmp_path):
+        pytest.importorskip("pyarrow")
+        import pyarrow.parquet as pq
+
+        input_path = tmp_path / "input.csv"
+        input_path.write_text("volume,unit\n0.5,mL\n500,mL\n2,L\n3,kg\n0.5,\n")
+        expected = [
+            "MICROFLUIDIC_SCALE", "BENCH_SCALE", "BENCH_SCALE", "", "BENCH_SCALE,MICROFLUIDIC_SCALE",
+        ]
+        outputs = []
+        for output_format in ["csv", "parquet"]:
+            output_path = tmp_path / f"output.{output_format}"
+            result = CliRunner().invoke(app, [
+                "classify", "ProcessScaleEnum", "-i", str(input_path), "-o", str(output_path),
+                "-f", "volume", "-u", "unit",
+            ])
+            assert result.exit_code == 0, result.output
+            outputs.append(output_path)
+        with open(outputs[0], newline="") as f:
+            assert [r["enum_value"] for r in csv.DictReader(f)] == expected
+        # Columnar input goes through classify_array with a units column
+        columnar_out = tmp_path / "columnar.csv"
+        result = CliRunner().invoke(app, [
+            "classify", "ProcessScaleEnum", "-i", str(outputs[1]), "-o", str(columnar_out),
+            "-f", "volume", "-u", "unit",
+        ])
+        assert result.exit_code == 0, result.output
+        with open(columnar_out, newline="") as f:
+            assert [r["enum_value"] for r in csv.DictReader(f)] == expected
+
+
+class TestClassifierRegistry:
+    """Test that list-enums and inspect answer from the registry as the module scan would"""
+
+    def test_list_enums_matches_scan(self):
+        from valuesets.cli import _registry_enum_fields, _scan_enum_fields
+
+        for classifiable_only in (True, False):
+            registry = _registry_enum_fields("valuesets.enums", classifiable_only)
+            assert sorted(registry) == sorted(_scan_enum_fields("valuesets.enums", classifiable_only))
+
+    def test_inspect_matches_scan(self):
+        import valuesets.enums
+        from valuesets.registry import get_registry
+
+        for name in get_registry().classifiable_enums():
+            module = getattr(valuesets.enums, name).__module__
+            runner = CliRunner()
+            from_registry = runner.invoke(app, ["inspect", name])
+            scanned = runner.invoke(app, ["inspect", name, "--module", module])
+            assert from_registry.exit_code == 0, from_registry.output
+            assert from_registry.stdout == scanned.stdout, name
+
+    def test_list_enums_does_not_import_enum_modules(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from typer.testing import CliRunner\n"
+            "from valuesets.cli import app\n"
+            "result = CliRunner().invoke(app, ['list-enums', '-c'])\n"
+            "assert 'ProcessScaleEnum (fields: volume)' in result.stdout\n"
+            "print(sorted(m for m in sys.modules if m.startswith('valuesets.enums.')))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+        assert output.strip() == "[]"
+
+    def test_load_qualified_enum(self):
+        import typer
+
+        from valuesets.cli import load_enum_class
+
+        enum_class = load_enum_class("bio.lipid_categories.PresenceEnum")
+        assert enum_class.__module__ == "valuesets.enums.bio.lipid_categories"
+        assert load_enum_class("PresenceEnum", "valuesets.enums.bio.lipid_categories") is enum_class
+        assert load_enum_class("lipid_categories.PresenceEnum", "valuesets.enums.bio") is enum_class
+        with pytest.raises(typer.BadParameter):
+            load_enum_class("NoSuchEnum")
@@ -0,0 +1,74 @@
+"""
+Tests for CLI cold-start time and deferred imports
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+# Wall-clock budget for `valuesets --help` in a fresh interpreter, in seconds;
+# override with VALUESETS_STARTUP_BUDGET on slow machines
+STARTUP_BUDGET_SECONDS = float(os.environ.get("VALUESETS_STARTUP_BUDGET", "1.0"))
+
+# Modules that commands answered from the registry must not import
+HEAVY_MODULES = ("oaklib", "linkml", "numpy", "pandas", "pyarrow", "valuesets.enums.", "valuesets.utils.")
+
+_RUN_CLI = """
+import json, runpy, sys
+sys.argv = ["valuesets"] + json.loads(sys.argv[1])
+try:
+    runpy.run_module("valuesets.cli", run_name="__main__")
+except SystemExit:
+    pass
+with open({modules_path!r}, "w") as f:
+    json.dump(sorted(sys.modules), f)
+"""
+
+
+def cli_modules(args, tmp_path):
+    """Run the CLI in a fresh interpreter and return the modules it imported."""
+    modules_path = tmp_path / "modules.json"
+    subprocess.run(
+        [sys.executable, "-c", _RUN_CLI.format(modules_path=str(modules_path)), json.dumps(args)],
+        check=True, capture_output=True,
+    )
+    return json.loads(modules_path.read_text())
+
+
+class TestColdStart:
+    """Test that CLI start-up stays within budget"""
+
+    def test_help_within_budget(self):
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, "-m", "valuesets.cli", "--help"], check=True, capture_output=True)
+            times.append(time.perf_counter() - start)
+        assert min(times) <= STARTUP_BUDGET_SECONDS, (
+            f"valuesets --help took {min(times):.2f} s (budget {STARTUP_BUDGET_SECONDS} s); "
+            f"see `valuesets --profile-startup`"
+        )
+
+    @pytest.mark.parametrize("args", [
+        ["--help"],
+        ["classify", "--help"],
+        ["list-enums", "-c"],
+        ["inspect", "ProcessScaleEnum"],
+        ["which-enum", "BSPO:0000000"],
+    ])
+    def test_heavy_imports_deferred(self, tmp_path, args):
+        heavy = [m for m in cli_modules(args, tmp_path) if m.startswith(HEAVY_MODULES)]
+        assert heavy == [], f"valuesets {' '.join(args)} imported {heavy[:10]}"
+
+    def test_profile_startup(self):
+        output = subprocess.run(
+            [sys.executable, "-m", "valuesets.cli", "--profile-startup", "list-enums", "-c"],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        assert output.startswith("Start-up profile of: valuesets list-enums -c")
+        assert "(exit status 0)" in output
+        assert "typer" in output
@@ -0,0 +1,102 @@
+"""
+Tests for stable integer codes of enum members
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import valuesets.enums
+from valuesets.enums.bio.taxonomy import BiologicalKingdom
+from valuesets.enums.bio.uniprot_species import UniProtSpeciesCode
+from valuesets.generators.rich_enum import RichEnum
+from valuesets.registry import get_registry
+from valuesets.utils.codes import (
+    code_order,
+    code_shifts,
+    code_snapshot,
+    code_table,
+    decode,
+    encode,
+    registry_code_snapshot,
+)
+
+
+class TestCodeTable:
+    """Test code assignment and array conversions"""
+
+    def test_definition_order_and_dtype(self):
+        table = code_table(BiologicalKingdom)
+        assert table.members == tuple(BiologicalKingdom)
+        assert table.dtype_name == "uint8"
+        assert code_table(UniProtSpeciesCode).dtype_name == "uint16"
+        assert code_table(BiologicalKingdom) is table
+
+    def test_rank_order(self):
+        assert code_order([("A", None), ("B", 1), ("C", 1), ("D", 0)]) == ["D", "B", "C", "A"]
+
+    def test_round_trip(self):
+        values = np.array(["SP_HUMAN", "SP_MOUSE", None, "SP_HUMAN", float("nan")], dtype=object)
+        codes = encode(UniProtSpeciesCode, values)
+        assert codes.dtype == np.uint16
+        assert codes[2] == codes[4] == code_table(UniProtSpeciesCode).missing
+        assert list(decode(UniProtSpeciesCode, codes)) == [
+            UniProtSpeciesCode.SP_HUMAN, UniProtSpeciesCode.SP_MOUSE, None, UniProtSpeciesCode.SP_HUMAN, None
+        ]
+
+    def test_encode_members_and_values(self):
+        table = code_table(BiologicalKingdom)
+        assert table.encode([BiologicalKingdom.ARCHAEA, "ARCHAEA"]).tolist() == [1, 1]
+        with pytest.raises(ValueError):
+            table.encode(["NOT_A_KINGDOM"])
+        with pytest.raises(ValueError):
+            table.decode(np.array([200], dtype=np.uint8))
+
+    def test_decode_rejects_out_of_range_codes(self):
+        table = code_table(BiologicalKingdom)
+        assert len(table.members) == 8
+        assert table.decode([7, table.missing]).tolist() == [table.members[7], None]
+        for codes in ([8], [-1], [-2], [0, 9]):
+            with pytest.raises(ValueError, match="Invalid codes"):
+                table.decode(np.array(codes))
+        with pytest.raises(ValueError):
+            table.member_of(-2)
+        with pytest.raises(ValueError):
+            table.member_of(8)
+
+    def test_categorical_round_trip(self):
+        table = code_table(BiologicalKingdom)
+        codes = table.encode(["EUKARYOTA", None, "BACTERIA"])
+        categorical = table.to_categorical(codes)
+        assert list(categorical.categories) == table.names
+        assert categorical.tolist()[0] == "EUKARYOTA" and pd.isna(categorical[1])
+        assert table.from_categorical(categorical).tolist() == codes.tolist()
+
+        # Categories in another order are remapped through the code table
+        other = pd.Categorical(["BACTERIA", "EUKARYOTA", None], categories=["EUKARYOTA", "BACTERIA"])
+        assert table.from_categorical(other).tolist() == table.encode(["BACTERIA", "EUKARYOTA", None]).tolist()
+
+    def test_cache_invalidated_on_metadata_reassignment(self):
+        class Level(RichEnum):
+            LOW = "LOW"
+            HIGH = "HIGH"
+
+        assert code_table(Level).names == ["LOW", "HIGH"]
+        Level._metadata = {"LOW": {"rank": 2}, "HIGH": {"rank": 1}}
+        assert code_table(Level).names == ["HIGH", "LOW"]
+
+
+class TestCodeShifts:
+    """Test the code shift check against a previous release"""
+
+    def test_appending_is_not_a_shift(self):
+        assert code_shifts({"E": ["A", "B"]}, {"E": ["A", "B", "C"]}) == []
+
+    def test_reorder_and_removal(self):
+        assert code_shifts({"E": ["A", "B", "C"]}, {"E": ["B", "A"]}) == [
+            "E: A 0 -> 1", "E: B 1 -> 0", "E: C 2 removed"
+        ]
+
+    def test_packaged_registry_matches_enums(self):
+        current = code_snapshot({name: getattr(valuesets.enums, name) for name in valuesets.enums.__all__})
+        assert code_shifts(registry_code_snapshot(get_registry()), current) == []
@@ -0,0 +1,89 @@
+"""
+Tests for the package-wide CURIE index
+"""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from valuesets.cli import app
+from valuesets.curie_index import CurieIndex, get_curie_index, which_enum
+from valuesets.enums.bio.taxonomy import BiologicalKingdom
+from valuesets.enums.clinical.nih_demographics import BiologicalSexEnum
+
+
+@pytest.fixture(scope="module")
+def index():
+    return get_curie_index()
+
+
+class TestCurieIndex:
+    """Test CURIE lookups across all enums"""
+
+    def test_meaning_hits(self, index):
+        hits = index.hits("NCBITaxon:2759")
+        assert ("BiologicalKingdom", "EUKARYOTA", "meaning") in [
+            (hit.enum_name, hit.member_name, hit.predicate) for hit in hits
+        ]
+
+    def test_mapping_hits(self, index):
+        # NCIT:C20197 is an exact mapping, not the meaning, of BiologicalSexEnum.MALE
+        assert BiologicalSexEnum.MALE.meaning != "NCIT:C20197"
+        pairs = index.lookup("NCIT:C20197")
+        assert (BiologicalSexEnum, BiologicalSexEnum.MALE) in pairs
+        assert {hit.predicate for hit in index.hits("NCIT:C20197")} == {"exact_mappings"}
+
+    def test_iri_and_unknown(self, index):
+        assert "http://purl.obolibrary.org/obo/NCBITaxon_2759" in index
+        assert "FAKE:0000000" not in index
+        assert index.hits("FAKE:0000000") == ()
+        assert index.hits("") == ()
+
+    def test_which_enum_resolves_members(self):
+        pairs = which_enum("NCBITaxon:2759")
+        assert (BiologicalKingdom, BiologicalKingdom.EUKARYOTA) in pairs
+        for enum_class, member in pairs:
+            assert member.meaning == "NCBITaxon:2759"
+            assert isinstance(member, enum_class)
+
+    def test_lookup_many(self, index):
+        results = index.lookup_many(["NCBITaxon:2759", "FAKE:1"])
+        assert results["FAKE:1"] == []
+        assert (BiologicalKingdom, BiologicalKingdom.EUKARYOTA) in results["NCBITaxon:2759"]
+
+    def test_covers_all_meanings(self, index):
+        import valuesets.enums
+
+        for name in valuesets.enums.__all__:
+            enum_class = getattr(valuesets.enums, name)
+            for member in enum_class:
+                if member.meaning:
+                    assert (enum_class, member) in index.lookup(member.meaning), f"{name}.{member.name}"
+
+    def test_shared_instance(self, index):
+        assert isinstance(index, CurieIndex)
+        assert get_curie_index() is index
+
+
+class TestWhichEnumCommand:
+    """Test the which-enum CLI command"""
+
+    def test_tsv_output(self):
+        result = CliRunner().invoke(app, ["which-enum", "NCBITaxon:2759", "FAKE:1"])
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0] == "curie\tenum\tmember\tpredicate\tmodule"
+        assert any(line.startswith("NCBITaxon:2759\tBiologicalKingdom\tEUKARYOTA\tmeaning\t") for line in lines)
+        assert "FAKE:1\t\t\t\t" in lines
+
+    def test_jsonl_from_stdin(self):
+        result = CliRunner().invoke(
+            app, ["which-enum", "--output-format", "jsonl"], input="NCIT:C20197\n\nFAKE:1\n"
+        )
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.stdout.splitlines() if line.startswith("{")]
+        assert [row["curie"] for row in rows] == ["NCIT:C20197", "FAKE:1"]
+        assert {"enum": "BiologicalSexEnum", "member": "MALE", "predicate": "exact_mappings",
+                "module": BiologicalSexEnum.__module__} in rows[0]["matches"]
+        assert rows[1]["matches"] == []
@@ -0,0 +1,72 @@
+"""
+Tests for lazy imports of the valuesets.enums package
+"""
+
+import json
+import subprocess
+import sys
+
+import valuesets.enums
+
+# Generous upper bound for importing a single enum in a fresh interpreter;
+# the eager package import this replaced took several times longer.
+SINGLE_ENUM_IMPORT_BUDGET_SECONDS = 0.5
+
+SINGLE_ENUM_IMPORT = """
+import json, sys, time
+start = time.perf_counter()
+from valuesets.enums import PresenceEnum
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "module": PresenceEnum.__module__,
+    "enum_modules": sorted(
+        m for m in sys.modules
+        if m.startswith("valuesets.enums.") and not hasattr(sys.modules[m], "__path__")
+    ),
+    "heavy": sorted(m for m in ("oaklib", "linkml", "linkml_runtime") if m in sys.modules),
+}))
+"""
+
+
+def run_in_fresh_interpreter(code: str) -> dict:
+    """Run code in a new interpreter and decode the JSON it prints."""
+    output = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+class TestLazyImports:
+    """Test that enums are only imported on demand"""
+
+    def test_single_enum_import_loads_one_module(self):
+        """Test that importing one enum imports only its defining module"""
+        result = run_in_fresh_interpreter(SINGLE_ENUM_IMPORT)
+        assert result["enum_modules"] == [result["module"]]
+        assert result["heavy"] == []
+
+    def test_single_enum_import_time(self):
+        """Test that importing one enum stays within the startup budget"""
+        result = run_in_fresh_interpreter(SINGLE_ENUM_IMPORT)
+        assert result["elapsed"] < SINGLE_ENUM_IMPORT_BUDGET_SECONDS
+
+    def test_duplicate_names_resolve_to_last_module(self):
+        """Test that enums defined in several modules keep their previous binding"""
+        assert valuesets.enums.PresenceEnum.__module__ == "valuesets.enums.lab_automation.cloud_lab"
+        assert valuesets.enums.RelativeTimeEnum.__module__ == "valuesets.enums.lab_automation.cloud_lab"
+
+    def test_star_import_exports_all(self):
+        """Test that import * still provides every name in __all__"""
+        namespace = {}
+        exec("from valuesets.enums import *", namespace)
+        missing = [name for name in valuesets.enums.__all__ if name not in namespace]
+        assert missing == []
+
+    def test_dir_lists_all_enums(self):
+        """Test that dir() includes enums that were not yet imported"""
+        assert set(valuesets.enums.__all__) <= set(dir(valuesets.enums))
+
+    def test_unknown_attribute(self):
+        """Test that unknown names still raise AttributeError"""
+        assert not hasattr(valuesets.enums, "NoSuchEnum")
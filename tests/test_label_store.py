@@ -0,0 +1,160 @@
+"""
+Tests for the shared SQLite ontology label store
+"""
+
+import csv
+import multiprocessing
+import sqlite3
+
+import pytest
+from typer.testing import CliRunner
+
+from valuesets.cli import app
+from valuesets.utils.label_store import LabelStore, StoredLabel, default_label_store_path
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = LabelStore(tmp_path / "labels.sqlite")
+    yield store
+    store.close()
+
+
+def write_csv_tree(root, rows_by_prefix):
+    for prefix, rows in rows_by_prefix.items():
+        path = root / prefix / "terms.csv"
+        path.parent.mkdir(parents=True)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["curie", "label", "retrieved_at"])
+            writer.writerows(rows)
+
+
+def read_many(path, curies):
+    return {curie: stored.label for curie, stored in LabelStore(path).get_many(curies).items()}
+
+
+class TestLabelStore:
+    """Test storing and reading labels"""
+
+    def test_put_and_get(self, store):
+        assert store.get("GO:0040007") is None
+        store.put("GO:0040007", "growth", synonyms=["growth of organism"], source="sqlite:obo:go")
+        stored = store.get("GO:0040007")
+        assert stored.label == "growth"
+        assert stored.synonyms == ("growth of organism",)
+        assert stored.source == "sqlite:obo:go"
+        assert stored.retrieved_at
+        assert "GO:0040007" in store and len(store) == 1
+
+    def test_not_found_terms(self, store):
+        store.put_many([StoredLabel("GO:9999999", None), StoredLabel("GO:8888888", "")])
+        assert store.get("GO:9999999").label is None
+        assert store.labels("GO") == {"GO:9999999": None, "GO:8888888": None}
+
+    def test_get_many_beyond_batch_size(self, store):
+        curies = [f"NCIT:C{i}" for i in range(1_200)]
+        assert store.put_many(StoredLabel(curie, f"term {curie}") for curie in curies[::2]) == 600
+        found = store.get_many(curies + curies[:10])
+        assert sorted(found) == sorted(curies[::2])
+        assert found["NCIT:C0"].label == "term NCIT:C0"
+
+    def test_prefix_index(self, store):
+        store.put_many([StoredLabel("NCBITaxon:9606", "Homo sapiens"), StoredLabel("GO:0040007", "growth")])
+        assert store.prefixes() == ["go", "ncbitaxon"]
+        assert store.labels("NCBITaxon") == {"NCBITaxon:9606": "Homo sapiens"}
+
+    def test_newer_entries_win(self, store):
+        store.put_many([StoredLabel("CL:0000000", "cell", retrieved_at="2025-06-01T00:00:00")])
+        store.put_many([StoredLabel("CL:0000000", "old cell", retrieved_at="2025-01-01T00:00:00")])
+        assert store.get("CL:0000000").label == "cell"
+        store.put("CL:0000000", "cell (renamed)")
+        assert store.get("CL:0000000").label == "cell (renamed)"
+
+    def test_default_path(self, tmp_path, monkeypatch):
+        monkeypatch.delenv("VALUESETS_LABEL_STORE", raising=False)
+        assert default_label_store_path(tmp_path) == tmp_path / "labels.sqlite"
+        monkeypatch.setenv("VALUESETS_LABEL_STORE", str(tmp_path / "shared.sqlite"))
+        assert default_label_store_path(tmp_path) == tmp_path / "shared.sqlite"
+        assert LabelStore().path == tmp_path / "shared.sqlite"
+
+
+class TestConcurrency:
+    """Test sharing one store file between connections and processes"""
+
+    def test_wal_mode(self, store):
+        store.put("GO:0040007", "growth")
+        with sqlite3.connect(store.path) as conn:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_reader_sees_committed_writes(self, store):
+        reader = LabelStore(store.path)
+        assert reader.get("GO:0040007") is None
+        store.put("GO:0040007", "growth")
+        assert reader.get("GO:0040007").label == "growth"
+        reader.close()
+
+    def test_parallel_process_readers(self, store):
+        curies = [f"CHEBI:{i}" for i in range(500)]
+        store.put_many(StoredLabel(curie, curie.lower()) for curie in curies)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(2) as pool:
+            pending = [pool.apply_async(read_many, (store.path, curies)) for _ in range(4)]
+            # Writes while the readers run do not block or corrupt them
+            store.put_many(StoredLabel(f"CHEBI:{i}", "new") for i in range(500, 1_000))
+            results = [p.get(60) for p in pending]
+        assert all(result == {curie: curie.lower() for curie in curies} for result in results)
+        assert len(store) == 1_000
+
+
+class TestCSVTrees:
+    """Test importing and exporting the per-prefix terms.csv cache files"""
+
+    def test_import(self, store, tmp_path):
+        write_csv_tree(tmp_path / "cache", {
+            "go": [["GO:0040007", "growth", "2025-10-19T07:20:44"], ["GO:9999999", "", "2025-10-19T07:20:45"]],
+            "ncit": [["NCIT:C1", "Label, with comma", "2025-10-19T07:20:46"]],
+        })
+        assert store.import_csv_tree(tmp_path / "cache", source="csv") == 3
+        stored = store.get("GO:0040007")
+        assert (stored.label, stored.retrieved_at, stored.source) == ("growth", "2025-10-19T07:20:44", "csv")
+        assert store.get("GO:9999999").label is None
+        assert store.get("NCIT:C1").label == "Label, with comma"
+
+    def test_export_round_trip(self, store, tmp_path):
+        rows = [["UO:0000001", "length unit", "2025-01-01T00:00:00"], ["UO:0000002", "", "2025-01-02T00:00:00"]]
+        write_csv_tree(tmp_path / "before", {"uo": rows})
+        store.import_csv_tree(tmp_path / "before")
+        assert store.export_csv_tree(tmp_path / "after") == 2
+        before = (tmp_path / "before" / "uo" / "terms.csv").read_bytes()
+        assert (tmp_path / "after" / "uo" / "terms.csv").read_bytes() == before
+
+    def test_labels_command(self, tmp_path):
+        write_csv_tree(tmp_path / "cache", {"go": [["GO:0040007", "growth", ""], ["GO:9999999", "", ""]]})
+        result = CliRunner().invoke(app, [
+            "labels", "--store", str(tmp_path / "labels.sqlite"), "--import", str(tmp_path / "cache"),
+        ])
+        assert result.exit_code == 0, result.output
+        assert result.stdout.splitlines() == ["prefix\tterms\tnot_found", "go\t2\t1"]
+
+
+class TestCallSites:
+    """Test that label consumers answer from the store before asking an ontology"""
+
+    def test_sssom_generator(self, store):
+        from valuesets.generators.sssom_generator import SSSOMGenerator
+
+        store.put("NOSUCHONTOLOGY:1", "stored label")
+        generator = SSSOMGenerator(label_store=store)
+        assert generator.get_ontology_label("NOSUCHONTOLOGY:1") == "stored label"
+        assert SSSOMGenerator(cache_labels=False).label_store is None
+
+    def test_fetch_label_from_ols(self, store, monkeypatch):
+        from valuesets.utils import query_describer
+
+        def no_network(*args, **kwargs):
+            raise AssertionError("OLS should not be queried")
+
+        monkeypatch.setattr("urllib.request.urlopen", no_network)
+        store.put("CL:0000000", "cell", source="sqlite:obo:cl")
+        assert query_describer.fetch_label_from_ols("CL:0000000", store) == "cell"
@@ -0,0 +1,101 @@
+"""
+Tests for bulk normalization of raw strings to enum members
+"""
+
+import csv
+import itertools
+import json
+
+from typer.testing import CliRunner
+
+from valuesets.cli import app
+from valuesets.enums.bio.uniprot_species import UniProtSpeciesCode
+from valuesets.utils.normalize import AMBIGUOUS, Normalizer, normalize_many
+
+
+class TestNormalizer:
+    """Test the Normalizer and normalize_many"""
+
+    def test_match_types(self):
+        results = list(normalize_many(
+            UniProtSpeciesCode,
+            ["SP_HUMAN", "NCBITaxon:9606", "http://purl.obolibrary.org/obo/NCBITaxon_9606",
+             "  human ", "Fission yeast", "nothing", None],
+        ))
+        assert [r.match_type for r in results] == [
+            "name", "meaning", "meaning", "label", AMBIGUOUS, None, None
+        ]
+        assert [r.member for r in results[:4]] == [UniProtSpeciesCode.SP_HUMAN] * 4
+        assert results[4].member is None
+        assert results[0].raw == "SP_HUMAN"
+
+    def test_memoizes_distinct_values(self):
+        normalizer = Normalizer(UniProtSpeciesCode)
+        results = list(normalizer.normalize_many(["human", "mouse", "human", "human", "???"]))
+        assert len(normalizer._cache) == 3
+        assert results[0] is results[2]
+        assert (normalizer.total, normalizer.matched) == (5, 4)
+        assert normalizer.unmatched == {"???": 1}
+
+    def test_cache_size_limit(self):
+        normalizer = Normalizer(UniProtSpeciesCode, max_cache_size=1)
+        list(normalizer.normalize_many(["human", "mouse", "rat"]))
+        assert list(normalizer._cache) == ["human"]
+
+    def test_non_string_values(self):
+        normalizer = Normalizer(UniProtSpeciesCode)
+        results = list(normalizer.normalize_many([1, 1.0, None]))
+        assert [r.raw for r in results] == [1, 1.0, None]
+        assert normalizer.unmatched == {"1": 1, "1.0": 1, "": 1}
+
+    def test_streams_lazily(self):
+        values = itertools.cycle(["human", "mouse"])
+        results = list(itertools.islice(normalize_many(UniProtSpeciesCode, values), 5))
+        assert [r.member.name for r in results] == ["SP_HUMAN", "SP_MOUSE"] * 2 + ["SP_HUMAN"]
+
+
+class TestNormalizeCommand:
+    """Test the normalize CLI command"""
+
+    def test_csv_file(self, tmp_path):
+        input_path = tmp_path / "input.csv"
+        output_path = tmp_path / "output.csv"
+        report_path = tmp_path / "unmatched.csv"
+        input_path.write_text("id,species\n1,human\n2,NCBITaxon:10090\n3,martian\n4,martian\n5,\n")
+
+        result = CliRunner().invoke(app, [
+            "normalize", "UniProtSpeciesCode", "-f", "species",
+            "-i", str(input_path), "-o", str(output_path), "--unmatched-report", str(report_path),
+        ])
+        assert result.exit_code == 0, result.output
+        with open(output_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [(r["enum_value"], r["match_type"]) for r in rows] == [
+            ("SP_HUMAN", "label"), ("SP_MOUSE", "meaning"), ("", ""), ("", ""), ("", ""),
+        ]
+        assert rows[0]["id"] == "1"
+        with open(report_path, newline="") as f:
+            assert list(csv.reader(f)) == [["value", "count"], ["martian", "2"], ["", "1"]]
+        assert "5 value(s): 2 matched, 3 unmatched" in result.output
+
+    def test_jsonl_stdin_to_json(self):
+        result = CliRunner().invoke(
+            app,
+            ["normalize", "UniProtSpeciesCode", "-f", "species", "--output-format", "json",
+             "--output-field", "code"],
+            input='{"species": "Human"}\n{"species": "nope"}\n',
+        )
+        assert result.exit_code == 0, result.output
+        output = result.stdout[:result.stdout.rindex("]") + 1]
+        assert json.loads(output) == [
+            {"species": "Human", "code": "SP_HUMAN", "match_type": "label"},
+            {"species": "nope", "code": None, "match_type": None},
+        ]
+
+    def test_missing_csv_field(self, tmp_path):
+        input_path = tmp_path / "input.csv"
+        input_path.write_text("id,species\n1,human\n")
+        result = CliRunner().invoke(
+            app, ["normalize", "UniProtSpeciesCode", "-f", "organism", "-i", str(input_path)]
+        )
+        assert result.exit_code != 0
@@ -0,0 +1,208 @@
+"""
+Tests for the precompiled enum registry
+"""
+
+import sqlite3
+import subprocess
+import sys
+
+import pytest
+
+import valuesets.enums
+from valuesets.generators.registry_generator import EnumRegistryGenerator
+from valuesets.registry import DEFAULT_REGISTRY_PATH, EnumRegistry, get_registry, load_enum
+from valuesets.utils.classifier import detect_classifier_fields, get_classifier_config, get_range_with_unit
+
+
+@pytest.fixture(scope="module")
+def registry():
+    return get_registry()
+
+
+class TestRegistryLookups:
+    """Test lookups answered from the packaged registry"""
+
+    def test_get_member(self, registry):
+        member = registry.get_member("UniProtSpeciesCode", "SP_HUMAN")
+        assert member.value == "SP_HUMAN"
+        assert member.meaning == "NCBITaxon:9606"
+        assert member.aliases == ["Human"]
+        assert member.annotations == {"sources": "common, GO"}
+        assert registry.get_member("UniProtSpeciesCode", "NO_SUCH_MEMBER") is None
+
+    def test_from_meaning(self, registry):
+        assert registry.from_meaning("AnatomicalSide", "BSPO:0000000").name == "LEFT"
+        assert registry.from_meaning(
+            "AnatomicalSide", "http://purl.obolibrary.org/obo/BSPO_0000000"
+        ).name == "LEFT"
+        assert registry.from_meaning("AnatomicalSide", "FAKE:1") is None
+
+    def test_unknown_enum(self, registry):
+        assert "NoSuchEnum" not in registry
+        assert registry.get_enum("NoSuchEnum") is None
+        with pytest.raises(KeyError):
+            registry.members("NoSuchEnum")
+
+    def test_duplicate_names_use_exported_module(self, registry):
+        record = registry.get_enum("PresenceEnum")
+        assert record.module == valuesets.enums.PresenceEnum.__module__
+
+    def test_aliased_export(self, registry):
+        # statistics re-exports OutcomeTypeEnum as PredictionOutcomeType
+        record = registry.get_enum("PredictionOutcomeType")
+        assert record.module == valuesets.enums.PredictionOutcomeType.__module__
+        assert record.name == valuesets.enums.PredictionOutcomeType.__name__
+
+    def test_materialize(self, registry):
+        Kingdom = registry.materialize("BiologicalKingdom")
+        assert Kingdom is registry.materialize("BiologicalKingdom")
+        assert [m.name for m in Kingdom] == [m.name for m in valuesets.enums.BiologicalKingdom]
+        assert Kingdom.EUKARYOTA.get_meaning() == "NCBITaxon:2759"
+        assert Kingdom.from_meaning("NCBITaxon:2759") == Kingdom.EUKARYOTA
+        assert Kingdom.EUKARYOTA == "EUKARYOTA"
+
+    def test_lookup_does_not_import_enum_modules(self):
+        code = (
+            "import sys\n"
+            "from valuesets.registry import get_registry\n"
+            "assert get_registry().get_member('UniProtSpeciesCode', 'SP_HUMAN').meaning == 'NCBITaxon:9606'\n"
+            "print(sorted(m for m in sys.modules if m.startswith('valuesets.enums.')))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+        assert output.strip() == "[]"
+
+
+class TestNameResolution:
+    """Test resolving plain and module-qualified enum names"""
+
+    def test_every_definition_resolves(self, registry):
+        conn = sqlite3.connect(DEFAULT_REGISTRY_PATH)
+        definitions = conn.execute("SELECT module, name FROM enums").fetchall()
+        conn.close()
+        for module, name in definitions:
+            relative = module[len("valuesets.enums."):]
+            assert registry.resolve_name(f"{relative}.{name}") == (module, name)
+            assert registry.resolve_name(f"{module}.{name}") == (module, name)
+            assert module in registry.definitions(name)
+
+    def test_plain_names(self, registry):
+        for name in ["PresenceEnum", "RelativeTimeEnum", "BiologicalKingdom"]:
+            assert load_enum(name) is getattr(valuesets.enums, name)
+            assert registry.definitions(name)[0] == getattr(valuesets.enums, name).__module__
+        # Defined in a submodule but not exported by valuesets.enums
+        assert load_enum("EducationLevelEnum").__module__ == "valuesets.enums.common_value_sets"
+
+    def test_qualified_names(self, registry):
+        Presence = load_enum("bio.lipid_categories.PresenceEnum")
+        assert Presence.__module__ == "valuesets.enums.bio.lipid_categories"
+        assert Presence is not valuesets.enums.PresenceEnum
+        assert load_enum("lipid_categories.PresenceEnum") is Presence
+        assert registry.get_enum("bio.lipid_categories.PresenceEnum").module == Presence.__module__
+        assert [m.name for m in registry.members("bio.lipid_categories.PresenceEnum")] == [m.name for m in Presence]
+
+    def test_unknown_and_ambiguous_names(self):
+        with pytest.raises(KeyError):
+            load_enum("NoSuchEnum")
+        with pytest.raises(KeyError):
+            load_enum("no_such_module.PresenceEnum")
+        registry = EnumRegistry()
+        registry._definitions = {"Twin": ("valuesets.enums.a.shared", "valuesets.enums.b.shared")}
+        with pytest.raises(ValueError, match="a.shared.Twin, b.shared.Twin"):
+            registry.resolve_name("Twin")
+        with pytest.raises(ValueError):
+            registry.resolve_name("shared.Twin")
+        assert registry.resolve_name("a.shared.Twin") == ("valuesets.enums.a.shared", "Twin")
+
+    def test_qualified_lookup_imports_only_owning_module(self):
+        code = (
+            "import sys\n"
+            "from valuesets.registry import load_enum\n"
+            "load_enum('bio.lipid_categories.PresenceEnum')\n"
+            "print(sorted(m for m in sys.modules if m.startswith('valuesets.enums.')))\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+        assert output.strip() == "['valuesets.enums.bio', 'valuesets.enums.bio.lipid_categories']"
+
+
+class TestRegistryFreshness:
+    """Test that the packaged registry matches the generated enum modules"""
+
+    def test_registry_matches_enums(self, registry):
+        assert registry.enum_names() == sorted(valuesets.enums.__all__)
+        for name in valuesets.enums.__all__:
+            enum_class = getattr(valuesets.enums, name)
+            metadata = enum_class.__dict__.get("_metadata", {})
+            members = registry.members(name)
+            assert [m.name for m in members] == [m.name for m in enum_class], name
+            assert [m.value for m in members] == [m.value for m in enum_class], name
+            for member in members:
+                record = metadata.get(member.name)
+                expected = record.to_dict() if record is not None else {}
+                assert member.metadata == expected, f"{name}.{member.name}"
+
+    def test_classifier_capabilities_match_enums(self, registry):
+        classifiable = registry.classifiable_enums()
+        for name in valuesets.enums.__all__:
+            enum_class = getattr(valuesets.enums, name)
+            fields = sorted(detect_classifier_fields(enum_class))
+            assert registry.classifier_fields(name) == fields, name
+            assert classifiable.get(name, []) == fields, name
+            mappings = get_classifier_config(enum_class).get("annotation_mappings")
+            for field in fields:
+                expected = [
+                    (member.name, *get_range_with_unit(member, field, mappings)) for member in enum_class
+                    if get_range_with_unit(member, field, mappings)[:2] != (None, None)
+                ]
+                assert [tuple(r) for r in registry.classifier_ranges(name, field)] == expected, name
+
+
+class TestRegistryGenerator:
+    """Test building a registry file"""
+
+    def test_generate(self, tmp_path):
+        path = tmp_path / "registry.sqlite"
+        count = EnumRegistryGenerator().generate(path)
+        assert count > len(valuesets.enums.__all__)  # includes shadowed definitions
+
+        conn = sqlite3.connect(path)
+        predicates = {row[0] for row in conn.execute("SELECT DISTINCT predicate FROM curies")}
+        definitions = conn.execute("SELECT COUNT(*) FROM enums WHERE name = 'PresenceEnum'").fetchone()[0]
+        exported = conn.execute(
+            "SELECT e.module FROM exports x JOIN enums e ON e.id = x.enum_id WHERE x.name = 'PresenceEnum'"
+        ).fetchall()
+        conn.close()
+        assert definitions > 1
+        assert {"meaning", "exact_mappings"} <= predicates
+        assert exported == [(valuesets.enums.PresenceEnum.__module__,)]
+
+        assert EnumRegistry(path).get_member("AnatomicalSide", "LEFT").meaning == "BSPO:0000000"
+
+    def test_from_meaning_with_iri_meanings(self, tmp_path):
+        # Another package may declare meanings as IRIs; lookups go through the normalized CURIE index
+        path = tmp_path / "registry.sqlite"
+        path.write_bytes(DEFAULT_REGISTRY_PATH.read_bytes())
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "UPDATE members SET meaning = 'http://purl.obolibrary.org/obo/BSPO_0000000' "
+            "WHERE meaning = 'BSPO:0000000'"
+        )
+        conn.commit()
+        conn.close()
+        registry = EnumRegistry(path)
+        assert registry.from_meaning("AnatomicalSide", "BSPO:0000000").name == "LEFT"
+        assert registry.from_meaning("AnatomicalSide", "http://purl.obolibrary.org/obo/BSPO_0000000").name == "LEFT"
+        assert registry.from_meaning("AnatomicalSide", "FAKE:1") is None
+
+    def test_rejects_other_format_versions(self, tmp_path):
+        path = tmp_path / "registry.sqlite"
+        path.write_bytes(DEFAULT_REGISTRY_PATH.read_bytes())
+        conn = sqlite3.connect(path)
+        conn.execute("UPDATE info SET value = '999' WHERE key = 'format_version'")
+        conn.commit()
+        conn.close()
+        with pytest.raises(ValueError):
+            EnumRegistry(path)
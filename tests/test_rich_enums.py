@@ -2,11 +2,15 @@
 Unit tests for rich enum functionality
 """
 
+from collections.abc import Mapping
+
 import pytest
 from valuesets.enums.spatial.spatial_qualifiers import AnatomicalSide, AnatomicalPlane
 from valuesets.enums.bio.structural_biology import StructuralBiologyTechnique, SampleType
 from valuesets.enums.core import PresenceEnum
 from valuesets.enums.bio.taxonomy import BiologicalKingdom
+from valuesets.enums.bio.uniprot_species import UniProtSpeciesCode
+from valuesets.generators.rich_enum import AmbiguousLabelError, MemberMetadata
 
 
 class TestRichEnumBasics:
@@ -70,7 +74,7 @@ class TestMetadataAccess:
         """Test annotations access"""
         anterior = AnatomicalSide.ANTERIOR
         annotations = anterior.get_annotations()
-        assert isinstance(annotations, dict)
+        assert isinstance(annotations, Mapping)
         assert "aliases" in annotations
         assert annotations["aliases"] == "front, rostral, cranial (in head region)"
 
@@ -91,6 +95,41 @@ class TestMetadataAccess:
         assert "annotations" in metadata
         assert metadata["annotations"]["aliases"] == "front, rostral, cranial (in head region)"
 
+    def test_member_attributes(self):
+        """Test metadata exposed as member attributes"""
+        assert AnatomicalSide.LEFT.meaning == "BSPO:0000000"
+        assert AnatomicalSide.LEFT.description is None
+        assert AnatomicalSide.LEFT.annotations == {}
+        assert PresenceEnum.PRESENT.description == "The entity is present"
+        anterior = AnatomicalSide.ANTERIOR
+        assert anterior.annotations is anterior.get_annotations()
+        assert anterior.meaning == anterior.get_meaning()
+
+    def test_accessors_are_shared(self):
+        """Test that accessors live on RichEnum rather than on each subclass"""
+        for name in ("get_meaning", "get_description", "get_annotations", "meaning"):
+            assert name not in AnatomicalSide.__dict__
+            assert name not in PresenceEnum.__dict__
+
+    def test_member_attributes_follow_metadata_reassignment(self):
+        """Test that reassigning _metadata updates member attributes"""
+        from valuesets.generators.rich_enum import RichEnum
+
+        class Thing(RichEnum):
+            A = "A"
+            B = "B"
+
+        assert Thing.A.meaning is None
+        Thing._metadata = {"A": {"meaning": "EX:1", "description": "First"}}
+        assert (Thing.A.meaning, Thing.A.description) == ("EX:1", "First")
+        assert Thing.B.meaning is None
+
+        Thing._metadata = {"B": {"meaning": "EX:2", "annotations": {"k": "v"}}}
+        assert Thing.A.meaning is None
+        assert Thing.A.description is None
+        assert Thing.B.meaning == "EX:2"
+        assert Thing.B.annotations == {"k": "v"}
+
 
 class TestMeaningLookup:
     """Test ontology meaning lookup functionality"""
@@ -129,6 +168,109 @@ class TestMeaningLookup:
         cryo_em = StructuralBiologyTechnique.from_meaning("CHMO:0002413")  # Correct CURIE
         assert cryo_em == StructuralBiologyTechnique.CRYO_EM
 
+    def test_from_meaning_expanded_iri(self):
+        """Test that expanded IRIs resolve like their CURIEs"""
+        found = BiologicalKingdom.from_meaning("http://purl.obolibrary.org/obo/NCBITaxon_2759")
+        assert found == BiologicalKingdom.EUKARYOTA
+
+        found = AnatomicalSide.from_meaning("https://purl.obolibrary.org/obo/BSPO_0000000")
+        assert found == AnatomicalSide.LEFT
+
+    def test_from_meanings_preserves_order(self):
+        """Test bulk meaning lookup returns results in input order"""
+        results = AnatomicalSide.from_meanings(
+            ["BSPO:0000007", "FAKE:1", None, "http://purl.obolibrary.org/obo/BSPO_0000000"]
+        )
+        assert results == [AnatomicalSide.RIGHT, None, None, AnatomicalSide.LEFT]
+
+    def test_meaning_index_invalidated_on_metadata_reassignment(self):
+        """Test that reassigning _metadata rebuilds the reverse index"""
+        from valuesets.generators.rich_enum import RichEnum
+
+        class Shared(RichEnum):
+            A = "A"
+            B = "B"
+
+        Shared._metadata = {"A": {"meaning": "EX:1"}, "B": {"meaning": "EX:1"}}
+        assert Shared.from_meaning("EX:1") == Shared.A
+        assert Shared.members_with_meaning("EX:1") == (Shared.A, Shared.B)
+
+        Shared._metadata = {"B": {"meaning": "EX:1"}}
+        assert Shared.from_meaning("EX:1") == Shared.B
+        assert Shared.members_with_meaning("EX:1") == (Shared.B,)
+
+
+class TestLabelLookup:
+    """Test free-text label lookup functionality"""
+
+    def test_from_label_aliases(self):
+        """Test lookup by alias ignores case and punctuation"""
+        assert UniProtSpeciesCode.from_label("Baker's yeast") == UniProtSpeciesCode.SP_YEAST
+        assert UniProtSpeciesCode.from_label("bakers yeast") is None
+        assert UniProtSpeciesCode.from_label("baker s  YEAST") == UniProtSpeciesCode.SP_YEAST
+        assert UniProtSpeciesCode.from_label("human") == UniProtSpeciesCode.SP_HUMAN
+        assert UniProtSpeciesCode.from_label("Rabbit") == UniProtSpeciesCode.SP_RABIT
+
+    def test_from_label_name_and_value(self):
+        """Test lookup by normalized member name"""
+        assert AnatomicalSide.from_label("left") == AnatomicalSide.LEFT
+        assert PresenceEnum.from_label("below detection limit") == PresenceEnum.BELOW_DETECTION_LIMIT
+
+    def test_from_label_not_found(self):
+        """Test lookup with unknown or empty labels"""
+        assert UniProtSpeciesCode.from_label("unicorn") is None
+        assert UniProtSpeciesCode.from_label("") is None
+        assert UniProtSpeciesCode.from_label(None) is None
+
+    def test_from_label_ambiguous(self):
+        """Test that shared aliases are reported instead of picking one"""
+        with pytest.raises(AmbiguousLabelError) as excinfo:
+            UniProtSpeciesCode.from_label("Fission yeast")
+        assert set(excinfo.value.candidates) == {
+            UniProtSpeciesCode.SP_SCHJY,
+            UniProtSpeciesCode.SP_SCHPO,
+        }
+        assert set(UniProtSpeciesCode.members_with_label("fission yeast")) == {
+            UniProtSpeciesCode.SP_SCHJY,
+            UniProtSpeciesCode.SP_SCHPO,
+        }
+
+    def test_name_takes_precedence_over_alias(self):
+        """Test that names and values outrank titles and aliases"""
+        from valuesets.generators.rich_enum import RichEnum
+
+        class Fruit(RichEnum):
+            APPLE = "APPLE"
+            PEAR = "PEAR"
+
+        Fruit._metadata = {
+            "APPLE": {"title": "Malus"},
+            "PEAR": {"aliases": ["apple", "malus"]},
+        }
+        assert Fruit.from_label("Apple") == Fruit.APPLE
+        assert Fruit.from_label("MALUS") == Fruit.APPLE
+        assert Fruit.from_label("pear") == Fruit.PEAR
+
+    def test_match_reports_match_type(self):
+        """Test that match returns the members and how they matched"""
+        assert UniProtSpeciesCode.match("SP_HUMAN") == ((UniProtSpeciesCode.SP_HUMAN,), "name")
+        assert UniProtSpeciesCode.match("NCBITaxon:9606") == ((UniProtSpeciesCode.SP_HUMAN,), "meaning")
+        assert UniProtSpeciesCode.match("human") == ((UniProtSpeciesCode.SP_HUMAN,), "label")
+        members, match_type = UniProtSpeciesCode.match("Fission yeast")
+        assert match_type == "label" and len(members) == 2
+        assert UniProtSpeciesCode.match("no such thing") == ((), None)
+        assert UniProtSpeciesCode.match("") == ((), None)
+
+    def test_from_any(self):
+        """Test lookup by name, value, meaning or label"""
+        assert UniProtSpeciesCode.from_any("SP_HUMAN") == UniProtSpeciesCode.SP_HUMAN
+        assert UniProtSpeciesCode.from_any("NCBITaxon:9606") == UniProtSpeciesCode.SP_HUMAN
+        assert UniProtSpeciesCode.from_any(
+            "http://purl.obolibrary.org/obo/NCBITaxon_9606"
+        ) == UniProtSpeciesCode.SP_HUMAN
+        assert UniProtSpeciesCode.from_any("Human") == UniProtSpeciesCode.SP_HUMAN
+        assert UniProtSpeciesCode.from_any("unicorn") is None
+
 
 class TestClassMethods:
     """Test class-level methods"""
@@ -244,17 +386,50 @@ class TestEdgeCases:
         anterior = AnatomicalSide.ANTERIOR
         annotations = anterior.get_annotations()
 
-        # Should be a proper dict
-        assert isinstance(annotations, dict)
+        # Should be a read-only mapping shared between calls
+        assert isinstance(annotations, Mapping)
+        assert annotations is anterior.get_annotations()
+        with pytest.raises(TypeError):
+            annotations["test"] = "modified"
+        assert "test" not in anterior.get_annotations()
+
+        # Members without annotations get an empty mapping
+        assert PresenceEnum.PRESENT.get_annotations() == {}
+
+
+class TestCompactMetadata:
+    """Test that assigned metadata is stored as compact read-only records"""
+
+    def test_metadata_records(self):
+        record = UniProtSpeciesCode.__dict__["_metadata"]["SP_HUMAN"]
+        assert isinstance(record, MemberMetadata)
+        assert not hasattr(record, "__dict__")
+        assert record["meaning"] == "NCBITaxon:9606"
+        assert record["aliases"] == ("Human",)
+        assert record.get("title") is None
+
+    def test_metadata_table_is_read_only(self):
+        with pytest.raises(TypeError):
+            UniProtSpeciesCode.__dict__["_metadata"]["SP_HUMAN"] = {}
+
+    def test_to_dict_round_trip(self):
+        metadata = {
+            "description": "A thing",
+            "meaning": "EX:1",
+            "aliases": ["thing"],
+            "annotations": {"source": "test"},
+            "deprecated": True,
+        }
+        record = MemberMetadata.from_dict(metadata)
+        assert record.to_dict() == metadata
+        assert dict(record) == {**metadata, "aliases": ("thing",)}
+        assert MemberMetadata.from_dict(record) is record
 
-        # Note: Currently annotations return the same dict object
-        # This tests the current behavior - modifications affect subsequent calls
-        annotations["test"] = "modified"
-        fresh_annotations = anterior.get_annotations()
-        assert "test" in fresh_annotations  # Same object, so modification persists
+    def test_get_metadata_is_json_serializable(self):
+        import json
 
-        # Clean up for other tests
-        del annotations["test"]
+        metadata = UniProtSpeciesCode.SP_HUMAN.get_metadata()
+        assert json.loads(json.dumps(metadata))["aliases"] == ["Human"]
 
 
 class TestJSONSerialization:
@@ -0,0 +1,239 @@
+"""
+Tests for the batch classification/normalization server
+"""
+
+import asyncio
+import http.client
+import json
+import random
+import socket
+import threading
+import time
+
+import pytest
+
+from valuesets import server as server_module
+from valuesets.enums import BiologicalKingdom, IPCCLikelihoodScale, ProcessScaleEnum
+from valuesets.server import RequestError, ValuesetsServer, classify_batch, lookup_batch, normalize_batch
+from valuesets.utils.classifier import classify
+from valuesets.utils.normalize import normalize_many
+
+
+class RunningServer:
+    """A ValuesetsServer on its own event loop thread."""
+
+    def __init__(self, unix_socket=None, **options):
+        self.server = ValuesetsServer(**options)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        asyncio.run_coroutine_threadsafe(self.server.start(port=0, unix_socket=unix_socket), self.loop).result(30)
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self.server.close(), self.loop).result(30)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+
+    def connection(self):
+        host, port = self.server.address.rsplit(":", 1)
+        return http.client.HTTPConnection(host, int(port), timeout=30)
+
+
+def post(connection, path, payload):
+    connection.request("POST", path, json.dumps(payload), {"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+@pytest.fixture
+def server():
+    running = RunningServer()
+    yield running
+    running.close()
+
+
+class TestHandlers:
+    """Test that batch handlers agree with the library functions"""
+
+    @pytest.mark.parametrize("all_matches", [False, True])
+    def test_classify_values_match_classify(self, all_matches):
+        rng = random.Random(0)
+        values = [rng.random() for _ in range(300)] + [0.0, 1.0, None, "0.5", True]
+        response = classify_batch({"enum": "IPCCLikelihoodScale", "values": values, "all_matches": all_matches})
+        for value, result in zip(values, response["results"]):
+            # JSON true/false are not numbers and match nothing
+            expected = [] if isinstance(value, bool) else [
+                m.name for m in classify({"probability": value}, IPCCLikelihoodScale, "probability")
+            ]
+            assert result == (expected if all_matches else (expected[0] if expected else None)), value
+
+    def test_classify_units(self):
+        values = [0.5, 500, 2, 3, 0.5]
+        units = ["mL", "mL", "L", "kg", None]
+        response = classify_batch({"enum": "ProcessScaleEnum", "values": values, "units": units,
+                                   "all_matches": True})
+        assert response["results"] == [
+            [m.name for m in classify({"volume": (v, u)}, ProcessScaleEnum)] for v, u in zip(values, units)
+        ]
+        with pytest.raises(RequestError):
+            classify_batch({"enum": "ProcessScaleEnum", "values": values, "units": ["mL"]})
+
+    def test_classify_booleans_match_nothing(self):
+        response = classify_batch({"enum": "ProcessScaleEnum", "values": [0.5, 500, True, False], "units": "mL"})
+        assert response["results"] == ["MICROFLUIDIC_SCALE", "BENCH_SCALE", None, None]
+
+    def test_classify_records(self):
+        records = [{"volume": 0.5, "unit": "mL"}, {"volume": 500}, {}, "not a record"]
+        response = classify_batch({"enum": "ProcessScaleEnum", "records": records, "unit_field": "unit"})
+        assert response["results"] == ["MICROFLUIDIC_SCALE", "PILOT_SCALE", None, None]
+
+    def test_normalize(self):
+        values = ["EUKARYOTA", "NCBITaxon:2759", "nope", None]
+        response = normalize_batch({"enum": "BiologicalKingdom", "values": values})
+        expected = list(normalize_many(BiologicalKingdom, values))
+        assert [r["member"] for r in response["results"]] == [r.member.name if r.member else None for r in expected]
+        assert [r["match_type"] for r in response["results"]] == [r.match_type for r in expected]
+        # Counts are per request although the normalizer is shared
+        assert (response["matched"], response["total"]) == (2, 4)
+        assert normalize_batch({"enum": "BiologicalKingdom", "values": ["nope"]})["total"] == 1
+
+    def test_lookup(self):
+        response = lookup_batch({"curies": ["BSPO:0000000", "FAKE:1"]})
+        assert ("AnatomicalSide", "LEFT", "meaning") in [
+            (m["enum"], m["member"], m["predicate"]) for m in response["results"][0]["matches"]
+        ]
+        assert response["results"][1] == {"curie": "FAKE:1", "matches": []}
+
+    def test_bad_requests(self):
+        with pytest.raises(RequestError) as e:
+            classify_batch({"enum": "NoSuchEnum", "values": []})
+        assert e.value.status == 404
+        with pytest.raises(RequestError) as e:
+            classify_batch({"enum": "ProcessScaleEnum", "values": 1})
+        assert e.value.status == 400
+
+
+class TestHTTP:
+    """Test the HTTP framing, routing and errors"""
+
+    def test_keep_alive_requests(self, server):
+        connection = server.connection()
+        for value, expected in [(0.995, "VIRTUALLY_CERTAIN"), (0.5, "MORE_LIKELY_THAN_NOT")]:
+            status, body = post(connection, "/classify", {"enum": "IPCCLikelihoodScale", "values": [value]})
+            assert status == 200
+            assert body["results"] == [expected]
+        connection.request("GET", "/health")
+        health = json.loads(connection.getresponse().read())
+        assert health["status"] == "ok" and health["requests"] == 2 and health["items"] == 2
+
+    def test_slow_batch_does_not_block_health(self, monkeypatch):
+        started = threading.Event()
+
+        def slow_classify(payload):
+            started.set()
+            time.sleep(2)  # CPU-bound work holding its thread
+            return {"results": []}
+
+        monkeypatch.setitem(server_module.HANDLERS, "/classify", slow_classify)
+        running = RunningServer(workers=0)
+        try:
+            slow = threading.Thread(target=post, args=(running.connection(), "/classify", {"values": [1]}))
+            slow.start()
+            assert started.wait(10)
+            start = time.monotonic()
+            connection = running.connection()
+            connection.request("GET", "/health")
+            assert connection.getresponse().status == 200
+            assert time.monotonic() - start < 1
+            slow.join()
+        finally:
+            running.close()
+
+    @pytest.mark.parametrize("method, path, body, status", [
+        ("POST", "/nowhere", "{}", 404),
+        ("GET", "/classify", None, 405),
+        ("POST", "/classify", "not json", 400),
+        ("POST", "/classify", "[1, 2]", 400),
+        ("POST", "/normalize", '{"enum": "NoSuchEnum", "values": []}', 404),
+    ])
+    def test_errors(self, server, method, path, body, status):
+        connection = server.connection()
+        connection.request(method, path, body)
+        response = connection.getresponse()
+        assert response.status == status
+        assert "error" in json.loads(response.read())
+        # The connection stays usable after an error
+        assert post(connection, "/lookup", {"curies": []}) == (200, {"results": []})
+
+    def test_body_too_large(self):
+        running = RunningServer(max_body_size=100)
+        try:
+            status, body = post(running.connection(), "/lookup", {"curies": ["X:1"] * 50})
+            assert status == 413
+        finally:
+            running.close()
+
+    def test_unix_socket(self, tmp_path):
+        path = tmp_path / "valuesets.sock"
+        running = RunningServer(unix_socket=path)
+        try:
+            body = json.dumps({"enum": "BiologicalKingdom", "values": ["EUKARYOTA"]}).encode()
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(str(path))
+                client.sendall(
+                    b"POST /normalize HTTP/1.1\r\nConnection: close\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+                )
+                response = b""
+                while chunk := client.recv(65536):
+                    response += chunk
+            head, _, payload = response.partition(b"\r\n\r\n")
+            assert head.startswith(b"HTTP/1.1 200")
+            assert json.loads(payload)["results"][0]["member"] == "EUKARYOTA"
+        finally:
+            running.close()
+
+
+class TestConcurrentRequests:
+    """Test that requests answered at the same time do not share per-request state"""
+
+    def test_normalize_counts_per_request(self):
+        # Large batches in the thread pool, so the requests' normalizers interleave
+        running = RunningServer(workers=4, inline_limit=1_000_000)
+        batches = [["EUKARYOTA"] * 100_000, ["nope"] * 100_000, ["bacteria", "?"] * 50_000, ["EUKARYOTA"] * 10]
+        responses = [None] * len(batches)
+
+        def send(i):
+            responses[i] = post(running.connection(), "/normalize", {"enum": "BiologicalKingdom", "values": batches[i]})
+
+        try:
+            threads = [threading.Thread(target=send, args=(i,)) for i in range(len(batches))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            running.close()
+        counts = [(body["matched"], body["total"]) for _, body in responses]
+        assert counts == [(100_000, 100_000), (0, 100_000), (50_000, 100_000), (10, 10)]
+        assert all(status == 200 for status, _ in responses)
+
+
+class TestWorkerPool:
+    """Test that batches split across worker processes give the inline results"""
+
+    def test_pooled_matches_inline(self):
+        rng = random.Random(1)
+        values = [rng.random() for _ in range(1_000)]
+        raw = [rng.choice(["EUKARYOTA", "bacteria", "NCBITaxon:2759", "?"]) for _ in range(1_000)]
+        running = RunningServer(workers=2, inline_limit=10, chunk_size=64)
+        try:
+            connection = running.connection()
+            status, classified = post(connection, "/classify", {"enum": "IPCCLikelihoodScale", "values": values})
+            assert status == 200
+            assert classified == classify_batch({"enum": "IPCCLikelihoodScale", "values": values})
+            status, normalized = post(connection, "/normalize", {"enum": "BiologicalKingdom", "values": raw})
+            assert normalized == normalize_batch({"enum": "BiologicalKingdom", "values": raw})
+            assert running.server.stats["pooled_requests"] == 2
+        finally:
+            running.close()
@@ -0,0 +1,70 @@
+"""
+Tests for unit conversion factors derived from the unit value sets
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from valuesets.enums.units.measurements import TemperatureUnitEnum, VolumeUnitEnum
+from valuesets.utils.units import NO_UNIT, UNKNOWN_UNIT, _linear_formula, unit_table
+
+
+class TestUnitTable:
+    """Test conversions and lookups over the packaged unit enums"""
+
+    def test_every_member_resolves(self):
+        table = unit_table()
+        for conversion in table.conversions:
+            assert table.lookup(conversion.unit) is conversion
+            assert math.isfinite(conversion.scale) and conversion.scale > 0
+
+    @pytest.mark.parametrize("value, source, target, expected", [
+        (250, "mL", "L", 0.25),
+        (1, "L", "mL", 1000),
+        (37, "°C", "°F", 98.6),
+        (0, "CELSIUS", "K", 273.15),
+        (2, "h", "min", 120),
+        (1, "kg", "g", 1000),
+    ])
+    def test_known_conversions(self, value, source, target, expected):
+        assert unit_table().convert(value, source, target) == pytest.approx(expected)
+
+    def test_lookup_spellings(self):
+        table = unit_table()
+        assert table.lookup("milliliters").unit is VolumeUnitEnum.MILLILITER
+        assert table.lookup("uL") is table.lookup("μL") is table.lookup("µL")
+        assert table.lookup("F").unit is TemperatureUnitEnum.FAHRENHEIT
+        assert table.lookup("Å typical").unit.name == "ANGSTROM"
+        assert table.lookup("") is None
+        assert table.lookup("furlong") is None
+
+    def test_different_dimensions_do_not_convert(self):
+        with pytest.raises(ValueError):
+            unit_table().convert(1, "L", "kg")
+        with pytest.raises(ValueError):
+            unit_table().convert(1, "L", "furlong")
+
+    def test_to_base_array(self):
+        values = np.array([1.0, 500.0, 2.0, 3.0, 4.0, 5.0])
+        units = np.array(["L", "mL", "kg", None, "", "furlong"], dtype=object)
+        base, codes, dimensions = unit_table().to_base_array(values, units)
+        volume, mass = dimensions
+        assert volume.startswith("VolumeUnitEnum") and mass.startswith("MassUnitEnum")
+        assert codes.tolist() == [0, 0, 1, NO_UNIT, NO_UNIT, UNKNOWN_UNIT]
+        assert base[0] == pytest.approx(unit_table().lookup("L").to_base(1.0))
+        assert base[1] == pytest.approx(base[0] / 2)
+        assert base[3:5].tolist() == [3.0, 4.0]
+        assert np.isnan(base[5])
+
+    def test_to_base_array_single_unit(self):
+        base, codes, dimensions = unit_table().to_base_array(np.arange(3.0), "mL")
+        assert (codes == 0).all() and len(dimensions) == 1
+        with pytest.raises(ValueError):
+            unit_table().to_base_array(np.arange(3.0), ["mL"])
+
+    def test_linear_formula_rejects_other_expressions(self):
+        assert _linear_formula("K * 2 - 1", "K") == (2.0, -1.0)
+        with pytest.raises(ValueError):
+            _linear_formula("__import__('os')", "K")
@@ -2,10 +2,19 @@
 Tests for the enum evaluator module.
 """
 
+import random
+import threading
+import time
+
+import yaml
+
 import pytest
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
+from pydantic import ValidationError
 
+from valuesets.utils.label_store import LabelStore
+from valuesets.validators import enum_evaluator
 from valuesets.validators.enum_evaluator import (
     EnumEvaluator,
     ValidationConfig,
@@ -73,9 +82,9 @@ def test_validation_result():
     assert result.has_errors() is True
 
 
-def test_curie_handling():
+def test_curie_handling(tmp_path):
     """Test CURIE handling in label lookups."""
-    evaluator = EnumEvaluator()
+    evaluator = EnumEvaluator(ValidationConfig(cache_dir=tmp_path))
 
     # Test that CURIEs are passed correctly to adapters
     mock_adapter = Mock()
@@ -211,3 +220,302 @@ def test_cache_behavior():
     label1 = evaluator.get_ontology_label("TEST:123")
     label2 = evaluator.get_ontology_label("TEST:123")
     assert mock_adapter.label.call_count == 2  # Called twice
+
+
+SCHEMA = """
+id: https://example.org/test
+name: test
+prefixes:
+  linkml: https://w3id.org/linkml/
+  GO: http://purl.obolibrary.org/obo/GO_
+imports:
+  - linkml:types
+default_range: string
+enums:
+  ProcessEnum:
+    permissible_values:
+      GROWTH:
+        meaning: GO:0040007
+      DEATH:
+        meaning: GO:0016265
+      MISSING:
+        meaning: GO:9999999
+"""
+
+
+def test_labels_stored_once_per_schema(tmp_path, monkeypatch):
+    """Test that resolved labels are written to the label store in one batch per schema."""
+    schema_path = tmp_path / "schema.yaml"
+    schema_path.write_text(SCHEMA)
+    labels = {"GO:0040007": "growth", "GO:0016265": "death"}
+    mock_adapter = Mock()
+    mock_adapter.label = Mock(side_effect=labels.get)
+
+    config = ValidationConfig(cache_dir=tmp_path / "cache", label_store_path=tmp_path / "labels.sqlite")
+    evaluator = EnumEvaluator(config)
+    evaluator._per_prefix_adapters['go'] = mock_adapter
+    put_many = Mock(wraps=evaluator.label_store.put_many)
+    monkeypatch.setattr(evaluator.label_store, "put_many", put_many)
+
+    result = evaluator.validate_schema(schema_path)
+    assert mock_adapter.label.call_count == 3
+    assert put_many.call_count == 1
+    assert [i.meaning for i in result.issues] == ["GO:9999999"]
+    stored = LabelStore(tmp_path / "labels.sqlite").get_many(labels)
+    assert {curie: s.label for curie, s in stored.items()} == labels
+    assert stored["GO:0040007"].source == "sqlite:obo:go"
+    rows = (tmp_path / "cache" / "go" / "terms.csv").read_text().splitlines()
+    assert rows[0] == "curie,label,retrieved_at"
+    assert sorted(row.split(",")[:2] for row in rows[1:]) == [
+        ["GO:0016265", "death"], ["GO:0040007", "growth"], ["GO:9999999", ""]
+    ]
+
+    # A warm store answers every lookup, including the unresolved term
+    evaluator = EnumEvaluator(config)
+    evaluator._per_prefix_adapters['go'] = mock_adapter
+    mock_adapter.label.reset_mock()
+    warm = evaluator.validate_schema(schema_path)
+    assert mock_adapter.label.call_count == 0
+    assert warm.issues == result.issues
+
+
+def test_label_store_imports_csv_cache(tmp_path):
+    """Test that a new label store starts from the CSV cache files in cache_dir."""
+    (tmp_path / "go").mkdir()
+    (tmp_path / "go" / "terms.csv").write_text(
+        "curie,label,retrieved_at\r\nGO:0040007,growth,2025-01-01T00:00:00\r\nGO:9999999,,2025-01-01T00:00:00\r\n"
+    )
+    evaluator = EnumEvaluator(ValidationConfig(cache_dir=tmp_path))
+    mock_adapter = Mock()
+    evaluator._per_prefix_adapters['go'] = mock_adapter
+    assert evaluator.get_ontology_label("GO:0040007") == "growth"
+    assert evaluator.get_ontology_label("GO:9999999") is None
+    mock_adapter.label.assert_not_called()
+    assert evaluator.label_store.path == tmp_path / "labels.sqlite"
+
+
+class BulkAdapter:
+    """An adapter counting single and bulk label lookups."""
+
+    def __init__(self, labels):
+        self._labels = labels
+        self.label_calls = 0
+        self.bulk_calls = []
+
+    def label(self, curie):
+        self.label_calls += 1
+        return self._labels.get(curie)
+
+    def labels(self, curies):
+        curies = list(curies)
+        self.bulk_calls.append(sorted(curies))
+        return [(curie, self._labels.get(curie)) for curie in curies]
+
+
+def test_prefetch_resolves_each_prefix_once(tmp_path):
+    """Test that validating several schemas looks up each prefix's terms in one bulk call."""
+    paths = []
+    for i, meanings in enumerate([("GO:0040007", "GO:0016265"), ("GO:0040007", "GO:9999999")]):
+        path = tmp_path / f"schema{i}.yaml"
+        schema = SCHEMA.replace("GO:0040007", meanings[0]).replace("GO:0016265", meanings[1])
+        path.write_text(schema.replace("name: test", f"name: test{i}"))
+        paths.append(path)
+    labels = {"GO:0040007": "growth", "GO:0016265": "death"}
+
+    results = {}
+    for prefetch in (True, False):
+        config = ValidationConfig(cache_dir=tmp_path / f"cache{prefetch}")
+        evaluator = EnumEvaluator(config)
+        adapter = evaluator._per_prefix_adapters['go'] = BulkAdapter(labels)
+        results[prefetch] = evaluator.validate_schemas(paths, prefetch=prefetch)
+        if prefetch:
+            assert adapter.bulk_calls == [["GO:0016265", "GO:0040007", "GO:9999999"]]
+            assert adapter.label_calls == 0
+        else:
+            assert adapter.bulk_calls == []
+            assert adapter.label_calls == 3
+    assert [r.issues for r in results[True]] == [r.issues for r in results[False]]
+    assert [r.schema_path for r in results[True]] == paths
+
+
+def test_prefetch_skips_stored_and_unvalidated_terms(tmp_path):
+    """Test that prefetching only asks the adapter for terms not already known."""
+    config = ValidationConfig(cache_dir=tmp_path)
+    evaluator = EnumEvaluator(config)
+    evaluator.label_store.put("GO:0040007", "growth")
+    adapter = evaluator._per_prefix_adapters['go'] = BulkAdapter({"GO:0016265": "death"})
+    assert evaluator.prefetch_labels(["GO:0040007", "GO:0016265", "GO:0016265", "AFO:1", "nocolon"]) == 1
+    assert adapter.bulk_calls == [["GO:0016265"]]
+    assert evaluator.get_ontology_label("GO:0016265") == "death"
+    assert evaluator.get_ontology_label("GO:0040007") == "growth"
+    assert adapter.label_calls == 0
+
+
+class ThreadBoundAdapter(BulkAdapter):
+    """A BulkAdapter that, like a sqlite connection, may only be used by the thread that created it."""
+
+    def __init__(self, labels):
+        super().__init__(labels)
+        self.thread = threading.get_ident()
+
+    def label(self, curie):
+        assert threading.get_ident() == self.thread
+        return super().label(curie)
+
+    def labels(self, curies):
+        assert threading.get_ident() == self.thread
+        time.sleep(0.01)  # Let the other prefixes' lookups overlap
+        return super().labels(curies)
+
+
+def test_prefetch_jobs(tmp_path, monkeypatch):
+    """Test that concurrent prefetching uses one adapter per prefix per thread and matches a serial run."""
+    labels = {"GO:0040007": "growth", "CL:0000000": "cell", "UBERON:0000955": "brain",
+              "SO:0000704": "gene", "PATO:0000001": "quality"}
+    curies = ["GO:0040007", "GO:9999999", "CL:0000000", "CL:9999999", "UBERON:0000955", "SO:0000704", "PATO:0000001"]
+    created = []
+
+    def get_adapter(adapter_string):
+        adapter = ThreadBoundAdapter(labels)
+        created.append((adapter_string, adapter.thread))
+        return adapter
+
+    monkeypatch.setattr(enum_evaluator, "get_adapter", get_adapter)
+    stored = {}
+    for jobs in (1, 4):
+        created.clear()
+        evaluator = EnumEvaluator(ValidationConfig(cache_dir=tmp_path / f"cache{jobs}", jobs=jobs))
+        put_many = Mock(wraps=evaluator.label_store.put_many)
+        monkeypatch.setattr(evaluator.label_store, "put_many", put_many)
+        assert evaluator.prefetch_labels(curies) == len(curies)
+        stored[jobs] = [(e.curie, e.label, e.source) for e in put_many.call_args.args[0]]
+        # A term not prefetched is looked up with an adapter of the calling thread
+        assert evaluator.get_ontology_label("GO:0016265") is None
+        assert {curie: evaluator.get_ontology_label(curie) for curie in curies} == {
+            curie: labels.get(curie) for curie in curies
+        }
+        assert len(created) == len(set(created))
+        threads = {thread for _, thread in created}
+        assert len(threads) == 1 if jobs == 1 else len(threads) > 2
+
+    assert stored[4] == stored[1]
+    assert [curie for curie, _, _ in stored[1]] == curies  # Grouped by prefix in input order
+    with pytest.raises(ValidationError):
+        ValidationConfig(jobs=0)
+
+
+LABELS = {"GO:0040007": "growth", "GO:0016265": "death", "CL:0000000": "cell", "CL:0000540": "neuron"}
+MEANINGS = list(LABELS) + ["GO:9999999", "FOO:1"]
+
+
+def write_schema(path, enums):
+    path.write_text(yaml.safe_dump({
+        "id": f"https://example.org/{path.stem}",
+        "name": path.stem,
+        "prefixes": {"linkml": "https://w3id.org/linkml/"},
+        "imports": ["linkml:types"],
+        "default_range": "string",
+        "enums": enums,
+    }))
+
+
+def random_edit(rng, enums):
+    """Make one random change to an enum: a meaning, an alias, a value or the enum itself."""
+    enum_name = rng.choice(sorted(enums))
+    values = enums[enum_name]["permissible_values"]
+    value_name = rng.choice(sorted(values))
+    edit = rng.choice(["meaning", "alias", "title", "add", "remove", "rename", "new_enum"])
+    if edit == "meaning":
+        values[value_name]["meaning"] = rng.choice(MEANINGS)
+    elif edit == "alias":
+        values[value_name].setdefault("aliases", []).append(rng.choice(list(LABELS.values()) + ["other"]))
+    elif edit == "title":
+        values[value_name]["title"] = rng.choice(list(LABELS.values()))
+    elif edit == "add":
+        values[f"V{rng.randrange(1000)}"] = {"meaning": rng.choice(MEANINGS)}
+    elif edit == "remove" and len(values) > 1:
+        del values[value_name]
+    elif edit == "rename":
+        values[LABELS.get(values[value_name].get("meaning"), "OTHER").upper()] = values.pop(value_name)
+    elif edit == "new_enum":
+        enums[f"Enum{rng.randrange(1000)}"] = {"permissible_values": {"GROWTH": {"meaning": "GO:0040007"}}}
+
+
+@pytest.fixture
+def offline_adapters(monkeypatch):
+    """Answer configured prefixes from LABELS; other prefixes have no ontology."""
+    def get_adapter(adapter_string):
+        if adapter_string in ("sqlite:obo:go", "sqlite:obo:cl"):
+            return BulkAdapter(LABELS)
+        raise ValueError(f"No ontology for {adapter_string}")
+
+    monkeypatch.setattr(enum_evaluator, "get_adapter", get_adapter)
+
+
+def test_incremental_matches_full_after_random_edits(tmp_path, offline_adapters):
+    """Test that incremental runs report the same results as full runs while schemas are edited."""
+    rng = random.Random(25)
+    schemas = {}
+    for i in range(2):
+        schemas[tmp_path / f"schema{i}.yaml"] = {
+            f"Enum{j}": {"permissible_values": {
+                f"V{k}": {"meaning": rng.choice(MEANINGS)} for k in range(3)
+            }} for j in range(4)
+        }
+    replayed = []
+    for round_number in range(12):
+        if round_number:
+            path = rng.choice(sorted(schemas))
+            random_edit(rng, schemas[path])
+        for path, enums in schemas.items():
+            write_schema(path, enums)
+
+        incremental = EnumEvaluator(ValidationConfig(cache_dir=tmp_path / "incremental", incremental=True))
+        full = EnumEvaluator(ValidationConfig(cache_dir=tmp_path / "full"))
+        incremental_results = incremental.validate_schemas(sorted(schemas))
+        full_results = full.validate_schemas(sorted(schemas))
+        assert [r.model_dump(exclude={"total_enums_replayed"}) for r in incremental_results] == [
+            r.model_dump(exclude={"total_enums_replayed"}) for r in full_results
+        ]
+        assert incremental._warned_prefixes == full._warned_prefixes == {"foo"}
+        replayed.append(sum(r.total_enums_replayed for r in incremental_results))
+
+    assert replayed[0] == 0
+    # Most enums are unchanged by each edit
+    assert all(count >= 4 for count in replayed[1:])
+
+
+def test_incremental_invalidation(tmp_path, offline_adapters):
+    """Test that full runs, changed enums and changed settings are validated again."""
+    schema_path = tmp_path / "schema.yaml"
+    write_schema(schema_path, {
+        "ProcessEnum": {"permissible_values": {"GROWTH": {"meaning": "GO:0040007"}, "DEAD": {"meaning": "GO:0016265"}}},
+        "CellEnum": {"permissible_values": {"CELL": {"meaning": "CL:0000000"}}},
+    })
+    config = ValidationConfig(cache_dir=tmp_path, incremental=True)
+
+    def run(config=config, full=False):
+        return EnumEvaluator(config).validate_schema(schema_path, full=full)
+
+    first = run()
+    assert (first.total_enums_replayed, [i.value_name for i in first.issues]) == (0, ["DEAD"])
+    assert (tmp_path / "validation_manifest.json").exists()
+    assert run().total_enums_replayed == 2
+    assert run(full=True).total_enums_replayed == 0
+    assert run(config.model_copy(update={"strict_mode": True})).total_enums_replayed == 0
+    assert run().total_enums_replayed == 0  # The strict run replaced the manifest
+
+    schema_path.write_text(schema_path.read_text().replace("DEAD:", "DEATH:"))
+    edited = run()
+    assert (edited.total_enums_replayed, edited.issues) == (1, [])
+
+    # A label refreshed in the store, or read from another store, re-validates the enums using it
+    EnumEvaluator(config).label_store.put("GO:0016265", "cell death")
+    refreshed = run()
+    assert refreshed.total_enums_replayed == 1
+    assert [(i.value_name, i.actual_label) for i in refreshed.issues] == [("DEATH", "cell death")]
+    other_store = tmp_path / "other.sqlite"
+    LabelStore(other_store).put("CL:0000000", "renamed cell")
+    switched = run(config.model_copy(update={"label_store_path": other_store}))
+    assert switched.total_enums_replayed == 0  # The other store has none of the stored labels
+    assert [(i.value_name, i.actual_label) for i in switched.issues] == [("CELL", "renamed cell")]
@@ -284,6 +284,25 @@ class TestRORAdapter:
         assert 'linkml-common-valuesets' in adapter._session.headers['User-Agent']
 
 
+class TestBulkLabels:
+    """Tests for labels() on REST adapters."""
+
+    def test_labels_in_order(self):
+        """Test that labels() yields every CURIE in input order from concurrent lookups."""
+        class EchoAdapter(BaseRestAdapter):
+            def label(self, curie):
+                return None if curie.endswith("0") else curie.lower()
+
+        curies = [f"X:{i}" for i in range(25)]
+        assert list(EchoAdapter().labels(curies)) == [
+            (c, None if c.endswith("0") else c.lower()) for c in curies
+        ]
+        assert [c for c, _ in EchoAdapter().labels(curies, allow_none=False)] == [
+            c for c in curies if not c.endswith("0")
+        ]
+        assert list(EchoAdapter().labels([])) == []
+
+
 class TestRestAdapterFactory:
     """Tests for get_rest_adapter() factory function."""
 